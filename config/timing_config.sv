@@ -25,6 +25,19 @@ class timing_config extends uvm_object;
     int detection_poll_interval_ns = 1;    // Polling interval for detection
     int propagation_delay_ns = 1;          // General propagation delay
 
+    // Detection timing overrides per path ("GROUP@DEST"), destination and group, generated
+    // from monitor latency traces by tools/analyze_latency_trace.py (int_timing_overrides.svh).
+    // Lookup order: path, destination, group, then the defaults above.
+    int path_timeout_ns[string];
+    int path_poll_interval_ns[string];
+    int dest_timeout_ns[string];
+    int dest_poll_interval_ns[string];
+    int group_timeout_ns[string];
+    int group_poll_interval_ns[string];
+
+    // Stimulus-to-detect latency trace written by the monitor ("": off, +INT_LATENCY_TRACE=<file>)
+    string latency_trace_file = "";
+
     // Clear timing parameters
     int clear_propagation_delay_ns = 10;   // Time to wait after clear
     int clear_setup_time_ns = 1;           // Setup time before clear
@@ -52,10 +65,42 @@ class timing_config extends uvm_object;
             `uvm_info("TIMING_CONFIG", "Using default detection_timeout_ns", UVM_HIGH)
         end
 
+        if (!uvm_config_db#(string)::get(null, "*", "latency_trace_file", latency_trace_file)) begin
+            void'($value$plusargs("INT_LATENCY_TRACE=%s", latency_trace_file));
+        end
+
+        // +INT_NO_TIMING_OVERRIDES keeps the defaults, e.g. to record a fresh latency trace
+        if (!$test$plusargs("INT_NO_TIMING_OVERRIDES")) begin
+            load_timing_overrides();
+        end
+
         `uvm_info("TIMING_CONFIG", $sformatf("Loaded timing config: level_hold=%0dns, edge_width=%0dns, pulse_width=%0dns, timeout=%0dns",
                   level_hold_time_ns, edge_pulse_width_ns, pulse_width_ns, detection_timeout_ns), UVM_MEDIUM)
     endfunction
 
+    // Load the generated detection timing overrides
+    function void load_timing_overrides();
+`include "config/int_timing_overrides.svh"
+    endfunction
+
+    // Detection timeout of a path, measured from the stimulus
+    function int get_detection_timeout_ns(string group, string dest);
+        string path = {group, "@", dest};
+        if (path_timeout_ns.exists(path)) return path_timeout_ns[path];
+        if (dest_timeout_ns.exists(dest)) return dest_timeout_ns[dest];
+        if (group_timeout_ns.exists(group)) return group_timeout_ns[group];
+        return detection_timeout_ns;
+    endfunction
+
+    // Polling interval of a path
+    function int get_poll_interval_ns(string group, string dest);
+        string path = {group, "@", dest};
+        if (path_poll_interval_ns.exists(path)) return path_poll_interval_ns[path];
+        if (dest_poll_interval_ns.exists(dest)) return dest_poll_interval_ns[dest];
+        if (group_poll_interval_ns.exists(group)) return group_poll_interval_ns[group];
+        return detection_poll_interval_ns;
+    endfunction
+
     // Validate timing parameters
     function bit validate();
         bit valid = 1;
@@ -79,10 +124,33 @@ class timing_config extends uvm_object;
             `uvm_error("TIMING_CONFIG", "detection_timeout_ns must be positive")
             valid = 0;
         end
+
+        if (detection_poll_interval_ns <= 0) begin
+            `uvm_error("TIMING_CONFIG", "detection_poll_interval_ns must be positive")
+            valid = 0;
+        end
+
+        valid &= overrides_valid(path_timeout_ns, "path_timeout_ns");
+        valid &= overrides_valid(path_poll_interval_ns, "path_poll_interval_ns");
+        valid &= overrides_valid(dest_timeout_ns, "dest_timeout_ns");
+        valid &= overrides_valid(dest_poll_interval_ns, "dest_poll_interval_ns");
+        valid &= overrides_valid(group_timeout_ns, "group_timeout_ns");
+        valid &= overrides_valid(group_poll_interval_ns, "group_poll_interval_ns");
         
         return valid;
     endfunction
 
+    // Check that every override of a table is positive
+    function bit overrides_valid(const ref int values[string], input string table_name);
+        foreach (values[key]) begin
+            if (values[key] <= 0) begin
+                `uvm_error("TIMING_CONFIG", $sformatf("%s[\"%s\"] must be positive", table_name, key))
+                return 0;
+            end
+        end
+        return 1;
+    endfunction
+
     // Print current configuration
     function void print_config();
         `uvm_info("TIMING_CONFIG", "=== Timing Configuration ===", UVM_LOW)
@@ -104,6 +172,13 @@ class timing_config extends uvm_object;
         `uvm_info("TIMING_CONFIG", $sformatf("Detection:"), UVM_LOW)
         `uvm_info("TIMING_CONFIG", $sformatf("  Timeout: %0d ns", detection_timeout_ns), UVM_LOW)
         `uvm_info("TIMING_CONFIG", $sformatf("  Poll interval: %0d ns", detection_poll_interval_ns), UVM_LOW)
+        `uvm_info("TIMING_CONFIG", $sformatf("  Overrides: %0d paths, %0d destinations, %0d groups",
+                  path_timeout_ns.size() + path_poll_interval_ns.size(),
+                  dest_timeout_ns.size() + dest_poll_interval_ns.size(),
+                  group_timeout_ns.size() + group_poll_interval_ns.size()), UVM_LOW)
+        if (latency_trace_file != "") begin
+            `uvm_info("TIMING_CONFIG", $sformatf("  Latency trace: %s", latency_trace_file), UVM_LOW)
+        end
         `uvm_info("TIMING_CONFIG", "============================", UVM_LOW)
     endfunction
 
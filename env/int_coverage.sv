@@ -43,14 +43,14 @@ class int_coverage extends uvm_subscriber #(int_transaction);
             bins unknown_polarity = {UNKNOWN_POLARITY};
         }
         
-        // Cover all destination types
-        destination: coverpoint m_transaction.destination_name {
-            bins ap_dest = {"AP"};
-            bins scp_dest = {"SCP"};
-            bins mcp_dest = {"MCP"};
-            bins imu_dest = {"ACCEL"};
-            bins io_dest = {"IO"};
-            bins other_die_dest = {"OTHER_DIE"};
+        // Cover all destination types (coverpoints must be integral, so the int_dest_e index)
+        destination: coverpoint int_pair_table::get_dest_index(m_transaction.destination_name) {
+            bins ap_dest = {DEST_AP};
+            bins scp_dest = {DEST_SCP};
+            bins mcp_dest = {DEST_MCP};
+            bins imu_dest = {DEST_ACCEL};
+            bins io_dest = {DEST_IO};
+            bins other_die_dest = {DEST_OTHER_DIE};
         }
         
         // Cross coverage: group vs destination
@@ -106,13 +106,24 @@ class int_coverage extends uvm_subscriber #(int_transaction);
         }
     endgroup
 
+    // Per-pair routing coverage: one bin per (interrupt, destination) pair ID and per merge
+    // path ID, generated from the interrupt map (see tools/pair_ids.py). Sampled by integer.
+    covergroup pair_routing_cg with function sample(int pair_id, int merge_path_id);
+        option.per_instance = 1;
+`include "int_pair_coverage.svh"
+    endgroup
+
     // Transaction being analyzed
     int_transaction m_transaction;
+
+    // Stimulus times of the merge sources, for merge path coverage
+    int_event_manager event_manager;
+    realtime last_detection[int]; // merge pair ID -> time of its previous detection
     
     // Coverage statistics
     int total_interrupts_seen = 0;
     int unique_interrupts_seen = 0;
-    string seen_interrupts[string]; // Associative array to track unique interrupts
+    bit seen_pairs[int]; // pair IDs seen so far
 
     function new(string name = "int_coverage", uvm_component parent = null);
         super.new(name, parent);
@@ -121,18 +132,27 @@ class int_coverage extends uvm_subscriber #(int_transaction);
         interrupt_basic_cg = new();
         interrupt_routing_cg = new();
         interrupt_timing_cg = new();
+        pair_routing_cg = new();
+    endfunction
+
+    function void build_phase(uvm_phase phase);
+        super.build_phase(phase);
+        if(!uvm_config_db#(int_event_manager)::get(this, "", "event_manager", event_manager)) begin
+            `uvm_info(get_type_name(), "No event_manager found in config DB, merge path coverage is not sampled", UVM_MEDIUM)
+        end
     endfunction
 
     // Main write function called for each transaction
     virtual function void write(int_transaction t);
-        string interrupt_key;
+        int pair_id = t.pair_id;
         m_transaction = t;
         total_interrupts_seen++;
+
+        if (pair_id < 0) pair_id = int_pair_table::get_or_add_pair_id(t.interrupt_info.name, t.destination_name);
         
         // Track unique interrupts
-        interrupt_key = $sformatf("%s@%s", t.interrupt_info.name, t.destination_name);
-        if (!seen_interrupts.exists(interrupt_key)) begin
-            seen_interrupts[interrupt_key] = interrupt_key;
+        if (!seen_pairs.exists(pair_id)) begin
+            seen_pairs[pair_id] = 1;
             unique_interrupts_seen++;
         end
         
@@ -140,11 +160,31 @@ class int_coverage extends uvm_subscriber #(int_transaction);
         interrupt_basic_cg.sample();
         interrupt_routing_cg.sample();
         interrupt_timing_cg.sample();
+        pair_routing_cg.sample(pair_id, -1);
+        sample_merge_paths(pair_id);
         
         `uvm_info(get_type_name(), $sformatf("Sampled coverage for interrupt: %s -> %s", 
                   t.interrupt_info.name, t.destination_name), UVM_HIGH)
     endfunction
     
+    // A merge path is covered when its merge pair is detected and its source was stimulated
+    // since the previous detection of that pair
+    function void sample_merge_paths(int pair_id);
+        int paths[$];
+        realtime stimulus_time;
+        realtime previous;
+
+        if (event_manager == null || !int_pair_table::pair_merge_paths.exists(pair_id)) return;
+
+        paths = int_pair_table::pair_merge_paths[pair_id];
+        previous = last_detection.exists(pair_id) ? last_detection[pair_id] : -1;
+        foreach (paths[i]) begin
+            stimulus_time = event_manager.get_stimulus_time(int_pair_table::merge_paths[paths[i]].source);
+            if (stimulus_time >= 0 && stimulus_time > previous) pair_routing_cg.sample(-1, paths[i]);
+        end
+        last_detection[pair_id] = $realtime;
+    endfunction
+
     // Helper function to get destination count for routing coverage
     function int get_destination_count();
         int count = 0;
@@ -160,6 +200,7 @@ class int_coverage extends uvm_subscriber #(int_transaction);
     // Report coverage statistics
     virtual function void report_phase(uvm_phase phase);
         real basic_coverage, routing_coverage, timing_coverage;
+        real pair_coverage, merge_path_coverage;
         real overall_coverage;
         
         super.report_phase(phase);
@@ -168,6 +209,8 @@ class int_coverage extends uvm_subscriber #(int_transaction);
         basic_coverage = interrupt_basic_cg.get_inst_coverage();
         routing_coverage = interrupt_routing_cg.get_inst_coverage();
         timing_coverage = interrupt_timing_cg.get_inst_coverage();
+        pair_coverage = pair_routing_cg.routed_pair.get_inst_coverage();
+        merge_path_coverage = (int_pair_table::merge_paths.size() > 0) ? pair_routing_cg.merge_path.get_inst_coverage() : 100.0;
         
         `uvm_info(get_type_name(), "=== Interrupt Functional Coverage Report ===", UVM_LOW)
         `uvm_info(get_type_name(), $sformatf("Total interrupts processed: %0d", total_interrupts_seen), UVM_LOW)
@@ -175,6 +218,10 @@ class int_coverage extends uvm_subscriber #(int_transaction);
         `uvm_info(get_type_name(), $sformatf("Basic interrupt coverage: %0.2f%%", basic_coverage), UVM_LOW)
         `uvm_info(get_type_name(), $sformatf("Routing coverage: %0.2f%%", routing_coverage), UVM_LOW)
         `uvm_info(get_type_name(), $sformatf("Timing coverage: %0.2f%%", timing_coverage), UVM_LOW)
+        `uvm_info(get_type_name(), $sformatf("Pair routing coverage: %0.2f%% of %0d generated pairs",
+                  pair_coverage, int_pair_table::generated_pairs), UVM_LOW)
+        `uvm_info(get_type_name(), $sformatf("Merge path coverage: %0.2f%% of %0d merge paths",
+                  merge_path_coverage, int_pair_table::merge_paths.size()), UVM_LOW)
         
         // Calculate overall coverage
         overall_coverage = (basic_coverage + routing_coverage + timing_coverage) / 3.0;
@@ -7,6 +7,15 @@ class int_driver extends uvm_driver #(int_stimulus_item);
     virtual int_interface int_if;
     timing_config timing_cfg;
 
+    // Stimulus times are recorded here for the monitor's latency trace and detection timeouts
+    int_event_manager event_manager;
+
+    // Source signals forced as a whole (see force_source): bits held by the driver, their
+    // values, and the signal value before the first force
+    protected uvm_hdl_data_t forced_mask[string];
+    protected uvm_hdl_data_t forced_value[string];
+    protected uvm_hdl_data_t unforced_value[string];
+
     function new(string name = "int_driver", uvm_component parent = null);
         super.new(name, parent);
     endfunction
@@ -17,6 +26,10 @@ class int_driver extends uvm_driver #(int_stimulus_item);
             `uvm_fatal(get_type_name(), "Failed to get virtual interface")
         end
 
+        if(!uvm_config_db#(int_event_manager)::get(this, "", "event_manager", event_manager)) begin
+            `uvm_info(get_type_name(), "No event_manager found in config DB, stimulus times are not recorded", UVM_MEDIUM)
+        end
+
         // Initialize timing configuration
         init_timing_config();
         timing_cfg = global_timing_config;
@@ -33,6 +46,11 @@ class int_driver extends uvm_driver #(int_stimulus_item);
 
     // Main driver task that selects appropriate stimulus method
     virtual task drive_interrupt(int_stimulus_item item);
+        if (item.stimulus_type inside {STIMULUS_BURST_ASSERT, STIMULUS_BURST_CLEAR}) begin
+            drive_burst(item);
+            return;
+        end
+
         `uvm_info(get_type_name(), "=== DRIVER STIMULUS GENERATION ===", UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("Driving interrupt stimulus: %s", item.interrupt_info.name), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Group: %s", item.interrupt_info.group.name()), UVM_MEDIUM)
@@ -41,6 +59,9 @@ class int_driver extends uvm_driver #(int_stimulus_item);
         `uvm_info(get_type_name(), $sformatf("  - Polarity: %s", item.interrupt_info.polarity.name()), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Stimulus Type: %s", item.stimulus_type.name()), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - RTL Source Path: %s", item.interrupt_info.rtl_path_src), UVM_MEDIUM)
+        if (item.interrupt_info.width > 1) begin
+            `uvm_info(get_type_name(), $sformatf("  - Vector Width: %0d (driven as one bus slice)", item.interrupt_info.width), UVM_MEDIUM)
+        end
 
         if (item.interrupt_info.rtl_path_src == "") begin
             `uvm_error(get_type_name(), $sformatf("Source path for interrupt '%s' is empty. Skipping stimulus generation.",
@@ -95,7 +116,7 @@ class int_driver extends uvm_driver #(int_stimulus_item);
     // Level-triggered interrupt stimulus
     virtual task drive_level_stimulus(interrupt_info_s info, bit assert_level);
         logic target_value;
-        logic current_value;
+        uvm_hdl_data_t current_value;
         string action_str = assert_level ? "ASSERT" : "DEASSERT";
 
         `uvm_info(get_type_name(), $sformatf("Generating LEVEL stimulus (%s) for: %s", action_str, info.name), UVM_MEDIUM)
@@ -122,7 +143,7 @@ class int_driver extends uvm_driver #(int_stimulus_item);
         end
 
         // Read current value for debugging
-        if (uvm_hdl_read(info.rtl_path_src, current_value)) begin
+        if (read_select_path(info.rtl_path_src, current_value)) begin
             `uvm_info(get_type_name(), $sformatf("Current signal value: %s = %0d", info.rtl_path_src, current_value), UVM_MEDIUM)
         end
 
@@ -131,7 +152,8 @@ class int_driver extends uvm_driver #(int_stimulus_item);
         #(timing_cfg.level_setup_time_ns * 1ns);
 
         `uvm_info(get_type_name(), $sformatf("Forcing signal: %s = %0d", info.rtl_path_src, target_value), UVM_MEDIUM)
-        uvm_hdl_force(info.rtl_path_src, target_value);
+        force_source(info.rtl_path_src, slice_value(info, target_value));
+        if (assert_level) mark_stimulus(info);
         `uvm_info(get_type_name(), $sformatf("✅ Level stimulus applied: %s = %b (%s)", info.name, target_value, action_str), UVM_MEDIUM)
 
         // Apply propagation delay
@@ -145,27 +167,31 @@ class int_driver extends uvm_driver #(int_stimulus_item);
 
         if (info.polarity == RISING_FALLING) begin
             // Both rising and falling edges
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
             #(timing_cfg.edge_setup_time_ns * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
+            mark_stimulus(info);
             #(timing_cfg.edge_pulse_width_ns * 1ns); // Hold high for edge detection
         end else if (info.polarity == ACTIVE_HIGH) begin
             // Rising edge only
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
             #(timing_cfg.edge_setup_time_ns * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
+            mark_stimulus(info);
             #(timing_cfg.edge_hold_time_ns * 1ns);
         end else if (info.polarity == ACTIVE_LOW) begin
             // Falling edge only
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
             #(timing_cfg.edge_setup_time_ns * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
+            mark_stimulus(info);
             #(timing_cfg.edge_hold_time_ns * 1ns);
         end else begin
             `uvm_warning(get_type_name(), $sformatf("Unknown polarity for edge interrupt '%s', using rising edge", info.name));
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
             #(timing_cfg.edge_setup_time_ns * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
+            mark_stimulus(info);
             #(timing_cfg.edge_hold_time_ns * 1ns);
         end
     endtask
@@ -175,26 +201,29 @@ class int_driver extends uvm_driver #(int_stimulus_item);
         `uvm_info(get_type_name(), $sformatf("Generating pulse stimulus for %s", info.name), UVM_HIGH)
 
         if (info.polarity == ACTIVE_HIGH) begin
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
             #(timing_cfg.pulse_setup_time_ns * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
+            mark_stimulus(info);
             #((info.pulse_width_ns > 0 ? info.pulse_width_ns : timing_cfg.pulse_width_ns) * 1ns); // Use per-interrupt pulse width or default
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
             #(timing_cfg.pulse_hold_time_ns * 1ns);
         end else if (info.polarity == ACTIVE_LOW) begin
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
             #(timing_cfg.pulse_setup_time_ns * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
+            mark_stimulus(info);
             #((info.pulse_width_ns > 0 ? info.pulse_width_ns : timing_cfg.pulse_width_ns) * 1ns); // Use per-interrupt pulse width or default
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
             #(timing_cfg.pulse_hold_time_ns * 1ns);
         end else begin
             `uvm_warning(get_type_name(), $sformatf("Unknown polarity for pulse interrupt '%s', using positive pulse", info.name));
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
             #(timing_cfg.pulse_setup_time_ns * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 1);
+            force_source(info.rtl_path_src, slice_value(info, 1));
+            mark_stimulus(info);
             #((info.pulse_width_ns > 0 ? info.pulse_width_ns : timing_cfg.pulse_width_ns) * 1ns);
-            uvm_hdl_force(info.rtl_path_src, 0);
+            force_source(info.rtl_path_src, slice_value(info, 0));
             #(timing_cfg.pulse_hold_time_ns * 1ns);
         end
     endtask
@@ -202,11 +231,171 @@ class int_driver extends uvm_driver #(int_stimulus_item);
     // Clear interrupt stimulus (release HDL force)
     virtual task clear_interrupt_stimulus(interrupt_info_s info);
         #(timing_cfg.clear_setup_time_ns * 1ns); // Setup time before clear
-        uvm_hdl_release(info.rtl_path_src);
+        release_source(info.rtl_path_src);
         `uvm_info(get_type_name(), $sformatf("Cleared interrupt stimulus for '%s'", info.name), UVM_HIGH)
         #(timing_cfg.clear_propagation_delay_ns * 1ns); // Configurable propagation delay
     endtask
 
+    // Burst stimulus: a set of interrupts driven as source bus images (see int_source_bus_table).
+    // Assert forces the image of every touched segment in one write; pulse members are returned
+    // to idle with a second write after the longest pulse width. Clear releases each touched
+    // segment once. Segments are written through force_source, i.e. as a read-modify-write of
+    // the whole bus signal. Interrupts without a bus slot are driven one by one.
+    virtual task drive_burst(int_stimulus_item item);
+        uvm_hdl_data_t images[int];      // segment -> image to force
+        uvm_hdl_data_t idle_images[int]; // segment -> image with the pulse members idle again
+        uvm_hdl_data_t idle;
+        interrupt_info_s singles[$];
+        interrupt_info_s pulsed[$];
+        int_source_bus_table::int_bus_slot_s slot;
+        int pulse_ns = 0;
+        int width_ns;
+        bit assert_burst = (item.stimulus_type == STIMULUS_BURST_ASSERT);
+
+        foreach (item.burst[i]) begin
+            if (is_merge_interrupt(item.burst[i].name)) begin
+                `uvm_error(get_type_name(), $sformatf("Interrupt '%s' is a merge signal and cannot be part of a burst. Skipping it.",
+                             item.burst[i].name));
+                continue;
+            end
+            if (!int_source_bus_table::has_slot(item.burst[i].name)) begin
+                singles.push_back(item.burst[i]);
+                continue;
+            end
+
+            slot = int_source_bus_table::get_slot(item.burst[i].name);
+            if (!images.exists(slot.segment)) images[slot.segment] = int_source_bus_table::get_idle_image(slot.segment);
+            if (!assert_burst) continue;
+
+            for (int b = 0; b < slot.width; b++) begin
+                images[slot.segment][slot.offset + b] = (item.burst[i].polarity == ACTIVE_LOW) ? 1'b0 : 1'b1;
+            end
+            if (item.burst[i].trigger == PULSE) begin
+                // All pulses of the burst share one pulse phase of the longest width
+                width_ns = (item.burst[i].pulse_width_ns > 0) ? item.burst[i].pulse_width_ns : timing_cfg.pulse_width_ns;
+                if (width_ns > pulse_ns) pulse_ns = width_ns;
+                pulsed.push_back(item.burst[i]);
+            end
+        end
+
+        `uvm_info(get_type_name(), $sformatf("%s burst: %0d interrupts on %0d bus segments, %0d driven one by one",
+                  assert_burst ? "ASSERT" : "CLEAR", item.burst.size() - singles.size(), images.size(), singles.size()), UVM_MEDIUM)
+
+        if (images.size() > 0) begin
+            if (assert_burst) begin
+                #(timing_cfg.level_setup_time_ns * 1ns);
+                foreach (images[seg]) begin
+                    force_source(int_source_bus_table::get_segment_path(seg), images[seg]);
+                end
+                foreach (item.burst[i]) begin
+                    if (int_source_bus_table::has_slot(item.burst[i].name)) mark_stimulus(item.burst[i]);
+                end
+
+                if (pulsed.size() > 0) begin
+                    #(pulse_ns * 1ns);
+                    foreach (pulsed[i]) begin
+                        slot = int_source_bus_table::get_slot(pulsed[i].name);
+                        idle = int_source_bus_table::get_idle_image(slot.segment);
+                        if (!idle_images.exists(slot.segment)) idle_images[slot.segment] = images[slot.segment];
+                        for (int b = 0; b < slot.width; b++) begin
+                            idle_images[slot.segment][slot.offset + b] = idle[slot.offset + b];
+                        end
+                    end
+                    foreach (idle_images[seg]) begin
+                        force_source(int_source_bus_table::get_segment_path(seg), idle_images[seg]);
+                    end
+                    #(timing_cfg.pulse_hold_time_ns * 1ns);
+                end
+                #(timing_cfg.propagation_delay_ns * 1ns);
+            end else begin
+                #(timing_cfg.clear_setup_time_ns * 1ns);
+                foreach (images[seg]) begin
+                    release_source(int_source_bus_table::get_segment_path(seg));
+                end
+                #(timing_cfg.clear_propagation_delay_ns * 1ns);
+            end
+        end
+
+        foreach (singles[i]) begin
+            if (!assert_burst) begin
+                clear_interrupt_stimulus(singles[i]);
+                continue;
+            end
+            case (singles[i].trigger)
+                EDGE:    drive_edge_stimulus(singles[i]);
+                PULSE:   drive_pulse_stimulus(singles[i]);
+                default: drive_level_stimulus(singles[i], 1);
+            endcase
+        end
+    endtask
+
+    // Record the time the interrupt reached its active level at the source
+    virtual function void mark_stimulus(interrupt_info_s info);
+        if (event_manager != null) event_manager.record_stimulus(info.name);
+    endfunction
+
+    // Value forced onto the source path for a logic level: ranged vector entries
+    // drive all bits of their bus slice at once, single interrupts one bit
+    virtual function uvm_hdl_data_t slice_value(interrupt_info_s info, logic level);
+        if (!level) return 0;
+        return (info.width > 1) ? (uvm_hdl_data_t'(1) << info.width) - 1 : 1;
+    endfunction
+
+    // Force a source path. Bit- and part-select paths are forced as their whole signal with a
+    // read-modify-write image (see split_select_path), so no simulator support for forcing
+    // selects is needed. The bits of every select forced on a signal are kept in the image
+    // until they are released, and bits the driver does not hold keep the value read when
+    // the image is written (the whole signal stays forced until its last select is released).
+    virtual function void force_source(string path, uvm_hdl_data_t value);
+        string signal;
+        int lsb, width;
+        uvm_hdl_data_t mask;
+        uvm_hdl_data_t current;
+
+        if (!split_select_path(path, signal, lsb, width)) begin
+            uvm_hdl_force(path, value);
+            return;
+        end
+        mask = ((uvm_hdl_data_t'(1) << width) - 1) << lsb;
+        if (!uvm_hdl_read(signal, current)) current = 0;
+        if (!forced_mask.exists(signal)) begin
+            forced_mask[signal] = 0;
+            forced_value[signal] = 0;
+            unforced_value[signal] = current;
+        end
+        forced_mask[signal] |= mask;
+        forced_value[signal] = (forced_value[signal] & ~mask) | ((value << lsb) & mask);
+        uvm_hdl_force(signal, (current & ~forced_mask[signal]) | forced_value[signal]);
+    endfunction
+
+    // Release a source path forced with force_source. Released bits of a signal that still
+    // has forced selects return to their value before the first force.
+    virtual function void release_source(string path);
+        string signal;
+        int lsb, width;
+        uvm_hdl_data_t mask;
+        uvm_hdl_data_t current;
+
+        if (!split_select_path(path, signal, lsb, width)) begin
+            uvm_hdl_release(path);
+            return;
+        end
+        if (!forced_mask.exists(signal)) return;
+        mask = ((uvm_hdl_data_t'(1) << width) - 1) << lsb;
+        forced_mask[signal] &= ~mask;
+        forced_value[signal] &= ~mask;
+        if (forced_mask[signal] == 0) begin
+            uvm_hdl_release(signal);
+            forced_mask.delete(signal);
+            forced_value.delete(signal);
+            unforced_value.delete(signal);
+            return;
+        end
+        if (!uvm_hdl_read(signal, current)) current = 0;
+        current = (current & ~mask) | (unforced_value[signal] & mask);
+        uvm_hdl_force(signal, (current & ~forced_mask[signal]) | forced_value[signal]);
+    endfunction
+
     // Function to check if an interrupt is a merge interrupt
     // Merge interrupts should not be directly stimulated
     virtual function bit is_merge_interrupt(string interrupt_name);
@@ -6,86 +6,143 @@
 class int_event_manager extends uvm_object;
     `uvm_object_utils(int_event_manager)
     
-    // Event pool for interrupt detection handshake
+    // Event pool for interrupt detection handshake (string keys, kept for
+    // components that are not connected to the event manager)
     uvm_event_pool interrupt_event_pool;
 
+    // Detection events indexed by pair ID (see int_pair_table), allocated up front
+    uvm_event pair_events[];
+
+    // Time of the last asserting stimulus per interrupt (map entry name), set by the driver,
+    // for stimulus-to-detect latency measurement and detection timeouts in the monitor.
+    // Merge outputs are never driven: they take the time of their last stimulated source,
+    // which is kept in stimulus_sources.
+    realtime stimulus_times[string];
+    string   stimulus_sources[string];
+
     // Note: Using wait_ptrigger() eliminates the need for manual race condition tracking
 
     function new(string name = "int_event_manager");
         super.new(name);
         interrupt_event_pool = new("interrupt_event_pool");
+        pair_events = new[int_pair_table::size()];
+        foreach (pair_events[i]) begin
+            pair_events[i] = new(int_pair_table::get_pair_key(i));
+        end
     endfunction
-    
-    // Task for sequences to wait for interrupt detection
-    // This creates a handshake mechanism between monitor and sequence
-    // Fixed race condition: check if event was already triggered before waiting
-    task wait_for_interrupt_detection(interrupt_info_s info, int timeout_ns = 1000);
-        uvm_event int_events[$];
-        string event_keys[$];
-        bit timeout_occurred = 0;
 
-        // Collect all expected destination events for this interrupt
-        if (info.to_ap) begin
-            event_keys.push_back($sformatf("%s@%s", info.name, "AP"));
-        end
-        if (info.to_scp) begin
-            event_keys.push_back($sformatf("%s@%s", info.name, "SCP"));
-        end
-        if (info.to_mcp) begin
-            event_keys.push_back($sformatf("%s@%s", info.name, "MCP"));
-        end
-        if (info.to_accel) begin
-            event_keys.push_back($sformatf("%s@%s", info.name, "ACCEL"));
-        end
-        if (info.to_io) begin
-            event_keys.push_back($sformatf("%s@%s", info.name, "IO"));
+    // Detection event of one pair; pairs added to the table at run time get one on first use
+    function uvm_event get_pair_event(int pair_id);
+        if (pair_id >= pair_events.size()) begin
+            int old_size = pair_events.size();
+            pair_events = new[int_pair_table::size()](pair_events);
+            for (int i = old_size; i < pair_events.size(); i++) begin
+                pair_events[i] = new(int_pair_table::get_pair_key(i));
+            end
         end
-        if (info.to_other_die) begin
-            event_keys.push_back($sformatf("%s@%s", info.name, "OTHER_DIE"));
+        return pair_events[pair_id];
+    endfunction
+
+    // Called by the monitor when an interrupt is detected at a destination
+    function void trigger_pair_detection(int pair_id);
+        get_pair_event(pair_id).trigger();
+    endfunction
+
+    // Same by name, for callers that do not know the pair ID
+    function void trigger_detection(string interrupt_name, string destination);
+        trigger_pair_detection(int_pair_table::get_or_add_pair_id(interrupt_name, destination));
+    endfunction
+
+    // Called by the driver when it drives an interrupt to its active level. The merge
+    // interrupts the source drives (see int_pair_table::get_source_merges) get the same time.
+    function void record_stimulus(string interrupt_name);
+        string merges[$];
+
+        stimulus_times[interrupt_name] = $realtime;
+        stimulus_sources[interrupt_name] = interrupt_name;
+        int_pair_table::get_source_merges(interrupt_name, merges);
+        foreach (merges[i]) begin
+            stimulus_times[merges[i]] = $realtime;
+            stimulus_sources[merges[i]] = interrupt_name;
         end
+    endfunction
+
+    // Time of the last stimulus of an interrupt, -1 if it was never driven
+    function realtime get_stimulus_time(string interrupt_name);
+        return stimulus_times.exists(interrupt_name) ? stimulus_times[interrupt_name] : -1;
+    endfunction
+
+    // Stimulated source behind the last stimulus time of an interrupt, "" if it was never driven
+    function string get_stimulus_source(string interrupt_name);
+        return stimulus_sources.exists(interrupt_name) ? stimulus_sources[interrupt_name] : "";
+    endfunction
+
+    // Task for sequences to wait for interrupt detection
+    // This creates a handshake mechanism between monitor and sequence
+    // Fixed race condition: check if event was already triggered before waiting
+    // One timeout covers all destinations of the interrupt, and all bits of a ranged vector entry
+    // (detected bit by bit). map_index/bit_index: interrupt_map entry (and bit of a single-bit
+    // view) of info when known, so the pair IDs come from the entry table (see int_pair_table).
+    task wait_for_interrupt_detection(interrupt_info_s info, int timeout_ns = 1000, int map_index = -1, int bit_index = 0);
+        int pair_ids[$];
 
-        if (event_keys.size() == 0) begin
+        int_pair_table::get_info_pair_ids(info, map_index, bit_index, pair_ids);
+        if (pair_ids.size() == 0) begin
             `uvm_warning("INT_EVENT_MANAGER", $sformatf("No destinations specified for interrupt '%s'", info.name))
             return;
         end
+        wait_for_pair_detection(pair_ids, info.name, timeout_ns);
+    endtask
 
-        // Get events from pool
-        foreach (event_keys[i]) begin
-            int_events.push_back(interrupt_event_pool.get(event_keys[i]));
+    // Wait for the detection events of a set of pairs under one timeout
+    task wait_for_pair_detection(int pair_ids[$], string label, int timeout_ns = 1000);
+        uvm_event int_events[$];
+        bit timeout_occurred = 0;
+
+        foreach (pair_ids[i]) begin
+            int_events.push_back(get_pair_event(pair_ids[i]));
         end
 
         `uvm_info("INT_EVENT_MANAGER", $sformatf("Waiting for %0d destination events for interrupt '%s'",
-                  int_events.size(), info.name), UVM_HIGH)
+                  int_events.size(), label), UVM_HIGH)
 
         // Wait for all expected events to be triggered with timeout
         // Use wait_ptrigger() to avoid race conditions - it can detect events triggered before or after the wait
-        // Fixed race condition: check if event was already triggered before waiting        
-        foreach (int_events[i]) begin
-            if (int_events[i].is_on()) begin
-                `uvm_info("INT_EVENT_MANAGER", $sformatf("Handshake: Event already triggered (past detection) for %s", event_keys[i]), UVM_HIGH)
-                continue; 
+        // Fixed race condition: check if event was already triggered before waiting
+        fork
+            begin
+                fork
+                    begin
+                        foreach (int_events[i]) begin
+                            if (int_events[i].is_on()) begin
+                                `uvm_info("INT_EVENT_MANAGER", $sformatf("Handshake: Event already triggered (past detection) for %s",
+                                          int_events[i].get_name()), UVM_HIGH)
+                                continue;
+                            end
+                            int_events[i].wait_ptrigger();
+                            `uvm_info("INT_EVENT_MANAGER", $sformatf("Handshake: Received detection event for %s",
+                                      int_events[i].get_name()), UVM_HIGH)
+                        end
+                    end
+                    begin
+                        #(timeout_ns * 1ns);
+                        timeout_occurred = 1;
+                    end
+                join_any
+                disable fork;
             end
-            fork
-                begin
-                    int_events[i].wait_ptrigger();
-                    `uvm_info("INT_EVENT_MANAGER", $sformatf("Handshake: Received detection event for %s",
-                              event_keys[i]), UVM_HIGH)
-                end
-                begin
-                    #(timeout_ns * 1ns);
-                    timeout_occurred = 1;
+        join
+
+        if (timeout_occurred) begin
+            foreach (int_events[i]) begin
+                if (!int_events[i].is_on()) begin
                     `uvm_error("INT_EVENT_MANAGER", $sformatf("Timeout waiting for interrupt detection: %s (timeout: %0dns)",
-                               event_keys[i], timeout_ns))
+                               int_events[i].get_name(), timeout_ns))
                 end
-            join_any
-            disable fork;
-
-            if (timeout_occurred) break;
-        end
-
-        if (!timeout_occurred) begin
+            end
+        end else begin
             `uvm_info("INT_EVENT_MANAGER", $sformatf("Handshake complete: All destinations detected for interrupt '%s'",
-                      info.name), UVM_MEDIUM)
+                      label), UVM_MEDIUM)
         end
     endtask
     
@@ -8,11 +8,11 @@ class int_monitor extends uvm_monitor;
 
     virtual int_interface int_if;
 
-    // Event pool for interrupt detection handshake
+    // Event pool for interrupt detection handshake, used when no event manager is configured
     // Key format: "interrupt_name@destination"
     uvm_event_pool interrupt_detected_events;
 
-    // Event manager for race condition handling
+    // Event manager for race condition handling (pair-ID indexed detection events)
     int_event_manager event_manager;
 
     // Model object references
@@ -22,6 +22,12 @@ class int_monitor extends uvm_monitor;
     // Timing configuration
     timing_config timing_cfg;
 
+    // Stimulus-to-detect latency trace (timing_cfg.latency_trace_file), one line per detection:
+    //   <interrupt> <group> <destination> <latency_ps> <poll_interval_ns>
+    // Analyzed across runs by tools/analyze_latency_trace.py
+    int latency_fd;
+    realtime traced_stimulus[int];  // pair ID -> stimulus time already traced
+
     function new(string name = "int_monitor", uvm_component parent = null);
         super.new(name, parent);
         item_collected_port = new("item_collected_port", this);
@@ -55,6 +61,23 @@ class int_monitor extends uvm_monitor;
         // Initialize timing configuration
         init_timing_config();
         timing_cfg = global_timing_config;
+
+        if (timing_cfg.latency_trace_file != "") begin
+            latency_fd = $fopen(timing_cfg.latency_trace_file, "w");
+            if (latency_fd == 0) begin
+                `uvm_error(get_type_name(), $sformatf("Cannot open latency trace file %s", timing_cfg.latency_trace_file))
+            end else begin
+                $fdisplay(latency_fd, "# int_latency_trace v1: interrupt group destination latency_ps poll_interval_ns");
+            end
+        end
+    endfunction
+
+    function void final_phase(uvm_phase phase);
+        super.final_phase(phase);
+        if (latency_fd != 0) begin
+            $fclose(latency_fd);
+            latency_fd = 0;
+        end
     endfunction
 
     virtual task run_phase(uvm_phase phase);
@@ -69,78 +92,175 @@ class int_monitor extends uvm_monitor;
             foreach (m_routing_model.interrupt_map[i]) begin
                 automatic int j = i;
                 fork
-                    monitor_interrupt(m_routing_model.interrupt_map[j]);
+                    monitor_interrupt(m_routing_model.interrupt_map[j], j);
                 join_none
             end
         join
     endtask
 
-    // Monitors a single interrupt's destinations
-    virtual task monitor_interrupt(interrupt_info_s info);
+    // Monitors a single interrupt's destinations (map_index: its interrupt_map index)
+    virtual task monitor_interrupt(interrupt_info_s info, int map_index = -1);
         // Task 2: Check routing configuration before monitoring
         validate_routing_configuration(info);
 
+        // Ranged vector entries: one bus watcher per destination slice instead of one thread per bit
+        if (info.width > 1) begin
+            fork
+                if (info.rtl_path_ap != "") monitor_vector_path(info, "AP", info.rtl_path_ap, map_index);
+                if (info.rtl_path_scp != "") monitor_vector_path(info, "SCP", info.rtl_path_scp, map_index);
+                if (info.rtl_path_mcp != "") monitor_vector_path(info, "MCP", info.rtl_path_mcp, map_index);
+                if (info.rtl_path_accel != "") monitor_vector_path(info, "ACCEL", info.rtl_path_accel, map_index);
+                // IO monitoring disabled, as for single interrupts
+                if (info.rtl_path_other_die != "") monitor_vector_path(info, "OTHER_DIE", info.rtl_path_other_die, map_index);
+            join_none
+            return;
+        end
+
         fork
-            if (info.rtl_path_ap != "") monitor_single_path(info, "AP", info.rtl_path_ap);
-            if (info.rtl_path_scp != "") monitor_single_path(info, "SCP", info.rtl_path_scp);
-            if (info.rtl_path_mcp != "") monitor_single_path(info, "MCP", info.rtl_path_mcp);
-            if (info.rtl_path_accel!= "") monitor_single_path(info, "ACCEL", info.rtl_path_accel);
+            if (info.rtl_path_ap != "") monitor_single_path(info, "AP", info.rtl_path_ap, map_index);
+            if (info.rtl_path_scp != "") monitor_single_path(info, "SCP", info.rtl_path_scp, map_index);
+            if (info.rtl_path_mcp != "") monitor_single_path(info, "MCP", info.rtl_path_mcp, map_index);
+            if (info.rtl_path_accel!= "") monitor_single_path(info, "ACCEL", info.rtl_path_accel, map_index);
             // TODO
             // IO monitoring disabled - iosub_to_io monitoring mechanism turned off
             // if (info.rtl_path_io != "") monitor_single_path(info, "IO", info.rtl_path_io);
-            if (info.rtl_path_other_die != "") monitor_single_path(info, "OTHER_DIE", info.rtl_path_other_die);
+            if (info.rtl_path_other_die != "") monitor_single_path(info, "OTHER_DIE", info.rtl_path_other_die, map_index);
         join_none
     endtask
 
     // Monitors a specific RTL signal path for an interrupt
-    virtual task monitor_single_path(interrupt_info_s info, string dest, string path);
+    // The pair ID is resolved once per thread, from the entry table when the map index is known
+    virtual task monitor_single_path(interrupt_info_s info, string dest, string path, int map_index = -1);
         logic value;
         logic prev_value = 0;
         int detection_count = 0;
+        int poll_interval_ns = timing_cfg.get_poll_interval_ns(info.group.name(), dest);
+        int timeout_ns = timing_cfg.get_detection_timeout_ns(info.group.name(), dest);
+        int pair_id = get_monitor_pair_id(info, dest, map_index, 0);
 
-        `uvm_info(get_type_name(), $sformatf("Starting monitor for interrupt '%s' -> '%s' at path: %s",
-                  info.name, dest, path), UVM_MEDIUM)
+        `uvm_info(get_type_name(), $sformatf("Starting monitor for interrupt '%s' -> '%s' at path: %s (poll %0dns, timeout %0dns)",
+                  info.name, dest, path, poll_interval_ns, timeout_ns), UVM_MEDIUM)
 
         forever begin
             // Wait for the interrupt signal to go high
             `uvm_info(get_type_name(), $sformatf("Waiting for signal HIGH on path: %s (interrupt: %s -> %s)",
                       path, info.name, dest), UVM_HIGH)
-            wait_for_signal_edge(path, 1);
+            wait_for_signal_edge(path, 1, poll_interval_ns, info.name, dest, timeout_ns);
 
             detection_count++;
             `uvm_info(get_type_name(), $sformatf("INTERRUPT DETECTED [%0d]: '%s' -> '%s' signal went HIGH at path: %s",
                       detection_count, info.name, dest, path), UVM_LOW)
+            trace_latency(info.name, info.name, info.group.name(), dest, poll_interval_ns, pair_id);
 
             // Send the transaction when the interrupt is detected
-            send_transaction(info, dest);
+            send_transaction(info, dest, pair_id);
 
             // Wait for the interrupt signal to go low to prevent re-triggering
             `uvm_info(get_type_name(), $sformatf("Waiting for signal LOW on path: %s (interrupt: %s -> %s)",
                       path, info.name, dest), UVM_HIGH)
-            wait_for_signal_edge(path, 0);
+            wait_for_signal_edge(path, 0, poll_interval_ns);
 
             `uvm_info(get_type_name(), $sformatf("INTERRUPT CLEARED [%0d]: '%s' -> '%s' signal went LOW at path: %s",
                       detection_count, info.name, dest, path), UVM_HIGH)
         end
     endtask
 
+    // Monitors a destination bus slice of a ranged vector entry.
+    // The bus is read as a whole signal once per poll interval and masked to the slice (see
+    // read_select_path), and every bit that goes HIGH is reported as its own single-bit
+    // interrupt (see get_vector_bit), so scoreboard keys and events are the same as for
+    // individually listed bits. The bit views, paths and pair IDs are
+    // built once per thread.
+    virtual task monitor_vector_path(interrupt_info_s info, string dest, string path, int map_index = -1);
+        uvm_hdl_data_t value;
+        uvm_hdl_data_t prev_value = 0;
+        uvm_hdl_data_t rising;
+        interrupt_info_s bit_infos[] = new[info.width];
+        string bit_paths[] = new[info.width];
+        int bit_pair_ids[] = new[info.width];
+        int detection_count[] = new[info.width];
+        int consecutive_failures = 0;
+        const int MAX_FAILURES = 10;
+        int poll_interval_ns = timing_cfg.get_poll_interval_ns(info.group.name(), dest);
+
+        foreach (bit_infos[b]) begin
+            bit_infos[b] = get_vector_bit(info, b);
+            bit_paths[b] = get_vector_bit_path(path, b);
+            bit_pair_ids[b] = get_monitor_pair_id(bit_infos[b], dest, map_index, b);
+        end
+
+        `uvm_info(get_type_name(), $sformatf("Starting bus monitor for vector interrupt '%s[%0d:0]' -> '%s' at path: %s (poll %0dns)",
+                  info.name, info.width - 1, dest, path, poll_interval_ns), UVM_MEDIUM)
+
+        forever begin
+            #(poll_interval_ns * 1ns);
+
+            if (!read_select_path(path, value)) begin
+                consecutive_failures++;
+                if (consecutive_failures >= MAX_FAILURES) begin
+                    `uvm_error(get_type_name(), $sformatf("Failed to read signal at path: %s (consecutive failures: %0d)",
+                              path, consecutive_failures))
+                    return;
+                end
+                `uvm_warning(get_type_name(), $sformatf("HDL read failure [%0d/%0d] for path: %s",
+                            consecutive_failures, MAX_FAILURES, path))
+                continue;
+            end
+            consecutive_failures = 0;
+
+            rising = value & ~prev_value;
+            if (rising != 0) begin
+                for (int b = 0; b < info.width; b++) begin
+                    if (rising[b]) begin
+                        detection_count[b]++;
+                        `uvm_info(get_type_name(), $sformatf("INTERRUPT DETECTED [%0d]: '%s' -> '%s' signal went HIGH at path: %s",
+                                  detection_count[b], bit_infos[b].name, dest, bit_paths[b]), UVM_LOW)
+                        // The driver drives the whole slice, so the stimulus is recorded for the entry
+                        trace_latency(bit_infos[b].name, info.name, info.group.name(), dest, poll_interval_ns, bit_pair_ids[b]);
+                        send_transaction(bit_infos[b], dest, bit_pair_ids[b]);
+                    end
+                end
+            end
+            prev_value = value;
+        end
+    endtask
+
+    // Pair ID of a monitored (interrupt, destination), from the entry table of the interrupt_map
+    // entry when it has one, else by name (e.g. destinations routed only at run time)
+    function int get_monitor_pair_id(interrupt_info_s info, string dest, int map_index, int bit_index);
+        int pair_id = int_pair_table::get_entry_pair_id(map_index, bit_index, int_pair_table::get_dest_index(dest));
+
+        return (pair_id >= 0) ? pair_id : int_pair_table::get_or_add_pair_id(info.name, dest);
+    endfunction
+
     // Helper task to wait for a specific signal value using polling.
     // In a real scenario, this would be replaced with @(posedge/negedge virtual_interface.signal)
-    virtual task wait_for_signal_edge(string path, logic expected_value);
+    //
+    // With an interrupt name and timeout_ns > 0, a stimulus of that interrupt (of one of its
+    // sources for a merge output) driven while waiting arms a detection timeout: if the
+    // signal has not reached the expected value
+    // timeout_ns after the stimulus, and the destination is expected under the current
+    // masks, a timeout error is reported.  Polling continues, so a late detection is still
+    // reported, and each stimulus is reported at most once.
+    virtual task wait_for_signal_edge(string path, logic expected_value, int poll_interval_ns = 0,
+                                      string interrupt_name = "", string dest = "", int timeout_ns = 0);
         logic current_value;
         logic prev_value;
         int consecutive_failures = 0;
         const int MAX_FAILURES = 10;
-        int timeout_counter = 0;
-        int max_timeout_cycles = timing_cfg.detection_timeout_ns / timing_cfg.detection_poll_interval_ns;
         bit first_read = 1;
+        realtime wait_start = $realtime;
+        realtime stimulus_time;
+        realtime reported_stimulus = -1;
+        string stimulus_source;
 
-        `uvm_info(get_type_name(), $sformatf("Starting signal polling: path=%s, expected_value=%0d, timeout=%0dns",
-                  path, expected_value, timing_cfg.detection_timeout_ns), UVM_DEBUG)
+        if (poll_interval_ns <= 0) poll_interval_ns = timing_cfg.detection_poll_interval_ns;
+
+        `uvm_info(get_type_name(), $sformatf("Starting signal polling: path=%s, expected_value=%0d, poll=%0dns, timeout=%0dns",
+                  path, expected_value, poll_interval_ns, timeout_ns), UVM_DEBUG)
 
         forever begin
-            #(timing_cfg.detection_poll_interval_ns * 1ns);
-            timeout_counter++;
+            #(poll_interval_ns * 1ns);
 
             if (uvm_hdl_read(path, current_value)) begin
                 consecutive_failures = 0; // Reset failure counter on successful read
@@ -171,19 +291,45 @@ class int_monitor extends uvm_monitor;
                             consecutive_failures, MAX_FAILURES, path))
             end
 
-            //// Check for timeout using configurable timeout
-            //if (timeout_counter >= max_timeout_cycles) begin
-            //    `uvm_error(get_type_name(), $sformatf("Timeout (%0dns) waiting for signal %s to become %0d (current: %0d, cycles: %0d)",
-            //              timing_cfg.detection_timeout_ns, path, expected_value, current_value, timeout_counter))
-            //    break;
-            //end
+            // Check for a detection timeout of a stimulus driven during this wait
+            if (timeout_ns > 0 && interrupt_name != "" && event_manager != null) begin
+                stimulus_time = event_manager.get_stimulus_time(interrupt_name);
+                if (stimulus_time >= wait_start && stimulus_time != reported_stimulus &&
+                    $realtime - stimulus_time >= timeout_ns * 1ns) begin
+                    reported_stimulus = stimulus_time;
+                    // A merge output is only expected when the source that was driven passes its masks
+                    stimulus_source = event_manager.get_stimulus_source(interrupt_name);
+                    if ((stimulus_source == interrupt_name ||
+                         m_register_model.should_expect_merge_interrupt(interrupt_name, stimulus_source, m_routing_model)) &&
+                        m_routing_model.predict_interrupt_routing_with_mask(interrupt_name, dest, m_register_model)) begin
+                        `uvm_error(get_type_name(), $sformatf("Timeout (%0dns) waiting for interrupt '%s' -> '%s' driven at %0t: signal %s did not become %0d",
+                                   timeout_ns, interrupt_name, dest, stimulus_time, path, expected_value))
+                    end
+                end
+            end
         end
     endtask
 
-    virtual task send_transaction(interrupt_info_s info, string dest);
+    // Append the stimulus-to-detect latency of a detection to the latency trace.
+    // Only the first detection after a stimulus is traced.
+    virtual function void trace_latency(string interrupt_name, string stimulus_name, string group, string dest,
+                                        int poll_interval_ns, int pair_id);
+        realtime stimulus_time;
+
+        if (latency_fd == 0 || event_manager == null) return;
+        stimulus_time = event_manager.get_stimulus_time(stimulus_name);
+        if (stimulus_time < 0) return;
+
+        if (traced_stimulus.exists(pair_id) && traced_stimulus[pair_id] == stimulus_time) return;
+        traced_stimulus[pair_id] = stimulus_time;
+
+        $fdisplay(latency_fd, "%s %s %s %0d %0d", interrupt_name, group, dest,
+                  longint'(($realtime - stimulus_time) / 1ps), poll_interval_ns);
+    endfunction
+
+    // pair_id: ID of the (interrupt, destination) pair, resolved by name if not given
+    virtual task send_transaction(interrupt_info_s info, string dest, int pair_id = -1);
         int_transaction trans = int_transaction::type_id::create("trans");
-        string event_key;
-        uvm_event int_event;
         string rtl_path;
 
         `uvm_info(get_type_name(), "=== INTERRUPT TRANSACTION CREATION ===", UVM_MEDIUM)
@@ -211,6 +357,7 @@ class int_monitor extends uvm_monitor;
         // Create transaction
         trans.interrupt_info = info;
         trans.destination_name = dest;
+        trans.pair_id = (pair_id >= 0) ? pair_id : int_pair_table::get_or_add_pair_id(info.name, dest);
 
         `uvm_info(get_type_name(), $sformatf("Sending transaction to scoreboard: %s@%s", info.name, dest), UVM_MEDIUM)
 
@@ -221,14 +368,14 @@ class int_monitor extends uvm_monitor;
         // Send to scoreboard
         item_collected_port.write(trans);
 
-        // Create event key and trigger event for handshake
-        event_key = $sformatf("%s@%s", info.name, dest);
-        int_event = interrupt_detected_events.get(event_key);
-
-        int_event.trigger();
+        // Trigger the handshake event of this (interrupt, destination) pair
+        if (event_manager != null) begin
+            event_manager.trigger_pair_detection(trans.pair_id);
+        end else begin
+            interrupt_detected_events.get($sformatf("%s@%s", info.name, dest)).trigger();
+        end
 
-        `uvm_info(get_type_name(), $sformatf("✅ INTERRUPT DETECTED: '%s' -> '%s' (event: %s)",
-                  info.name, dest, event_key), UVM_LOW)
+        `uvm_info(get_type_name(), $sformatf("✅ INTERRUPT DETECTED: '%s' -> '%s'", info.name, dest), UVM_LOW)
         `uvm_info(get_type_name(), "=== END INTERRUPT TRANSACTION ===", UVM_MEDIUM)
     endtask
 
@@ -8,6 +8,11 @@
 class int_exp_transaction extends uvm_sequence_item;
     interrupt_info_s interrupt_info;
 
+    // interrupt_map index of the entry (and bit of a single-bit view), when the sender knows it,
+    // so the pair IDs come from the entry table instead of name lookups (-1: unknown)
+    int map_index = -1;
+    int bit_index = 0;
+
     // Note: UVM field automation removed because interrupt_info_s is a struct, not a UVM object
     // uvm_field_object can only be used with objects that extend uvm_object
     `uvm_object_utils(int_exp_transaction)
@@ -20,7 +25,9 @@ endclass
 class int_scoreboard extends uvm_scoreboard;
     `uvm_component_utils(int_scoreboard)
     
-    bit expected_interrupts_aa[string];  // key: "name@dest" → exists=1
+    // Outstanding expectations, indexed by pair ID (see int_pair_table)
+    bit expected_pairs[];
+    int outstanding_count = 0;
 
     uvm_analysis_imp #(int_transaction, int_scoreboard) item_collected_export;
     uvm_analysis_imp_exp #(int_exp_transaction, int_scoreboard) expected_export;
@@ -32,73 +39,97 @@ class int_scoreboard extends uvm_scoreboard;
         super.new(name, parent);
         item_collected_export = new("item_collected_export", this);
         expected_export = new("expected_export", this);
+        expected_pairs = new[int_pair_table::size()];
     endfunction
 
     virtual function void write(int_transaction t);
         bit is_expected = 0;
-        string expected_key;
-        string remaining[$];  // 获取所有剩余键
+        int pair_id;
 
-        // Create a unique key for matching: "interrupt_name@destination"
-        expected_key = $sformatf("%s@%s", t.interrupt_info.name, t.destination_name);
+        // The monitor sets the pair ID; resolve by name only for transactions without one
+        pair_id = (t.pair_id >= 0) ? t.pair_id : int_pair_table::get_pair_id(t.interrupt_info.name, t.destination_name);
 
         `uvm_info(get_type_name(), "=== SCOREBOARD INTERRUPT PROCESSING ===", UVM_MEDIUM)
-        `uvm_info(get_type_name(), $sformatf("Received interrupt transaction: %s", expected_key), UVM_MEDIUM)
+        `uvm_info(get_type_name(), $sformatf("Received interrupt transaction: %s@%s", t.interrupt_info.name, t.destination_name), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Interrupt Name: %s", t.interrupt_info.name), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Group: %s", t.interrupt_info.group.name()), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Index: %0d", t.interrupt_info.index), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Destination: %s", t.destination_name), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Trigger: %s", t.interrupt_info.trigger.name()), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - Polarity: %s", t.interrupt_info.polarity.name()), UVM_MEDIUM)
+        `uvm_info(get_type_name(), $sformatf("Current expected queue size: %0d", outstanding_count), UVM_MEDIUM)
 
-        // 新增：手动用 foreach 遍历键，填充 remaining
-        foreach (expected_interrupts_aa[key]) begin
-            remaining.push_back(key);  // 添加每个剩余键到 queue
-        end
-        `uvm_info(get_type_name(), $sformatf("Current expected queue size: %0d", remaining.size()), UVM_MEDIUM)
-
-        if (remaining.size() > 0) begin
-            foreach (remaining[i]) begin
-                `uvm_info(get_type_name(), $sformatf("  [%0d]: %s", i, remaining[i]), UVM_MEDIUM)
-            end
-        end else begin
-            `uvm_info(get_type_name(), "Expected interrupts queue is EMPTY", UVM_MEDIUM)
-        end
-
-        if (expected_interrupts_aa.exists(expected_key)) begin
-            expected_interrupts_aa.delete(expected_key);
+        if (pair_id >= 0 && pair_id < expected_pairs.size() && expected_pairs[pair_id]) begin
+            expected_pairs[pair_id] = 0;
+            outstanding_count--;
             is_expected = 1;
-            `uvm_info(get_type_name(), $sformatf("✅ MATCH FOUND and removed: %s", expected_key), UVM_MEDIUM)
+            `uvm_info(get_type_name(), $sformatf("✅ MATCH FOUND and removed: %s@%s", t.interrupt_info.name, t.destination_name), UVM_MEDIUM)
         end
 
         // If it was not found in the expected queue, it's an error.
         if (!is_expected) begin
             `uvm_info(get_type_name(), "❌ NO MATCH FOUND - This is an UNEXPECTED interrupt!", UVM_MEDIUM)
             `uvm_error(get_type_name(), $sformatf("Detected an UNEXPECTED interrupt: '%s' was routed to '%s'. Current expected queue size: %0d",
-                      t.interrupt_info.name, t.destination_name, remaining.size()))
+                      t.interrupt_info.name, t.destination_name, outstanding_count))
 
             // Print detailed debugging information
             `uvm_info(get_type_name(), "=== DEBUGGING INFORMATION ===", UVM_MEDIUM)
-            `uvm_info(get_type_name(), $sformatf("Expected key format: %s", expected_key), UVM_MEDIUM)
+            `uvm_info(get_type_name(), $sformatf("Expected key format: %s@%s (pair ID %0d)", t.interrupt_info.name, t.destination_name, pair_id), UVM_MEDIUM)
             `uvm_info(get_type_name(), $sformatf("Interrupt routing configuration for %s:", t.interrupt_info.name), UVM_MEDIUM)
             `uvm_info(get_type_name(), $sformatf("  - to_ap: %0d, to_scp: %0d, to_mcp: %0d", t.interrupt_info.to_ap, t.interrupt_info.to_scp, t.interrupt_info.to_mcp), UVM_MEDIUM)
             `uvm_info(get_type_name(), $sformatf("  - to_accel: %0d, to_io: %0d, to_other_die: %0d", t.interrupt_info.to_accel, t.interrupt_info.to_io, t.interrupt_info.to_other_die), UVM_MEDIUM)
-
+            print_outstanding();
         end
 
         `uvm_info(get_type_name(), "=== END SCOREBOARD PROCESSING ===", UVM_MEDIUM)
     endfunction
-    
+
+    // List the outstanding expectations (only done on failures)
+    function void print_outstanding();
+        int n = 0;
+
+        if (outstanding_count == 0) begin
+            `uvm_info(get_type_name(), "Expected interrupts queue is EMPTY", UVM_MEDIUM)
+            return;
+        end
+        foreach (expected_pairs[id]) begin
+            if (expected_pairs[id]) begin
+                `uvm_info(get_type_name(), $sformatf("  [%0d]: %s", n++, int_pair_table::get_pair_key(id)), UVM_MEDIUM)
+            end
+        end
+    endfunction
+
+    // Mark one pair as expected by its ID; duplicates are ignored
+    function bit add_expected_pair_id(int pair_id);
+        if (pair_id >= expected_pairs.size()) begin
+            expected_pairs = new[int_pair_table::size()](expected_pairs);
+        end
+        if (expected_pairs[pair_id]) begin
+            `uvm_info(get_type_name(), $sformatf("  ℹ️  Skipped duplicate expected: %s", int_pair_table::get_pair_key(pair_id)), UVM_HIGH)
+            return 0;
+        end
+        expected_pairs[pair_id] = 1;
+        outstanding_count++;
+        `uvm_info(get_type_name(), $sformatf("  ✅ Added unique expected: %s", int_pair_table::get_pair_key(pair_id)), UVM_MEDIUM)
+        return 1;
+    endfunction
+
+    // Mark one (interrupt, destination) pair as expected by name
+    function bit add_expected_pair(string interrupt_name, string destination);
+        return add_expected_pair_id(int_pair_table::get_or_add_pair_id(interrupt_name, destination));
+    endfunction
+
     // This function is called when an expected interrupt is registered through TLM
     virtual function void write_exp(int_exp_transaction t);
-        add_expected(t.interrupt_info);
+        add_expected(t.interrupt_info, t.map_index, t.bit_index);
     endfunction
 
-    // Add expected interrupts to the queue
-    function void add_expected(interrupt_info_s info);
+    // Add expected interrupts to the queue. A ranged vector entry is expected bit by bit,
+    // as the monitor reports it. With the interrupt_map index of the entry (see
+    // int_pair_table::get_info_pair_ids) no name lookups are needed.
+    function void add_expected(interrupt_info_s info, int map_index = -1, int bit_index = 0);
         int expected_count = 0;
-        string caller_info;
-        string key;
+        int pair_ids[$];
 
         `uvm_info(get_type_name(), "=== ADDING EXPECTED INTERRUPT ===", UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("Adding expected interrupt: %s", info.name), UVM_MEDIUM)
@@ -115,65 +146,9 @@ class int_scoreboard extends uvm_scoreboard;
         `uvm_info(get_type_name(), $sformatf("  - to_io: %0d", info.to_io), UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("  - to_other_die: %0d", info.to_other_die), UVM_MEDIUM)
 
-        if (info.to_ap) begin
-            key = $sformatf("%s@%s", info.name, "AP");
-            if (!expected_interrupts_aa.exists(key)) begin
-                expected_interrupts_aa[key] = 1;
-                expected_count++;
-                `uvm_info(get_type_name(), $sformatf("  ✅ Added unique expected: %s", key), UVM_MEDIUM)
-            end else begin
-                `uvm_info(get_type_name(), $sformatf("  ℹ️  Skipped duplicate expected: %s", key), UVM_HIGH)
-            end
-        end
-        if (info.to_scp) begin
-            key = $sformatf("%s@%s", info.name, "SCP");
-            if (!expected_interrupts_aa.exists(key)) begin
-                expected_interrupts_aa[key] = 1;
-                expected_count++;
-                `uvm_info(get_type_name(), $sformatf("  ✅ Added unique expected: %s", key), UVM_MEDIUM)
-            end else begin
-                `uvm_info(get_type_name(), $sformatf("  ℹ️  Skipped duplicate expected: %s", key), UVM_HIGH)
-            end
-        end
-        if (info.to_mcp) begin
-            key = $sformatf("%s@%s", info.name, "MCP");
-            if (!expected_interrupts_aa.exists(key)) begin
-                expected_interrupts_aa[key] = 1;
-                expected_count++;
-                `uvm_info(get_type_name(), $sformatf("  ✅ Added unique expected: %s", key), UVM_MEDIUM)
-            end else begin
-                `uvm_info(get_type_name(), $sformatf("  ℹ️  Skipped duplicate expected: %s", key), UVM_HIGH)
-            end
-        end
-        if (info.to_accel) begin
-            key = $sformatf("%s@%s", info.name, "ACCEL");
-            if (!expected_interrupts_aa.exists(key)) begin
-                expected_interrupts_aa[key] = 1;
-                expected_count++;
-                `uvm_info(get_type_name(), $sformatf("  ✅ Added unique expected: %s", key), UVM_MEDIUM)
-            end else begin
-                `uvm_info(get_type_name(), $sformatf("  ℹ️  Skipped duplicate expected: %s", key), UVM_HIGH)
-            end
-        end
-        if (info.to_io) begin
-            key = $sformatf("%s@%s", info.name, "IO");
-            if (!expected_interrupts_aa.exists(key)) begin
-                expected_interrupts_aa[key] = 1;
-                expected_count++;
-                `uvm_info(get_type_name(), $sformatf("  ✅ Added unique expected: %s", key), UVM_MEDIUM)
-            end else begin
-                `uvm_info(get_type_name(), $sformatf("  ℹ️  Skipped duplicate expected: %s", key), UVM_HIGH)
-            end
-        end
-        if (info.to_other_die) begin
-            key = $sformatf("%s@%s", info.name, "OTHER_DIE");
-            if (!expected_interrupts_aa.exists(key)) begin
-                expected_interrupts_aa[key] = 1;
-                expected_count++;
-                `uvm_info(get_type_name(), $sformatf("  ✅ Added unique expected: %s", key), UVM_MEDIUM)
-            end else begin
-                `uvm_info(get_type_name(), $sformatf("  ℹ️  Skipped duplicate expected: %s", key), UVM_HIGH)
-            end
+        int_pair_table::get_info_pair_ids(info, map_index, bit_index, pair_ids);
+        foreach (pair_ids[i]) begin
+            expected_count += add_expected_pair_id(pair_ids[i]);
         end
 
         `uvm_info(get_type_name(), $sformatf("Total expected destinations added: %0d for interrupt '%s'",
@@ -188,19 +163,16 @@ class int_scoreboard extends uvm_scoreboard;
     
     // Check for any remaining expected interrupts at the end of test
     virtual function void check_phase(uvm_phase phase);
-        string remaining[$];
         super.check_phase(phase);
 
-        // 新增：手动用 foreach 遍历键，填充 remaining
-        foreach (expected_interrupts_aa[key]) begin
-            remaining.push_back(key);  // 添加每个剩余键到 queue
-        end
-        `uvm_info(get_type_name(), $sformatf("Current expected queue size: %0d", remaining.size()), UVM_MEDIUM)
+        `uvm_info(get_type_name(), $sformatf("Current expected queue size: %0d", outstanding_count), UVM_MEDIUM)
 
-        if (remaining.size() > 0) begin
-            `uvm_error(get_type_name(), $sformatf("Test completed with %0d undetected expected interrupts:", remaining.size()))
-            foreach (remaining[i]) begin
-                `uvm_error(get_type_name(), $sformatf("  Missing interrupt: %s", remaining[i]))
+        if (outstanding_count > 0) begin
+            `uvm_error(get_type_name(), $sformatf("Test completed with %0d undetected expected interrupts:", outstanding_count))
+            foreach (expected_pairs[id]) begin
+                if (expected_pairs[id]) begin
+                    `uvm_error(get_type_name(), $sformatf("  Missing interrupt: %s", int_pair_table::get_pair_key(id)))
+                end
             end
         end else begin
             `uvm_info(get_type_name(), "All expected interrupts were successfully detected", UVM_MEDIUM)
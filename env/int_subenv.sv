@@ -9,7 +9,7 @@ class int_subenv extends soc_base_subenv;
     int_event_manager m_event_manager;
     int_sequencer m_sequencer;
     int_driver    m_driver;
-    //int_coverage  m_coverage;
+    int_coverage  m_coverage;
 
     // Model object references (created by test case)
     int_register_model m_register_model;
@@ -26,7 +26,7 @@ class int_subenv extends soc_base_subenv;
         m_sequencer = int_sequencer::type_id::create("m_sequencer", this);
         m_driver = int_driver::type_id::create("m_driver", this);
         m_event_manager = int_event_manager::type_id::create("m_event_manager");
-        //m_coverage = int_coverage::type_id::create("m_coverage", this);
+        m_coverage = int_coverage::type_id::create("m_coverage", this);
 
         // Get model object references from configuration database (set by test case)
         if(!uvm_config_db#(int_register_model)::get(this, "", "register_model", m_register_model)) begin
@@ -53,7 +53,7 @@ class int_subenv extends soc_base_subenv;
         m_sequencer.expected_port.connect(m_scoreboard.expected_export);
 
         // Connect coverage collector
-        //m_monitor.item_collected_port.connect(m_coverage.analysis_export);
+        m_monitor.item_collected_port.connect(m_coverage.analysis_export);
 
         // Connect sequencer to driver
         m_driver.seq_item_port.connect(m_sequencer.seq_item_export);
@@ -102,7 +102,7 @@ def generate_missing_interrupts():
             # 生成条目
             entry = (f'        entry = \'{{name:"{intr_name}", index:{sub_index}, group:IOSUB, trigger:LEVEL, polarity:ACTIVE_HIGH, '
                     f'rtl_path_src:"top_tb.multidie_top.DUT[0].u_str_top.u_iosub_top_wrap.u0_iosub_top_wrap_hd.u0_iosub_top_wrap_raw.u_iosub_int_sub.iosub_peri_intr[{sub_index}]", '
-                    f'pulse_width_ns:0, to_ap:{to_ap}, rtl_path_ap:"", dest_index_ap:-1, '
+                    f'pulse_width_ns:0, width:1, to_ap:{to_ap}, rtl_path_ap:"", dest_index_ap:-1, '
                     f'to_scp:{to_scp}, rtl_path_scp:{rtl_path_scp}, dest_index_scp:{dest_index_scp}, '
                     f'to_mcp:{to_mcp}, rtl_path_mcp:{rtl_path_mcp}, dest_index_mcp:{dest_index_mcp}, '
                     f'to_accel:0, rtl_path_accel:"", dest_index_accel:-1, '
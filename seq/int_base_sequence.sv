@@ -45,12 +45,34 @@ class int_base_sequence extends uvm_sequence;
         `uvm_info(get_type_name(), "Interrupt sequence initialization completed", UVM_LOW)
     endtask
 
+    // Default detection timeout of an interrupt: the longest per-path timeout of its
+    // routed destinations (timing overrides, see config/int_timing_overrides.svh)
+    function int get_default_timeout_ns(interrupt_info_s info);
+        string dests[$];
+        int timeout_ns = 0;
+
+        init_timing_config();
+        if (info.to_ap) dests.push_back("AP");
+        if (info.to_scp) dests.push_back("SCP");
+        if (info.to_mcp) dests.push_back("MCP");
+        if (info.to_accel) dests.push_back("ACCEL");
+        if (info.to_io) dests.push_back("IO");
+        if (info.to_other_die) dests.push_back("OTHER_DIE");
+        if (dests.size() == 0) return global_timing_config.detection_timeout_ns;
+
+        foreach (dests[i]) begin
+            int dest_timeout_ns = global_timing_config.get_detection_timeout_ns(info.group.name(), dests[i]);
+            if (dest_timeout_ns > timeout_ns) timeout_ns = dest_timeout_ns;
+        end
+        return timeout_ns;
+    endfunction
+
     // Helper task to wait for interrupt detection with configurable timeout
-    task wait_for_interrupt_detection(interrupt_info_s info, int timeout_ns = -1);
+    // map_index/bit_index: interrupt_map entry (and bit of a single-bit view) of info, when known
+    task wait_for_interrupt_detection(interrupt_info_s info, int timeout_ns = -1, int map_index = -1, int bit_index = 0);
         // Use global timing config if no specific timeout provided
         if (timeout_ns == -1) begin
-            init_timing_config();
-            timeout_ns = global_timing_config.detection_timeout_ns;
+            timeout_ns = get_default_timeout_ns(info);
         end
 
         `uvm_info(get_type_name(), $sformatf("Waiting for interrupt detection: %s (group: %s, index: %0d) with timeout %0d ns",
@@ -58,7 +80,7 @@ class int_base_sequence extends uvm_sequence;
                  
         if (event_manager != null) begin
             `uvm_info(get_type_name(), $sformatf("Starting wait for interrupt: %s", info.name), UVM_HIGH)
-            event_manager.wait_for_interrupt_detection(info, timeout_ns);
+            event_manager.wait_for_interrupt_detection(info, timeout_ns, map_index, bit_index);
             `uvm_info(get_type_name(), $sformatf("Interrupt detected: %s", info.name), UVM_LOW)
         end else begin
             `uvm_error(get_type_name(), "event_manager is null in wait_for_interrupt_detection")
@@ -69,7 +91,7 @@ class int_base_sequence extends uvm_sequence;
 
     // Helper task to wait for interrupt detection with mask consideration
     // This ensures consistency with add_expected_with_mask behavior
-    task wait_for_interrupt_detection_with_mask(interrupt_info_s info, int timeout_ns = -1);
+    task wait_for_interrupt_detection_with_mask(interrupt_info_s info, int timeout_ns = -1, int map_index = -1, int bit_index = 0);
         string expected_destinations[$];
         interrupt_info_s masked_info;
 
@@ -80,8 +102,7 @@ class int_base_sequence extends uvm_sequence;
 
         // Use global timing config if no specific timeout provided
         if (timeout_ns == -1) begin
-            init_timing_config();
-            timeout_ns = global_timing_config.detection_timeout_ns;
+            timeout_ns = get_default_timeout_ns(info);
         end
 
         // Get expected destinations considering masks
@@ -146,14 +167,16 @@ class int_base_sequence extends uvm_sequence;
 
         // Wait for the masked interrupt using the original wait function
         `uvm_info(get_type_name(), $sformatf(" Waiting for masked interrupt: %s with timeout %0d ns", info.name, timeout_ns), UVM_HIGH)
-        wait_for_interrupt_detection(masked_info, timeout_ns);
+        wait_for_interrupt_detection(masked_info, timeout_ns, map_index, bit_index);
 
         `uvm_info(get_type_name(), $sformatf("✅ Mask-aware wait completed for interrupt: %s", info.name), UVM_MEDIUM)
         `uvm_info(get_type_name(), "=== END SEQUENCE WAIT FOR INTERRUPT WITH MASK ===", UVM_MEDIUM)
     endtask
 
     // Helper function to add expected interrupt
-    function void add_expected(interrupt_info_s info);
+    // map_index/bit_index: interrupt_map entry (and bit of a single-bit view) of info, when known,
+    // so the scoreboard takes the pair IDs from the entry table (see int_pair_table)
+    function void add_expected(interrupt_info_s info, int map_index = -1, int bit_index = 0);
         int_exp_transaction exp_trans;
         int_sequencer int_seq;
         string caller_info;
@@ -186,6 +209,8 @@ class int_base_sequence extends uvm_sequence;
 
         exp_trans = int_exp_transaction::type_id::create("exp_trans");
         exp_trans.interrupt_info = info;
+        exp_trans.map_index = map_index;
+        exp_trans.bit_index = bit_index;
 
         `uvm_info(get_type_name(), $sformatf("Sending expected interrupt transaction to scoreboard via TLM port"), UVM_MEDIUM)
         int_seq.expected_port.write(exp_trans);
@@ -195,7 +220,7 @@ class int_base_sequence extends uvm_sequence;
     endfunction
 
     // 修改 add_expected_with_mask 函数（添加 source_name 参数，并处理 iosub_normal_intr）
-    function void add_expected_with_mask(interrupt_info_s info, string source_name = "");
+    function void add_expected_with_mask(interrupt_info_s info, string source_name = "", int map_index = -1, int bit_index = 0);
         string expected_destinations[$];
         interrupt_info_s masked_info;
     
@@ -266,7 +291,7 @@ class int_base_sequence extends uvm_sequence;
     
         // Register the masked expectation
         `uvm_info(get_type_name(), $sformatf(" Registering masked expectation for interrupt: %s", info.name), UVM_HIGH)
-        add_expected(masked_info);
+        add_expected(masked_info, map_index, bit_index);
     
         `uvm_info(get_type_name(), "=== END SEQUENCE EXPECTED INTERRUPT WITH MASK ===", UVM_MEDIUM)
     endfunction
@@ -276,7 +301,9 @@ class int_base_sequence extends uvm_sequence;
     // =========================================================================
 
     // Recursive helper to add all expectations in the merge chain
-    function void add_all_expected_interrupts_recursive(interrupt_info_s current_info, string original_source_name, ref string processed[string]);
+    // map_index/bit_index locate current_info in the interrupt_map (merge interrupts are looked up by name)
+    function void add_all_expected_interrupts_recursive(interrupt_info_s current_info, string original_source_name, ref string processed[string],
+                                                        input int map_index = -1, input int bit_index = 0);
         string merge_interrupts[$];
         interrupt_info_s merge_info;
 
@@ -286,7 +313,7 @@ class int_base_sequence extends uvm_sequence;
         `uvm_info(get_type_name(), $sformatf("[RECURSIVE_ADD] Processing: %s (Original Source: %s)", current_info.name, original_source_name), UVM_HIGH);
 
         // 1. Add expectation for the current interrupt in the chain (direct or merged)
-        add_expected_with_mask(current_info, original_source_name);
+        add_expected_with_mask(current_info, original_source_name, map_index, bit_index);
 
         // 2. Find what this interrupt merges into (next level) and recurse
         m_routing_model.get_merge_interrupts_for_source(current_info.name, merge_interrupts);
@@ -304,7 +331,8 @@ class int_base_sequence extends uvm_sequence;
     endfunction
 
     // Recursive helper to wait for all interrupts in the merge chain
-    task wait_for_all_expected_interrupts_recursive(interrupt_info_s current_info, int timeout_ns, ref string processed[string]);
+    task wait_for_all_expected_interrupts_recursive(interrupt_info_s current_info, int timeout_ns, ref string processed[string],
+                                                    input int map_index = -1, input int bit_index = 0);
         string merge_interrupts[$];
         interrupt_info_s merge_info;
 
@@ -313,7 +341,7 @@ class int_base_sequence extends uvm_sequence;
         `uvm_info(get_type_name(), $sformatf("[RECURSIVE_WAIT] Processing: %s", current_info.name), UVM_HIGH);
 
         // 1. Wait for the current interrupt in the chain
-        wait_for_interrupt_detection_with_mask(current_info, timeout_ns);
+        wait_for_interrupt_detection_with_mask(current_info, timeout_ns, map_index, bit_index);
 
         // 2. Find next-level merges and recurse
         m_routing_model.get_merge_interrupts_for_source(current_info.name, merge_interrupts);
@@ -356,22 +384,46 @@ class int_base_sequence extends uvm_sequence;
     // =========================================================================
 
     // High-level function to add all expected interrupts for a given source interrupt
-    function void add_all_expected_interrupts(interrupt_info_s source_info);
+    // A ranged vector entry is driven as one bus slice, so expectations are added for every bit
+    // map_index: interrupt_map index of source_info when the caller knows it (-1: resolve by name)
+    function void add_all_expected_interrupts(interrupt_info_s source_info, int map_index = -1, int bit_index = 0);
         string processed[string];
+        if (source_info.width > 1) begin
+            for (int b = 0; b < source_info.width; b++) begin
+                add_all_expected_interrupts(get_vector_bit(source_info, b), map_index, bit_index + b);
+            end
+            return;
+        end
         `uvm_info(get_type_name(), "=== ADDING ALL EXPECTED INTERRUPTS (HIERARCHICAL) ===", UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("Processing all routing paths for top-level source: %s", source_info.name), UVM_MEDIUM)
-        add_all_expected_interrupts_recursive(source_info, source_info.name, processed);
+        add_all_expected_interrupts_recursive(source_info, source_info.name, processed, map_index, bit_index);
         `uvm_info(get_type_name(), "=== END ADDING ALL EXPECTED INTERRUPTS ===", UVM_MEDIUM)
     endfunction
 
     // High-level function to wait for all expected interrupts for a given source interrupt
-    task wait_for_all_expected_interrupts(interrupt_info_s source_info, int timeout_ns = -1);
+    // The bits of a ranged vector entry are driven together and waited for concurrently,
+    // so the whole entry completes within one timeout
+    task wait_for_all_expected_interrupts(interrupt_info_s source_info, int timeout_ns = -1, int map_index = -1, int bit_index = 0);
         string processed[string];
+        if (source_info.width > 1) begin
+            fork
+                begin
+                    for (int b = 0; b < source_info.width; b++) begin
+                        automatic int k = b;
+                        fork
+                            wait_for_all_expected_interrupts(get_vector_bit(source_info, k), timeout_ns, map_index, bit_index + k);
+                        join_none
+                    end
+                    wait fork;
+                end
+            join
+            return;
+        end
         `uvm_info(get_type_name(), "=== WAITING FOR ALL EXPECTED INTERRUPTS (HIERARCHICAL) ===", UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("Waiting for all routing paths for top-level source: %s", source_info.name), UVM_MEDIUM)
         begin
             fork
-                wait_for_all_expected_interrupts_recursive(source_info, timeout_ns, processed);
+                wait_for_all_expected_interrupts_recursive(source_info, timeout_ns, processed, map_index, bit_index);
             join
         end
         `uvm_info(get_type_name(), "=== END WAITING FOR ALL EXPECTED INTERRUPTS ===", UVM_MEDIUM)
@@ -380,6 +432,12 @@ class int_base_sequence extends uvm_sequence;
     // High-level function to update status for all related interrupts
     task update_all_interrupt_status(interrupt_info_s source_info);
         string processed[string];
+        if (source_info.width > 1) begin
+            for (int b = 0; b < source_info.width; b++) begin
+                update_all_interrupt_status(get_vector_bit(source_info, b));
+            end
+            return;
+        end
         `uvm_info(get_type_name(), "=== UPDATING ALL INTERRUPT STATUS (HIERARCHICAL) ===", UVM_MEDIUM)
         `uvm_info(get_type_name(), $sformatf("Updating status for all routing paths for top-level source: %s", source_info.name), UVM_MEDIUM)
         update_all_interrupt_status_recursive(source_info, processed);
@@ -0,0 +1,210 @@
+`ifndef INT_BATCHED_SEQUENCE_SV
+`define INT_BATCHED_SEQUENCE_SV
+
+// Batched interrupt routing sequence
+// Stimulates conflict-free waves of interrupts in parallel instead of one at a time.
+// The wave schedule is generated offline by tools/plan_stimulus_waves.py: interrupts in the
+// same wave share no source signal, no destination bit and no merge output, so their
+// expectations can be registered and checked concurrently without aliasing.
+// Interrupts the planner does not stimulate are listed with wave -1; map entries missing from the
+// schedule altogether (stale schedule) are reported and checked one at a time after the waves.
+// With +INT_BURST_MODE every wave is driven as one burst item: the driver forces the source bus
+// images of the whole wave in one write per bus segment (see int_source_bus_table).
+class int_batched_sequence extends int_lightweight_sequence;
+    `uvm_object_utils(int_batched_sequence)
+
+    typedef struct {
+        int    wave;
+        string name;
+    } int_wave_entry_s;
+
+    int_wave_entry_s wave_schedule[$];
+    bit burst_mode = 0;
+
+    function new(string name = "int_batched_sequence");
+        super.new(name);
+    endfunction
+
+    // Load the generated wave schedule
+    function void build_wave_schedule();
+        int_wave_entry_s wave_entry;
+
+        if (wave_schedule.size() > 0) return; // guard against multiple builds
+
+`include "int_wave_schedule.svh"
+    endfunction
+
+    virtual task body();
+        int name_to_index[string];
+        bit scheduled[string];
+        interrupt_info_s wave_members[$];
+        interrupt_info_s unscheduled[$];
+        interrupt_info_s source_interrupts[$];
+        int current_wave;
+        int wave_count = 0;
+
+        `uvm_info(get_type_name(), "Starting batched interrupt sequence execution", UVM_LOW)
+
+        m_routing_model.build();
+        build_wave_schedule();
+        build_shard_schedule();
+        if ($test$plusargs("INT_BURST_MODE")) burst_mode = check_source_bus_table();
+
+        if (m_routing_model.interrupt_map.size() == 0) begin
+            `uvm_warning(get_type_name(), "Interrupt map is empty. No checks will be performed.")
+            return;
+        end
+
+        if (wave_schedule.size() == 0) begin
+            `uvm_warning(get_type_name(), "Wave schedule is empty. Falling back to sequential routing check.")
+            super.body();
+            return;
+        end
+
+        foreach (m_routing_model.interrupt_map[i]) begin
+            name_to_index[m_routing_model.interrupt_map[i].name] = i;
+        end
+        foreach (wave_schedule[i]) begin
+            scheduled[wave_schedule[i].name] = 1;
+            if (wave_schedule[i].wave >= wave_count) wave_count = wave_schedule[i].wave + 1;
+        end
+        foreach (m_routing_model.interrupt_map[i]) begin
+            if (scheduled.exists(m_routing_model.interrupt_map[i].name)) continue;
+            `uvm_warning(get_type_name(), $sformatf("Interrupt '%s' is not in the wave schedule and is checked on its own. Regenerate int_wave_schedule.svh.",
+                         m_routing_model.interrupt_map[i].name))
+            unscheduled.push_back(m_routing_model.interrupt_map[i]);
+        end
+
+        #10us;
+        `uvm_info(get_type_name(), $sformatf("Starting batched interrupt routing check: %0d interrupts in %0d waves",
+                  wave_schedule.size(), wave_count), UVM_LOW)
+
+        // Schedule entries are grouped by wave in ascending order, not stimulated ones (wave -1) last
+        current_wave = wave_schedule[0].wave;
+        foreach (wave_schedule[i]) begin
+            if (wave_schedule[i].wave < 0) continue;
+            if (wave_schedule[i].wave != current_wave) begin
+                run_wave(current_wave, wave_members);
+                wave_members.delete();
+                current_wave = wave_schedule[i].wave;
+            end
+
+            if (!is_in_current_shard(wave_schedule[i].name)) continue;
+            if (!name_to_index.exists(wave_schedule[i].name)) begin
+                `uvm_warning(get_type_name(), $sformatf("Scheduled interrupt '%s' not found in interrupt map. Regenerate int_wave_schedule.svh.",
+                             wave_schedule[i].name))
+                continue;
+            end
+            wave_members.push_back(m_routing_model.interrupt_map[name_to_index[wave_schedule[i].name]]);
+        end
+        run_wave(current_wave, wave_members);
+
+        foreach (unscheduled[i]) begin
+            if (is_in_current_shard(unscheduled[i].name)) check_interrupt_routing(unscheduled[i]);
+        end
+
+        // Multi-source merge checks assert several sources of the same merge together,
+        // so they cannot share a wave and still run once per merge interrupt
+        foreach (m_routing_model.interrupt_map[i]) begin
+            if (m_routing_model.is_merge_interrupt(m_routing_model.interrupt_map[i].name) &&
+                is_unit_in_current_shard(m_routing_model.interrupt_map[i].name)) begin
+                if (m_routing_model.get_merge_sources(m_routing_model.interrupt_map[i].name, source_interrupts) > 1) begin
+                    test_multiple_merge_sources(m_routing_model.interrupt_map[i], source_interrupts);
+                end
+            end
+        end
+
+        `uvm_info(get_type_name(), "Batched interrupt routing check completed successfully", UVM_LOW)
+    endtask
+
+    // Check that the source bus images were generated for the current interrupt map
+    function bit check_source_bus_table();
+        int mismatches = 0;
+
+        int_source_bus_table::build();
+        foreach (int_source_bus_table::slots[name]) begin
+            if (m_routing_model.get_map_index(name) != int_source_bus_table::slots[name].map_index) mismatches++;
+        end
+        if (mismatches > 0) begin
+            `uvm_warning(get_type_name(), $sformatf("%0d source bus slots do not match the interrupt map. Regenerate int_source_buses.svh. Burst mode disabled.",
+                         mismatches))
+            return 0;
+        end
+        `uvm_info(get_type_name(), $sformatf("Burst mode: %0d interrupts on %0d source bus segments",
+                  int_source_bus_table::slots.size(), int_source_bus_table::segments.size()), UVM_LOW)
+        return 1;
+    endfunction
+
+    // Stimulate and check all interrupts of one wave concurrently
+    virtual task run_wave(int wave, interrupt_info_s members[$]);
+        int_stimulus_item stim_item;
+        int map_idx[$];
+
+        if (members.size() == 0) return;
+
+        `uvm_info(get_type_name(), $sformatf("WAVE %0d: Testing %0d interrupts in parallel", wave, members.size()), UVM_MEDIUM)
+
+        // interrupt_map entries of the members, so expectations are keyed by pair ID without name lookups
+        foreach (members[i]) begin
+            map_idx.push_back(m_routing_model.get_map_index(members[i].name));
+        end
+
+        // 1. Set expectations for every member (including merge chains)
+        foreach (members[i]) begin
+            add_all_expected_interrupts(members[i], map_idx[i]);
+        end
+
+        // 2. Assert all sources of the wave
+        if (burst_mode) begin
+            stim_item = int_stimulus_item::create_burst(members, STIMULUS_BURST_ASSERT);
+            start_item(stim_item);
+            finish_item(stim_item);
+        end else foreach (members[i]) begin
+            `uvm_info(get_type_name(), $sformatf("Sending ASSERT stimulus for: %s", members[i].name), UVM_DEBUG)
+            stim_item = int_stimulus_item::create_stimulus(members[i], STIMULUS_ASSERT);
+            start_item(stim_item);
+            finish_item(stim_item);
+        end
+
+        `uvm_info(get_type_name(), "Waiting for propagation through merge logic...", UVM_DEBUG)
+        #10ns;
+
+        // 3. Wait for all expected interrupts of the wave
+        fork
+            begin
+                foreach (members[i]) begin
+                    automatic int j = i;
+                    fork
+                        wait_for_all_expected_interrupts(members[j], -1, map_idx[j]);
+                    join_none
+                end
+                wait fork;
+            end
+        join
+
+        // 4. Update status for all affected interrupts
+        foreach (members[i]) begin
+            update_all_interrupt_status(members[i]);
+        end
+
+        // 5. Clear all sources of the wave
+        if (burst_mode) begin
+            stim_item = int_stimulus_item::create_burst(members, STIMULUS_BURST_CLEAR);
+            start_item(stim_item);
+            finish_item(stim_item);
+        end else foreach (members[i]) begin
+            `uvm_info(get_type_name(), $sformatf("Sending CLEAR stimulus for: %s", members[i].name), UVM_DEBUG)
+            stim_item = int_stimulus_item::create_stimulus(members[i], STIMULUS_CLEAR);
+            start_item(stim_item);
+            finish_item(stim_item);
+        end
+
+        `uvm_info(get_type_name(), "Waiting for clear to propagate...", UVM_DEBUG)
+        #10ns;
+
+        `uvm_info(get_type_name(), $sformatf("WAVE %0d: Completed", wave), UVM_MEDIUM)
+    endtask
+
+endclass
+
+`endif // INT_BATCHED_SEQUENCE_SV
@@ -34,6 +34,14 @@ typedef enum int {
 typedef enum { LEVEL, EDGE, PULSE, UNKNOWN_TRIGGER } interrupt_trigger_e;
 typedef enum { ACTIVE_HIGH, ACTIVE_LOW, RISING_FALLING, UNKNOWN_POLARITY } interrupt_polarity_e;
 
+// Destination order of the per-destination routing bitmaps (see int_route_bitmaps.svh)
+typedef enum int { DEST_AP, DEST_SCP, DEST_MCP, DEST_ACCEL, DEST_IO, DEST_OTHER_DIE } int_dest_e;
+localparam int INT_DEST_COUNT = 6;
+
+// Packed set of interrupt_map indices: bit i stands for interrupt_map[i]
+localparam int INT_MAP_MAX_ENTRIES = 1024;
+typedef bit [INT_MAP_MAX_ENTRIES-1:0] int_map_bitmap_t;
+
 // Defines the structure for a single interrupt entry in our model
 typedef struct {
     string               name;
@@ -43,6 +51,8 @@ typedef struct {
     interrupt_polarity_e polarity;
     string               rtl_path_src; // RTL path to force the interrupt source
     int                  pulse_width_ns; // Width of pulse interrupt in nanoseconds (only for PULSE type)
+    int                  width;          // Number of bits: 1 for a single interrupt, >1 for a ranged vector entry
+                                         // whose paths are part-selects and whose indices refer to bit 0
 
     // Destination routing information and check paths
     bit                  to_ap;
@@ -65,6 +75,82 @@ typedef struct {
     int                  dest_index_other_die; // Index in destination interrupt vector
 } interrupt_info_s;
 
+// Returns the path of one bit of a part-select path, e.g. ("a.sig[16:0]", 3) -> "a.sig[3]".
+// Paths without a part-select are returned unchanged.
+function automatic string get_vector_bit_path(string path, int bit_index);
+    int msb, lsb;
+    int open_pos = -1;
+
+    for (int i = path.len() - 1; i >= 0; i--) begin
+        if (path[i] == "[") begin
+            open_pos = i;
+            break;
+        end
+    end
+    if (open_pos <= 0 || $sscanf(path.substr(open_pos, path.len() - 1), "[%d:%d]", msb, lsb) != 2) return path;
+    return $sformatf("%s[%0d]", path.substr(0, open_pos - 1), (msb >= lsb) ? lsb + bit_index : lsb - bit_index);
+endfunction
+
+// Splits a bit- or part-select path into its whole signal and the selected bits, e.g.
+// "a.sig[16:8]" -> ("a.sig", lsb 8, width 9) and "a.sig[3]" -> ("a.sig", 3, 1), so that
+// the signal can be accessed with uvm_hdl_read/uvm_hdl_force as a whole (HDL access to
+// selects is simulator dependent). Returns 0 for paths without a select.
+function automatic bit split_select_path(string path, output string signal, output int lsb, output int width);
+    int msb;
+    int open_pos = -1;
+
+    for (int i = path.len() - 1; i >= 0; i--) begin
+        if (path[i] == "[") begin
+            open_pos = i;
+            break;
+        end
+    end
+    if (open_pos <= 0 || path[path.len() - 1] != "]") return 0;
+    if ($sscanf(path.substr(open_pos, path.len() - 1), "[%d:%d]", msb, lsb) != 2) begin
+        if ($sscanf(path.substr(open_pos, path.len() - 1), "[%d]", msb) != 1) return 0;
+        lsb = msb;
+    end
+    signal = path.substr(0, open_pos - 1);
+    width = (msb >= lsb) ? msb - lsb + 1 : lsb - msb + 1;
+    if (msb < lsb) lsb = msb;
+    return 1;
+endfunction
+
+// Reads a path, selects through their whole signal (see split_select_path).
+// The value holds the selected bits from bit 0. Returns 0 if the read failed.
+function automatic bit read_select_path(string path, output uvm_hdl_data_t value);
+    string signal;
+    int lsb, width;
+
+    if (!split_select_path(path, signal, lsb, width)) return uvm_hdl_read(path, value);
+    if (!uvm_hdl_read(signal, value)) return 0;
+    value = (value >> lsb) & ((uvm_hdl_data_t'(1) << width) - 1);
+    return 1;
+endfunction
+
+// Returns the single-bit view of bit 'bit_index' of a ranged vector entry.
+// Bit views are named "<name>_<bit>", which is also the key used by the mask tables.
+function automatic interrupt_info_s get_vector_bit(interrupt_info_s info, int bit_index);
+    interrupt_info_s bit_info = info;
+
+    bit_info.name  = $sformatf("%s_%0d", info.name, bit_index);
+    bit_info.width = 1;
+    bit_info.rtl_path_src       = get_vector_bit_path(info.rtl_path_src, bit_index);
+    bit_info.rtl_path_ap        = get_vector_bit_path(info.rtl_path_ap, bit_index);
+    bit_info.rtl_path_scp       = get_vector_bit_path(info.rtl_path_scp, bit_index);
+    bit_info.rtl_path_mcp       = get_vector_bit_path(info.rtl_path_mcp, bit_index);
+    bit_info.rtl_path_accel     = get_vector_bit_path(info.rtl_path_accel, bit_index);
+    bit_info.rtl_path_io        = get_vector_bit_path(info.rtl_path_io, bit_index);
+    bit_info.rtl_path_other_die = get_vector_bit_path(info.rtl_path_other_die, bit_index);
+    if (info.dest_index_ap >= 0)        bit_info.dest_index_ap        = info.dest_index_ap + bit_index;
+    if (info.dest_index_scp >= 0)       bit_info.dest_index_scp       = info.dest_index_scp + bit_index;
+    if (info.dest_index_mcp >= 0)       bit_info.dest_index_mcp       = info.dest_index_mcp + bit_index;
+    if (info.dest_index_accel >= 0)     bit_info.dest_index_accel     = info.dest_index_accel + bit_index;
+    if (info.dest_index_io >= 0)        bit_info.dest_index_io        = info.dest_index_io + bit_index;
+    if (info.dest_index_other_die >= 0) bit_info.dest_index_other_die = info.dest_index_other_die + bit_index;
+    return bit_info;
+endfunction
+
 localparam int PSUB_MASK_WIDTH = 20; // [19:0]
 localparam int PCIE1_MASK_WIDTH = 20; // [19:0]
 
@@ -6,10 +6,97 @@
 class int_lightweight_sequence extends int_base_sequence;
     `uvm_object_utils(int_lightweight_sequence)
 
+    // Regression sharding (see tools/plan_regression_shards.py)
+    // +INT_SHARD_ID=<k> restricts the run to the units of work assigned to shard k: an
+    // interrupt_map entry, or for merge interrupts each source test (source set) and the
+    // multi-source test (source "")
+    typedef struct {
+        int    shard;
+        string name;
+        string source;
+    } int_shard_entry_s;
+
+    int_shard_entry_s shard_schedule[$];
+    int shard_id = -1;
+    bit shard_members[string];    // entries with any unit in this shard
+    bit shard_units[string];      // units of this shard ("name" or "merge/source")
+    bit scheduled_units[string];  // units of all shards
+
     function new(string name = "int_lightweight_sequence");
         super.new(name);
     endfunction
 
+    // Load the generated shard schedule and select this run's shard
+    function void build_shard_schedule();
+        int_shard_entry_s shard_entry;
+
+        if (!$value$plusargs("INT_SHARD_ID=%d", shard_id)) begin
+            shard_id = -1;
+            return;
+        end
+
+        if (shard_schedule.size() == 0) begin
+`include "int_shard_schedule.svh"
+        end
+
+        shard_members.delete();
+        shard_units.delete();
+        scheduled_units.delete();
+        foreach (shard_schedule[i]) begin
+            string unit = get_shard_unit(shard_schedule[i].name, shard_schedule[i].source);
+
+            scheduled_units[unit] = 1;
+            if (shard_schedule[i].shard == shard_id) begin
+                shard_members[shard_schedule[i].name] = 1;
+                shard_units[unit] = 1;
+            end
+        end
+
+        // Map entries the schedule does not know (stale schedule) run in shard 0
+        foreach (m_routing_model.interrupt_map[i]) begin
+            string name = m_routing_model.interrupt_map[i].name;
+
+            if (scheduled_units.exists(name)) continue;
+            `uvm_warning(get_type_name(), $sformatf("Interrupt '%s' is in no shard and is checked in shard 0. Regenerate int_shard_schedule.svh.", name))
+            scheduled_units[name] = 1;
+            if (shard_id == 0) begin
+                shard_members[name] = 1;
+                shard_units[name] = 1;
+            end
+        end
+
+        if (shard_members.size() == 0) begin
+            `uvm_warning(get_type_name(), $sformatf("Shard %0d has no interrupts assigned. Regenerate int_shard_schedule.svh.", shard_id))
+        end
+        `uvm_info(get_type_name(), $sformatf("Running regression shard %0d with %0d interrupts", shard_id, shard_members.size()), UVM_LOW)
+    endfunction
+
+    // Shard schedule key of a unit of work
+    function string get_shard_unit(string interrupt_name, string source_name = "");
+        return (source_name == "") ? interrupt_name : {interrupt_name, "/", source_name};
+    endfunction
+
+    // Check whether an interrupt has work in the selected shard (always true when not sharded)
+    function bit is_in_current_shard(string interrupt_name);
+        if (shard_id < 0) return 1;
+        return shard_members.exists(interrupt_name);
+    endfunction
+
+    // Check whether a unit of work belongs to the selected shard: the check of an entry or the
+    // multi-source test of a merge (no source), or the test of one merge source. A merge source
+    // the schedule does not know runs with the multi-source test of its merge.
+    function bit is_unit_in_current_shard(string interrupt_name, string source_name = "");
+        string unit = get_shard_unit(interrupt_name, source_name);
+
+        if (shard_id < 0) return 1;
+        if (scheduled_units.exists(unit)) return shard_units.exists(unit);
+        `uvm_warning(get_type_name(), $sformatf("Merge source test '%s' is in no shard and runs with '%s'. Regenerate int_shard_schedule.svh.",
+                     unit, interrupt_name))
+        scheduled_units[unit] = 1;
+        if (shard_units.exists(interrupt_name)) shard_units[unit] = 1;
+        return shard_units.exists(unit);
+    endfunction
+
     // Helper function to check if interrupt routing should be skipped
     // Skip interrupts that have no routing destinations (merge sources)
     // Skip interrupts that only route to other_die or io destinations
@@ -70,6 +157,7 @@ class int_lightweight_sequence extends int_base_sequence;
         // Build the interrupt model database
         `uvm_info(get_type_name(), "Building interrupt routing model database", UVM_HIGH)
         m_routing_model.build();
+        build_shard_schedule();
 
         if (m_routing_model.interrupt_map.size() == 0) begin
             `uvm_warning(get_type_name(), "Interrupt map is empty. No checks will be performed.")
@@ -82,6 +170,7 @@ class int_lightweight_sequence extends int_base_sequence;
         // Iterate over all interrupts in the model and check their routing
         `uvm_info(get_type_name(), "Beginning iteration through all interrupts in the model", UVM_DEBUG)
         foreach (m_routing_model.interrupt_map[i]) begin
+            if (!is_in_current_shard(m_routing_model.interrupt_map[i].name)) continue;
             `uvm_info(get_type_name(), $sformatf("Processing interrupt %0d of %0d: %s",
                      i+1, m_routing_model.interrupt_map.size(),
                      m_routing_model.interrupt_map[i].name), UVM_DEBUG)
@@ -189,13 +278,14 @@ class int_lightweight_sequence extends int_base_sequence;
         `uvm_info(get_type_name(), $sformatf("Testing each source interrupt individually for merge interrupt: %s",
                  merge_info.name), UVM_HIGH)
         foreach (source_interrupts[i]) begin
+            if (!is_unit_in_current_shard(merge_info.name, source_interrupts[i].name)) continue;
             `uvm_info(get_type_name(), $sformatf("Testing source interrupt %0d of %0d: %s",
                      i+1, num_sources, source_interrupts[i].name), UVM_DEBUG)
             test_merge_source(merge_info, source_interrupts[i]);
         end
 
         // Test multiple sources simultaneously if there are multiple sources
-        if (num_sources > 1) begin
+        if (num_sources > 1 && is_unit_in_current_shard(merge_info.name)) begin
             `uvm_info(get_type_name(), $sformatf("Testing multiple sources simultaneously for merge interrupt: %s",
                      merge_info.name), UVM_MEDIUM)
             test_multiple_merge_sources(merge_info, source_interrupts);
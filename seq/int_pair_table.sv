@@ -0,0 +1,180 @@
+`ifndef INT_PAIR_TABLE_SV
+`define INT_PAIR_TABLE_SV
+
+// Dense integer IDs of (interrupt, destination) pairs, generated with the interrupt map
+// (see tools/pair_ids.py). Every routed pair of the map, vector entries bit by bit, has an
+// ID in [0, generated_pairs). Pairs outside the table (e.g. an expectation on a destination
+// the map does not route to) get the next free ID on first use, so no pair is ever lost.
+// Merge paths (source -> merge interrupt -> destination) are numbered in [0, merge_paths.size()).
+// Once the interrupt map is built, the IDs of every entry are also held by interrupt_map index
+// (index_entries), so components that know the entry resolve pairs without name lookups.
+class int_pair_table extends uvm_object;
+    `uvm_object_utils(int_pair_table)
+
+    typedef struct {
+        int    pair_id;   // pair of the merge interrupt and destination
+        string source;    // stimulable source interrupt
+    } int_merge_path_s;
+
+    static int    pair_ids[string][INT_DEST_COUNT];  // name -> ID per destination (int_dest_e order), -1 if not routed
+    static string pair_keys[$];                      // ID -> "name@DEST"
+    static int    extra_pair_ids[string];            // "name@DEST" -> ID of pairs outside the table
+    static int    generated_pairs = 0;
+    static bit    built = 0;
+
+    static int_merge_path_s merge_paths[$];          // merge path ID -> merge pair and source
+    static int              pair_merge_paths[int][$]; // merge pair ID -> its merge path IDs
+    static string           source_merges[string][$]; // source -> merge interrupts it drives, nested merges included
+
+    // interrupt_map index -> ID per (bit, destination) at [bit * INT_DEST_COUNT + destination], -1 if none
+    static int entry_pair_ids[$][$];
+
+    static string dest_names[INT_DEST_COUNT] = '{"AP", "SCP", "MCP", "ACCEL", "IO", "OTHER_DIE"};
+
+    function new(string name = "int_pair_table");
+        super.new(name);
+    endfunction
+
+    // Load the generated pair ID table
+    static function void build();
+        int_merge_path_s merge_path;
+
+        if (built) return; // guard against multiple builds
+        built = 1;
+
+`include "int_pair_ids.svh"
+
+        repeat (generated_pairs) pair_keys.push_back("");
+        foreach (pair_ids[name]) begin
+            foreach (pair_ids[name][d]) begin
+                if (pair_ids[name][d] >= 0) pair_keys[pair_ids[name][d]] = {name, "@", dest_names[d]};
+            end
+        end
+        foreach (merge_paths[p]) begin
+            pair_merge_paths[merge_paths[p].pair_id].push_back(p);
+            add_source_merge(merge_paths[p].source, get_pair_key(merge_paths[p].pair_id));
+        end
+    endfunction
+
+    // Record the merge interrupt of a merge pair key ("name@DEST") once per source
+    static function void add_source_merge(string source, string merge_key);
+        string merge_name = merge_key;
+
+        for (int i = 0; i < merge_key.len(); i++) begin
+            if (merge_key[i] == "@") begin
+                merge_name = merge_key.substr(0, i - 1);
+                break;
+            end
+        end
+        if (source_merges.exists(source)) begin
+            foreach (source_merges[source][m]) begin
+                if (source_merges[source][m] == merge_name) return;
+            end
+        end
+        source_merges[source].push_back(merge_name);
+    endfunction
+
+    // Merge interrupts a stimulable source drives, directly or through nested merges
+    static function void get_source_merges(string source, ref string merges[$]);
+        build();
+        merges.delete();
+        if (source_merges.exists(source)) merges = source_merges[source];
+    endfunction
+
+    // Destination name ("AP", ..., "OTHER_DIE") -> int_dest_e index, -1 if unknown
+    static function int get_dest_index(string destination);
+        case (destination)
+            "AP":        return DEST_AP;
+            "SCP":       return DEST_SCP;
+            "MCP":       return DEST_MCP;
+            "ACCEL":     return DEST_ACCEL;
+            "IO":        return DEST_IO;
+            "OTHER_DIE": return DEST_OTHER_DIE;
+            default:     return -1;
+        endcase
+    endfunction
+
+    // ID of a pair, -1 if it was never assigned one
+    static function int get_pair_id(string interrupt_name, string destination);
+        int d = get_dest_index(destination);
+        string key;
+
+        build();
+        if (d >= 0 && pair_ids.exists(interrupt_name) && pair_ids[interrupt_name][d] >= 0) begin
+            return pair_ids[interrupt_name][d];
+        end
+        key = {interrupt_name, "@", destination};
+        return extra_pair_ids.exists(key) ? extra_pair_ids[key] : -1;
+    endfunction
+
+    // ID of a pair, assigning the next free ID to pairs outside the table
+    static function int get_or_add_pair_id(string interrupt_name, string destination);
+        int id = get_pair_id(interrupt_name, destination);
+        string key;
+
+        if (id >= 0) return id;
+        key = {interrupt_name, "@", destination};
+        id = pair_keys.size();
+        extra_pair_ids[key] = id;
+        pair_keys.push_back(key);
+        return id;
+    endfunction
+
+    // Resolve the IDs of every interrupt_map entry (vector entries bit by bit) once
+    static function void index_entries(const ref interrupt_info_s map[$]);
+        int ids[$];
+
+        build();
+        entry_pair_ids.delete();
+        foreach (map[i]) begin
+            ids.delete();
+            for (int b = 0; b < ((map[i].width > 1) ? map[i].width : 1); b++) begin
+                for (int d = 0; d < INT_DEST_COUNT; d++) begin
+                    ids.push_back(get_pair_id((map[i].width > 1) ? $sformatf("%s_%0d", map[i].name, b) : map[i].name,
+                                              dest_names[d]));
+                end
+            end
+            entry_pair_ids.push_back(ids);
+        end
+    endfunction
+
+    // ID of a pair of an interrupt_map entry (bit 0 for single-bit entries), -1 if the
+    // entry table has none (entry not indexed, or destination not routed in the map)
+    static function int get_entry_pair_id(int map_index, int bit_index, int dest);
+        if (map_index < 0 || map_index >= entry_pair_ids.size() ||
+            bit_index * INT_DEST_COUNT + dest >= entry_pair_ids[map_index].size()) return -1;
+        return entry_pair_ids[map_index][bit_index * INT_DEST_COUNT + dest];
+    endfunction
+
+    // IDs of the destinations an interrupt (every bit of a ranged entry) is routed to in info.
+    // With the interrupt_map index (and bit of a single-bit view) the IDs come from the entry
+    // table; pairs it does not hold (e.g. routes enabled at run time) are resolved by name.
+    static function void get_info_pair_ids(interrupt_info_s info, int map_index, int bit_index, ref int ids[$]);
+        bit routed[INT_DEST_COUNT] = '{info.to_ap, info.to_scp, info.to_mcp, info.to_accel, info.to_io, info.to_other_die};
+        int id;
+
+        for (int b = 0; b < ((info.width > 1) ? info.width : 1); b++) begin
+            for (int d = 0; d < INT_DEST_COUNT; d++) begin
+                if (!routed[d]) continue;
+                id = get_entry_pair_id(map_index, bit_index + b, d);
+                if (id < 0) id = get_or_add_pair_id((info.width > 1) ? $sformatf("%s_%0d", info.name, b) : info.name,
+                                                    dest_names[d]);
+                ids.push_back(id);
+            end
+        end
+    endfunction
+
+    // Number of IDs assigned so far (generated and added at run time)
+    static function int size();
+        build();
+        return pair_keys.size();
+    endfunction
+
+    // "name@DEST" of an ID
+    static function string get_pair_key(int id);
+        build();
+        return (id >= 0 && id < pair_keys.size()) ? pair_keys[id] : "";
+    endfunction
+endclass
+
+`endif // INT_PAIR_TABLE_SV
@@ -75,6 +75,7 @@ class int_register_model extends uvm_object;
     // Instance variables to store register base address and current mask values
     bit[63:0] interrupt_reg_base;
     logic [31:0] current_mask_values[logic [31:0]];  // Cache for mask values
+    int unsigned mask_version;                        // Bumped on every change of the cache
 
     // Constructor
     function new(string name = "int_register_model");
@@ -90,6 +91,7 @@ class int_register_model extends uvm_object;
 
         // Clear the mask value cache
         current_mask_values.delete();
+        mask_version++;
 
         `uvm_info("INT_REG_MODEL", "Hardware register model initialized", UVM_MEDIUM)
     endtask
@@ -106,6 +108,7 @@ class int_register_model extends uvm_object;
 
         // Cache the written value for mask checking
         current_mask_values[addr] = data;
+        mask_version++;
     endtask
 
     // Read from hardware register using reg_seq (like tc_int_sanity.sv)
@@ -216,6 +219,42 @@ class int_register_model extends uvm_object;
         `uvm_info("INT_REG_MODEL", "Mask registers randomized for test initialization", UVM_MEDIUM)
     endtask
 
+    // Directed mask configurations (see tools/plan_mask_configs.py)
+    // +INT_MASK_CONFIG=<n> programs configuration n instead of random masks
+    typedef struct {
+        int          config_id;
+        logic [31:0] addr;
+        logic [31:0] value;
+    } int_mask_config_entry_s;
+
+    int_mask_config_entry_s mask_config_table[$];
+
+    // Load the generated mask configuration table
+    function void build_mask_config_table();
+        int_mask_config_entry_s mask_cfg_entry;
+
+        if (mask_config_table.size() > 0) return; // guard against multiple builds
+
+`include "int_mask_configs.svh"
+    endfunction
+
+    // Program every mask register of one directed configuration
+    task apply_mask_config(int config_id, output bit applied);
+        applied = 0;
+        build_mask_config_table();
+
+        foreach (mask_config_table[i]) begin
+            if (mask_config_table[i].config_id == config_id) begin
+                write_register(mask_config_table[i].addr, mask_config_table[i].value);
+                applied = 1;
+            end
+        end
+
+        if (applied) begin
+            `uvm_info("INT_REG_MODEL", $sformatf("Mask registers programmed with directed configuration %0d", config_id), UVM_MEDIUM)
+        end
+    endtask
+
     // Update status register (called when interrupt occurs)
     // Note: Status registers are typically read-only and updated by hardware
     // This function is kept for compatibility but may not be needed for hardware model
@@ -226,200 +265,62 @@ class int_register_model extends uvm_object;
         // This function is kept for compatibility with existing code
     endfunction
 
-    function bit check_source_domain_mask(interrupt_info_s info);
-        logic [31:0] mask_value;
-        int bit_idx;
-        
-        bit_idx = info.index;
-        case (info.group)
-            PSUB: begin
-                if (bit_idx < 0 || bit_idx >= PSUB_MASK_WIDTH)  return 0; // 超出掩码范围，视为不受 PSUB 源域层屏蔽
-                if (!current_mask_values.exists(ADDR_MASK_PSUB_TO_IOSUB_INTR)) return 0; // 未写入时默认全使能
-                mask_value = current_mask_values[ADDR_MASK_PSUB_TO_IOSUB_INTR];
-            end
-            PCIE1: begin
-                if (bit_idx < 0 || bit_idx >= PCIE1_MASK_WIDTH) return 0; // 超出掩码范围，视为不受 PCIE1 源域层屏蔽
-                if (!current_mask_values.exists(ADDR_MASK_PCIE1_TO_IOSUB_INTR)) return 0; // 未写入时默认全使能
-                mask_value = current_mask_values[ADDR_MASK_PCIE1_TO_IOSUB_INTR];
-            end
-            default: return 0; // Do not handle other group
-        endcase
+    // Mask bit positions per layer, generated with the interrupt map (see tools/mask_layout.py)
+    // Keys are interrupt names, or int_pair_table pair IDs for destination-dependent layers.
+    // An interrupt missing from a table is not gated by that layer.
+    typedef struct {
+        bit          always_masked;
+        logic [31:0] addr;
+        int          bit_idx;
+    } int_mask_pos_s;
+
+    int_mask_pos_s source_domain_mask_pos[string];
+    int_mask_pos_s level_pulse_mask_pos[string];
+    int_mask_pos_s pll_mask_pos[string];
+    int_mask_pos_s iosub_normal_mask_pos[int];
+    int_mask_pos_s general_mask_pos[int];
+    bit mask_tables_built = 0;
 
-        return ~mask_value[bit_idx]; // 1=masked, 0=enabled
+    // Load the generated mask position tables
+    function void build_mask_tables();
+        int_mask_pos_s mask_pos;
+
+        if (mask_tables_built) return; // guard against multiple builds
+        mask_tables_built = 1;
+
+`include "int_mask_tables.svh"
     endfunction
 
-    function bit get_pll_type_and_bit(string name, output pll_type_e t, output int bit_idx);
-        // 默认无效
-        t = PLL_T_LOCK;
-        bit_idx = -1;
-            
-            
-        `uvm_info("INT_REG_MODEL", $sformatf("name.substr : %s .", name.substr(0,10)), UVM_HIGH)
-    
-        // 合并信号不做“按源”判定
-        if (name.substr(0, 15) == "merge_pll_intr_")
-            return 0;
-    
-        // 事件类型判定（先长串，避免误匹配）
-        if      (name.match("*intdocfrac_err*"))     t = PLL_T_INTDOCFRAC_ERR;
-        else if (name.match("*frechange_tot*"))      t = PLL_T_FRECHANGE_TOT_DONE;
-        else if (name.match("*frechangedone*"))      t = PLL_T_FRECHANGEDONE;
-        else if (name.match("*_unlock*"))            t = PLL_T_UNLOCK;
-        else if (name.match("*_lock*"))              t = PLL_T_LOCK;
-        else return 0;
-
-        `uvm_info("INT_REG_MODEL", $sformatf("name.substr : %s .", name.substr(0,10)), UVM_HIGH)
-
-        // 判定 25bit 的位号（从高位到低位）
-        if      (name.substr(0, 10) == "accel_pll_") bit_idx = 24;
-        else if (name.substr(0, 9 ) == "psub_pll_")  bit_idx = 23;
-        else if (name.substr(0, 10) == "pcie1_pll_") bit_idx = 22;
-        else if (name.substr(0, 10) == "iosub_pll_") bit_idx = 21;
-        else if (name.substr(0, 8 ) == "d2d_pll_")   bit_idx = 20;
-        else if (name.substr(0, 9 ) == "ddr2_pll_")  bit_idx = 19;
-        else if (name.substr(0, 9 ) == "ddr1_pll_")  bit_idx = 18;
-        else if (name.substr(0, 9 ) == "ddr0_pll_")  bit_idx = 17;
-        else if (name.substr(0, 14) == "csub_pll_intr_") begin
-            // csub 需要解析末尾索引 0..16
-            int idx;
-            // 按事件类型分别解析（避免误判）
-            if      ($sscanf(name, "csub_pll_intr_lock_%0d", idx)              == 1) bit_idx = idx;
-            else if ($sscanf(name, "csub_pll_intr_unlock_%0d", idx)            == 1) bit_idx = idx;
-            else if ($sscanf(name, "csub_pll_intr_frechangedone_%0d", idx)     == 1) bit_idx = idx;
-            else if ($sscanf(name, "csub_pll_intr_frechange_tot_done_%0d", idx)== 1) bit_idx = idx;
-            else if ($sscanf(name, "csub_pll_intr_intdocfrac_err_%0d", idx)    == 1) bit_idx = idx;
-            else return 0;
-            if (idx < 0 || idx > 16) return 0;
-        end
-        else return 0;
-        
-        `uvm_info("INT_REG_MODEL", $sformatf("name.substr : %s .", name.substr(0,10)), UVM_HIGH)
-    
-        return (bit_idx >= 0 && bit_idx < PLL_MASK_WIDTH);
+    // Check one table position against the cached mask value (1=masked, 0=enabled)
+    function bit is_mask_pos_masked(int_mask_pos_s pos);
+        if (pos.always_masked) return 1;
+        if (!current_mask_values.exists(pos.addr)) return 0; // 未写入时默认全使能
+        return ~current_mask_values[pos.addr][pos.bit_idx];
+    endfunction
+
+    function bit check_source_domain_mask(interrupt_info_s info);
+        build_mask_tables();
+        if (!source_domain_mask_pos.exists(info.name)) return 0; // 非 PSUB/PCIE1 源或超出掩码范围
+        return is_mask_pos_masked(source_domain_mask_pos[info.name]);
     endfunction
-    
+
     function bit check_pll_mask_layer(string name);
-        pll_type_e t;
-        int bit_idx;
-        logic [31:0] mask_value;
-        logic [31:0] addr;
-    
-        if (!get_pll_type_and_bit(name, t, bit_idx)) begin
-            `uvm_info("INT_REG_MODEL", $sformatf("Non-PLL source '%s', not subject to PLL mask layer", name), UVM_HIGH)
-            return 0; // 非 PLL 源或无法识别，视为不受 PLL 源层屏蔽
-        end
-        
-        `uvm_info("INT_REG_MODEL", $sformatf("PLL source '%s', mask_value : %h, addr : %h, bit_idx : %h .", name, mask_value, addr, bit_idx), UVM_HIGH)
-    
-        case (t)
-            PLL_T_LOCK:               addr = ADDR_MASK_PLL_INTR_0;
-            PLL_T_UNLOCK:             addr = ADDR_MASK_PLL_INTR_1;
-            PLL_T_FRECHANGEDONE:      addr = ADDR_MASK_PLL_INTR_2;
-            PLL_T_FRECHANGE_TOT_DONE: addr = ADDR_MASK_PLL_INTR_3;
-            PLL_T_INTDOCFRAC_ERR:     addr = ADDR_MASK_PLL_INTR_4;
-            default: return 0;
-        endcase
-    
-        // 未写入缓存时，默认“全1=未屏蔽”
-        if (!current_mask_values.exists(addr)) return 0;
-    
-        mask_value = current_mask_values[addr];
-        `uvm_info("INT_REG_MODEL", $sformatf("PLL source '%s', mask_value : %h, addr : %h, bit_idx : %h .", name, mask_value, addr, bit_idx), UVM_HIGH)
-        if (bit_idx < 0 || bit_idx >= PLL_MASK_WIDTH) return 0;
-    
-        // 位为0 → masked；位为1 → enabled
-        return ~mask_value[bit_idx];
+        build_mask_tables();
+        if (!pll_mask_pos.exists(name)) return 0; // 非 PLL 源或无法识别，视为不受 PLL 源层屏蔽
+        return is_mask_pos_masked(pll_mask_pos[name]);
     endfunction
 
     // Check Level/Pulse interrupt mask layer
     function bit check_level_pulse_mask_layer(string interrupt_name);
-        logic [31:0] mask_value;
-        int bit_idx = -1;
-        bit is_level = 0;
-        bit is_pulse = 0;
-        logic [31:0] addr;
-        
-        `uvm_info("INT_REG_MODEL", $sformatf("Checking Level/Pulse mask for interrupt: %s", interrupt_name), UVM_HIGH)
-        
-        // Check if this is a Level interrupt
-        if (interrupt_name.match("iosub_pad_in_[0-9]+_intr_level")) begin
-            // Extract pad index from interrupt name (0-15)
-            int pad_idx;
-            if ($sscanf(interrupt_name, "iosub_pad_in_%0d_intr_level", pad_idx) == 1) begin
-                if (pad_idx >= 0 && pad_idx <= 15) begin
-                    bit_idx = pad_idx;
-                    is_level = 1;
-                    addr = ADDR_LEVEL_INTR_ENABLE;
-                end
-            end
-        end else if (interrupt_name == "iosub_nic400_in_slverr_wr_intr") begin
-            bit_idx = 16;
-            is_level = 1;
-            addr = ADDR_LEVEL_INTR_ENABLE;
-        end else if (interrupt_name == "iosub_nic400_in_slverr_rd_intr") begin
-            bit_idx = 17;
-            is_level = 1;
-            addr = ADDR_LEVEL_INTR_ENABLE;
-        end else if (interrupt_name == "iosub_nic400_out_slverr_wr_intr") begin
-            bit_idx = 18;
-            is_level = 1;
-            addr = ADDR_LEVEL_INTR_ENABLE;
-        end else if (interrupt_name == "iosub_nic400_out_slverr_rd_intr") begin
-            bit_idx = 19;
-            is_level = 1;
-            addr = ADDR_LEVEL_INTR_ENABLE;
-        end else if (interrupt_name == "iosub_apb1ton_pslverr_intr") begin
-            bit_idx = 20;
-            is_level = 1;
-            addr = ADDR_LEVEL_INTR_ENABLE;
-        end
-        
-        // Check if this is a Pulse interrupt
-        else if (interrupt_name.match("iosub_pad_in_[0-9]+_intr_pulse")) begin
-            // Extract pad index from interrupt name (0-15)
-            int pad_idx;
-            if ($sscanf(interrupt_name, "iosub_pad_in_%0d_intr_pulse", pad_idx) == 1) begin
-                if (pad_idx >= 0 && pad_idx <= 15) begin
-                    bit_idx = pad_idx;
-                    is_pulse = 1;
-                    addr = ADDR_PULSE_INTR_ENABLE;
-                end
-            end
-        end else if (interrupt_name == "iosub_mem_ist_intr") begin
-            bit_idx = 16;
-            is_pulse = 1;
-            addr = ADDR_PULSE_INTR_ENABLE;
-        end else if (interrupt_name == "iosub_dw_axi_dlock_intr") begin
-            bit_idx = 17;
-            is_pulse = 1;
-            addr = ADDR_PULSE_INTR_ENABLE;
-        end
-        
-        // If not a Level/Pulse interrupt, return unmasked
-        if (!is_level && !is_pulse) begin
-            `uvm_info("INT_REG_MODEL", $sformatf("Interrupt '%s' is not a Level/Pulse interrupt, not masked", interrupt_name), UVM_HIGH)
-            return 0;
-        end
-        
-        // If bit index is invalid, return masked for safety
-        if (bit_idx < 0) begin
-            `uvm_info("INT_REG_MODEL", $sformatf("Invalid bit index for interrupt '%s', assuming masked", interrupt_name), UVM_MEDIUM)
-            return 1;
-        end
-        
-        // Get mask value from cache if available, otherwise assume enabled
-        if (current_mask_values.exists(addr)) begin
-            mask_value = current_mask_values[addr];
-            `uvm_info("INT_REG_MODEL", $sformatf("Found cached mask value: addr=0x%08x, value=0x%08x", addr, mask_value), UVM_HIGH)
-        end else begin
-            mask_value = 32'hFFFF_FFFF; // Default to enabled if not cached
-            `uvm_info("INT_REG_MODEL", $sformatf("No cached mask value for addr=0x%08x, using default 0x%08x (all enabled)", addr, mask_value), UVM_MEDIUM)
-        end
-        
-        // Return 1 if masked (bit is 0), 0 if enabled (bit is 1)
-        bit result = ~mask_value[bit_idx];
-        `uvm_info("INT_REG_MODEL", $sformatf("Level/Pulse mask result: interrupt='%s', addr=0x%08x, bit_idx=%0d, mask_bit=%b, result=%s",
-                  interrupt_name, addr, bit_idx, mask_value[bit_idx], result ? "BLOCKED" : "PASSED"), UVM_HIGH)
+        bit result;
+
+        build_mask_tables();
+        if (!level_pulse_mask_pos.exists(interrupt_name)) return 0; // Not a Level/Pulse interrupt
+
+        result = is_mask_pos_masked(level_pulse_mask_pos[interrupt_name]);
+        `uvm_info("INT_REG_MODEL", $sformatf("Level/Pulse mask result: interrupt='%s', addr=0x%08x, bit_idx=%0d, result=%s",
+                  interrupt_name, level_pulse_mask_pos[interrupt_name].addr, level_pulse_mask_pos[interrupt_name].bit_idx,
+                  result ? "BLOCKED" : "PASSED"), UVM_HIGH)
         return result;
     endfunction
 
@@ -566,311 +467,35 @@ class int_register_model extends uvm_object;
         `uvm_info("INT_REG_MODEL", "=== End Hardware Status Registers ===", UVM_MEDIUM)
     endtask
 
-    // Get interrupt sub_index from interrupt map (for IOSUB normal interrupts)
-    function int get_interrupt_sub_index(string interrupt_name, int_routing_model routing_model);
-        `uvm_info("INT_REG_MODEL", $sformatf(" Searching sub_index for interrupt: %s", interrupt_name), UVM_HIGH)
-
-        // Search through interrupt map to find the sub_index for this interrupt
-        foreach (routing_model.interrupt_map[i]) begin
-            if (routing_model.interrupt_map[i].name == interrupt_name) begin
-                `uvm_info("INT_REG_MODEL", $sformatf("✅ Found interrupt '%s' at map index %0d, sub_index=%0d",
-                          interrupt_name, i, routing_model.interrupt_map[i].index), UVM_HIGH)
-                return routing_model.interrupt_map[i].index;
-            end
-        end
-        `uvm_info("INT_REG_MODEL", $sformatf("❌ Interrupt '%s' not found in routing model", interrupt_name), UVM_MEDIUM)
-        return -1; // Not found
-    endfunction
-
-    // Get interrupt destination index from interrupt map (for SCP/MCP general interrupts)
-    function int get_interrupt_dest_index(string interrupt_name, string destination, int_routing_model routing_model);
-        `uvm_info("INT_REG_MODEL", $sformatf(" Searching dest_index for interrupt: %s, destination: %s", interrupt_name, destination), UVM_HIGH)
-
-        // Search through interrupt map to find the dest_index for this interrupt and destination
-        foreach (routing_model.interrupt_map[i]) begin
-            if (routing_model.interrupt_map[i].name == interrupt_name) begin
-                `uvm_info("INT_REG_MODEL", $sformatf("✅ Found interrupt '%s' at map index %0d", interrupt_name, i), UVM_HIGH)
-
-                case (destination.toupper())
-                    "SCP": begin
-                        if (routing_model.interrupt_map[i].to_scp == 1) begin
-                            `uvm_info("INT_REG_MODEL", $sformatf(" SCP routing enabled, dest_index_scp=%0d", routing_model.interrupt_map[i].dest_index_scp), UVM_HIGH)
-                            return routing_model.interrupt_map[i].dest_index_scp;
-                        end else begin
-                            `uvm_info("INT_REG_MODEL", $sformatf("❌ SCP routing disabled for interrupt '%s'", interrupt_name), UVM_HIGH)
-                        end
-                    end
-                    "MCP": begin
-                        if (routing_model.interrupt_map[i].to_mcp == 1) begin
-                            `uvm_info("INT_REG_MODEL", $sformatf(" MCP routing enabled, dest_index_mcp=%0d", routing_model.interrupt_map[i].dest_index_mcp), UVM_HIGH)
-                            return routing_model.interrupt_map[i].dest_index_mcp;
-                        end else begin
-                            `uvm_info("INT_REG_MODEL", $sformatf("❌ MCP routing disabled for interrupt '%s'", interrupt_name), UVM_HIGH)
-                        end
-                    end
-                    "ACCEL": begin
-                        if (routing_model.interrupt_map[i].to_accel == 1) begin
-                            `uvm_info("INT_REG_MODEL", $sformatf(" ACCEL routing enabled, dest_index_accel=%0d", routing_model.interrupt_map[i].dest_index_accel), UVM_HIGH)
-                            return routing_model.interrupt_map[i].dest_index_accel;
-                        end else begin
-                            `uvm_info("INT_REG_MODEL", $sformatf("❌ ACCEL routing disabled for interrupt '%s'", interrupt_name), UVM_HIGH)
-                        end
-                    end
-                    "AP": begin
-                        if (routing_model.interrupt_map[i].to_ap == 1) begin
-                            `uvm_info("INT_REG_MODEL", $sformatf(" AP routing enabled, dest_index_ap=%0d", routing_model.interrupt_map[i].dest_index_ap), UVM_HIGH)
-                            return routing_model.interrupt_map[i].dest_index_ap;
-                        end else begin
-                            `uvm_info("INT_REG_MODEL", $sformatf("❌ AP routing disabled for interrupt '%s'", interrupt_name), UVM_HIGH)
-                        end
-                    end
-                    "IO": begin
-                        if (routing_model.interrupt_map[i].to_io == 1) begin
-                            `uvm_info("INT_REG_MODEL", $sformatf(" IO routing enabled, dest_index_io=%0d", routing_model.interrupt_map[i].dest_index_io), UVM_HIGH)
-                            return routing_model.interrupt_map[i].dest_index_io;
-                        end else begin
-                            `uvm_info("INT_REG_MODEL", $sformatf("❌ IO routing disabled for interrupt '%s'", interrupt_name), UVM_HIGH)
-                        end
-                    end
-                    default: begin
-                        `uvm_info("INT_REG_MODEL", $sformatf("❌ Unknown destination '%s' for interrupt '%s'", destination, interrupt_name), UVM_MEDIUM)
-                    end
-                endcase
-                break; // Found the interrupt, no need to continue
-            end
-        end
-        `uvm_info("INT_REG_MODEL", $sformatf("❌ Interrupt '%s' not found or destination '%s' not supported", interrupt_name, destination), UVM_MEDIUM)
-        return -1; // Not found or destination not supported
-    endfunction
-
     // Check IOSUB normal mask layer (Layer 1 of serial mask processing)
     function bit check_iosub_normal_mask_layer(string interrupt_name, string destination, int_routing_model routing_model);
-        logic [31:0] mask_value;
-        logic [31:0] addr;
-        int bit_index;
-        int sub_index;
-        int reg_bit;
+        int pair_id;
         bit result;
 
-        `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Checking IOSUB normal mask for '%s' to '%s'", interrupt_name, destination), UVM_HIGH)
-
-        // Get interrupt sub_index for IOSUB normal interrupts
-        sub_index = get_interrupt_sub_index(interrupt_name, routing_model);
-        `uvm_info("INT_REG_MODEL", $sformatf(" Retrieved sub_index: %0d for interrupt %s", sub_index, interrupt_name), UVM_HIGH)
-
-        if (sub_index < 0) begin
-            `uvm_info("INT_REG_MODEL", $sformatf("❌ Invalid sub_index (%0d) for interrupt %s, assuming not masked", sub_index, interrupt_name), UVM_MEDIUM)
-            return 0;
-        end
-
-        case (destination.toupper())
-            "SCP": begin
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Processing SCP destination for IOSUB normal interrupt"), UVM_HIGH)
-                // IOSUB normal interrupts: 45-bit mask split across 2 registers
-                if (sub_index >= 0 && sub_index <= 9) begin
-                    reg_bit = sub_index;  // Index 0-9 maps to bit 0-9
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Range 0-9: sub_index=%0d → reg_bit=%0d", sub_index, reg_bit), UVM_HIGH)
-                end else if (sub_index >= 15 && sub_index <= 50) begin
-                    reg_bit = sub_index - 5;  // Index 15-50 maps to bit 10-45
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Range 15-50: sub_index=%0d → reg_bit=%0d", sub_index, reg_bit), UVM_HIGH)
-                end else begin
-                    `uvm_info("INT_REG_MODEL", $sformatf("❌ Invalid sub_index range (%0d) for SCP, assuming masked", sub_index), UVM_MEDIUM)
-                    return 1; // Not in valid range, assume masked
-                end
-
-                if (reg_bit <= 31) begin
-                    addr = ADDR_MASK_IOSUB_TO_SCP_NORMAL_INTR_0;  // [31:0]
-                    bit_index = reg_bit;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Using register 0: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else begin
-                    addr = ADDR_MASK_IOSUB_TO_SCP_NORMAL_INTR_1;  // [45:32]
-                    bit_index = reg_bit - 32;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Using register 1: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end
-            end
-
-            "MCP": begin
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Processing MCP destination for IOSUB normal interrupt"), UVM_HIGH)
-                // IOSUB normal interrupts: 45-bit mask split across 2 registers
-                if (sub_index >= 0 && sub_index <= 9) begin
-                    reg_bit = sub_index;  // Index 0-9 maps to bit 0-9
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Range 0-9: sub_index=%0d → reg_bit=%0d", sub_index, reg_bit), UVM_HIGH)
-                end else if (sub_index >= 15 && sub_index <= 50) begin
-                    reg_bit = sub_index - 5;  // Index 15-50 maps to bit 10-45
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Range 15-50: sub_index=%0d → reg_bit=%0d", sub_index, reg_bit), UVM_HIGH)
-                end else begin
-                    `uvm_info("INT_REG_MODEL", $sformatf("❌ Invalid sub_index range (%0d) for MCP, assuming masked", sub_index), UVM_MEDIUM)
-                    return 1; // Not in valid range, assume masked
-                end
-
-                if (reg_bit <= 31) begin
-                    addr = ADDR_MASK_IOSUB_TO_MCP_NORMAL_INTR_0;  // [31:0]
-                    bit_index = reg_bit;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Using register 0: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else begin
-                    addr = ADDR_MASK_IOSUB_TO_MCP_NORMAL_INTR_1;  // [45:32]
-                    bit_index = reg_bit - 32;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Using register 1: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end
-            end
-
-            default: begin
-                `uvm_info("INT_REG_MODEL", $sformatf("❌ Unsupported destination '%s' for IOSUB normal interrupt Layer 1, assuming unmasked", destination), UVM_MEDIUM)
-                return 0; // Unmasked for other destinations
-            end
-        endcase
-
-        // Get mask value from cache if available, otherwise assume enabled
-        if (current_mask_values.exists(addr)) begin
-            mask_value = current_mask_values[addr];
-            `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1: Found cached mask value: addr=0x%08x, value=0x%08x", addr, mask_value), UVM_HIGH)
-        end else begin
-            mask_value = 32'hFFFF_FFFF; // Default to enabled if not cached
-            `uvm_info("INT_REG_MODEL", $sformatf("⚠️  Layer 1: No cached mask value for addr=0x%08x, using default 0x%08x (all enabled)", addr, mask_value), UVM_MEDIUM)
-        end
+        build_mask_tables();
+        pair_id = int_pair_table::get_pair_id(interrupt_name, destination.toupper());
+        if (!iosub_normal_mask_pos.exists(pair_id)) return 0; // Unmasked for other destinations or unknown interrupts
 
-        // Return 1 if masked (bit is 0), 0 if enabled (bit is 1)
-        result = ~mask_value[bit_index];
-        `uvm_info("INT_REG_MODEL", $sformatf(" Layer 1 result: interrupt='%s', dest='%s', addr=0x%08x, bit_index=%0d, mask_bit=%b, result=%s",
-                  interrupt_name, destination, addr, bit_index, mask_value[bit_index], result ? "BLOCKED" : "PASSED"), UVM_HIGH)
+        result = is_mask_pos_masked(iosub_normal_mask_pos[pair_id]);
+        `uvm_info("INT_REG_MODEL", $sformatf("IOSUB normal mask result: %s, addr=0x%08x, bit_idx=%0d, result=%s",
+                  int_pair_table::get_pair_key(pair_id), iosub_normal_mask_pos[pair_id].addr, iosub_normal_mask_pos[pair_id].bit_idx,
+                  result ? "BLOCKED" : "PASSED"), UVM_HIGH)
         return result;
     endfunction
 
     // Check general mask layer (Layer 2 of serial mask processing)
     function bit check_general_mask_layer(string interrupt_name, string destination, int_routing_model routing_model);
-        logic [31:0] mask_value;
-        logic [31:0] addr;
-        int bit_index;
-        int dest_index;
-        int mask_bit;
+        int pair_id;
         bit result;
 
-        `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Checking general mask for '%s' to '%s'", interrupt_name, destination), UVM_HIGH)
-
-        // Get destination index for the interrupt
-        dest_index = get_interrupt_dest_index(interrupt_name, destination, routing_model);
-        `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Retrieved dest_index: %0d for interrupt %s to %s", dest_index, interrupt_name, destination), UVM_HIGH)
-
-        if (dest_index < 0) begin
-            `uvm_info("INT_REG_MODEL", $sformatf("❌ Layer 2: Invalid dest_index (%0d) for interrupt %s to %s, assuming not masked", dest_index, interrupt_name, destination), UVM_MEDIUM)
-            return 0;
-        end
-
-        case (destination.toupper())
-            "SCP": begin
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Processing SCP destination for general interrupt"), UVM_HIGH)
-                // SCP: dest_index_scp maps to cpu_irq[109-239]
-                // mask bit 0-130 corresponds to cpu_irq[109-239]
-                // So mask_bit = dest_index_scp - 109
-                if (dest_index < 109 || dest_index > 239) begin
-                    `uvm_info("INT_REG_MODEL", $sformatf("❌ Layer 2: dest_index (%0d) out of valid SCP cpu_irq range [109-239], assuming masked", dest_index), UVM_MEDIUM)
-                    return 1; // Out of valid cpu_irq range, assume masked
-                end
-
-                mask_bit = dest_index - 109;  // Convert cpu_irq index to mask bit position
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: SCP mapping: dest_index=%0d → mask_bit=%0d", dest_index, mask_bit), UVM_HIGH)
-
-                // Map mask bit to register and bit position
-                if (mask_bit <= 31) begin
-                    addr = ADDR_MASK_IOSUB_TO_SCP_INTR_0;  // [31:0]
-                    bit_index = mask_bit;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using SCP register 0: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 63) begin
-                    addr = ADDR_MASK_IOSUB_TO_SCP_INTR_1;  // [63:32]
-                    bit_index = mask_bit - 32;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using SCP register 1: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 95) begin
-                    addr = ADDR_MASK_IOSUB_TO_SCP_INTR_2;  // [95:64]
-                    bit_index = mask_bit - 64;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using SCP register 2: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 127) begin
-                    addr = ADDR_MASK_IOSUB_TO_SCP_INTR_3;  // [127:96]
-                    bit_index = mask_bit - 96;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using SCP register 3: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 130) begin
-                    addr = ADDR_MASK_IOSUB_TO_SCP_INTR_4;  // [130:128]
-                    bit_index = mask_bit - 128;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using SCP register 4: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else begin
-                    `uvm_info("INT_REG_MODEL", $sformatf("❌ Layer 2: mask_bit (%0d) out of SCP mask range [0-130], assuming masked", mask_bit), UVM_MEDIUM)
-                    return 1; // Out of mask range, assume masked
-                end
-            end
-
-            "MCP": begin
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Processing MCP destination for general interrupt"), UVM_HIGH)
-                // MCP: dest_index_mcp maps to cpu_irq[64-209]
-                // mask bit 0-145 corresponds to cpu_irq[64-209]
-                // So mask_bit = dest_index_mcp - 64
-                if (dest_index < 64 || dest_index > 209) begin
-                    `uvm_info("INT_REG_MODEL", $sformatf("❌ Layer 2: dest_index (%0d) out of valid MCP cpu_irq range [64-209], assuming masked", dest_index), UVM_MEDIUM)
-                    return 1; // Out of valid cpu_irq range, assume masked
-                end
-
-                mask_bit = dest_index - 64;  // Convert cpu_irq index to mask bit position
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: MCP mapping: dest_index=%0d → mask_bit=%0d", dest_index, mask_bit), UVM_HIGH)
-
-                // Map mask bit to register and bit position
-                if (mask_bit <= 31) begin
-                    addr = ADDR_MASK_IOSUB_TO_MCP_INTR_0;  // [31:0]
-                    bit_index = mask_bit;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using MCP register 0: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 63) begin
-                    addr = ADDR_MASK_IOSUB_TO_MCP_INTR_1;  // [63:32]
-                    bit_index = mask_bit - 32;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using MCP register 1: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 95) begin
-                    addr = ADDR_MASK_IOSUB_TO_MCP_INTR_2;  // [95:64]
-                    bit_index = mask_bit - 64;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using MCP register 2: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 127) begin
-                    addr = ADDR_MASK_IOSUB_TO_MCP_INTR_3;  // [127:96]
-                    bit_index = mask_bit - 96;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using MCP register 3: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else if (mask_bit <= 145) begin
-                    addr = ADDR_MASK_IOSUB_TO_MCP_INTR_4;  // [145:128]
-                    bit_index = mask_bit - 128;
-                    `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using MCP register 4: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-                end else begin
-                    `uvm_info("INT_REG_MODEL", $sformatf("❌ Layer 2: mask_bit (%0d) out of MCP mask range [0-145], assuming masked", mask_bit), UVM_MEDIUM)
-                    return 1; // Out of mask range, assume masked
-                end
-            end
-
-            "ACCEL": begin
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Processing ACCEL destination for general interrupt"), UVM_HIGH)
-                // ACCEL: dest_index_accel maps directly to mask bit position
-                // ACCEL uses a single 32-bit mask register
-                if (dest_index < 0 || dest_index > 31) begin
-                    `uvm_info("INT_REG_MODEL", $sformatf("❌ Layer 2: dest_index (%0d) out of valid ACCEL mask range [0-31], assuming masked", dest_index), UVM_MEDIUM)
-                    return 1; // Out of valid mask range, assume masked
-                end
-
-                addr = ADDR_MASK_IOSUB_TO_ACCEL_INTR_0;  // [31:0]
-                bit_index = dest_index;  // Direct mapping
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: ACCEL mapping: dest_index=%0d → bit_index=%0d", dest_index, bit_index), UVM_HIGH)
-                `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Using ACCEL register: addr=0x%08x, bit_index=%0d", addr, bit_index), UVM_HIGH)
-            end
-
-            default: begin
-                `uvm_info("INT_REG_MODEL", $sformatf("❌ Layer 2: Unsupported destination '%s', assuming unmasked", destination), UVM_MEDIUM)
-                return 0; // Unmasked for other destinations
-            end
-        endcase
-
-        // Get mask value from cache if available, otherwise assume enabled
-        if (current_mask_values.exists(addr)) begin
-            mask_value = current_mask_values[addr];
-            `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2: Found cached mask value: addr=0x%08x, value=0x%08x", addr, mask_value), UVM_HIGH)
-        end else begin
-            mask_value = 32'hFFFF_FFFF; // Default to enabled if not cached
-            `uvm_info("INT_REG_MODEL", $sformatf("⚠️  Layer 2: No cached mask value for addr=0x%08x, using default 0x%08x (all enabled)", addr, mask_value), UVM_MEDIUM)
-        end
+        build_mask_tables();
+        pair_id = int_pair_table::get_pair_id(interrupt_name, destination.toupper());
+        if (!general_mask_pos.exists(pair_id)) return 0; // Not routed there, or unmasked for this destination
 
-        // Return 1 if masked (bit is 0), 0 if enabled (bit is 1)
-        result = ~mask_value[bit_index];
-        `uvm_info("INT_REG_MODEL", $sformatf(" Layer 2 result: interrupt='%s', dest='%s', addr=0x%08x, bit_index=%0d, mask_bit=%b, result=%s",
-                  interrupt_name, destination, addr, bit_index, mask_value[bit_index], result ? "BLOCKED" : "PASSED"), UVM_HIGH)
+        result = is_mask_pos_masked(general_mask_pos[pair_id]);
+        `uvm_info("INT_REG_MODEL", $sformatf("General mask result: %s, addr=0x%08x, bit_idx=%0d, result=%s",
+                  int_pair_table::get_pair_key(pair_id), general_mask_pos[pair_id].addr, general_mask_pos[pair_id].bit_idx,
+                  result ? "BLOCKED" : "PASSED"), UVM_HIGH)
         return result;
     endfunction
 
@@ -888,10 +513,14 @@ class int_register_model extends uvm_object;
         int routed_accel_bit;
         string dma_num_str;
         int dma_index;
+        bit routing_changed;
 
 
         `uvm_info("INT_REG_MODEL", " Updating ACCEL UART and DMA interrupt routing based on configuration registers", UVM_MEDIUM)
 
+        // ACCEL mask positions follow the rewritten dest_index_accel
+        build_mask_tables();
+
         // Get UART selection register value
         if (current_mask_values.exists(ADDR_ACCEL_UART_SEL)) begin
             accel_uart_sel_value = current_mask_values[ADDR_ACCEL_UART_SEL];
@@ -938,9 +567,11 @@ class int_register_model extends uvm_object;
                     if (is_routed) begin
                         // Update routing to ACCEL
                         routing_model.interrupt_map[i].to_accel = 1;
+                        routing_changed = 1;
                         // uart_to_accel_intr[0:2] maps to iosub_accel_peri_intr[18:20]
                         accel_uart_dest_index = 18 + routed_accel_bit;
                         routing_model.interrupt_map[i].dest_index_accel = accel_uart_dest_index;
+                        general_mask_pos[int_pair_table::get_or_add_pair_id(routing_model.interrupt_map[i].name, "ACCEL")] = '{0, ADDR_MASK_IOSUB_TO_ACCEL_INTR_0, accel_uart_dest_index};
                         accel_uart_path = $sformatf("top_tb.multidie_top.DUT[0].u_str_top.u_iosub_top_wrap.iosub_accel_peri_intr[%0d]", accel_uart_dest_index);
                         routing_model.interrupt_map[i].rtl_path_accel = accel_uart_path;
 
@@ -949,8 +580,10 @@ class int_register_model extends uvm_object;
                     end else begin
                         // Disable routing to ACCEL
                         routing_model.interrupt_map[i].to_accel = 0;
+                        routing_changed = 1;
                         routing_model.interrupt_map[i].dest_index_accel = -1;
                         routing_model.interrupt_map[i].rtl_path_accel = "";
+                        general_mask_pos.delete(int_pair_table::get_pair_id(routing_model.interrupt_map[i].name, "ACCEL"));
 
                         `uvm_info("INT_REG_MODEL", $sformatf(" Disabled UART routing: %s (uart_index=%0d not selected)",
                                   routing_model.interrupt_map[i].name, uart_index), UVM_MEDIUM)
@@ -987,9 +620,11 @@ class int_register_model extends uvm_object;
                     if (is_routed) begin
                         // Update routing to ACCEL
                         routing_model.interrupt_map[i].to_accel = 1;
+                        routing_changed = 1;
                         // dma_to_accel_intr[0:5] maps to iosub_accel_peri_intr[22:27]
                         accel_dma_dest_index = 22 + routed_accel_bit;
                         routing_model.interrupt_map[i].dest_index_accel = accel_dma_dest_index;
+                        general_mask_pos[int_pair_table::get_or_add_pair_id(routing_model.interrupt_map[i].name, "ACCEL")] = '{0, ADDR_MASK_IOSUB_TO_ACCEL_INTR_0, accel_dma_dest_index};
                         accel_dma_path = $sformatf("top_tb.multidie_top.DUT[0].u_str_top.u_iosub_top_wrap.iosub_accel_peri_intr[%0d]", accel_dma_dest_index);
                         routing_model.interrupt_map[i].rtl_path_accel = accel_dma_path;
 
@@ -998,8 +633,10 @@ class int_register_model extends uvm_object;
                     end else begin
                         // Disable routing to ACCEL
                         routing_model.interrupt_map[i].to_accel = 0;
+                        routing_changed = 1;
                         routing_model.interrupt_map[i].dest_index_accel = -1;
                         routing_model.interrupt_map[i].rtl_path_accel = "";
+                        general_mask_pos.delete(int_pair_table::get_pair_id(routing_model.interrupt_map[i].name, "ACCEL"));
 
                         `uvm_info("INT_REG_MODEL", $sformatf(" Disabled DMA routing: %s (dma_index=%0d not selected)",
                                   routing_model.interrupt_map[i].name, dma_index), UVM_MEDIUM)
@@ -1008,6 +645,9 @@ class int_register_model extends uvm_object;
             end
         end
 
+        // The generated routing bitmaps no longer describe the rewritten ACCEL routing
+        if (routing_changed) routing_model.invalidate_route_bitmaps();
+
         `uvm_info("INT_REG_MODEL", "✅ ACCEL UART and DMA interrupt routing update completed", UVM_MEDIUM)
     endtask
 
@@ -10,6 +10,27 @@ class int_routing_model extends uvm_object;
     // The main data structure holding all interrupt information.
     interrupt_info_s interrupt_map[$];
 
+    // Per-destination routing bitmaps over interrupt_map indices (see tools/mask_layout.py)
+    typedef struct {
+        logic [31:0]     addr;
+        int              bit_idx;
+        int_dest_e       dest;
+        int_map_bitmap_t gated;    // Routed interrupts masked at dest while this mask bit is 0
+    } int_mask_gate_s;
+
+    int_map_bitmap_t route_bitmap[INT_DEST_COUNT];
+    int_map_bitmap_t always_masked_bitmap[INT_DEST_COUNT];
+    int_mask_gate_s  mask_gates[$];
+    int              route_bitmap_size = 0;
+    bit              route_bitmaps_built = 0;
+    bit              route_bitmaps_valid = 0;
+    int              map_index[string];    // Name -> first interrupt_map index
+
+    // Masked bitmaps, cached until the register model mask values change
+    int_map_bitmap_t   masked_bitmap[INT_DEST_COUNT];
+    int_register_model masked_bitmap_model;
+    int unsigned       masked_bitmap_version;
+
     // Constructor
     function new(string name = "int_routing_model");
         super.new(name);
@@ -23,6 +44,70 @@ class int_routing_model extends uvm_object;
 
         // Include auto-generated interrupt map entries from Excel file
 `include "int_map_entries.svh"
+
+        int_pair_table::index_entries(interrupt_map);
+    endfunction
+
+    // Load the generated routing bitmaps and check that they match the map
+    function void build_route_bitmaps();
+        int_mask_gate_s mask_gate;
+
+        if (route_bitmaps_built) return; // guard against multiple builds
+        route_bitmaps_built = 1;
+        build();
+
+`include "int_route_bitmaps.svh"
+
+        foreach (interrupt_map[i]) begin
+            if (!map_index.exists(interrupt_map[i].name)) map_index[interrupt_map[i].name] = i;
+        end
+
+        route_bitmaps_valid = (route_bitmap_size == interrupt_map.size());
+        if (!route_bitmaps_valid) begin
+            `uvm_warning("INT_ROUTING_MODEL", $sformatf("int_route_bitmaps.svh covers %0d interrupts but the map has %0d. Regenerate it; using per-interrupt prediction.",
+                         route_bitmap_size, interrupt_map.size()))
+        end
+    endfunction
+
+    // Disable the bitmaps after the map routing was rewritten at run time
+    function void invalidate_route_bitmaps();
+        build_route_bitmaps();
+        route_bitmaps_valid = 0;
+    endfunction
+
+    // Index of the first interrupt_map entry with this name, -1 if none
+    function int get_map_index(string interrupt_name);
+        build_route_bitmaps();
+        return map_index.exists(interrupt_name) ? map_index[interrupt_name] : -1;
+    endfunction
+
+    // Interrupts masked at each destination by the current mask register values
+    function void get_masked_bitmaps(int_register_model register_model, output int_map_bitmap_t masked[INT_DEST_COUNT]);
+        build_route_bitmaps();
+
+        if (masked_bitmap_model != register_model || masked_bitmap_version != register_model.mask_version) begin
+            masked_bitmap = always_masked_bitmap;
+            foreach (mask_gates[g]) begin
+                if (register_model.is_mask_pos_masked('{0, mask_gates[g].addr, mask_gates[g].bit_idx})) begin
+                    masked_bitmap[mask_gates[g].dest] |= mask_gates[g].gated;
+                end
+            end
+            masked_bitmap_model = register_model;
+            masked_bitmap_version = register_model.mask_version;
+        end
+        masked = masked_bitmap;
+    endfunction
+
+    // Expected destinations of a whole batch of stimuli: bit i of expected[d] is set
+    // when interrupt_map[i] is in stimuli, routes to d and is not masked there
+    function void get_expected_bitmaps(int_map_bitmap_t stimuli, int_register_model register_model,
+                                       output int_map_bitmap_t expected[INT_DEST_COUNT]);
+        int_map_bitmap_t masked[INT_DEST_COUNT];
+
+        get_masked_bitmaps(register_model, masked);
+        foreach (expected[d]) begin
+            expected[d] = stimuli & route_bitmap[d] & ~masked[d];
+        end
     endfunction
 
     // Function to get all source interrupts that should be merged into a specific merge interrupt
@@ -35,7 +120,7 @@ class int_routing_model extends uvm_object;
             foreach (interrupt_map[i]) begin
                 if (interrupt_map[i].name == $sformatf("psub_normal%0d_intr",  n) ||
                     interrupt_map[i].name == $sformatf("pcie1_normal%0d_intr", n)) begin
-                    sources.push_back(interrupt_map[i]);
+                    add_merge_source(interrupt_map[i], sources);
                 end
             end
             return sources.size();
@@ -46,7 +131,7 @@ class int_routing_model extends uvm_object;
             foreach (interrupt_map[i]) begin
                 if (interrupt_map[i].name == $sformatf("psub_abnormal%0d_intr",  n) ||
                     interrupt_map[i].name == $sformatf("pcie1_abnormal%0d_intr", n)) begin
-                    sources.push_back(interrupt_map[i]);
+                    add_merge_source(interrupt_map[i], sources);
                 end
             end
             return sources.size();
@@ -57,7 +142,7 @@ class int_routing_model extends uvm_object;
             foreach (interrupt_map[i]) begin
                 if (interrupt_map[i].name == "psub_ras_cri_intr" ||
                     interrupt_map[i].name == "pcie1_ras_cri_intr") begin
-                    sources.push_back(interrupt_map[i]);
+                    add_merge_source(interrupt_map[i], sources);
                 end
             end
             return sources.size();
@@ -66,7 +151,7 @@ class int_routing_model extends uvm_object;
             foreach (interrupt_map[i]) begin
                 if (interrupt_map[i].name == "psub_ras_eri_intr" ||
                     interrupt_map[i].name == "pcie1_ras_eri_intr") begin
-                    sources.push_back(interrupt_map[i]);
+                    add_merge_source(interrupt_map[i], sources);
                 end
             end
             return sources.size();
@@ -75,7 +160,7 @@ class int_routing_model extends uvm_object;
             foreach (interrupt_map[i]) begin
                 if (interrupt_map[i].name == "psub_ras_fhi_intr" ||
                     interrupt_map[i].name == "pcie1_ras_fhi_intr") begin
-                    sources.push_back(interrupt_map[i]);
+                    add_merge_source(interrupt_map[i], sources);
                 end
             end
             return sources.size();
@@ -85,6 +170,7 @@ class int_routing_model extends uvm_object;
             "merge_pll_intr_lock": begin
                 foreach (interrupt_map[i]) begin
                     if (interrupt_map[i].name.match("csub_pll_intr_lock_*") ||
+                        interrupt_map[i].name == "csub_pll_intr_lock" ||
                         interrupt_map[i].name == "iosub_pll_lock_intr" ||
                         interrupt_map[i].name == "accel_pll_lock_intr" ||
                         interrupt_map[i].name == "psub_pll_lock_intr" ||
@@ -93,7 +179,7 @@ class int_routing_model extends uvm_object;
                         interrupt_map[i].name == "ddr0_pll_lock_intr" ||
                         interrupt_map[i].name == "ddr1_pll_lock_intr" ||
                         interrupt_map[i].name == "ddr2_pll_lock_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
@@ -101,6 +187,7 @@ class int_routing_model extends uvm_object;
             "merge_pll_intr_unlock": begin
                 foreach (interrupt_map[i]) begin
                     if (interrupt_map[i].name.match("csub_pll_intr_unlock_*") ||
+                        interrupt_map[i].name == "csub_pll_intr_unlock" ||
                         interrupt_map[i].name == "iosub_pll_unlock_intr" ||
                         interrupt_map[i].name == "accel_pll_unlock_intr" ||
                         interrupt_map[i].name == "psub_pll_unlock_intr" ||
@@ -109,40 +196,43 @@ class int_routing_model extends uvm_object;
                         interrupt_map[i].name == "ddr0_pll_unlock_intr" ||
                         interrupt_map[i].name == "ddr1_pll_unlock_intr" ||
                         interrupt_map[i].name == "ddr2_pll_unlock_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
 
             "merge_pll_intr_frechangedone": begin
                  foreach (interrupt_map[i]) begin
-                    if (interrupt_map[i].name.match("csub_pll_intr_frechangedone_*") || // MODIFIED: Match pattern
+                    if (interrupt_map[i].name.match("csub_pll_intr_frechangedone_*") ||
+                        interrupt_map[i].name == "csub_pll_intr_frechangedone" || // MODIFIED: Match pattern
                         interrupt_map[i].name == "ddr0_pll_frechangedone_intr" ||
                         interrupt_map[i].name == "ddr1_pll_frechangedone_intr" ||
                         interrupt_map[i].name == "ddr2_pll_frechangedone_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
 
             "merge_pll_intr_frechange_tot_done": begin
                  foreach (interrupt_map[i]) begin
-                    if (interrupt_map[i].name.match("csub_pll_intr_frechange_tot_done_*") || // MODIFIED: Match pattern
+                    if (interrupt_map[i].name.match("csub_pll_intr_frechange_tot_done_*") ||
+                        interrupt_map[i].name == "csub_pll_intr_frechange_tot_done" || // MODIFIED: Match pattern
                         interrupt_map[i].name == "ddr0_pll_frechange_tot_done_intr" ||
                         interrupt_map[i].name == "ddr1_pll_frechange_tot_done_intr" ||
                         interrupt_map[i].name == "ddr2_pll_frechange_tot_done_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
 
             "merge_pll_intr_intdocfrac_err": begin
                  foreach (interrupt_map[i]) begin
-                    if (interrupt_map[i].name.match("csub_pll_intr_intdocfrac_err_*") || // MODIFIED: Match pattern
+                    if (interrupt_map[i].name.match("csub_pll_intr_intdocfrac_err_*") ||
+                        interrupt_map[i].name == "csub_pll_intr_intdocfrac_err" || // MODIFIED: Match pattern
                         interrupt_map[i].name == "ddr0_pll_intdocfrac_err_intr" ||
                         interrupt_map[i].name == "ddr1_pll_intdocfrac_err_intr" ||
                         interrupt_map[i].name == "ddr2_pll_intdocfrac_err_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
@@ -153,7 +243,7 @@ class int_routing_model extends uvm_object;
                     if (interrupt_map[i].group == IOSUB) begin
                         int idx = interrupt_map[i].index;
                         if ((idx >= 0 && idx <= 9) || (idx >= 15 && idx <= 50)) begin
-                            sources.push_back(interrupt_map[i]);
+                            add_merge_source(interrupt_map[i], sources);
                         end
                     end
                 end
@@ -171,7 +261,7 @@ class int_routing_model extends uvm_object;
                         interrupt_map[i].name == "usb0_apb1ton_intr" ||
                         interrupt_map[i].name == "usb1_apb1ton_intr" ||
                         interrupt_map[i].name == "usb_top_apb1ton_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
@@ -180,7 +270,7 @@ class int_routing_model extends uvm_object;
                 // Collect only SMMU interrupts that should be merged into iosub_ras_cri_intr
                 foreach (interrupt_map[i]) begin
                     if (interrupt_map[i].name == "smmu_cri_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
@@ -189,7 +279,7 @@ class int_routing_model extends uvm_object;
                 // Collect only SMMU interrupts that should be merged into iosub_ras_eri_intr
                 foreach (interrupt_map[i]) begin
                     if (interrupt_map[i].name == "smmu_eri_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
@@ -198,7 +288,7 @@ class int_routing_model extends uvm_object;
                 // Collect only SMMU interrupts that should be merged into iosub_ras_fhi_intr
                 foreach (interrupt_map[i]) begin
                     if (interrupt_map[i].name == "smmu_fhi_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
@@ -208,7 +298,7 @@ class int_routing_model extends uvm_object;
                 foreach (interrupt_map[i]) begin
                     if (interrupt_map[i].name == "iodap_etr_buf_intr" ||
                         interrupt_map[i].name == "iodap_catu_addrerr_intr") begin
-                        sources.push_back(interrupt_map[i]);
+                        add_merge_source(interrupt_map[i], sources);
                     end
                 end
             end
@@ -227,6 +317,18 @@ class int_routing_model extends uvm_object;
         return sources.size();
     endfunction
 
+    // Adds a merge source. A ranged vector entry contributes one single-bit view per bit,
+    // so every bit is stimulated, masked and checked like an individual source.
+    function void add_merge_source(interrupt_info_s entry, ref interrupt_info_s sources[$]);
+        if (entry.width > 1) begin
+            for (int b = 0; b < entry.width; b++) begin
+                sources.push_back(get_vector_bit(entry, b));
+            end
+        end else begin
+            sources.push_back(entry);
+        end
+    endfunction
+
     // Function to check if an interrupt is a merge interrupt
     function bit is_merge_interrupt(string interrupt_name);
         return (interrupt_name == "merge_pll_intr_lock" ||
@@ -385,19 +487,31 @@ class int_routing_model extends uvm_object;
 
     // Function to get all expected destinations for an interrupt considering masks
     function void get_expected_destinations_with_mask(string interrupt_name, ref string destinations[$], int_register_model register_model);
-        string all_destinations[$] = {"AP", "SCP", "MCP", "ACCEL", "IO", "OTHER_DIE"};
+        string all_destinations[$] = {"AP", "SCP", "MCP", "ACCEL", "IO", "OTHER_DIE"}; // int_dest_e order
+        int_map_bitmap_t masked[INT_DEST_COUNT];
+        int idx;
 
         `uvm_info("INT_ROUTING_MODEL", $sformatf(" Getting expected destinations with mask for interrupt: %s", interrupt_name), UVM_HIGH)
 
         destinations.delete();
 
-        foreach (all_destinations[i]) begin
-            `uvm_info("INT_ROUTING_MODEL", $sformatf(" Checking destination %0d/%0d: %s", i+1, all_destinations.size(), all_destinations[i]), UVM_HIGH)
-            if (predict_interrupt_routing_with_mask(interrupt_name, all_destinations[i], register_model)) begin
-                destinations.push_back(all_destinations[i]);
-                `uvm_info("INT_ROUTING_MODEL", $sformatf("Added destination: %s", all_destinations[i]), UVM_HIGH)
-            end else begin
-                `uvm_info("INT_ROUTING_MODEL", $sformatf("Skipped destination: %s", all_destinations[i]), UVM_HIGH)
+        // Map entries are looked up in the routing bitmaps; vector bit views and
+        // unknown names take the per-destination prediction below
+        idx = get_map_index(interrupt_name);
+        if (route_bitmaps_valid && idx >= 0 && interrupt_map[idx].width == 1) begin
+            get_masked_bitmaps(register_model, masked);
+            foreach (all_destinations[i]) begin
+                if (route_bitmap[i][idx] && !masked[i][idx]) destinations.push_back(all_destinations[i]);
+            end
+        end else begin
+            foreach (all_destinations[i]) begin
+                `uvm_info("INT_ROUTING_MODEL", $sformatf(" Checking destination %0d/%0d: %s", i+1, all_destinations.size(), all_destinations[i]), UVM_HIGH)
+                if (predict_interrupt_routing_with_mask(interrupt_name, all_destinations[i], register_model)) begin
+                    destinations.push_back(all_destinations[i]);
+                    `uvm_info("INT_ROUTING_MODEL", $sformatf("Added destination: %s", all_destinations[i]), UVM_HIGH)
+                end else begin
+                    `uvm_info("INT_ROUTING_MODEL", $sformatf("Skipped destination: %s", all_destinations[i]), UVM_HIGH)
+                end
             end
         end
 
@@ -0,0 +1,69 @@
+`ifndef INT_SOURCE_BUS_TABLE_SV
+`define INT_SOURCE_BUS_TABLE_SV
+
+// Bit positions of the interrupt sources on their multi-bit source buses, generated with the
+// interrupt map (see tools/source_buses.py). A segment is a run of contiguous bus bits that
+// belong to drivable interrupts only, so the driver's burst mode can force the image of a whole
+// set of interrupts with one write per segment. Interrupts without a slot (single-signal
+// sources, bits shared with other entries or merge outputs) are driven one by one.
+class int_source_bus_table extends uvm_object;
+    `uvm_object_utils(int_source_bus_table)
+
+    typedef struct {
+        int            bus;
+        int            lsb;
+        int            msb;
+        uvm_hdl_data_t idle;       // segment value with all interrupts inactive
+    } int_bus_segment_s;
+
+    typedef struct {
+        int segment;
+        int offset;                // bit 0 of the interrupt, relative to the segment lsb
+        int width;
+        int map_index;             // interrupt_map index the table was generated for
+    } int_bus_slot_s;
+
+    static string            bus_paths[$];
+    static int_bus_segment_s segments[$];
+    static int_bus_slot_s    slots[string];  // interrupt name -> slot
+    static bit               built = 0;
+
+    function new(string name = "int_source_bus_table");
+        super.new(name);
+    endfunction
+
+    // Load the generated source bus images
+    static function void build();
+        int_bus_segment_s segment;
+        int_bus_slot_s    slot;
+
+        if (built) return; // guard against multiple builds
+        built = 1;
+
+`include "int_source_buses.svh"
+    endfunction
+
+    // Whether an interrupt can be driven as part of a bus image
+    static function bit has_slot(string interrupt_name);
+        build();
+        return slots.exists(interrupt_name);
+    endfunction
+
+    static function int_bus_slot_s get_slot(string interrupt_name);
+        build();
+        return slots[interrupt_name];
+    endfunction
+
+    // Part-select path of a segment, e.g. "...iosub_peri_intr[50:36]"
+    static function string get_segment_path(int segment);
+        build();
+        return $sformatf("%s[%0d:%0d]", bus_paths[segments[segment].bus], segments[segment].msb, segments[segment].lsb);
+    endfunction
+
+    static function uvm_hdl_data_t get_idle_image(int segment);
+        build();
+        return segments[segment].idle;
+    endfunction
+endclass
+
+`endif // INT_SOURCE_BUS_TABLE_SV
@@ -5,7 +5,9 @@
 typedef enum {
     STIMULUS_ASSERT,    // Assert the interrupt (using appropriate method for trigger type)
     STIMULUS_DEASSERT,  // Deassert the interrupt (for level-triggered interrupts)
-    STIMULUS_CLEAR      // Clear the interrupt (release HDL force)
+    STIMULUS_CLEAR,     // Clear the interrupt (release HDL force)
+    STIMULUS_BURST_ASSERT, // Assert all burst interrupts, one force per source bus segment
+    STIMULUS_BURST_CLEAR   // Clear all burst interrupts, one release per source bus segment
 } stimulus_type_e;
 
 // Transaction class for interrupt stimulus
@@ -18,6 +20,9 @@ class int_stimulus_item extends uvm_sequence_item;
     // Stimulus type
     stimulus_type_e stimulus_type = STIMULUS_ASSERT;
 
+    // Interrupts of a STIMULUS_BURST_* item (interrupt_info is unused)
+    interrupt_info_s burst[$];
+
     function new(string name = "int_stimulus_item");
         super.new(name);
     endfunction
@@ -35,9 +40,25 @@ class int_stimulus_item extends uvm_sequence_item;
         return item;
     endfunction
 
+    // Helper function to create a burst stimulus item
+    static function int_stimulus_item create_burst(
+        interrupt_info_s members[$],
+        stimulus_type_e type_val = STIMULUS_BURST_ASSERT
+    );
+        int_stimulus_item item = int_stimulus_item::type_id::create("burst_item");
+
+        item.burst = members;
+        item.stimulus_type = type_val;
+
+        return item;
+    endfunction
+
     // Convert to string for debug
     virtual function string convert2string();
         string s;
+        if (stimulus_type inside {STIMULUS_BURST_ASSERT, STIMULUS_BURST_CLEAR})
+            return $sformatf("Burst of %0d interrupts, Type: %s", burst.size(), stimulus_type.name());
+
         s = $sformatf("Interrupt: %s (group: %s, index: %0d), Type: %s",
                      interrupt_info.name,
                      interrupt_info.group.name(),
@@ -12,6 +12,9 @@ class int_transaction extends uvm_sequence_item;
     // The destination where it was detected
     string destination_name;
 
+    // Dense ID of the (interrupt, destination) pair, see int_pair_table (-1: not set)
+    int pair_id = -1;
+
     function new(string name = "int_transaction");
         super.new(name);
     endfunction
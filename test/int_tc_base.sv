@@ -42,14 +42,25 @@ class int_tc_base extends soc_tc_base;
     endfunction
 
     task pre_reset_phase(uvm_phase phase);
+        int mask_config_id;
+        bit mask_config_applied;
+
         phase.raise_objection(this);
 
         // Initialize interrupt register model
         `uvm_info(get_type_name(), "Initializing interrupt register model...", UVM_MEDIUM)
         m_register_model.init_registers();
 
-        `uvm_info(get_type_name(), "Randomizing interrupt mask registers...", UVM_MEDIUM)
-        m_register_model.randomize_mask_registers();
+        if ($value$plusargs("INT_MASK_CONFIG=%d", mask_config_id)) begin
+            `uvm_info(get_type_name(), $sformatf("Applying directed mask configuration %0d...", mask_config_id), UVM_MEDIUM)
+            m_register_model.apply_mask_config(mask_config_id, mask_config_applied);
+            if (!mask_config_applied) begin
+                `uvm_error(get_type_name(), $sformatf("Mask configuration %0d not found. Regenerate int_mask_configs.svh.", mask_config_id))
+            end
+        end else begin
+            `uvm_info(get_type_name(), "Randomizing interrupt mask registers...", UVM_MEDIUM)
+            m_register_model.randomize_mask_registers();
+        end
 
         // Update ACCEL UART and DMA interrupt routing based on configuration registers
         `uvm_info(get_type_name(), "Updating ACCEL UART and DMA interrupt routing...", UVM_MEDIUM)
@@ -19,7 +19,13 @@ class tc_int_routing extends int_tc_base;
             `uvm_fatal(get_type_name(), "Failed to cast subenv[\"int_subenv\"] to int_subenv")
         end
 
-        seq = int_lightweight_sequence::type_id::create("seq");
+        // +INT_BATCHED_MODE runs conflict-free waves of interrupts in parallel,
+        // +INT_BURST_MODE additionally drives each wave as source bus images
+        if ($test$plusargs("INT_BATCHED_MODE") || $test$plusargs("INT_BURST_MODE")) begin
+            seq = int_batched_sequence::type_id::create("seq");
+        end else begin
+            seq = int_lightweight_sequence::type_id::create("seq");
+        end
         // Use the new lightweight sequence with driver architecture
         seq.start(int_env.m_sequencer);
 
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Detection Latency Trace Analyzer
+
+Reads the stimulus-to-detect latency traces written by int_monitor
+(+INT_LATENCY_TRACE=<file>) of any number of runs and derives per-path
+detection timing:
+- poll interval: half the shortest active phase the driver produces on the
+  path (level hold, edge or pulse width), so that no phase falls between polls
+- timeout: the largest observed latency times a safety margin, plus one poll
+  interval of detection granularity
+
+A path is a (group, destination) pair.  Timeouts are only emitted for paths
+with at least --min-samples detections; a destination or group timeout is only
+emitted when every routed path of it is covered.  Everything else keeps the
+timing_config defaults.
+
+The overrides are emitted as an SV include consumed by
+timing_config.load_timing_overrides().
+"""
+
+import sys
+import math
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from interrupt_map import load_interrupt_map, load_timing_config, get_destinations
+
+TRACE_HEADER = '# int_latency_trace v1'
+
+# Upper bounds (ns) of the histogram buckets: 1, 2, 4, ... ns
+HISTOGRAM_BUCKETS = 20
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (HISTOGRAM_BUCKETS + 1)
+        self.samples = 0
+        self.max_ns = 0.0
+        self.total_ns = 0.0
+
+    def add(self, latency_ns: float):
+        bucket = 0 if latency_ns <= 1 else min(HISTOGRAM_BUCKETS, math.ceil(math.log2(latency_ns)))
+        self.counts[bucket] += 1
+        self.samples += 1
+        self.total_ns += latency_ns
+        self.max_ns = max(self.max_ns, latency_ns)
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound (ns) of the bucket holding the given fraction of the samples."""
+        wanted = math.ceil(self.samples * fraction)
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= wanted:
+                return 1 << bucket
+        return 0
+
+    def to_dict(self) -> dict:
+        return {
+            'samples': self.samples,
+            'mean_ns': round(self.total_ns / self.samples, 3) if self.samples else 0,
+            'max_ns': self.max_ns,
+            'p99_ns': self.percentile(0.99),
+            'buckets': {f"<={1 << b}": count for b, count in enumerate(self.counts) if count},
+        }
+
+
+def read_traces(trace_files: List[str]) -> Tuple[List[Tuple[str, str, str, float]], int]:
+    """
+    Read latency trace files.
+
+    Returns:
+        ((interrupt, group, destination, latency in ns) records, malformed line count)
+    """
+    records = []
+    malformed = 0
+    for trace_file in trace_files:
+        with open(trace_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip() or line.startswith('#'):
+                    continue
+                fields = line.split()
+                try:
+                    records.append((fields[0], fields[1], fields[2], int(fields[3]) / 1000.0))
+                except (IndexError, ValueError):
+                    malformed += 1
+    return records, malformed
+
+
+class TimingTuner:
+    def __init__(self, entries: List[dict], timing: Dict[str, int], margin: float = 1.5,
+                 min_timeout_ns: int = 10, min_samples: int = 20):
+        """
+        Initialize the tuner.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+            timing: timing_config defaults (see interrupt_map.load_timing_config)
+            margin: Factor applied to the largest observed latency
+            min_timeout_ns: Lower bound of every emitted timeout
+            min_samples: Detections a path needs before it gets a timeout
+        """
+        self.entries = entries
+        self.timing = timing
+        self.margin = margin
+        self.min_timeout_ns = min_timeout_ns
+        self.min_samples = min_samples
+        self.paths: Dict[Tuple[str, str], List[dict]] = {}
+        for entry in entries:
+            for dest in get_destinations(entry):
+                self.paths.setdefault((entry['group'], dest.upper()), []).append(entry)
+        self.histograms: Dict[str, Dict[str, LatencyHistogram]] = {'path': {}, 'dest': {}, 'group': {}}
+
+    def add_records(self, records: List[Tuple[str, str, str, float]]):
+        for _, group, dest, latency_ns in records:
+            for level, key in (('path', f"{group}@{dest}"), ('dest', dest), ('group', group)):
+                self.histograms[level].setdefault(key, LatencyHistogram()).add(latency_ns)
+
+    def active_time_ns(self, entry: dict) -> int:
+        """Shortest time the driver holds an entry at its active level."""
+        trigger = entry.get('trigger', 'LEVEL')
+        if trigger == 'PULSE':
+            return entry.get('pulse_width_ns', 0) or self.timing.get('pulse_width_ns', 1)
+        if trigger == 'EDGE':
+            if entry.get('polarity') == 'RISING_FALLING':
+                return self.timing.get('edge_pulse_width_ns', 1)
+            return self.timing.get('edge_hold_time_ns', 1)
+        return self.timing.get('level_hold_time_ns', 1)
+
+    def poll_interval_ns(self, entries: List[dict]) -> int:
+        """
+        Poll interval that samples every active phase of the entries at least once.
+
+        A poll interval equal to the shortest active time can step over a phase
+        that starts just after a poll, so half of it is used (at least 1ns).
+        """
+        return max(1, min(self.active_time_ns(e) for e in entries) // 2)
+
+    def timeout_ns(self, histogram: LatencyHistogram, poll_ns: int) -> int:
+        return max(self.min_timeout_ns, math.ceil(histogram.max_ns * self.margin) + poll_ns)
+
+    def _covered(self, keys: List[Tuple[str, str]]) -> bool:
+        histograms = self.histograms['path']
+        return all(f"{g}@{d}" in histograms and histograms[f"{g}@{d}"].samples >= self.min_samples
+                   for g, d in keys)
+
+    def tune(self) -> Dict[str, Dict[str, int]]:
+        """
+        Derive the override tables.
+
+        Returns:
+            Table name (as in timing_config, e.g. 'dest_timeout_ns') -> key -> value
+        """
+        tables = {name: {} for name in ('path_timeout_ns', 'path_poll_interval_ns', 'dest_timeout_ns',
+                                        'dest_poll_interval_ns', 'group_timeout_ns', 'group_poll_interval_ns')}
+
+        by_dest: Dict[str, List[Tuple[str, str]]] = {}
+        by_group: Dict[str, List[Tuple[str, str]]] = {}
+        for group, dest in self.paths:
+            by_dest.setdefault(dest, []).append((group, dest))
+            by_group.setdefault(group, []).append((group, dest))
+
+        for level, grouped in (('dest', by_dest), ('group', by_group)):
+            for key, keys in sorted(grouped.items()):
+                entries = [e for k in keys for e in self.paths[k]]
+                poll_ns = self.poll_interval_ns(entries)
+                tables[f'{level}_poll_interval_ns'][key] = poll_ns
+                if self._covered(keys):
+                    tables[f'{level}_timeout_ns'][key] = self.timeout_ns(self.histograms[level][key], poll_ns)
+
+        for (group, dest), entries in sorted(self.paths.items()):
+            path = f"{group}@{dest}"
+            poll_ns = self.poll_interval_ns(entries)
+            # Paths fall back to the destination first, so only differing polls need an entry
+            if poll_ns != tables['dest_poll_interval_ns'][dest]:
+                tables['path_poll_interval_ns'][path] = poll_ns
+            if self._covered([(group, dest)]):
+                tables['path_timeout_ns'][path] = self.timeout_ns(self.histograms['path'][path], poll_ns)
+
+        return tables
+
+    def generate_sv_file(self, tables: Dict[str, Dict[str, int]], output_path: str, sources: List[str]):
+        """Generate the SystemVerilog include file holding the timing overrides."""
+        sv_lines = [
+            "// Auto-generated detection timing overrides",
+            f"// Source: {', '.join(sources)}",
+            "// Generated by: analyze_latency_trace.py",
+            "// NOTE: This file is included in timing_config.sv",
+            "// Keys: path \"GROUP@DEST\", destination \"DEST\", group \"GROUP\"; values in ns",
+            ""
+        ]
+        for table, values in tables.items():
+            if not values:
+                continue
+            sv_lines.append(f"        // --- {table} ({len(values)}) ---")
+            for key, value in values.items():
+                sv_lines.append(f"        {table}[\"{key}\"] = {value};")
+            sv_lines.append("")
+
+        with open(output_path, 'w', encoding='utf-8') as svfile:
+            svfile.write("\n".join(sv_lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Detection Latency Trace Analyzer')
+    parser.add_argument('traces', nargs='+', help='Latency trace files written by int_monitor (+INT_LATENCY_TRACE)')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('-t', '--timing-config', default='config/timing_config.sv',
+                        help='Path to the timing configuration class')
+    parser.add_argument('-o', '--output', default='config/int_timing_overrides.svh',
+                        help='Path for the generated timing overrides include file')
+    parser.add_argument('--margin', type=float, default=1.5,
+                        help='Factor applied to the largest observed latency (default: 1.5)')
+    parser.add_argument('--min-timeout', type=int, default=10,
+                        help='Lower bound of every emitted timeout in ns (default: 10)')
+    parser.add_argument('--min-samples', type=int, default=20,
+                        help='Detections a path needs before its timeout is tuned (default: 20)')
+    parser.add_argument('--report', help='Write the latency histograms and overrides as JSON')
+
+    args = parser.parse_args()
+
+    for path in [args.entries, args.timing_config] + args.traces:
+        if not Path(path).exists():
+            print(f"Error: {path} not found!")
+            return 1
+
+    records, malformed = read_traces(args.traces)
+    tuner = TimingTuner(load_interrupt_map(args.entries), load_timing_config(args.timing_config),
+                        args.margin, args.min_timeout, args.min_samples)
+    tuner.add_records(records)
+    tables = tuner.tune()
+
+    print(f"Loaded {len(records)} detections from {len(args.traces)} trace files")
+    if malformed:
+        print(f"Warning: skipped {malformed} malformed trace lines")
+    for path, histogram in sorted(tuner.histograms['path'].items()):
+        stats = histogram.to_dict()
+        print(f"  {path:24s} samples={stats['samples']:6d} mean={stats['mean_ns']:10.3f}ns "
+              f"max={stats['max_ns']:10.3f}ns p99<={stats['p99_ns']}ns")
+    uncovered = [f"{g}@{d}" for g, d in sorted(tuner.paths) if f"{g}@{d}" not in tables['path_timeout_ns']]
+    if uncovered:
+        print(f"Paths without enough samples (default timeout kept): {len(uncovered)}")
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    tuner.generate_sv_file(tables, args.output, args.traces)
+    print(f"Successfully generated '{args.output}'")
+
+    if args.report:
+        report = {
+            'histograms': {level: {key: h.to_dict() for key, h in sorted(hs.items())}
+                           for level, hs in tuner.histograms.items()},
+            'overrides': tables,
+        }
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Successfully generated '{args.report}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
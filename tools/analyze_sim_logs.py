@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Streaming Simulation Log Analyzer for Interrupt Routing Coverage
+
+Parses regression logs line by line (optionally gzip-compressed) for the
+messages printed by int_monitor and int_scoreboard:
+- INTERRUPT DETECTED [n]: '<name>' -> '<dest>'
+- Detected an UNEXPECTED interrupt: '<name>' was routed to '<dest>'
+- Missing interrupt: <name>@<dest>
+
+Logs are split into byte-range chunks and scanned by a pool of worker
+processes; each worker only keeps counters per (interrupt, destination), so
+memory use is bounded by the size of the interrupt map, not by the logs.
+Results are joined against the generated interrupt map to produce hit, miss
+and unexpected matrices and the list of routed destinations never observed.
+"""
+
+import os
+import re
+import sys
+import csv
+import gzip
+import argparse
+from collections import Counter
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from interrupt_map import load_interrupt_map, expand_vector_entries, get_destinations, DESTINATIONS
+
+DEST_LABELS = [dest.upper() for dest in DESTINATIONS]
+
+# int_monitor does not monitor IO destinations, so they can never be hit
+UNMONITORED_DESTINATIONS = {'IO'}
+
+_DETECTED_PATTERN = re.compile(r"INTERRUPT DETECTED \[\d+\]: '([^']+)' -> '([^']+)'")
+_UNEXPECTED_PATTERN = re.compile(r"UNEXPECTED interrupt: '([^']+)' was routed to '([^']+)'")
+_MISSING_PATTERN = re.compile(r"Missing interrupt: ([^@\s]+)@(\S+)")
+
+# (substring pre-filter, pattern, counter name)
+_LINE_MATCHERS = [
+    ("INTERRUPT DETECTED", _DETECTED_PATTERN, 'hits'),
+    ("UNEXPECTED interrupt", _UNEXPECTED_PATTERN, 'unexpected'),
+    ("Missing interrupt", _MISSING_PATTERN, 'misses'),
+]
+
+
+def split_log(log_path: str, chunk_size: int) -> List[Tuple[str, int, int]]:
+    """
+    Split a log into (path, start, end) byte ranges of roughly chunk_size bytes.
+    Compressed logs cannot be seeked and are always scanned as one chunk.
+    """
+    size = os.path.getsize(log_path)
+    if log_path.endswith('.gz') or chunk_size <= 0 or size <= chunk_size:
+        return [(log_path, 0, -1)]
+    return [(log_path, start, min(start + chunk_size, size))
+            for start in range(0, size, chunk_size)]
+
+
+def _iter_chunk_lines(log_path: str, start: int, end: int):
+    """Lazily yield the lines that begin inside [start, end) of a log file."""
+    if log_path.endswith('.gz'):
+        with gzip.open(log_path, 'rb') as f:
+            for raw in f:
+                yield raw.decode('utf-8', errors='replace')
+        return
+
+    with open(log_path, 'rb') as f:
+        if start > 0:
+            # A line straddling the boundary belongs to the previous chunk
+            f.seek(start - 1)
+            f.readline()
+        while end < 0 or f.tell() < end:
+            raw = f.readline()
+            if not raw:
+                break
+            yield raw.decode('utf-8', errors='replace')
+
+
+def scan_chunk(chunk: Tuple[str, int, int]) -> Dict[str, Counter]:
+    """Worker: count detected, unexpected and missing (name, dest) pairs in one chunk."""
+    log_path, start, end = chunk
+    counters = {'hits': Counter(), 'unexpected': Counter(), 'misses': Counter(), 'logs': Counter()}
+
+    for line in _iter_chunk_lines(log_path, start, end):
+        for marker, pattern, key in _LINE_MATCHERS:
+            if marker in line:
+                match = pattern.search(line)
+                if match:
+                    counters[key][(match.group(1), match.group(2).upper())] += 1
+                    if key != 'hits':
+                        counters['logs'][(log_path, key)] += 1
+                break
+    return counters
+
+
+def analyze_logs(log_files: List[str], jobs: int, chunk_size: int) -> Dict[str, Counter]:
+    """Scan all logs in parallel and merge the per-chunk counters."""
+    chunks = [chunk for log_path in log_files for chunk in split_log(log_path, chunk_size)]
+    totals = {'hits': Counter(), 'unexpected': Counter(), 'misses': Counter(), 'logs': Counter()}
+
+    if jobs == 1 or len(chunks) == 1:
+        for counters in map(scan_chunk, chunks):
+            for key, counter in counters.items():
+                totals[key].update(counter)
+        return totals
+
+    with Pool(processes=jobs) as pool:
+        for counters in pool.imap_unordered(scan_chunk, chunks):
+            for key, counter in counters.items():
+                totals[key].update(counter)
+    return totals
+
+
+def build_matrix(entries: List[dict], counter: Counter) -> List[List]:
+    """
+    Build a per-interrupt, per-destination matrix in interrupt_map order.
+    Destinations the interrupt is not routed to are shown as '-' unless
+    something was counted there anyway.
+    """
+    rows = []
+    for entry in entries:
+        routed = {dest.upper() for dest in get_destinations(entry)}
+        row = [entry['name']]
+        for label in DEST_LABELS:
+            count = counter.get((entry['name'], label), 0)
+            row.append(count if (label in routed or count) else '-')
+        rows.append(row)
+    return rows
+
+
+def get_uncovered(entries: List[dict], hits: Counter) -> List[str]:
+    """List routed name@DEST pairs that were never detected in any log."""
+    uncovered = []
+    for entry in entries:
+        for dest in get_destinations(entry):
+            label = dest.upper()
+            if label in UNMONITORED_DESTINATIONS:
+                continue
+            if hits.get((entry['name'], label), 0) == 0:
+                uncovered.append(f"{entry['name']}@{label}")
+    return uncovered
+
+
+def write_matrix(path: str, rows: List[List]):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['interrupt'] + DEST_LABELS)
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Streaming Simulation Log Analyzer for Interrupt Routing Coverage')
+    parser.add_argument('logs', nargs='+', help='Simulation log files (.log or .log.gz)')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('-o', '--output-prefix', default='int_routing_coverage',
+                        help='Prefix for the generated _hits.csv, _misses.csv, _unexpected.csv and _uncovered.txt files')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--chunk-mb', type=int, default=256,
+                        help='Split uncompressed logs into chunks of this size in MB (default: 256, 0 disables)')
+
+    args = parser.parse_args()
+
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+    for log_path in args.logs:
+        if not Path(log_path).exists():
+            print(f"Error: {log_path} not found!")
+            return 1
+
+    # The monitor reports ranged vector entries bit by bit
+    entries = expand_vector_entries(load_interrupt_map(args.entries))
+    totals = analyze_logs(args.logs, max(1, args.jobs), args.chunk_mb * 1024 * 1024)
+
+    hits, misses, unexpected = totals['hits'], totals['misses'], totals['unexpected']
+    write_matrix(f"{args.output_prefix}_hits.csv", build_matrix(entries, hits))
+    write_matrix(f"{args.output_prefix}_misses.csv", build_matrix(entries, misses))
+    write_matrix(f"{args.output_prefix}_unexpected.csv", build_matrix(entries, unexpected))
+
+    uncovered = get_uncovered(entries, hits)
+    with open(f"{args.output_prefix}_uncovered.txt", 'w', encoding='utf-8') as f:
+        f.write("\n".join(uncovered) + ("\n" if uncovered else ""))
+
+    known = {entry['name'] for entry in entries}
+    unknown = sorted({name for counter in (hits, misses, unexpected) for name, _ in counter if name not in known})
+
+    print(f"Analyzed {len(args.logs)} logs against {len(entries)} interrupt entries")
+    print(f"  Detected:   {sum(hits.values())} ({len(hits)} distinct interrupt/destination pairs)")
+    print(f"  Missing:    {sum(misses.values())} ({len(misses)} distinct)")
+    print(f"  Unexpected: {sum(unexpected.values())} ({len(unexpected)} distinct)")
+    print(f"  Uncovered routed destinations: {len(uncovered)}")
+    for (log_path, key), count in sorted(totals['logs'].items()):
+        print(f"  {log_path}: {count} {key}")
+    if unknown:
+        print(f"Warning: {len(unknown)} interrupt names in logs are not in {args.entries}:")
+        for name in unknown[:20]:
+            print(f"  - {name}")
+    print(f"Successfully generated '{args.output_prefix}_hits.csv', '{args.output_prefix}_misses.csv', "
+          f"'{args.output_prefix}_unexpected.csv' and '{args.output_prefix}_uncovered.txt'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
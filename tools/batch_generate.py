@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Batch Multi-Variant Interrupt Configuration Generator
+
+Generates the interrupt configuration of several chip variants in one run.
+The variants' workbooks share most sheets and differ in routing columns and
+destination lists, so every sheet is parsed once per distinct content instead
+of once per variant:
+
+1. hash:   every sheet referenced by the manifest is hashed from the cell
+           values in the workbook's sheet XML (shared strings resolved,
+           formatting ignored), which is far cheaper than reading it
+2. parse:  each distinct (sheet name, content hash) is read and parsed once
+           (parse_main_sheet, parse_mscp_sheet, parse_destination_sheet)
+3. render: each variant is assembled from the cached parses as
+           parse_interrupt_xlsx() does, and its map entries, mask tables,
+           routing bitmaps, pair IDs, coverage bins, RTL paths (with the
+           variant's hierarchy config), wave schedule, shard schedule, mask
+           configurations and source bus images are written to its output
+           directory
+4. diff:   the final maps are compared with the first variant of the manifest
+
+Parse units and variants are spread over -j worker processes.  Each variant's
+tool output goes to batch_generate.log in its output directory.  With
+--check-digests only the sheet hashing is checked: every workbook saved again
+by openpyxl must hash the same, sheet by sheet.
+
+Manifest (JSON, paths relative to the working directory):
+    {"variants": [
+        {"name": "die0", "workbook": "int_vector.xlsx", "output_dir": "build/die0"},
+        {"name": "lite", "workbook": "variants/lite.xlsx", "output_dir": "build/lite",
+         "hierarchy_config": "config/lite_hierarchy.json"}
+    ]}
+A plain list of variants is accepted as well.  name defaults to the output
+directory name and hierarchy_config to config/hierarchy_config.json.
+"""
+
+import os
+import sys
+import json
+import zipfile
+import hashlib
+import argparse
+import tempfile
+import traceback
+import contextlib
+import xml.etree.ElementTree as ET
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from convert_xlsx_to_sv import (DEST_SHEET_MAP, InterruptStore, parse_main_sheet, parse_mscp_sheet,
+                                parse_destination_sheet, apply_destination_sheet, render_outputs)
+from interrupt_map import load_interrupt_map, load_timing_config
+from name_resolver import NameResolver
+from update_rtl_paths import RTLPathUpdater
+from plan_stimulus_waves import StimulusWavePlanner
+from plan_regression_shards import DEFAULT_SHARD_COUNT, ShardCostModel, plan_shards
+from plan_regression_shards import generate_sv_file as generate_shard_schedule_file
+from plan_mask_configs import MaskConfigPlanner, write_plusargs
+from source_buses import generate_source_buses_file
+from generation_history import GenerationHistory
+
+MAIN_SHEET = 'IOSUB中断源'
+MSCP_SHEET = 'MSCP-to-IOSUB中断'
+
+# Generated files of a variant, by output directory
+OUTPUT_FILES = {'entries': 'int_map_entries.svh',
+                'mask_tables_path': 'int_mask_tables.svh',
+                'route_bitmaps_path': 'int_route_bitmaps.svh',
+                'pair_ids_path': 'int_pair_ids.svh',
+                'coverage_bins_path': 'int_pair_coverage.svh',
+                'waves': 'int_wave_schedule.svh',
+                'shards': 'int_shard_schedule.svh',
+                'mask_configs': 'int_mask_configs.svh',
+                'plusargs': 'int_mask_configs.plusargs',
+                'source_buses': 'int_source_buses.svh'}
+LOG_FILE = 'batch_generate.log'
+
+_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def load_manifest(path: str) -> List[dict]:
+    """
+    Read and check a batch manifest.
+
+    Returns:
+        Variants with name, workbook, output_dir and hierarchy_config (None for the default)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    variants = data['variants'] if isinstance(data, dict) else data
+    result, names = [], set()
+    for i, variant in enumerate(variants):
+        for key in ('workbook', 'output_dir'):
+            if not variant.get(key):
+                raise ValueError(f"variant {i} of {path} has no '{key}'")
+        name = variant.get('name') or Path(variant['output_dir']).name
+        if name in names:
+            raise ValueError(f"duplicate variant name '{name}' in {path}")
+        names.add(name)
+        result.append({'name': name, 'workbook': variant['workbook'], 'output_dir': variant['output_dir'],
+                       'hierarchy_config': variant.get('hierarchy_config')})
+    return result
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _string_text(elem) -> str:
+    """Text of a shared or inline string (plain or rich text runs, phonetic runs left out)."""
+    text = []
+    for child in elem:
+        if child.tag == f'{_NS}t':
+            text.append(child.text or '')
+        elif child.tag == f'{_NS}r':
+            text.extend(t.text or '' for t in child.iter(f'{_NS}t'))
+    return ''.join(text)
+
+
+def _cell_key(cell_type: str, value: str) -> Tuple[str, str]:
+    """
+    (type, value) of a cell as it goes into a sheet digest.
+
+    Text is 'str' however it is stored (shared, inline or formula string) and
+    numbers are hashed by value, so writers that store the same cells
+    differently (e.g. Excel and openpyxl) produce the same digest.
+    """
+    if cell_type in ('s', 'inlineStr', 'str'):
+        return 'str', value
+    if cell_type == 'n':
+        try:
+            number = float(value)
+        except ValueError:
+            return 'n', value
+        return 'n', str(int(number)) if number.is_integer() else repr(number)
+    return cell_type, value
+
+
+def sheet_digests(workbook: str) -> Dict[str, str]:
+    """
+    Content hash of every sheet of an .xlsx workbook.
+
+    Only cell references, value kinds (text, number, bool, error, date) and
+    values go into the hash (see _cell_key), with shared strings resolved, so a
+    sheet copied between workbooks hashes the same even if the shared string
+    tables, string storage or styles of the workbooks differ.
+
+    Returns:
+        Dictionary of sheet name -> SHA-256 hex digest
+    """
+    with zipfile.ZipFile(workbook) as z:
+        shared = []
+        if 'xl/sharedStrings.xml' in z.namelist():
+            with z.open('xl/sharedStrings.xml') as f:
+                for _, elem in ET.iterparse(f):
+                    if elem.tag == f'{_NS}si':
+                        shared.append(_string_text(elem))
+                        elem.clear()
+
+        targets = {}
+        for rel in ET.fromstring(z.read('xl/_rels/workbook.xml.rels')).iter(f'{_PKG_REL_NS}Relationship'):
+            target = rel.get('Target')
+            targets[rel.get('Id')] = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+
+        digests = {}
+        for sheet in ET.fromstring(z.read('xl/workbook.xml')).iter(f'{_NS}sheet'):
+            h = hashlib.sha256()
+            row, column = 0, 0
+            with z.open(targets[sheet.get(f'{_REL_NS}id')]) as f:
+                for event, elem in ET.iterparse(f, events=('start', 'end')):
+                    tag = _local(elem.tag)
+                    if tag == 'row':
+                        if event == 'start':
+                            row, column = int(elem.get('r', row + 1)), 0
+                        else:
+                            elem.clear()
+                    elif tag == 'c' and event == 'end':
+                        column += 1
+                        cell_type = elem.get('t', 'n')
+                        if cell_type == 'inlineStr':
+                            inline = elem.find(f'{_NS}is')
+                            value = _string_text(inline) if inline is not None else ''
+                        else:
+                            v = elem.find(f'{_NS}v')
+                            value = v.text if v is not None and v.text is not None else ''
+                            if cell_type == 's' and value:
+                                value = shared[int(value)]
+                        if value:
+                            kind, value = _cell_key(cell_type, value)
+                            h.update(f"{elem.get('r') or f'{row}:{column}'}\t{kind}\t{value}\n".encode('utf-8'))
+            digests[sheet.get('name')] = h.hexdigest()
+        return digests
+
+
+def check_roundtrip_digests(workbook: str, work_dir: Optional[str] = None) -> List[str]:
+    """
+    Check that a workbook saved again by openpyxl hashes the same, sheet by sheet.
+
+    openpyxl stores every string in the shared string table and writes cached
+    formula results as plain values, so this exercises the normalization of
+    sheet_digests() on a real workbook.
+
+    Returns:
+        Names of the sheets whose digests differ (empty if all are shared)
+    """
+    from openpyxl import load_workbook
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        copy = os.path.join(tmp, Path(workbook).name)
+        load_workbook(workbook, data_only=True).save(copy)
+        original, saved = sheet_digests(workbook), sheet_digests(copy)
+    return [sheet for sheet in original if saved.get(sheet) != original[sheet]]
+
+
+def parse_sheet(workbook: str, sheet_name: str):
+    """
+    Read and parse one sheet (the unit of work of the parse stage).
+
+    Returns:
+        InterruptStore for the source sheets, interrupt name -> destination
+        index for destination sheets
+    """
+    df = pd.read_excel(workbook, sheet_name=sheet_name)
+    if sheet_name == MAIN_SHEET:
+        return parse_main_sheet(df)
+    if sheet_name == MSCP_SHEET:
+        return parse_mscp_sheet(df)
+    return parse_destination_sheet(df, sheet_name)
+
+
+def variant_sheets(digests: Dict[str, str]) -> List[str]:
+    """Sheets the converter reads, in parse_interrupt_xlsx() order."""
+    sheets = [MAIN_SHEET] + [MSCP_SHEET] * (MSCP_SHEET in digests)
+    return sheets + [name for name in DEST_SHEET_MAP.values() if name in digests]
+
+
+def render_variant(variant: dict, parsed: Dict[str, object], strict_names: bool = False) -> dict:
+    """
+    Assemble one variant from its parsed sheets and write all its generated files.
+
+    Args:
+        variant: Manifest entry
+        parsed: Sheet name -> parse result of the variant's sheets
+        strict_names: Do not apply confident fuzzy matches of destination sheet names
+
+    Returns:
+        Variant result with the number of entries and, on failure, the error
+    """
+    out = Path(variant['output_dir'])
+    out.mkdir(parents=True, exist_ok=True)
+    paths = {key: str(out / name) for key, name in OUTPUT_FILES.items()}
+    result = {'name': variant['name'], 'output_dir': str(out), 'entries': 0, 'error': None}
+    with open(out / LOG_FILE, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        try:
+            # Copy the cached parses, the destination sheets update them in place
+            interrupts = InterruptStore()
+            interrupts.update(parsed[MAIN_SHEET])
+            if MSCP_SHEET in parsed:
+                interrupts.update(parsed[MSCP_SHEET])
+            else:
+                print(f"Warning: {MSCP_SHEET} sheet not found, SCP/MCP interrupts will be missing")
+            resolver = NameResolver(interrupts)
+            for dest_name, sheet_name in DEST_SHEET_MAP.items():
+                if sheet_name in parsed:
+                    print(f"Processing destination sheet: {sheet_name}")
+                    apply_destination_sheet(interrupts, resolver, dest_name, sheet_name, parsed[sheet_name],
+                                            strict_names)
+
+            render_outputs(interrupts, paths['entries'], variant['workbook'],
+                           **{key: paths[key] for key in ('mask_tables_path', 'route_bitmaps_path',
+                                                          'pair_ids_path', 'coverage_bins_path')})
+            GenerationHistory.for_file(paths['entries']).record(paths['entries'], 'convert', variant['workbook'])
+
+            updater = RTLPathUpdater(variant['hierarchy_config'])
+            updater.entries_file = paths['entries']
+            if not updater.update_entries_file():
+                raise RuntimeError(f"RTL path update of {paths['entries']} failed")
+
+            entries = load_interrupt_map(paths['entries'])
+            planner = StimulusWavePlanner(entries)
+            planner.generate_sv_file(planner.plan(), paths['waves'], paths['entries'],
+                                     planner.get_unscheduled_names())
+            shard_costs = ShardCostModel(entries, load_timing_config()).estimate()
+            generate_shard_schedule_file(plan_shards(shard_costs, list(shard_costs), DEFAULT_SHARD_COUNT),
+                                         paths['shards'], paths['entries'])
+            mask_planner = MaskConfigPlanner(entries)
+            configs, _ = mask_planner.plan()
+            mask_planner.generate_sv_file(configs, paths['mask_configs'], paths['entries'])
+            write_plusargs(paths['plusargs'], configs)
+            generate_source_buses_file(entries, paths['source_buses'], paths['entries'])
+            result['entries'] = len(entries)
+        except Exception as e:
+            traceback.print_exc(file=log)
+            result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _by_name(entries: List[dict]) -> Dict[str, dict]:
+    """Entries by name, repeated names numbered name#2, ..."""
+    by_name, seen = {}, {}
+    for entry in entries:
+        seen[entry['name']] = seen.get(entry['name'], 0) + 1
+        by_name[entry['name'] if seen[entry['name']] == 1 else f"{entry['name']}#{seen[entry['name']]}"] = entry
+    return by_name
+
+
+def diff_maps(base: List[dict], other: List[dict]) -> dict:
+    """
+    Per-entry difference of a variant's map against the baseline map.
+
+    Returns:
+        {'added': [names], 'removed': [names], 'changed': {name: {field: (base, other)}}}
+    """
+    base_entries, other_entries = _by_name(base), _by_name(other)
+    changed = {}
+    for name, entry in other_entries.items():
+        if name in base_entries:
+            delta = {key: (base_entries[name].get(key), entry.get(key))
+                     for key in list(base_entries[name]) + [k for k in entry if k not in base_entries[name]]
+                     if base_entries[name].get(key) != entry.get(key)}
+            if delta:
+                changed[name] = delta
+    return {'added': [name for name in other_entries if name not in base_entries],
+            'removed': [name for name in base_entries if name not in other_entries],
+            'changed': changed}
+
+
+def print_variant_diff(name: str, diff: dict, limit: int = 10):
+    """Summarize the differences of one variant."""
+    field_counts: Dict[str, int] = {}
+    for delta in diff['changed'].values():
+        for key in delta:
+            field_counts[key] = field_counts.get(key, 0) + 1
+    print(f"  {name}: +{len(diff['added'])} / -{len(diff['removed'])} interrupts, "
+          f"{len(diff['changed'])} changed entries")
+    if field_counts:
+        print("    fields: " + ", ".join(f"{key}={count}" for key, count in
+                                       sorted(field_counts.items(), key=lambda kv: (-kv[1], kv[0]))))
+    for sign, names in (('+', diff['added']), ('-', diff['removed'])):
+        if names:
+            print(f"    {sign} {', '.join(names[:limit])}{' ...' if len(names) > limit else ''}")
+    for entry_name, delta in list(diff['changed'].items())[:limit]:
+        routing = {k: v for k, v in delta.items() if not k.startswith('rtl_path_')}
+        if routing:
+            print(f"    ~ {entry_name}: " + ", ".join(f"{k} {old}->{new}" for k, (old, new) in routing.items()))
+
+
+def run_batch(manifest: str, jobs: int = 1, strict_names: bool = False, report: Optional[str] = None) -> bool:
+    """
+    Generate all variants of a manifest.
+
+    Returns:
+        True if every variant was generated
+    """
+    try:
+        variants = load_manifest(manifest)
+    except (ValueError, KeyError) as e:
+        print(f"Error: invalid manifest {manifest}: {e}")
+        return False
+    for variant in variants:
+        if not Path(variant['workbook']).exists():
+            print(f"Error: {variant['workbook']} not found!")
+            return False
+    if not variants:
+        print(f"Error: {manifest} lists no variants!")
+        return False
+
+    # Hash the sheets and collect the distinct parse units
+    sheet_keys: Dict[str, Dict[str, str]] = {}  # variant -> sheet name -> digest
+    units: Dict[Tuple[str, str], str] = {}       # (sheet name, digest) -> workbook to read it from
+    for variant in variants:
+        digests = sheet_digests(variant['workbook'])
+        if MAIN_SHEET not in digests:
+            print(f"Error: {MAIN_SHEET} sheet not found in {variant['workbook']}!")
+            return False
+        sheet_keys[variant['name']] = {sheet: digests[sheet] for sheet in variant_sheets(digests)}
+        for sheet, digest in sheet_keys[variant['name']].items():
+            units.setdefault((sheet, digest), variant['workbook'])
+    references = sum(len(sheets) for sheets in sheet_keys.values())
+    print(f"Variants: {len(variants)}, sheets: {references} references, {len(units)} distinct "
+          f"({references - len(units)} parses shared)")
+
+    pool = Pool(processes=min(jobs, max(len(units), len(variants)))) if jobs > 1 else None
+    try:
+        unit_keys = list(units)
+        args = [(units[key], key[0]) for key in unit_keys]
+        parsed_units = dict(zip(unit_keys, pool.starmap(parse_sheet, args) if pool
+                                else [parse_sheet(*a) for a in args]))
+        print(f"Parsed {len(parsed_units)} sheets")
+
+        render_args = [(variant, {sheet: parsed_units[(sheet, digest)]
+                                  for sheet, digest in sheet_keys[variant['name']].items()}, strict_names)
+                       for variant in variants]
+        results = pool.starmap(render_variant, render_args) if pool else [render_variant(*a) for a in render_args]
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    for result in results:
+        status = f"{result['entries']} entries" if not result['error'] else f"FAILED ({result['error']})"
+        print(f"  {result['name']:<20} {status}  -> {result['output_dir']} (log: {LOG_FILE})")
+
+    # Compare the generated maps with the first variant
+    generated = [r for r in results if not r['error']]
+    diffs = {}
+    if len(generated) > 1:
+        base = generated[0]
+        base_entries = load_interrupt_map(str(Path(base['output_dir']) / OUTPUT_FILES['entries']))
+        print(f"\nVariant differences (baseline: {base['name']}):")
+        for result in generated[1:]:
+            diffs[result['name']] = diff_maps(
+                base_entries, load_interrupt_map(str(Path(result['output_dir']) / OUTPUT_FILES['entries'])))
+            shared = [sheet for sheet, digest in sheet_keys[result['name']].items()
+                      if sheet_keys[base['name']].get(sheet) == digest]
+            print_variant_diff(result['name'], diffs[result['name']])
+            print(f"    sheets identical to {base['name']}: {len(shared)}/{len(sheet_keys[result['name']])}")
+
+    if report:
+        with open(report, 'w', encoding='utf-8') as f:
+            json.dump({'variants': results, 'sheets': sheet_keys,
+                       'baseline': generated[0]['name'] if generated else None, 'diffs': diffs},
+                      f, indent=2, ensure_ascii=False)
+        print(f"Successfully generated '{report}'")
+
+    return len(generated) == len(results)
+
+
+def run_digest_check(manifest: str) -> bool:
+    """
+    Run check_roundtrip_digests() on every workbook of a manifest.
+
+    Returns:
+        True if every sheet of every workbook survives the round-trip
+    """
+    try:
+        variants = load_manifest(manifest)
+    except (ValueError, KeyError) as e:
+        print(f"Error: invalid manifest {manifest}: {e}")
+        return False
+    ok = True
+    for workbook in dict.fromkeys(variant['workbook'] for variant in variants):
+        if not Path(workbook).exists():
+            print(f"Error: {workbook} not found!")
+            ok = False
+            continue
+        differing = check_roundtrip_digests(workbook)
+        if differing:
+            print(f"{workbook}: {len(differing)} sheets differ after an openpyxl round-trip: {', '.join(differing)}")
+            ok = False
+        else:
+            print(f"{workbook}: all sheets shared after an openpyxl round-trip")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch Multi-Variant Interrupt Configuration Generator')
+    parser.add_argument('manifest', help='JSON manifest of variants (workbook, output_dir, hierarchy_config)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for parsing sheets and rendering variants (default: all cores)')
+    parser.add_argument('--strict-names', action='store_true',
+                        help='Do not apply confident fuzzy matches of destination sheet names')
+    parser.add_argument('-r', '--report', help='Write the per-variant results and differences as JSON')
+    parser.add_argument('--check-digests', action='store_true',
+                        help='Only check that an openpyxl round-trip of each workbook shares all sheet digests')
+
+    args = parser.parse_args()
+
+    if not Path(args.manifest).exists():
+        print(f"Error: {args.manifest} not found!")
+        return 1
+
+    if args.check_digests:
+        return 0 if run_digest_check(args.manifest) else 1
+
+    return 0 if run_batch(args.manifest, args.jobs, args.strict_names, args.report) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
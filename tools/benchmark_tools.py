@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Tools Pipeline Scaling Benchmark
+
+Times each stage of the Excel-to-SV pipeline on synthetic workbooks (see
+generate_synthetic_workbook.py) and compares the results with a stored
+baseline.  Everything runs offline on generated data.
+
+Stages:
+- convert:          convert_xlsx_to_sv.parse_interrupt_xlsx() (entries + mask tables)
+- update_rtl_paths: RTLPathUpdater.update_entries_file() on a copy of the entries
+- signal_paths:     SignalPathGenerator source/destination paths for every entry
+- load_map:         interrupt_map.load_interrupt_map() of the updated entries
+
+Each stage runs in its own Python process, so the reported peak RSS belongs to
+that stage alone (interpreter and imports included).  Wall time excludes
+imports.  With --repeat, the fastest run and the highest peak are kept.
+
+--store-compare N builds N interrupts both as Dict[str, InterruptInfo] and as
+the columnar InterruptStore of convert_xlsx_to_sv.py, and reports retained
+memory, build, iteration and rendering time of each (plus a direct scan of the
+store's columns, the access pattern row views cannot match).
+
+A stage regresses when it is slower than the baseline by more than
+--time-tolerance (and by more than --min-delta seconds), or uses more memory
+than --memory-tolerance allows; any regression makes the run fail.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import subprocess
+import contextlib
+from pathlib import Path
+from typing import Dict, List
+
+STAGES = ['convert', 'update_rtl_paths', 'signal_paths', 'load_map']
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+GROUPS = ['IOSUB', 'USB', 'SCP', 'MCP', 'SMMU', 'IODAP', 'ACCEL', 'CSUB',
+          'PSUB', 'PCIE1', 'D2D', 'DDR0', 'DDR1', 'DDR2']
+DESTINATIONS = ['ap', 'scp', 'mcp', 'accel', 'io', 'other_die']
+
+
+def get_peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def write_hierarchy_config(path: Path):
+    """
+    Write a self-contained hierarchy configuration for the RTL path stages.
+
+    Starts from the configuration SignalPathGenerator loads by default.  Its
+    fallback configuration has no group or destination mappings, so any
+    workbook group or destination missing from it is added.
+    """
+    from generate_signal_paths import SignalPathGenerator
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        defaults = SignalPathGenerator()
+    interrupt_groups = dict(getattr(defaults, 'interrupt_groups', {}))
+    destination_mappings = dict(getattr(defaults, 'destination_mappings', {}))
+    for group in GROUPS:
+        interrupt_groups.setdefault(group, {'base_signal': f"{group.lower()}_to_iosub_intr"})
+    for dest in DESTINATIONS:
+        destination_mappings.setdefault(dest, {'signal': f"iosub_to_{dest}_intr"})
+
+    config = {
+        'base_hierarchy': defaults.base_hierarchy,
+        'signal_mappings': defaults.signal_mappings,
+        'signal_widths': defaults.signal_widths,
+        'interrupt_groups': interrupt_groups,
+        'destination_mappings': destination_mappings,
+        'hierarchy_selection_rules': getattr(defaults, 'hierarchy_rules', {}),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+
+
+def run_stage(stage: str, size_dir: Path) -> dict:
+    """
+    Run one pipeline stage in the current process.
+
+    Returns:
+        Dictionary with the stage wall time in seconds and peak RSS in MB
+    """
+    workbook = size_dir / 'int_vector.xlsx'
+    entries = size_dir / 'int_map_entries.svh'
+    rtl_entries = size_dir / 'int_map_entries_rtl.svh'
+    config = size_dir / 'hierarchy_config.json'
+    devnull = open(os.devnull, 'w')
+
+    if stage == 'convert':
+        from convert_xlsx_to_sv import parse_interrupt_xlsx
+        func = lambda: parse_interrupt_xlsx(str(workbook), str(entries), str(size_dir / 'int_mask_tables.svh'))
+    elif stage == 'update_rtl_paths':
+        from update_rtl_paths import RTLPathUpdater
+        shutil.copyfile(entries, rtl_entries)
+        with contextlib.redirect_stdout(devnull):
+            updater = RTLPathUpdater(str(config))
+        updater.entries_file = str(rtl_entries)
+        func = updater.update_entries_file
+    elif stage == 'signal_paths':
+        from generate_signal_paths import SignalPathGenerator
+        from interrupt_map import load_interrupt_map
+        with contextlib.redirect_stdout(devnull):
+            generator = SignalPathGenerator(str(config))
+        map_entries = load_interrupt_map(str(entries))
+
+        def func():
+            for entry in map_entries:
+                generator.generate_source_path(entry['name'], entry['group'], entry['index'])
+                for dest in DESTINATIONS:
+                    if entry[f'to_{dest}'] and entry[f'dest_index_{dest}'] >= 0:
+                        generator.generate_destination_path(dest, entry[f'dest_index_{dest}'], entry['name'])
+    elif stage == 'load_map':
+        from interrupt_map import load_interrupt_map
+        func = lambda: load_interrupt_map(str(rtl_entries))
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+
+    # Stage output (per-entry progress, warnings) would dominate the timing at 100k rows
+    with devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+
+    return {'seconds': seconds, 'peak_rss_mb': get_peak_rss_mb()}
+
+
+def measure_stage(stage: str, size_dir: Path, repeat: int) -> dict:
+    """Run a stage in fresh processes; keep the fastest time and the highest peak RSS."""
+    result = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--stage', stage, '--work-dir', str(size_dir)],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"Stage '{stage}' failed:\n{proc.stderr.strip()}")
+        sample = json.loads(proc.stdout.strip().splitlines()[-1])
+        if result is None:
+            result = sample
+        else:
+            result = {'seconds': min(result['seconds'], sample['seconds']),
+                      'peak_rss_mb': max(result['peak_rss_mb'], sample['peak_rss_mb'])}
+    return result
+
+
+def prepare_workbook(size_dir: Path, size: int, template: str, regenerate: bool) -> float:
+    """
+    Generate the synthetic workbook and hierarchy configuration for one size.
+
+    Returns:
+        Workbook generation time in seconds (0 if a cached workbook was reused)
+    """
+    from interrupt_map import load_interrupt_map
+    from generate_synthetic_workbook import SyntheticWorkbookGenerator
+
+    size_dir.mkdir(parents=True, exist_ok=True)
+    write_hierarchy_config(size_dir / 'hierarchy_config.json')
+
+    workbook = size_dir / 'int_vector.xlsx'
+    if workbook.exists() and not regenerate:
+        return 0.0
+
+    start = time.perf_counter()
+    SyntheticWorkbookGenerator(load_interrupt_map(template)).write(str(workbook), size)
+    return time.perf_counter() - start
+
+
+def compare_with_baseline(results: dict, baseline: dict, time_tolerance: float,
+                          memory_tolerance: float, min_delta: float) -> List[str]:
+    """
+    Compare benchmark results with the baseline.
+
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            slower = current['seconds'] - base['seconds']
+            if current['seconds'] > base['seconds'] * (1 + time_tolerance) and slower > min_delta:
+                regressions.append(f"{stage}@{size}: time {current['seconds']:.3f}s vs baseline "
+                                   f"{base['seconds']:.3f}s (+{slower / base['seconds']:.0%})")
+            if current['peak_rss_mb'] > base['peak_rss_mb'] * (1 + memory_tolerance):
+                regressions.append(f"{stage}@{size}: peak RSS {current['peak_rss_mb']:.1f}MB vs baseline "
+                                   f"{base['peak_rss_mb']:.1f}MB")
+    return regressions
+
+
+def compare_interrupt_store(template_entries: List[dict], count: int) -> Dict[str, dict]:
+    """
+    Compare the columnar InterruptStore with Dict[str, InterruptInfo].
+
+    Returns:
+        Dictionary of representation -> memory_mb / build / iterate / scan / render seconds
+    """
+    import gc
+    import tracemalloc
+    from convert_xlsx_to_sv import InterruptInfo, InterruptStore, DESTINATIONS
+
+    def build_legacy():
+        interrupts = {}
+        for name, entry in rows:
+            info = InterruptInfo(name, entry['index'], entry['group'], entry['trigger'], entry['polarity'])
+            for dest in DESTINATIONS:
+                if entry[f"to_{dest.lower()}"]:
+                    info.add_destination(dest, entry[f"dest_index_{dest.lower()}"], f"// {dest}")
+            interrupts[name] = info
+        return interrupts
+
+    def build_store():
+        interrupts = InterruptStore()
+        for name, entry in rows:
+            row = interrupts.add(name, entry['index'], entry['group'], entry['trigger'], entry['polarity'])
+            for dest in DESTINATIONS:
+                if entry[f"to_{dest.lower()}"]:
+                    row.add_destination(dest, entry[f"dest_index_{dest.lower()}"], f"// {dest}")
+        return interrupts
+
+    def scan(interrupts):
+        if isinstance(interrupts, InterruptStore):
+            return sum(1 for column in interrupts.dest_index for dest_index in column if dest_index >= 0)
+        return sum(1 for info in interrupts.values() for dest_index, _ in info.destinations.values()
+                   if dest_index >= 0)
+
+    def iterate(interrupts):
+        routed = 0
+        for info in interrupts.values():
+            if info.group and info.index >= 0:
+                routed += sum(1 for dest_index, _ in info.destinations.values() if dest_index >= 0)
+        return routed
+
+    rows = []
+    for i in range(count):
+        copy, pos = divmod(i, len(template_entries))
+        entry = template_entries[pos]
+        rows.append((entry['name'] if copy == 0 else f"{entry['name']}_s{copy}", entry))
+
+    results = {}
+    for label, build in (('InterruptInfo dict', build_legacy), ('InterruptStore', build_store)):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        interrupts = build()
+        build_seconds = time.perf_counter() - start
+        memory_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        iterate(interrupts)
+        iterate_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scan(interrupts)
+        scan_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for info in interrupts.values():
+            info.to_sv_entry()
+        render_seconds = time.perf_counter() - start
+
+        results[label] = {'memory_mb': memory_mb, 'build_seconds': build_seconds,
+                          'iterate_seconds': iterate_seconds, 'scan_seconds': scan_seconds,
+                          'render_seconds': render_seconds}
+        del interrupts
+    return results
+
+
+def print_results(results: dict, baseline: dict):
+    print(f"\n{'Size':>8}  {'Stage':<18}{'Time(s)':>10}{'Base(s)':>10}{'RSS(MB)':>10}{'Base(MB)':>10}")
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            base = baseline.get(size, {}).get(stage, {})
+            base_time = f"{base['seconds']:.3f}" if base else '-'
+            base_rss = f"{base['peak_rss_mb']:.1f}" if base else '-'
+            print(f"{size:>8}  {stage:<18}{current['seconds']:>10.3f}{base_time:>10}"
+                  f"{current['peak_rss_mb']:>10.1f}{base_rss:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tools Pipeline Scaling Benchmark')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Comma-separated interrupt counts (default: 1000,10000,100000)')
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"Comma-separated stages to run (default: {','.join(STAGES)})")
+    parser.add_argument('-t', '--template', default='seq/int_map_entries.svh',
+                        help='Interrupt map entries file replicated into the synthetic workbooks')
+    parser.add_argument('-w', '--work-dir', default='benchmark_work',
+                        help='Directory for synthetic workbooks and stage outputs')
+    parser.add_argument('-b', '--baseline', default='tools/benchmark_baseline.json',
+                        help='Baseline results file')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store the results as the new baseline instead of comparing')
+    parser.add_argument('--regenerate', action='store_true', help='Regenerate cached synthetic workbooks')
+    parser.add_argument('-r', '--repeat', type=int, default=1,
+                        help='Runs per stage; the fastest is kept (default: 1)')
+    parser.add_argument('--time-tolerance', type=float, default=0.25,
+                        help='Allowed relative slowdown before failing (default: 0.25)')
+    parser.add_argument('--memory-tolerance', type=float, default=0.10,
+                        help='Allowed relative peak RSS growth before failing (default: 0.10)')
+    parser.add_argument('--min-delta', type=float, default=0.05,
+                        help='Ignore slowdowns smaller than this many seconds (default: 0.05)')
+    parser.add_argument('--store-compare', type=int, metavar='N',
+                        help='Compare InterruptStore with InterruptInfo dicts at N interrupts and exit')
+    parser.add_argument('--stage', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    # Child process mode: run a single stage and report it as JSON
+    if args.stage:
+        print(json.dumps(run_stage(args.stage, Path(args.work_dir))))
+        return 0
+
+    if not Path(args.template).exists():
+        print(f"Error: {args.template} not found!")
+        return 1
+
+    if args.store_compare:
+        from interrupt_map import load_interrupt_map
+        results = compare_interrupt_store(load_interrupt_map(args.template), args.store_compare)
+        print(f"Interrupt representation comparison at {args.store_compare} interrupts")
+        print(f"{'Representation':<20}{'Memory(MB)':>12}{'Build(s)':>10}{'Iterate(s)':>12}"
+              f"{'Scan(s)':>10}{'Render(s)':>11}")
+        for label, r in results.items():
+            print(f"{label:<20}{r['memory_mb']:>12.1f}{r['build_seconds']:>10.3f}"
+                  f"{r['iterate_seconds']:>12.3f}{r['scan_seconds']:>10.3f}{r['render_seconds']:>11.3f}")
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    stages = [s.strip() for s in args.stages.split(',') if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        print(f"Error: unknown stages: {', '.join(unknown)} (available: {', '.join(STAGES)})")
+        return 1
+    # Later stages consume the outputs of earlier ones
+    stages = [s for s in STAGES if s in stages]
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+
+    print("Tools Pipeline Scaling Benchmark")
+    print("=" * 50)
+    print(f"Python {platform.python_version()} on {platform.platform()}")
+
+    results: Dict[str, Dict[str, dict]] = {}
+    for size in sizes:
+        size_dir = Path(args.work_dir).resolve() / str(size)
+        gen_time = prepare_workbook(size_dir, size, args.template, args.regenerate)
+        if gen_time:
+            print(f"Generated {size}-interrupt workbook in {gen_time:.1f}s")
+        else:
+            print(f"Reusing {size}-interrupt workbook in {size_dir}")
+
+        results[str(size)] = {}
+        for stage in stages:
+            try:
+                results[str(size)][stage] = measure_stage(stage, size_dir, max(1, args.repeat))
+            except RuntimeError as e:
+                print(f"Error: {e}")
+                return 1
+            print(f"  {stage}: {results[str(size)][stage]['seconds']:.3f}s")
+
+    print_results(results, baseline)
+
+    if args.update_baseline:
+        # Keep baseline entries for sizes/stages that were not run this time
+        merged = {size: dict(stages) for size, stages in baseline.items()}
+        for size, stages in results.items():
+            merged.setdefault(size, {}).update(stages)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(), 'platform': platform.platform(),
+                       'results': merged}, f, indent=2)
+        print(f"\nBaseline updated: {baseline_path}")
+        return 0
+
+    if not baseline:
+        print(f"\nNo baseline at {baseline_path}; run with --update-baseline to store one")
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.time_tolerance,
+                                        args.memory_tolerance, args.min_delta)
+    if regressions:
+        print(f"\n❌ {len(regressions)} performance regressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("\n✅ No performance regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Excel Naming Consistency Checker
+
+Lists the interrupt names of the destination sheets that have no exact match
+in the source sheets (IOSUB中断源, MSCP-to-IOSUB中断), which convert_xlsx_to_sv.py
+would otherwise leave at dest_index -1.
+
+Each name is resolved against a trigram index of the source names (see
+name_resolver.py) and reported as
+- fix:       a confident match, which convert_xlsx_to_sv.py applies unless
+             run with --strict-names
+- ambiguous: similar source names exist, but none is a clear match
+- unmatched: no similar source name (e.g. interrupts of groups that are not
+             converted)
+"""
+
+import sys
+import csv
+import argparse
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from convert_xlsx_to_sv import (DEST_SHEET_MAP, parse_main_sheet, parse_mscp_sheet, parse_destination_sheet,
+                                match_destination_names)
+from name_resolver import NameResolver
+
+
+def check_workbook(xlsx_file: str) -> List[dict]:
+    """
+    Resolve the unmatched destination sheet names of a workbook.
+
+    Returns:
+        One record (dest, sheet, name, status, candidates) per unmatched name
+    """
+    interrupts = parse_main_sheet(pd.read_excel(xlsx_file, sheet_name='IOSUB中断源'))
+    xl = pd.ExcelFile(xlsx_file)
+    if 'MSCP-to-IOSUB中断' in xl.sheet_names:
+        interrupts.update(parse_mscp_sheet(pd.read_excel(xlsx_file, sheet_name='MSCP-to-IOSUB中断')))
+    resolver = NameResolver(interrupts)
+
+    issues = []
+    for dest_name, sheet_name in DEST_SHEET_MAP.items():
+        if sheet_name not in xl.sheet_names:
+            continue
+        dest_indices = parse_destination_sheet(pd.read_excel(xlsx_file, sheet_name=sheet_name), sheet_name)
+        _, fixes, ambiguous = match_destination_names(dest_indices, interrupts, resolver, auto_fix=False)
+        for name, fix, score in fixes:
+            issues.append({'dest': dest_name, 'sheet': sheet_name, 'name': name, 'status': 'fix',
+                           'candidates': [(fix, score)]})
+        for name, candidates in ambiguous:
+            issues.append({'dest': dest_name, 'sheet': sheet_name, 'name': name,
+                           'status': 'ambiguous' if candidates else 'unmatched', 'candidates': candidates})
+    return issues
+
+
+def write_report(path: str, issues: List[dict]):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['destination', 'sheet', 'name', 'status', 'candidates'])
+        for issue in issues:
+            writer.writerow([issue['dest'], issue['sheet'], issue['name'], issue['status'],
+                             ' '.join(f"{name}:{score:.2f}" for name, score in issue['candidates'])])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Excel Naming Consistency Checker')
+    parser.add_argument('xlsx_file', nargs='?', default='int_vector.xlsx',
+                        help='Path to the input Excel file (default: int_vector.xlsx)')
+    parser.add_argument('-o', '--output', help='Write the unmatched names with candidates as CSV')
+    parser.add_argument('--show-unmatched', action='store_true',
+                        help='Also list names without any similar source name')
+
+    args = parser.parse_args()
+
+    if not Path(args.xlsx_file).exists():
+        print(f"Error: {args.xlsx_file} not found!")
+        return 1
+
+    issues = check_workbook(args.xlsx_file)
+    counts = {status: sum(1 for i in issues if i['status'] == status) for status in ('fix', 'ambiguous', 'unmatched')}
+    print(f"Destination sheet names without an exact source match: {len(issues)}")
+    print(f"  Confident fixes: {counts['fix']}")
+    print(f"  Ambiguous:       {counts['ambiguous']}")
+    print(f"  Unmatched:       {counts['unmatched']}")
+    for issue in issues:
+        if issue['status'] == 'fix':
+            fix, score = issue['candidates'][0]
+            print(f"    🔧 [{issue['dest']}] '{issue['name']}' -> '{fix}' (score {score:.2f})")
+        elif issue['status'] == 'ambiguous':
+            hint = ', '.join(f"'{name}' ({score:.2f})" for name, score in issue['candidates'])
+            print(f"    ⚠️  [{issue['dest']}] '{issue['name']}': did you mean {hint}")
+        elif args.show_unmatched:
+            print(f"    ❌ [{issue['dest']}] '{issue['name']}': no similar source name")
+
+    if args.output:
+        write_report(args.output, issues)
+        print(f"Successfully generated '{args.output}'")
+
+    return 1 if counts['fix'] or counts['ambiguous'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Generation Pipeline Equivalence Checker
+
+Runs a frozen reference implementation and the candidate implementation of the
+Excel-to-SV pipeline on the same workbooks and compares what they generate, so
+that performance rework of convert_xlsx_to_sv.py, update_rtl_paths.py or
+SignalPathGenerator can be checked for unchanged output.
+
+- reference: the tools/ directory of a git revision (default HEAD, i.e. the
+  committed code), extracted with 'git archive', or any tools directory
+- candidate: the tools/ directory of the working tree (or any other)
+
+Workbook corpus:
+- the real workbook (int_vector.xlsx)
+- randomized synthetic workbooks: a random sample of the template interrupts,
+  shuffled and replicated to a random size (see generate_synthetic_workbook.py)
+- fuzzed synthetic workbooks: as above, with cell mutations the converter has
+  to cope with (name case and whitespace, float/text indices, missing or
+  duplicated rows, 'Possible'/'yes' flags, blank trigger cells, name typos)
+
+Per workbook and implementation the pipeline stages run in one process, with
+that implementation's modules first on sys.path:
+- convert:          parse_interrupt_xlsx() -> entries, mask tables, routing
+                    bitmaps, pair IDs, coverage bins (whichever the
+                    implementation supports)
+- update_rtl_paths: RTLPathUpdater.update_entries_file() on a copy
+- signal_paths:     SignalPathGenerator source/destination path of every entry
+
+Maps are compared entry by entry and field by field, other generated files
+line by line, and the first divergence of each workbook is reported.  A stage
+that raises counts as output: both implementations must fail the same way.
+Workbooks are split across -j worker processes.
+"""
+
+import os
+import io
+import sys
+import json
+import random
+import shutil
+import tarfile
+import argparse
+import traceback
+import subprocess
+import contextlib
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+# Generated files compared line by line, in pipeline order (the maps are compared by field)
+MAP_FILES = ['int_map_entries.svh', 'int_map_entries_rtl.svh']
+TEXT_FILES = ['int_mask_tables.svh', 'int_route_bitmaps.svh', 'int_pair_ids.svh', 'int_pair_coverage.svh']
+CONVERT_OUTPUTS = {'mask_tables_path': 'int_mask_tables.svh',
+                   'route_bitmaps_path': 'int_route_bitmaps.svh',
+                   'pair_ids_path': 'int_pair_ids.svh',
+                   'coverage_bins_path': 'int_pair_coverage.svh'}
+
+FUZZ_MUTATIONS = ['name_case', 'name_whitespace', 'float_index', 'text_index', 'drop_dest_row',
+                  'duplicate_row', 'possible_flag', 'lowercase_flag', 'blank_trigger', 'name_typo']
+
+
+def extract_reference(revision: str, work_dir: Path) -> Path:
+    """
+    Extract the tools/ directory of a git revision.
+
+    Returns:
+        Path of the extracted tools directory
+    """
+    repo = subprocess.run(['git', 'rev-parse', '--show-toplevel'], cwd=TOOLS_DIR,
+                          capture_output=True, text=True, check=True).stdout.strip()
+    prefix = os.path.relpath(TOOLS_DIR, repo)
+    archive = subprocess.run(['git', 'archive', '--format=tar', revision, prefix], cwd=repo,
+                             capture_output=True, check=True).stdout
+    target = work_dir / 'reference'
+    shutil.rmtree(target, ignore_errors=True)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(target)
+    return target / prefix
+
+
+class WorkbookFuzzer:
+    def __init__(self, rng: random.Random, rate: float = 0.05):
+        """
+        Mutate synthetic workbook rows.
+
+        Args:
+            rng: Seeded random source
+            rate: Share of the data rows each mutation is applied to
+        """
+        self.rng = rng
+        self.rate = rate
+
+    @staticmethod
+    def index_column(sheet_name: str) -> int:
+        """Column of the index; the interrupt name is in the next column."""
+        from convert_xlsx_to_sv import DEST_SHEET_MAP
+        return 2 if sheet_name == DEST_SHEET_MAP['AP'] else 1
+
+    def data_rows(self, sheet_name: str, rows: List[list]) -> List[int]:
+        """Row numbers of the interrupt rows of a sheet (title, header, group and NMI rows excluded)."""
+        index_col = self.index_column(sheet_name)
+        return [i for i, row in enumerate(rows)
+                if len(row) > index_col + 1 and isinstance(row[index_col], int) and isinstance(row[index_col + 1], str)]
+
+    def pick(self, rows: List[int]) -> List[int]:
+        return [i for i in rows if self.rng.random() < self.rate]
+
+    def mutate(self, sheets: Dict[str, List[list]]) -> List[str]:
+        """
+        Apply a random selection of FUZZ_MUTATIONS in place.
+
+        Returns:
+            Names of the applied mutations
+        """
+        from generate_synthetic_workbook import MAIN_SHEET, MSCP_SHEET
+
+        applied = self.rng.sample(FUZZ_MUTATIONS, self.rng.randint(1, 4))
+        for sheet_name, rows in sheets.items():
+            source = sheet_name in (MAIN_SHEET, MSCP_SHEET)
+            data = self.data_rows(sheet_name, rows)
+            if not data:
+                continue
+            index_col = self.index_column(sheet_name)
+            name_col = index_col + 1
+            for mutation in applied:
+                if mutation == 'name_case' and not source:
+                    for i in self.pick(data):
+                        rows[i][name_col] = rows[i][name_col].upper()
+                elif mutation == 'name_whitespace':
+                    for i in self.pick(data):
+                        rows[i][name_col] = f" {rows[i][name_col]}  "
+                elif mutation == 'name_typo' and not source:
+                    for i in self.pick(data):
+                        rows[i][name_col] = rows[i][name_col][:-1]
+                elif mutation == 'float_index':
+                    for i in self.pick(data):
+                        rows[i][index_col] = float(rows[i][index_col])
+                elif mutation == 'text_index':
+                    for i in self.pick(data):
+                        rows[i][index_col] = str(rows[i][index_col])
+                elif mutation == 'possible_flag' and source:
+                    for i in self.pick(data):
+                        rows[i][7:] = ['Possible' if v == 'YES' else v for v in rows[i][7:]]
+                elif mutation == 'lowercase_flag' and source:
+                    for i in self.pick(data):
+                        rows[i][7:] = [v.lower() if isinstance(v, str) else v for v in rows[i][7:]]
+                elif mutation == 'blank_trigger' and source:
+                    for i in self.pick(data):
+                        rows[i][5] = None
+                elif mutation == 'duplicate_row':
+                    for i in sorted(self.pick(data), reverse=True):
+                        rows.insert(i + 1, list(rows[i]))
+                elif mutation == 'drop_dest_row' and not source:
+                    for i in sorted(self.pick(data), reverse=True):
+                        del rows[i]
+                # Row numbers are stale after inserting or deleting rows
+                data = self.data_rows(sheet_name, rows)
+        return applied
+
+
+def build_corpus(args) -> List[dict]:
+    """Workbook cases: the real workbook, then randomized and fuzzed synthetic ones."""
+    cases = []
+    if args.workbook and Path(args.workbook).exists():
+        cases.append({'name': 'real', 'kind': 'real', 'workbook': str(Path(args.workbook).resolve())})
+    elif args.workbook:
+        print(f"Warning: {args.workbook} not found, checking synthetic workbooks only")
+    rng = random.Random(args.seed)
+    for kind, count in (('random', args.random), ('fuzz', args.fuzz)):
+        for n in range(count):
+            cases.append({'name': f"{kind}_{n:03d}", 'kind': kind, 'seed': rng.randrange(1 << 30),
+                          'size': rng.randint(args.min_size, args.max_size)})
+    return cases
+
+
+def write_case_workbook(case: dict, template: str, case_dir: Path) -> Optional[str]:
+    """
+    Generate the synthetic workbook of a case.
+
+    Returns:
+        Description of the applied mutations, if any
+    """
+    from interrupt_map import load_interrupt_map
+    from generate_synthetic_workbook import SyntheticWorkbookGenerator, write_sheets
+
+    rng = random.Random(case['seed'])
+    entries = load_interrupt_map(template)
+    sample = rng.sample(entries, rng.randint(max(1, len(entries) // 4), len(entries)))
+    sheets, _ = SyntheticWorkbookGenerator(sample).build_sheets(case['size'])
+    mutations = WorkbookFuzzer(rng).mutate(sheets) if case['kind'] == 'fuzz' else []
+    case['workbook'] = str(case_dir / 'int_vector.xlsx')
+    write_sheets(case['workbook'], sheets)
+    return ', '.join(mutations) or None
+
+
+def run_pipeline(workbook: str, out_dir: Path, config: str):
+    """
+    Run all stages of the implementation that is first on sys.path.
+
+    Outputs (or <stage>.error on an exception) are written to out_dir.
+    """
+    import inspect
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries = out_dir / 'int_map_entries.svh'
+    rtl_entries = out_dir / 'int_map_entries_rtl.svh'
+
+    def stage(name, func):
+        try:
+            func()
+            return True
+        except Exception as e:
+            # Only the exception itself is compared, not where it was raised
+            (out_dir / f"{name}.error").write_text(f"{type(e).__name__}: {e}\n", encoding='utf-8')
+            (out_dir / f"{name}.traceback").write_text(traceback.format_exc(), encoding='utf-8')
+            return False
+
+    def convert():
+        from convert_xlsx_to_sv import parse_interrupt_xlsx
+        supported = inspect.signature(parse_interrupt_xlsx).parameters
+        kwargs = {arg: str(out_dir / f) for arg, f in CONVERT_OUTPUTS.items() if arg in supported}
+        parse_interrupt_xlsx(workbook, str(entries), **kwargs)
+
+    def update_rtl_paths():
+        from update_rtl_paths import RTLPathUpdater
+        shutil.copyfile(entries, rtl_entries)
+        updater = RTLPathUpdater(config)
+        updater.entries_file = str(rtl_entries)
+        updater.update_entries_file()
+
+    def signal_paths():
+        from generate_signal_paths import SignalPathGenerator
+        from interrupt_map import load_interrupt_map, DESTINATIONS
+        generator = SignalPathGenerator(config)
+        paths = []
+        for entry in load_interrupt_map(str(entries)):
+            paths.append([entry['name'], 'src',
+                          generator.generate_source_path(entry['name'], entry['group'], entry['index'])])
+            for dest in DESTINATIONS:
+                if entry[f'to_{dest}'] and entry[f'dest_index_{dest}'] >= 0:
+                    paths.append([entry['name'], dest, generator.generate_destination_path(
+                        dest, entry[f'dest_index_{dest}'], entry['name'])])
+        with open(out_dir / 'signal_paths.json', 'w', encoding='utf-8') as f:
+            json.dump(paths, f, indent=0, ensure_ascii=False)
+
+    with open(out_dir / 'stdout.log', 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        if stage('convert', convert):
+            stage('update_rtl_paths', update_rtl_paths)
+            stage('signal_paths', signal_paths)
+
+
+def run_side(tools_dir: str, config: str, case_dirs: List[str], side: str):
+    """Worker process: run the pipeline of one implementation on several workbooks."""
+    sys.path.insert(0, tools_dir)
+    for case_dir in case_dirs:
+        run_pipeline(str(Path(case_dir) / 'int_vector.xlsx'), Path(case_dir) / side, config)
+
+
+def first_divergence(reference_dir: Path, candidate_dir: Path) -> Optional[dict]:
+    """
+    Compare the outputs of both implementations for one workbook.
+
+    Returns:
+        The first divergence (file, location, reference and candidate value), or None
+    """
+    from interrupt_map import load_interrupt_map
+
+    def read(path: Path) -> Optional[str]:
+        return path.read_text(encoding='utf-8') if path.exists() else None
+
+    for name in ('convert', 'update_rtl_paths', 'signal_paths'):
+        ref, cand = read(reference_dir / f"{name}.error"), read(candidate_dir / f"{name}.error")
+        if ref != cand:
+            return {'file': f"{name} stage", 'location': 'exception',
+                    'reference': (ref or 'no exception').strip(), 'candidate': (cand or 'no exception').strip()}
+
+    for name in MAP_FILES:
+        ref_path, cand_path = reference_dir / name, candidate_dir / name
+        if not ref_path.exists() or not cand_path.exists():
+            continue
+        ref_entries, cand_entries = load_interrupt_map(str(ref_path)), load_interrupt_map(str(cand_path))
+        for i, (ref, cand) in enumerate(zip(ref_entries, cand_entries)):
+            for field in list(ref) + [f for f in cand if f not in ref]:
+                if ref.get(field) != cand.get(field):
+                    return {'file': name, 'location': f"entry {i} ({ref.get('name')}) field {field}",
+                            'reference': ref.get(field), 'candidate': cand.get(field)}
+        if len(ref_entries) != len(cand_entries):
+            return {'file': name, 'location': 'entry count',
+                    'reference': len(ref_entries), 'candidate': len(cand_entries)}
+
+    for name in TEXT_FILES:
+        ref, cand = read(reference_dir / name), read(candidate_dir / name)
+        if ref is None or cand is None:
+            continue  # Not generated by one of the implementations
+        ref_lines, cand_lines = ref.splitlines(), cand.splitlines()
+        for i, (ref_line, cand_line) in enumerate(zip(ref_lines, cand_lines)):
+            if ref_line != cand_line:
+                return {'file': name, 'location': f"line {i + 1}", 'reference': ref_line, 'candidate': cand_line}
+        if len(ref_lines) != len(cand_lines):
+            return {'file': name, 'location': 'line count', 'reference': len(ref_lines), 'candidate': len(cand_lines)}
+
+    ref, cand = read(reference_dir / 'signal_paths.json'), read(candidate_dir / 'signal_paths.json')
+    if ref is not None and cand is not None:
+        ref_paths, cand_paths = json.loads(ref), json.loads(cand)
+        for ref_path, cand_path in zip(ref_paths, cand_paths):
+            if ref_path != cand_path:
+                return {'file': 'signal paths', 'location': f"{ref_path[0]} [{ref_path[1]}]",
+                        'reference': ref_path[2], 'candidate': cand_path[2]}
+        if len(ref_paths) != len(cand_paths):
+            return {'file': 'signal paths', 'location': 'path count',
+                    'reference': len(ref_paths), 'candidate': len(cand_paths)}
+    return None
+
+
+def check_chunk(task: dict) -> List[dict]:
+    """
+    Pool worker: generate the workbooks of a chunk of cases, run both
+    implementations on them in parallel processes and compare the outputs.
+    """
+    work_dir = Path(task['work_dir'])
+    case_dirs = []
+    for case in task['cases']:
+        case_dir = work_dir / case['name']
+        shutil.rmtree(case_dir, ignore_errors=True)
+        case_dir.mkdir(parents=True)
+        if case['kind'] == 'real':
+            shutil.copyfile(case['workbook'], case_dir / 'int_vector.xlsx')
+        else:
+            case['mutations'] = write_case_workbook(case, task['template'], case_dir)
+        case_dirs.append(str(case_dir))
+
+    procs = []
+    for side, tools_dir in (('reference', task['reference']), ('candidate', task['candidate'])):
+        cmd = [sys.executable, str(Path(__file__).resolve()), '--side', side, '--tools-dir', tools_dir,
+               '--config', task['config']] + case_dirs
+        procs.append((side, subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)))
+    for side, proc in procs:
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"{side} worker failed:\n{stderr.strip()}")
+
+    results = []
+    for case, case_dir in zip(task['cases'], case_dirs):
+        divergence = first_divergence(Path(case_dir) / 'reference', Path(case_dir) / 'candidate')
+        results.append({'name': case['name'], 'kind': case['kind'], 'size': case.get('size'),
+                        'mutations': case.get('mutations'), 'divergence': divergence})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generation Pipeline Equivalence Checker')
+    parser.add_argument('--reference', default='HEAD',
+                        help='Git revision of the reference implementation (default: HEAD)')
+    parser.add_argument('--reference-dir', help='Reference tools directory (instead of --reference)')
+    parser.add_argument('--candidate-dir', default=str(TOOLS_DIR),
+                        help='Candidate tools directory (default: the working tree)')
+    parser.add_argument('-x', '--workbook', default='int_vector.xlsx',
+                        help="Real workbook to include ('' to skip)")
+    parser.add_argument('-t', '--template', default='seq/int_map_entries.svh',
+                        help='Interrupt map entries file the synthetic workbooks replicate')
+    parser.add_argument('--random', type=int, default=8, help='Number of randomized synthetic workbooks')
+    parser.add_argument('--fuzz', type=int, default=16, help='Number of fuzzed synthetic workbooks')
+    parser.add_argument('--min-size', type=int, default=50, help='Minimum interrupts per synthetic workbook')
+    parser.add_argument('--max-size', type=int, default=2000, help='Maximum interrupts per synthetic workbook')
+    parser.add_argument('--seed', type=int, default=1, help='Seed of the synthetic corpus')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: all cores)')
+    parser.add_argument('-w', '--work-dir', default='equivalence_work',
+                        help='Directory for workbooks and generated outputs')
+    parser.add_argument('-o', '--output', help='Write the per-workbook results as JSON')
+    parser.add_argument('--side', choices=['reference', 'candidate'], help=argparse.SUPPRESS)
+    parser.add_argument('--tools-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--config', help=argparse.SUPPRESS)
+    parser.add_argument('case_dirs', nargs='*', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.side:
+        run_side(args.tools_dir, args.config, args.case_dirs, args.side)
+        return 0
+
+    if not Path(args.template).exists():
+        print(f"Error: {args.template} not found!")
+        return 1
+
+    from benchmark_tools import write_hierarchy_config
+
+    work_dir = Path(args.work_dir).resolve()
+    work_dir.mkdir(parents=True, exist_ok=True)
+    if args.reference_dir:
+        reference = Path(args.reference_dir).resolve()
+    else:
+        try:
+            reference = extract_reference(args.reference, work_dir)
+        except subprocess.CalledProcessError as e:
+            print(f"Error: cannot extract revision {args.reference}: {e.stderr.strip() if e.stderr else e}")
+            return 1
+    config = work_dir / 'hierarchy_config.json'
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        write_hierarchy_config(config)
+
+    cases = build_corpus(args)
+    jobs = max(1, min(args.jobs, len(cases)))
+    tasks = [{'cases': cases[i::jobs], 'work_dir': str(work_dir / 'cases'), 'template': str(Path(args.template).resolve()),
+              'reference': str(reference), 'candidate': str(Path(args.candidate_dir).resolve()), 'config': str(config)}
+             for i in range(jobs)]
+    print(f"Checking {len(cases)} workbooks with {jobs} workers")
+    print(f"  reference: {args.reference_dir or args.reference} ({reference})")
+    print(f"  candidate: {args.candidate_dir}")
+
+    if jobs == 1:
+        chunks = [check_chunk(tasks[0])]
+    else:
+        with Pool(processes=jobs) as pool:
+            chunks = pool.map(check_chunk, tasks)
+    results = sorted((r for chunk in chunks for r in chunk), key=lambda r: r['name'])
+
+    diverged = [r for r in results if r['divergence']]
+    for result in results:
+        label = f"{result['name']:<10} {result['kind']:<6} {result['size'] or '':>6}"
+        if result['mutations']:
+            label += f"  [{result['mutations']}]"
+        d = result['divergence']
+        if not d:
+            print(f"  ✅ {label}")
+            continue
+        print(f"  ❌ {label}")
+        print(f"       first divergence in {d['file']} at {d['location']}")
+        print(f"         reference: {d['reference']}")
+        print(f"         candidate: {d['candidate']}")
+    print(f"Equivalent: {len(results) - len(diverged)}/{len(results)} workbooks")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        print(f"Successfully generated '{args.output}'")
+
+    return 1 if diverged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Offline RTL Path Checker
+
+Checks every rtl_path_src / rtl_path_<dest> of the generated interrupt map
+against an elaborated design hierarchy, so that wrong paths are found before
+simulation instead of as uvm_hdl_read failures in int_monitor.
+
+The hierarchy is loaded into a prefix trie from either
+- a text listing of the design hierarchy as printed by the simulator, one
+  scope or signal per line with an optional declared range, e.g.
+      top_tb.u_dut.u_int_sub.iosub_to_ap_intr [130:0]
+      logic [130:0] top_tb.u_dut.u_int_sub.iosub_to_ap_intr
+      /top_tb/u_dut/u_int_sub/iosub_to_ap_intr[130:0]
+- or the declaration section of a VCD dump ($scope / $var)
+
+The map is checked in a single pass: scopes are resolved once and shared by
+all paths below them, and bit-selects ([n] or [m:l]) are checked against the
+declared range of the signal.  For unresolved paths the nearest existing
+paths are suggested (the same signal in another scope, or similarly named
+scopes/signals at the level where the lookup failed).
+"""
+
+import re
+import sys
+import csv
+import difflib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from interrupt_map import load_interrupt_map, get_destinations
+
+_SELECT_PATTERN = re.compile(r'^(.*?)\[(\d+)(?::(\d+))?\]$')
+_LISTING_PATH_PATTERN = re.compile(r'^[/.]?[A-Za-z_]\w*(?:\[\d+\])?(?:[./][A-Za-z_$][\w$]*(?:\[\d+\])?)+')
+_LISTING_RANGE_PATTERN = re.compile(r'\[\s*(\d+)\s*:\s*(\d+)\s*\]')
+
+
+class HierarchyNode:
+    __slots__ = ('children', 'msb', 'lsb')
+
+    def __init__(self):
+        self.children: Dict[str, 'HierarchyNode'] = {}
+        self.msb: Optional[int] = None
+        self.lsb: Optional[int] = None
+
+
+class HierarchyTrie:
+    def __init__(self):
+        self.root = HierarchyNode()
+        self.signals = 0
+        # leaf name -> full paths declaring it, for suggestions
+        self.by_leaf: Dict[str, List[str]] = {}
+
+    def insert(self, path: str, msb: Optional[int] = None, lsb: Optional[int] = None):
+        """
+        Add a scope or signal.
+
+        Args:
+            path: Dotted hierarchical name
+            msb, lsb: Declared range of a vector signal
+        """
+        node = self.root
+        for component in path.split('.'):
+            child = node.children.get(component)
+            if child is None:
+                child = node.children[component] = HierarchyNode()
+            node = child
+        if msb is not None:
+            if node.msb is None:
+                self.signals += 1
+            node.msb, node.lsb = msb, lsb
+        leaf = path.rsplit('.', 1)[-1]
+        paths = self.by_leaf.setdefault(leaf, [])
+        if not paths or paths[-1] != path:
+            paths.append(path)
+
+    def walk(self, components: List[str], node: Optional[HierarchyNode] = None) -> Tuple[HierarchyNode, int]:
+        """
+        Follow components from node (default: root).
+
+        Returns:
+            (deepest node reached, number of components matched)
+        """
+        node = node or self.root
+        for depth, component in enumerate(components):
+            child = node.children.get(component)
+            if child is None:
+                return node, depth
+            node = child
+        return node, len(components)
+
+    def suggest(self, path: str, count: int = 3) -> List[str]:
+        """Nearest existing paths for an unresolved path."""
+        base = _SELECT_PATTERN.sub(r'\1', path)
+        leaf = base.rsplit('.', 1)[-1]
+        suggestions = difflib.get_close_matches(base, self.by_leaf.get(leaf, []), n=count, cutoff=0.0)
+
+        components = base.split('.')
+        node, depth = self.walk(components)
+        if depth < len(components):
+            prefix = '.'.join(components[:depth])
+            for name in difflib.get_close_matches(components[depth], list(node.children), n=count):
+                candidate = components[:depth] + [name]
+                # Complete the rest of the path below the suggestion where it exists
+                rest_node, rest_depth = self.walk(components[depth + 1:], node.children[name])
+                candidate += components[depth + 1:depth + 1 + rest_depth]
+                suggestion = '.'.join(candidate) if prefix else name
+                if suggestion not in suggestions:
+                    suggestions.append(suggestion)
+        return suggestions[:count]
+
+
+def load_listing(listing_file: str) -> HierarchyTrie:
+    """Load a simulator hierarchy listing (dotted or '/'-separated names, optional [msb:lsb])."""
+    trie = HierarchyTrie()
+    with open(listing_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            for token in line.split():
+                m = _LISTING_PATH_PATTERN.match(token)
+                if m:
+                    name = m.group(0).lstrip('/.').replace('/', '.')
+                    declared = _LISTING_RANGE_PATTERN.search(token[m.end():] or line)
+                    if declared:
+                        trie.insert(name, int(declared.group(1)), int(declared.group(2)))
+                    else:
+                        trie.insert(name)
+                    break
+    return trie
+
+
+def load_vcd_header(vcd_file: str) -> HierarchyTrie:
+    """Load scopes and variables from the declaration section of a VCD dump."""
+    trie = HierarchyTrie()
+    scopes: List[str] = []
+    with open(vcd_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            tokens = line.split()
+            if not tokens:
+                continue
+            if tokens[0] == '$scope':
+                scopes.append(tokens[2].lstrip('\\'))
+                trie.insert('.'.join(scopes))
+            elif tokens[0] == '$upscope':
+                scopes.pop()
+            elif tokens[0] == '$var':
+                width = int(tokens[2])
+                reference = ''.join(t for t in tokens[4:] if t != '$end').lstrip('\\')
+                m = _SELECT_PATTERN.match(reference)
+                name = m.group(1) if m else reference
+                if m and m.group(3) is not None:
+                    msb, lsb = int(m.group(2)), int(m.group(3))
+                elif m:
+                    # Single bit dumped as its own variable
+                    trie.insert('.'.join(scopes + [reference]), 0, 0)
+                    continue
+                else:
+                    msb, lsb = width - 1, 0
+                trie.insert('.'.join(scopes + [name]), msb, lsb)
+            elif tokens[0] == '$enddefinitions':
+                break
+    return trie
+
+
+def load_hierarchy(dump_file: str, fmt: str = 'auto') -> HierarchyTrie:
+    if fmt == 'vcd' or (fmt == 'auto' and dump_file.endswith('.vcd')):
+        return load_vcd_header(dump_file)
+    return load_listing(dump_file)
+
+
+class PathChecker:
+    def __init__(self, trie: HierarchyTrie):
+        self.trie = trie
+        # scope path -> resolved node (None if the scope does not exist)
+        self._scopes: Dict[str, Optional[HierarchyNode]] = {}
+
+    def _resolve_scope(self, scope: str) -> Optional[HierarchyNode]:
+        if scope not in self._scopes:
+            parent, _, name = scope.rpartition('.')
+            node = self._resolve_scope(parent) if parent else self.trie.root
+            self._scopes[scope] = node.children.get(name) if node else None
+        return self._scopes[scope]
+
+    def check(self, path: str) -> Optional[str]:
+        """
+        Check one RTL path.
+
+        Returns:
+            None if the path resolves, otherwise the reason it does not
+        """
+        scope, _, leaf = path.rpartition('.')
+        node = self._resolve_scope(scope) if scope else self.trie.root
+        if node is None:
+            return "scope not found"
+
+        if leaf in node.children:
+            signal = node.children[leaf]
+            if signal.children and signal.msb is None:
+                return "is a scope, not a signal"
+            return None
+
+        m = _SELECT_PATTERN.match(leaf)
+        if not m or m.group(1) not in node.children:
+            return "signal not found"
+        signal = node.children[m.group(1)]
+        if signal.msb is None:
+            return "is a scope, not a signal" if signal.children else "bit-select on a scalar signal"
+
+        low, high = sorted((signal.msb, signal.lsb))
+        bits = [int(m.group(2))] + ([int(m.group(3))] if m.group(3) is not None else [])
+        if any(bit < low or bit > high for bit in bits):
+            return f"select [{m.group(2)}{':' + m.group(3) if m.group(3) else ''}] outside [{signal.msb}:{signal.lsb}]"
+        return None
+
+
+def check_interrupt_map(entries: List[dict], checker: PathChecker) -> List[dict]:
+    """
+    Check all source and destination paths of the map in one pass.
+
+    Returns:
+        One failure record (name, role, path, reason, suggestions) per unresolved path
+    """
+    failures = []
+    results: Dict[str, Optional[str]] = {}
+    for entry in entries:
+        routes = [('src', entry.get('rtl_path_src', ''))]
+        routes += [(dest, entry.get(f'rtl_path_{dest}', '')) for dest in get_destinations(entry)]
+        for role, path in routes:
+            if not path:
+                continue
+            if path not in results:
+                results[path] = checker.check(path)
+            if results[path]:
+                failures.append({'name': entry['name'], 'role': role, 'path': path,
+                                 'reason': results[path], 'suggestions': []})
+
+    suggestions: Dict[str, List[str]] = {}
+    for failure in failures:
+        path = failure['path']
+        if failure['reason'].startswith('select'):
+            continue  # The signal exists, only the bit-select is wrong
+        if path not in suggestions:
+            suggestions[path] = checker.trie.suggest(path)
+        failure['suggestions'] = suggestions[path]
+    return failures
+
+
+def write_report(path: str, failures: List[dict]):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['interrupt', 'role', 'rtl_path', 'reason', 'suggestions'])
+        for failure in failures:
+            writer.writerow([failure['name'], failure['role'], failure['path'], failure['reason'],
+                             ' '.join(failure['suggestions'])])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline RTL Path Checker')
+    parser.add_argument('hierarchy', help='Design hierarchy listing from the simulator, or a VCD dump')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('--format', choices=['auto', 'listing', 'vcd'], default='auto',
+                        help='Hierarchy file format (default: by extension)')
+    parser.add_argument('-o', '--output', help='Write unresolved paths with suggestions as CSV')
+
+    args = parser.parse_args()
+
+    for path in (args.entries, args.hierarchy):
+        if not Path(path).exists():
+            print(f"Error: {path} not found!")
+            return 1
+
+    trie = load_hierarchy(args.hierarchy, args.format)
+    if not trie.root.children:
+        print(f"Error: no hierarchy found in {args.hierarchy}")
+        return 1
+
+    entries = load_interrupt_map(args.entries)
+    failures = check_interrupt_map(entries, PathChecker(trie))
+
+    checked = sum(1 for e in entries if e.get('rtl_path_src', '')) + \
+        sum(1 for e in entries for d in get_destinations(e) if e.get(f'rtl_path_{d}', ''))
+    print(f"Checked {checked} RTL paths of {len(entries)} interrupts against {args.hierarchy}")
+    print(f"  Hierarchy signals with declared ranges: {trie.signals}")
+    print(f"  Unresolved paths: {len(failures)}")
+    for failure in failures:
+        print(f"    ❌ {failure['name']} [{failure['role']}] {failure['path']}: {failure['reason']}")
+        for suggestion in failure['suggestions']:
+            print(f"         did you mean {suggestion}")
+
+    if args.output:
+        write_report(args.output, failures)
+        print(f"Successfully generated '{args.output}'")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
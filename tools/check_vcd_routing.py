@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Offline VCD Routing Checker
+
+Replays a VCD dump against the generated interrupt map and checks that every
+assertion edge on an interrupt's rtl_path_src shows up on each of its expected
+destination bits (rtl_path_<dest>, including the destinations of every merge
+interrupt the source feeds) within a latency window.
+
+Only the signals referenced by the interrupt map are decoded; all other value
+changes are skipped after a dictionary lookup.  Large dumps are split into
+byte-range chunks at timestamp boundaries and checked by worker processes.
+A worker that cannot tell whether a destination was already active at the
+start of its chunk reports the check as unresolved; it is resolved afterwards
+from the signal values at the end of the preceding chunks.
+
+Destinations whose signal is not in the dump cannot be checked; their source
+edges are reported as unchecked, separately from hits and misses, and do not
+fail the check.
+
+Note: interrupt masks programmed by the test are not modelled, so masked
+routes are reported as misses.
+"""
+
+import os
+import re
+import sys
+import csv
+import heapq
+import argparse
+from collections import defaultdict
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from interrupt_map import (load_interrupt_map, expand_vector_entries, load_timing_config,
+                           build_merge_relations, get_destinations)
+
+_BIT_SELECT_PATTERN = re.compile(r'^(.*)\[(\d+)\]$')
+_RANGE_PATTERN = re.compile(r'\[(\d+)(?::(\d+))?\]')
+_TIMESCALE_UNITS_PER_NS = {'s': 1e-9, 'ms': 1e-6, 'us': 1e-3, 'ns': 1.0, 'ps': 1e3, 'fs': 1e6}
+
+
+def split_bit_select(path: str) -> Tuple[str, Optional[int]]:
+    """Split 'a.b.sig[3]' into ('a.b.sig', 3); paths without a bit-select return None."""
+    m = _BIT_SELECT_PATTERN.match(path)
+    if m:
+        return m.group(1), int(m.group(2))
+    return path, None
+
+
+class RoutingExpectations:
+    def __init__(self, entries: List[dict]):
+        """
+        Build the source -> expected destination bits table from the interrupt map.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+        """
+        self.entry_by_name = {e['name']: e for e in entries}
+        self.merges_for_source = build_merge_relations(entries)
+        # source path -> list of (interrupt name, active level)
+        self.sources: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        # interrupt name -> list of (check label, destination path)
+        self.destinations: Dict[str, List[Tuple[str, str]]] = {}
+
+        for entry in entries:
+            if not entry.get('rtl_path_src', ''):
+                continue
+            active = '0' if entry.get('polarity') == 'ACTIVE_LOW' else '1'
+            self.sources[entry['rtl_path_src']].append((entry['name'], active))
+            self.destinations[entry['name']] = self._collect_destinations(entry['name'], entry['name'], set())
+
+    def _collect_destinations(self, name: str, origin: str, visited: set) -> List[Tuple[str, str]]:
+        if name in visited or name not in self.entry_by_name:
+            return []
+        visited.add(name)
+        entry = self.entry_by_name[name]
+        result = []
+        for dest in get_destinations(entry):
+            path = entry.get(f'rtl_path_{dest}', '')
+            if path:
+                label = dest.upper() if name == origin else f"{name}@{dest.upper()}"
+                result.append((label, path))
+        for merge_name in self.merges_for_source.get(name, []):
+            result.extend(self._collect_destinations(merge_name, origin, visited))
+        return result
+
+    def drop_destinations(self, missing: set) -> Dict[str, List[str]]:
+        """
+        Remove the destinations whose path is not in the dump.
+
+        Returns:
+            Interrupt name -> labels of the destinations that cannot be checked
+        """
+        dropped: Dict[str, List[str]] = {}
+        for name, dests in self.destinations.items():
+            labels = [label for label, path in dests if path in missing]
+            if labels:
+                dropped[name] = labels
+                self.destinations[name] = [(label, path) for label, path in dests if path not in missing]
+        return dropped
+
+    def signal_paths(self) -> set:
+        """All hierarchical paths the checker needs to decode."""
+        paths = set(self.sources)
+        for dests in self.destinations.values():
+            paths.update(path for _, path in dests)
+        return paths
+
+
+def parse_vcd_header(vcd_file: str, wanted_paths: set) -> dict:
+    """
+    Parse the VCD declaration section.
+
+    Returns:
+        Dictionary with 'subscriptions' (id code -> list of (path, char offset or None, width)),
+        'units_per_ns', 'data_start' (byte offset after $enddefinitions) and
+        'unmatched' (wanted paths that are not in the dump)
+    """
+    wanted_by_base = defaultdict(list)
+    for path in wanted_paths:
+        base, bit = split_bit_select(path)
+        wanted_by_base[base].append((path, bit))
+
+    scopes: List[str] = []
+    subscriptions = defaultdict(list)
+    matched = set()
+    timescale = []
+    in_timescale = False
+    offset = 0
+
+    with open(vcd_file, 'rb') as f:
+        for raw in f:
+            offset += len(raw)
+            line = raw.decode('utf-8', errors='replace').strip()
+            if not line:
+                continue
+
+            if in_timescale or line.startswith('$timescale'):
+                timescale.append(line.replace('$timescale', '').replace('$end', ''))
+                in_timescale = '$end' not in line
+                continue
+
+            tokens = line.split()
+            if tokens[0] == '$scope':
+                scopes.append(tokens[2].lstrip('\\'))
+            elif tokens[0] == '$upscope':
+                scopes.pop()
+            elif tokens[0] == '$var':
+                width, code = int(tokens[2]), tokens[3]
+                reference = ''.join(t for t in tokens[4:] if t != '$end').lstrip('\\')
+                m = _RANGE_PATTERN.search(reference)
+                name = reference[:m.start()] if m else reference
+                full_name = '.'.join(scopes + [name])
+
+                if m and m.group(2) is None and f"{full_name}[{m.group(1)}]" in wanted_paths:
+                    # Single bit declared as its own variable
+                    path = f"{full_name}[{m.group(1)}]"
+                    subscriptions[code].append((path, None, 1))
+                    matched.add(path)
+                    continue
+
+                msb = int(m.group(1)) if m else width - 1
+                lsb = int(m.group(2)) if m and m.group(2) is not None else msb - width + 1
+                for path, bit in wanted_by_base.get(full_name, []):
+                    if bit is None:
+                        subscriptions[code].append((path, None, width))
+                    else:
+                        position = msb - bit if msb >= lsb else bit - msb
+                        if 0 <= position < width:
+                            subscriptions[code].append((path, position, width))
+                        else:
+                            continue
+                    matched.add(path)
+            elif tokens[0] == '$enddefinitions':
+                break
+
+    scale = ''.join(timescale).strip()
+    m = re.match(r'(\d+)\s*(\w+)', scale)
+    units_per_ns = _TIMESCALE_UNITS_PER_NS.get(m.group(2), 1.0) / int(m.group(1)) if m else 1.0
+
+    return {
+        'subscriptions': dict(subscriptions),
+        'units_per_ns': units_per_ns,
+        'data_start': offset,
+        'unmatched': sorted(wanted_paths - matched),
+    }
+
+
+def split_vcd(vcd_file: str, data_start: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Split the value-change section into byte ranges that start on '#<time>' lines."""
+    size = os.path.getsize(vcd_file)
+    if chunk_size <= 0 or size - data_start <= chunk_size:
+        return [(data_start, size)]
+
+    starts = [data_start]
+    with open(vcd_file, 'rb') as f:
+        for target in range(data_start + chunk_size, size, chunk_size):
+            f.seek(target)
+            f.readline()
+            while True:
+                pos = f.tell()
+                raw = f.readline()
+                if not raw:
+                    pos = size
+                    break
+                if raw.startswith(b'#'):
+                    break
+            if pos > starts[-1] and pos < size:
+                starts.append(pos)
+
+    return [(start, end) for start, end in zip(starts, starts[1:] + [size])]
+
+
+def _expand_vector(value: str, width: int) -> str:
+    """Left-extend a VCD vector value to its declared width."""
+    if len(value) >= width:
+        return value[-width:]
+    pad = value[0] if value[0] in 'xXzZ' else '0'
+    return pad * (width - len(value)) + value
+
+
+def check_chunk(task: tuple) -> dict:
+    """
+    Worker: replay one chunk of value changes.
+
+    Source edges are only taken from [start, end); after end the worker keeps
+    reading destination changes until every pending check has resolved or expired.
+
+    A bit decoded from a vector record whose previous value is unknown may not
+    have changed at all, so such source edges are kept as tentative and only
+    counted once merge_chunk_results() knows the value before the chunk.
+
+    Returns:
+        Dictionary with per-interrupt 'results', 'unresolved' checks, 'tentative'
+        edges and the 'final_state' of every decoded bit at the end of the chunk
+        (bits that did not change inside the chunk are absent)
+    """
+    vcd_file, start, end, subscriptions, sources, destinations, window = task
+
+    state: Dict[str, str] = {}
+    results = defaultdict(lambda: {'edges': 0, 'dests': defaultdict(lambda: [0, 0, 0])})
+    # check id -> (interrupt name, label, destination path, source time,
+    #              destination unknown at source time, tentative edge id)
+    pending: Dict[int, tuple] = {}
+    pending_by_dest: Dict[str, List[int]] = defaultdict(list)
+    deadlines: List[Tuple[int, int]] = []
+    unresolved: List[Tuple[str, str, str]] = []
+    # tentative edge id -> {'name', 'source', 'checks': [(label, outcome, latency, path)]}
+    tentative: Dict[int, dict] = {}
+    ctx = {'now': 0, 'next_id': 0, 'in_dump': False, 'past_end': False}
+
+    def record(check_id: int, outcome: str, latency: int = 0):
+        name, label, path, _, _, edge_id = pending.pop(check_id)
+        if edge_id is not None:
+            tentative[edge_id]['checks'].append((label, outcome, latency, path))
+            return
+        if outcome == 'unresolved':
+            unresolved.append((name, label, path))
+            return
+        stats = results[name]['dests'][label]
+        if outcome == 'hit':
+            stats[0] += 1
+            stats[2] = max(stats[2], latency)
+        else:
+            stats[1] += 1
+
+    def expire(before):
+        while deadlines and deadlines[0][0] < before:
+            _, check_id = heapq.heappop(deadlines)
+            if check_id in pending:
+                record(check_id, 'unresolved' if pending[check_id][4] else 'miss')
+
+    def on_change(path: str, value: str, exact: bool):
+        old = state.get(path)
+        state[path] = value
+        if ctx['in_dump']:
+            return
+        now = ctx['now']
+
+        # Destination side: resolve pending checks waiting on this bit
+        if path in pending_by_dest:
+            ids = [check_id for check_id in pending_by_dest.pop(path) if check_id in pending]
+            if value == '1':
+                for check_id in ids:
+                    record(check_id, 'hit', now - pending[check_id][3])
+            elif old is None and exact:
+                # First change seen in this chunk is a release, so the bit was
+                # already active when the source fired
+                for check_id in ids:
+                    record(check_id, 'hit', 0)
+            elif ids:
+                pending_by_dest[path] = ids
+
+        # Source side: assertion edges are only taken inside this chunk
+        if ctx['past_end'] or path not in sources:
+            return
+        for name, active in sources[path]:
+            if value != active or old == active:
+                continue
+            edge_id = None
+            if old is None and not exact:
+                edge_id = len(tentative)
+                tentative[edge_id] = {'name': name, 'source': path, 'active': active, 'checks': []}
+            else:
+                results[name]['edges'] += 1
+            for label, dest_path in destinations.get(name, []):
+                check_id = ctx['next_id']
+                ctx['next_id'] += 1
+                pending[check_id] = (name, label, dest_path, now, dest_path not in state, edge_id)
+                if state.get(dest_path) == '1':
+                    record(check_id, 'hit', 0)
+                    continue
+                pending_by_dest[dest_path].append(check_id)
+                heapq.heappush(deadlines, (now + window, check_id))
+
+    final_state = None
+    pos = start
+    with open(vcd_file, 'rb') as f:
+        f.seek(start)
+        for raw in f:
+            pos += len(raw)
+            if not ctx['past_end'] and pos > end:
+                ctx['past_end'] = True
+                final_state = dict(state)
+            if ctx['past_end'] and not pending:
+                break
+
+            line = raw.strip()
+            if not line:
+                continue
+            lead = line[:1]
+
+            if lead == b'#':
+                ctx['now'] = int(line[1:])
+                expire(ctx['now'])
+            elif lead in (b'0', b'1', b'x', b'z', b'X', b'Z'):
+                code = line[1:].decode('ascii', errors='replace')
+                if code in subscriptions:
+                    value = lead.decode('ascii').lower()
+                    for path, _, _ in subscriptions[code]:
+                        on_change(path, value, True)
+            elif lead in (b'b', b'B'):
+                parts = line[1:].split()
+                if len(parts) == 2:
+                    code = parts[1].decode('ascii', errors='replace')
+                    if code in subscriptions:
+                        bits = parts[0].decode('ascii', errors='replace').lower()
+                        for path, position, width in subscriptions[code]:
+                            expanded = _expand_vector(bits, width)
+                            if position is not None:
+                                value = expanded[position]
+                            else:
+                                value = '1' if '1' in expanded else '0'
+                            if state.get(path) != value:
+                                on_change(path, value, width == 1)
+            elif lead == b'$':
+                keyword = line.split()[0]
+                if keyword in (b'$dumpvars', b'$dumpall', b'$dumpon', b'$dumpoff'):
+                    ctx['in_dump'] = b'$end' not in line
+                elif keyword == b'$end':
+                    ctx['in_dump'] = False
+
+    if final_state is None:
+        final_state = dict(state)
+    expire(float('inf'))
+
+    return {
+        'results': {name: {'edges': r['edges'], 'dests': {k: list(v) for k, v in r['dests'].items()}}
+                    for name, r in results.items()},
+        'unresolved': unresolved,
+        'tentative': list(tentative.values()),
+        'final_state': final_state,
+    }
+
+
+def merge_chunk_results(chunk_results: List[dict]) -> Dict[str, dict]:
+    """
+    Combine per-chunk results in chunk order.  Checks and edges that depend on
+    a bit's value before the chunk are resolved from the preceding chunks.
+    """
+    totals = defaultdict(lambda: {'edges': 0, 'dests': defaultdict(lambda: [0, 0, 0])})
+    carried_state: Dict[str, str] = {}
+
+    def add(name: str, label: str, hit: bool, latency: int = 0):
+        stats = totals[name]['dests'][label]
+        if hit:
+            stats[0] += 1
+            stats[2] = max(stats[2], latency)
+        else:
+            stats[1] += 1
+
+    for chunk in chunk_results:
+        for name, r in chunk['results'].items():
+            totals[name]['edges'] += r['edges']
+            for label, (hits, misses, latency) in r['dests'].items():
+                stats = totals[name]['dests'][label]
+                stats[0] += hits
+                stats[1] += misses
+                stats[2] = max(stats[2], latency)
+
+        for name, label, path in chunk['unresolved']:
+            add(name, label, carried_state.get(path) == '1')
+
+        for edge in chunk['tentative']:
+            if carried_state.get(edge['source']) == edge['active']:
+                continue  # Source was already active before the chunk: not an edge
+            totals[edge['name']]['edges'] += 1
+            for label, outcome, latency, path in edge['checks']:
+                if outcome == 'unresolved':
+                    add(edge['name'], label, carried_state.get(path) == '1')
+                else:
+                    add(edge['name'], label, outcome == 'hit', latency)
+
+        carried_state.update(chunk['final_state'])
+
+    return totals
+
+
+def write_report(path: str, totals: Dict[str, dict], unchecked: Dict[str, List[str]], units_per_ns: float):
+    """
+    Write the per-interrupt, per-destination CSV report.  Destinations missing
+    from the dump count every source edge as unchecked.
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['interrupt', 'destination', 'source_edges', 'hits', 'misses', 'unchecked',
+                         'max_latency_ns'])
+        for name in sorted(set(totals) | set(unchecked)):
+            result = totals.get(name, {'edges': 0, 'dests': {}})
+            edges = result['edges']
+            rows = {label: (hits, misses, 0, latency) for label, (hits, misses, latency) in result['dests'].items()}
+            rows.update({label: (0, 0, edges, 0) for label in unchecked.get(name, [])})
+            for label, (hits, misses, skipped, latency) in sorted(rows.items()):
+                writer.writerow([name, label, edges, hits, misses, skipped, f"{latency / units_per_ns:g}"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline VCD Routing Checker')
+    parser.add_argument('vcd', help='VCD dump file')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('-t', '--timing-config', default='config/timing_config.sv',
+                        help='Path to timing configuration class (for the default window)')
+    parser.add_argument('-w', '--window-ns', type=float,
+                        help='Latency window in ns (default: detection_timeout_ns)')
+    parser.add_argument('-o', '--output', help='Write the per-interrupt, per-destination report as CSV')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--chunk-mb', type=int, default=512,
+                        help='Split the dump into chunks of this size in MB (default: 512, 0 disables)')
+
+    args = parser.parse_args()
+
+    for path in (args.entries, args.vcd):
+        if not Path(path).exists():
+            print(f"Error: {path} not found!")
+            return 1
+
+    # Ranged vector entries are checked bit by bit
+    entries = expand_vector_entries(load_interrupt_map(args.entries))
+    expectations = RoutingExpectations(entries)
+    window_ns = args.window_ns
+    if window_ns is None:
+        window_ns = load_timing_config(args.timing_config).get('detection_timeout_ns', 1000)
+
+    header = parse_vcd_header(args.vcd, expectations.signal_paths())
+    subscriptions = header['subscriptions']
+    unchecked = expectations.drop_destinations(set(header['unmatched']))
+    if not subscriptions:
+        print("Error: none of the interrupt map signals are present in the dump")
+        return 1
+
+    window = int(window_ns * header['units_per_ns'])
+    chunks = split_vcd(args.vcd, header['data_start'], args.chunk_mb * 1024 * 1024)
+    tasks = [(args.vcd, start, end, subscriptions, dict(expectations.sources),
+              expectations.destinations, window) for start, end in chunks]
+
+    if args.jobs <= 1 or len(tasks) == 1:
+        chunk_results = [check_chunk(task) for task in tasks]
+    else:
+        with Pool(processes=args.jobs) as pool:
+            chunk_results = pool.map(check_chunk, tasks)
+
+    totals = merge_chunk_results(chunk_results)
+
+    failing = {name: r for name, r in totals.items()
+               if any(stats[1] for stats in r['dests'].values())}
+    stimulated = [name for name, r in totals.items() if r['edges']]
+    unchecked_edges = {name: totals[name]['edges'] for name in unchecked
+                       if name in totals and totals[name]['edges']}
+
+    print(f"Checked {args.vcd} in {len(chunks)} chunk(s) with a {window_ns:g}ns window")
+    print(f"  Decoded signals: {sum(len(v) for v in subscriptions.values())}, "
+          f"missing from dump: {len(header['unmatched'])}")
+    print(f"  Interrupts with source edges: {len(stimulated)}")
+    print(f"  Interrupts with routing misses: {len(failing)}")
+    for name in sorted(failing):
+        misses = [f"{label}({stats[1]})" for label, stats in sorted(failing[name]['dests'].items()) if stats[1]]
+        print(f"    ❌ {name}: {', '.join(misses)}")
+    print(f"  Interrupts with unchecked destinations (not in dump): {len(unchecked_edges)}")
+    for name in sorted(unchecked_edges):
+        labels = [f"{label}({unchecked_edges[name]})" for label in unchecked[name]]
+        print(f"    ⚠️  {name}: {', '.join(labels)}")
+
+    if args.output:
+        write_report(args.output, totals, unchecked, header['units_per_ns'])
+        print(f"Successfully generated '{args.output}'")
+
+    return 1 if failing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,11 +10,22 @@ Data Sources:
 """
 
 import pandas as pd
+import os
 import re
+import sys
 import argparse
+from array import array
+from multiprocessing import Pool
+from collections.abc import Mapping, MutableMapping
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from interrupt_map import load_interrupt_map
+from mask_layout import generate_mask_tables_file, generate_route_bitmaps_file
+from pair_ids import generate_pair_ids_file, generate_coverage_bins_file
+from name_resolver import NameResolver, AUTO_FIX
+from pipeline_profiler import PROFILER
+
 # --- Mappings ---
 GROUP_MAP = {
     "IOSUB中断源": "IOSUB",
@@ -55,14 +66,46 @@ DEST_SHEET_MAP = {
     'OTHER_DIE': '跨die中断列表'
 }
 
+# Vector interrupts are listed as name[m:l]; destination sheets may list each bit
+_VECTOR_RANGE_PATTERN = re.compile(r'\[\s*(\d+)\s*:\s*(\d+)\s*\]')
+_VECTOR_DEST_PATTERN = re.compile(r'^(\w+?)(?:\s*\[\s*(\d+)\s*(?::\s*(\d+)\s*)?\]|_(\d+))$')
+
+def vector_width(name: str) -> int:
+    """Number of bits of an interrupt name with a [m:l] range suffix (1 for a scalar name)."""
+    m = _VECTOR_RANGE_PATTERN.search(name)
+    return abs(int(m.group(1)) - int(m.group(2))) + 1 if m else 1
+
+def resolve_vector_destination(interrupt_name: str, dest_index: int,
+                               interrupts: Mapping) -> Optional[Tuple[str, int]]:
+    """
+    Map a destination sheet row of a vector interrupt to its ranged entry.
+
+    'name[m:l]' at index i, and the bit rows 'name[n]' / 'name_n' at index i + n,
+    all belong to the entry 'name' whose bit 0 sits at destination index i - l.
+
+    Returns:
+        (entry name, destination index of bit 0), or None if the row is not a vector bit
+    """
+    m = _VECTOR_DEST_PATTERN.match(interrupt_name.strip())
+    if not m or m.group(1) not in interrupts or interrupts[m.group(1)].width <= 1:
+        return None
+    if m.group(4) is not None:
+        bit = int(m.group(4))
+    elif m.group(3) is not None:
+        bit = min(int(m.group(2)), int(m.group(3)))
+    else:
+        bit = int(m.group(2))
+    return m.group(1), dest_index - bit
+
 class InterruptInfo:
     """Class to hold interrupt information with signal mapping."""
-    def __init__(self, name: str, index: int, group: str, trigger: str, polarity: str):
+    def __init__(self, name: str, index: int, group: str, trigger: str, polarity: str, width: int = 1):
         self.name = name
         self.index = index
         self.group = group
         self.trigger = trigger
         self.polarity = polarity
+        self.width = width  # >1 for a ranged vector interrupt such as name[16:0]
         self.destinations = {}  # dest_name -> (dest_index, signal_path)
         
     def add_destination(self, dest_name: str, dest_index: int, signal_path: str = ""):
@@ -72,10 +115,11 @@ class InterruptInfo:
     def to_sv_entry(self) -> str:
         """Convert to SystemVerilog entry format."""
         # Build destination fields
+        destinations = self.destinations
         dest_fields = []
         for dest in ['AP', 'SCP', 'MCP', 'ACCEL', 'IO', 'OTHER_DIE']:
-            if dest in self.destinations:
-                dest_index, signal_path = self.destinations[dest]
+            if dest in destinations:
+                dest_index, signal_path = destinations[dest]
                 dest_fields.extend([
                     f"to_{dest.lower()}:1",
                     f"rtl_path_{dest.lower()}:\"{signal_path}\"",
@@ -95,15 +139,216 @@ class InterruptInfo:
             f"trigger:{self.trigger}, "
             f"polarity:{self.polarity}, "
             f"rtl_path_src:\"\", "
+            f"pulse_width_ns:0, "
+            f"width:{self.width}, "
             f"{', '.join(dest_fields)}"
             "}; interrupt_map.push_back(entry);"
         )
         return entry_str
 
-def parse_main_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
+    def to_entry_dict(self) -> dict:
+        """Convert to the entry dictionary format of interrupt_map.load_interrupt_map()."""
+        entry = {'name': self.name, 'index': self.index, 'group': self.group,
+                 'trigger': self.trigger, 'polarity': self.polarity, 'width': self.width}
+        destinations = self.destinations
+        for dest in ['AP', 'SCP', 'MCP', 'ACCEL', 'IO', 'OTHER_DIE']:
+            dest_index = destinations[dest][0] if dest in destinations else -1
+            entry[f'to_{dest.lower()}'] = 1 if dest in destinations else 0
+            entry[f'dest_index_{dest.lower()}'] = dest_index
+        return entry
+
+DESTINATIONS = ['AP', 'SCP', 'MCP', 'ACCEL', 'IO', 'OTHER_DIE']
+DEST_BITS = {dest: bit for bit, dest in enumerate(DESTINATIONS)}
+
+class _Codebook:
+    """Interning table mapping strings to small integer codes."""
+    def __init__(self, initial: Tuple[str, ...] = ()):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for value in initial:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return code
+
+class _DestinationView(MutableMapping):
+    """dest_name -> (dest_index, signal_path) view of one InterruptStore row."""
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: 'InterruptStore', row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, dest_name: str) -> Tuple[int, str]:
+        bit = DEST_BITS.get(dest_name, -1)
+        if bit < 0 or not (self._store.dest_mask[self._row] >> bit) & 1:
+            raise KeyError(dest_name)
+        return (self._store.dest_index[bit][self._row],
+                self._store.paths.values[self._store.dest_path[bit][self._row]])
+
+    def __setitem__(self, dest_name: str, value: Tuple[int, str]):
+        bit = DEST_BITS[dest_name]
+        dest_index, signal_path = value
+        self._store.dest_mask[self._row] |= 1 << bit
+        self._store.dest_index[bit][self._row] = dest_index
+        self._store.dest_path[bit][self._row] = self._store.paths.code(signal_path)
+
+    def __delitem__(self, dest_name: str):
+        self[dest_name]  # KeyError if not routed
+        bit = DEST_BITS[dest_name]
+        self._store.dest_mask[self._row] &= ~(1 << bit)
+        self._store.dest_index[bit][self._row] = -1
+        self._store.dest_path[bit][self._row] = 0
+
+    def __iter__(self):
+        mask = self._store.dest_mask[self._row]
+        return (dest for bit, dest in enumerate(DESTINATIONS) if (mask >> bit) & 1)
+
+    def __len__(self) -> int:
+        return bin(self._store.dest_mask[self._row]).count('1')
+
+    def __contains__(self, dest_name) -> bool:
+        bit = DEST_BITS.get(dest_name, -1)
+        return bit >= 0 and bool((self._store.dest_mask[self._row] >> bit) & 1)
+
+    def items(self) -> List[Tuple[str, Tuple[int, str]]]:
+        store, row = self._store, self._row
+        mask, paths = store.dest_mask[row], store.paths.values
+        return [(dest, (store.dest_index[bit][row], paths[store.dest_path[bit][row]]))
+                for bit, dest in enumerate(DESTINATIONS) if (mask >> bit) & 1]
+
+    def values(self) -> List[Tuple[int, str]]:
+        return [value for _, value in self.items()]
+
+class InterruptRow:
+    """Lightweight view of one InterruptStore row with the InterruptInfo interface."""
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: 'InterruptStore', row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._store.names[self._row]
+
+    @property
+    def index(self) -> int:
+        return self._store.index[self._row]
+
+    @property
+    def group(self) -> str:
+        return self._store.groups.values[self._store.group[self._row]]
+
+    @property
+    def trigger(self) -> str:
+        return self._store.triggers.values[self._store.trigger[self._row]]
+
+    @property
+    def polarity(self) -> str:
+        return self._store.polarities.values[self._store.polarity[self._row]]
+
+    @property
+    def width(self) -> int:
+        return self._store.width[self._row]
+
+    @property
+    def destinations(self) -> _DestinationView:
+        return _DestinationView(self._store, self._row)
+
+    add_destination = InterruptInfo.add_destination
+    to_sv_entry = InterruptInfo.to_sv_entry
+    to_entry_dict = InterruptInfo.to_entry_dict
+
+class InterruptStore(Mapping):
+    """
+    Columnar interrupt table, a compact replacement for Dict[str, InterruptInfo].
+
+    Groups, triggers and polarities are integer-coded, destinations are a
+    packed bitmask (bit order of DESTINATIONS) with per-destination index
+    arrays, and names and signal paths are interned.  Indexing by name returns
+    an InterruptRow view, so code written against InterruptInfo keeps working.
+    Re-adding an existing name replaces the row in place, like dict assignment.
+    """
+    def __init__(self):
+        self.names: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.index = array('i')
+        self.group = array('B')
+        self.trigger = array('B')
+        self.polarity = array('B')
+        self.width = array('H')
+        self.dest_mask = array('B')
+        self.dest_index = [array('i') for _ in DESTINATIONS]
+        self.dest_path = [array('i') for _ in DESTINATIONS]
+        self.groups = _Codebook()
+        self.triggers = _Codebook(tuple(TRIGGER_MAP.values()))
+        self.polarities = _Codebook(tuple(POLARITY_MAP.values()))
+        self.paths = _Codebook(("",))
+
+    def add(self, name: str, index: int, group: str, trigger: str, polarity: str,
+            width: int = 1) -> InterruptRow:
+        """Add (or replace) an interrupt without destinations and return its row view."""
+        row = self.rows.get(name)
+        if row is None:
+            row = self.rows[name] = len(self.names)
+            self.names.append(sys.intern(name))
+            self.index.append(index)
+            self.group.append(0)
+            self.trigger.append(0)
+            self.polarity.append(0)
+            self.width.append(1)
+            self.dest_mask.append(0)
+            for bit in range(len(DESTINATIONS)):
+                self.dest_index[bit].append(-1)
+                self.dest_path[bit].append(0)
+        else:
+            self.dest_mask[row] = 0
+            for bit in range(len(DESTINATIONS)):
+                self.dest_index[bit][row] = -1
+                self.dest_path[bit][row] = 0
+        self.index[row] = index
+        self.group[row] = self.groups.code(group)
+        self.trigger[row] = self.triggers.code(trigger)
+        self.polarity[row] = self.polarities.code(polarity)
+        self.width[row] = width
+        return InterruptRow(self, row)
+
+    def update(self, other: Mapping):
+        """Merge rows from another store (or any name -> InterruptInfo-like mapping)."""
+        for name, info in other.items():
+            row = self.add(name, info.index, info.group, info.trigger, info.polarity,
+                           getattr(info, 'width', 1))
+            for dest_name, (dest_index, signal_path) in info.destinations.items():
+                row.add_destination(dest_name, dest_index, signal_path)
+
+    def __getitem__(self, name: str) -> InterruptRow:
+        return InterruptRow(self, self.rows[name])
+
+    def values(self) -> List[InterruptRow]:
+        return [InterruptRow(self, row) for row in range(len(self.names))]
+
+    def items(self) -> List[Tuple[str, InterruptRow]]:
+        return [(name, InterruptRow(self, row)) for row, name in enumerate(self.names)]
+
+    def __contains__(self, name) -> bool:
+        return name in self.rows
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+def parse_main_sheet(df: pd.DataFrame) -> InterruptStore:
     """Parse the main IOSUB中断源 sheet, excluding SCP and MCP groups."""
-    interrupts = {}
+    interrupts = InterruptStore()
     current_group = ""
+    PROFILER.count('rows_scanned', len(df))
 
     for idx, row in df.iterrows():
         # Check for group header first (before checking for empty interrupt name)
@@ -137,7 +382,9 @@ def parse_main_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
             index = int(float(row['sub index']))
 
             # Sanitize name
+            width = vector_width(name)
             name_sanitized = re.sub(r'(\s*\[\d+:\d+\]\s*)|(\s*\[\d+\]\s*)', '', name).strip()
+            PROFILER.count('regex_evaluations', 2)
             name_sanitized = name_sanitized.replace(' ', '_')
 
             # Map trigger and polarity
@@ -152,7 +399,7 @@ def parse_main_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
             # Create interrupt info
             if not current_group:
                 current_group = "UNKNOWN_GROUP"
-            interrupt_info = InterruptInfo(name_sanitized, index, current_group, trigger, polarity)
+            interrupt_info = interrupts.add(name_sanitized, index, current_group, trigger, polarity, width)
 
             # Check routing destinations
             for dest_col, dest_name in [('to AP?', 'AP'), ('to SCP?', 'SCP'), ('to MCP?', 'MCP'),
@@ -163,14 +410,13 @@ def parse_main_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
                     if 'YES' in dest_val:
                         interrupt_info.add_destination(dest_name, -1)  # Will be filled later
 
-            interrupts[name_sanitized] = interrupt_info
-
     return interrupts
 
-def parse_mscp_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
+def parse_mscp_sheet(df: pd.DataFrame) -> InterruptStore:
     """Parse the MSCP-to-IOSUB中断 sheet for SCP and MCP interrupt sources."""
-    interrupts = {}
+    interrupts = InterruptStore()
     current_group = ""
+    PROFILER.count('rows_scanned', len(df))
 
     for idx, row in df.iterrows():
         # Check for group header first (before checking for empty interrupt name)
@@ -194,7 +440,9 @@ def parse_mscp_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
             index = int(float(row['sub index']))
 
             # Sanitize name
+            width = vector_width(name)
             name_sanitized = re.sub(r'(\s*\[\d+:\d+\]\s*)|(\s*\[\d+\]\s*)', '', name).strip()
+            PROFILER.count('regex_evaluations', 2)
             name_sanitized = name_sanitized.replace(' ', '_')
 
             # Map trigger and polarity
@@ -207,7 +455,7 @@ def parse_mscp_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
             polarity = POLARITY_MAP.get(polarity_str, "UNKNOWN_POLARITY")
 
             # Create interrupt info
-            interrupt_info = InterruptInfo(name_sanitized, index, current_group, trigger, polarity)
+            interrupt_info = interrupts.add(name_sanitized, index, current_group, trigger, polarity, width)
 
             # Check routing destinations
             for dest_col, dest_name in [('to AP?', 'AP'), ('to SCP?', 'SCP'), ('to MCP?', 'MCP'),
@@ -218,13 +466,12 @@ def parse_mscp_sheet(df: pd.DataFrame) -> Dict[str, InterruptInfo]:
                     if 'YES' in dest_val:
                         interrupt_info.add_destination(dest_name, -1)  # Will be filled later
 
-            interrupts[name_sanitized] = interrupt_info
-
     return interrupts
 
 def parse_destination_sheet(df: pd.DataFrame, sheet_name: str) -> Dict[str, int]:
     """Parse destination sheet to get interrupt index mapping."""
     interrupt_indices = {}
+    PROFILER.count('rows_scanned', len(df))
 
     # Sheet-specific parsing logic based on observed structure
     if 'SCP M7' in sheet_name:
@@ -364,21 +611,162 @@ def parse_destination_sheet(df: pd.DataFrame, sheet_name: str) -> Dict[str, int]
 
     return interrupt_indices
 
-def parse_interrupt_xlsx(input_path: str, output_path: str):
-    """Parse the Excel file and generate SystemVerilog routing model."""
+def read_destination_sheet(input_path: str, sheet_name: str) -> Tuple[Dict[str, int], int]:
+    """
+    Read and parse one destination sheet (the unit of work of the parallel path).
+
+    Returns:
+        (interrupt name -> destination index, number of rows scanned)
+    """
+    df = pd.read_excel(input_path, sheet_name=sheet_name)
+    return parse_destination_sheet(df, sheet_name), len(df)
+
+# Names of unused slots in the destination sheets; they are not interrupts
+_PLACEHOLDER_NAMES = {'', '-', 'reserved'}
+
+def is_placeholder_name(name: str) -> bool:
+    """Whether a sheet name marks an unused slot ('reserved', '-', blank), in any case."""
+    return str(name).strip().lower() in _PLACEHOLDER_NAMES
+
+def match_destination_names(dest_indices: Dict[str, int], interrupts: Mapping, resolver: NameResolver,
+                            auto_fix: bool = True) -> Tuple[Dict[str, int], List[tuple], List[tuple]]:
+    """
+    Match the names of a destination sheet to source interrupts.
+
+    Exact names and vector bits are matched directly; the remaining names go
+    through the resolver.  A confident match is only taken if the sheet does
+    not list the matched name itself.  Placeholder slots ('reserved', '-',
+    blank) are skipped, and no name is fixed to a placeholder source name.
+
+    Returns:
+        (interrupt name -> destination index,
+         auto-fixes as (sheet name, interrupt name, score),
+         ambiguous/unmatched names as (sheet name, [(candidate, score), ...]))
+    """
+    matched: Dict[str, int] = {}
+    unresolved = []
+    for interrupt_name, dest_index in dest_indices.items():
+        if is_placeholder_name(interrupt_name):
+            PROFILER.count('dest_placeholders_skipped')
+            continue
+        if interrupt_name not in interrupts:
+            # Bits of a ranged vector interrupt map to its bit 0 index
+            vector = resolve_vector_destination(interrupt_name, dest_index, interrupts)
+            if vector:
+                interrupt_name, dest_index = vector
+        if interrupt_name in interrupts:
+            PROFILER.count('dest_lookup_hits')
+            matched[interrupt_name] = dest_index
+        else:
+            PROFILER.count('dest_lookup_misses')
+            unresolved.append((interrupt_name, dest_index))
+
+    fixes, ambiguous = [], []
+    for sheet_name, dest_index in unresolved:
+        status, candidates = resolver.resolve(sheet_name)
+        fix = candidates[0][0] if status == AUTO_FIX and not is_placeholder_name(candidates[0][0]) else None
+        if fix and fix not in matched and fix not in dest_indices:
+            fixes.append((sheet_name, fix, candidates[0][1]))
+            if auto_fix:
+                PROFILER.count('dest_lookup_fuzzy_fixes')
+                matched[fix] = dest_index
+        else:
+            ambiguous.append((sheet_name, candidates))
+    return matched, fixes, ambiguous
+
+def print_name_resolution(sheet_name: str, fixes: List[tuple], ambiguous: List[tuple], applied: bool = True):
+    """Report the fuzzy-matched and ambiguous names of a destination sheet."""
+    candidates_found = [(name, candidates) for name, candidates in ambiguous if candidates]
+    if not fixes and not ambiguous:
+        return
+    print(f"Name mismatches in {sheet_name}: {len(fixes)} {'auto-fixed' if applied else 'fixable'}, "
+          f"{len(candidates_found)} ambiguous, {len(ambiguous) - len(candidates_found)} without similar source name")
+    for name, fix, score in fixes:
+        print(f"  {'fixed' if applied else 'fix  '}  '{name}' -> '{fix}' (score {score:.2f})")
+    for name, candidates in candidates_found:
+        print(f"  check  '{name}': {', '.join(f'{c} ({score:.2f})' for c, score in candidates)}")
+
+def apply_destination_sheet(interrupts: Mapping, resolver: NameResolver, dest_name: str, sheet_name: str,
+                            dest_indices: Dict[str, int], strict_names: bool = False):
+    """Update the destination indices of the interrupts from one parsed destination sheet."""
+    print(f"Found {len(dest_indices)} interrupt mappings in {sheet_name}")
+
+    # Update interrupt destinations
+    matched, fixes, ambiguous = match_destination_names(dest_indices, interrupts, resolver,
+                                                        auto_fix=not strict_names)
+    for interrupt_name, dest_index in matched.items():
+        if dest_name in interrupts[interrupt_name].destinations:
+            # Update with actual destination index
+            signal_path = f"// {sheet_name}[{dest_index}]"
+            interrupts[interrupt_name].destinations[dest_name] = (dest_index, signal_path)
+    print_name_resolution(sheet_name, fixes, ambiguous, applied=not strict_names)
+
+def render_outputs(interrupts: Mapping, output_path: str, input_path: str, mask_tables_path: Optional[str] = None,
+                   route_bitmaps_path: Optional[str] = None, pair_ids_path: Optional[str] = None,
+                   coverage_bins_path: Optional[str] = None):
+    """Write the map entries and whichever of the derived tables have a path."""
+    generate_sv_file(interrupts, output_path, input_path)
+
+    # Generate mask bit position tables for int_register_model
+    if mask_tables_path:
+        generate_mask_tables_file([i.to_entry_dict() for i in interrupts.values()],
+                                  mask_tables_path, input_path)
+        print(f"Successfully generated mask tables '{mask_tables_path}'")
+
+    # Routing bitmaps, pair IDs and coverage bins follow interrupt_map order, so read the entries back
+    if route_bitmaps_path or pair_ids_path or coverage_bins_path:
+        entries = load_interrupt_map(str(output_path))
+    if route_bitmaps_path:
+        generate_route_bitmaps_file(entries, route_bitmaps_path, input_path)
+        print(f"Successfully generated routing bitmaps '{route_bitmaps_path}'")
+    if pair_ids_path:
+        generate_pair_ids_file(entries, pair_ids_path, input_path)
+        print(f"Successfully generated pair IDs '{pair_ids_path}'")
+    if coverage_bins_path:
+        generate_coverage_bins_file(entries, coverage_bins_path, input_path)
+        print(f"Successfully generated coverage bins '{coverage_bins_path}'")
+
+def parse_interrupt_xlsx(input_path: str, output_path: str, mask_tables_path: Optional[str] = None,
+                         route_bitmaps_path: Optional[str] = None, pair_ids_path: Optional[str] = None,
+                         strict_names: bool = False, jobs: int = 1, coverage_bins_path: Optional[str] = None):
+    """
+    Parse the Excel file and generate SystemVerilog routing model, mask tables, routing bitmaps, pair IDs
+    and per-pair coverage bins.
+
+    Destination sheet names without an exact source match are resolved with
+    NameResolver; confident matches are applied unless strict_names is set.
+
+    With jobs > 1 the destination sheets are read and parsed in worker
+    processes while the source sheets are parsed.  Their results are merged in
+    DEST_SHEET_MAP order, as in the serial path, so the output is identical.
+    """
+    pool = None
     try:
+        with PROFILER.stage('read_excel'):
+            xl = pd.ExcelFile(input_path)
+        dest_sheets = [(dest_name, sheet_name) for dest_name, sheet_name in DEST_SHEET_MAP.items()
+                       if sheet_name in xl.sheet_names]
+        if jobs > 1 and len(dest_sheets) > 1:
+            # openpyxl parses the sheet XML in Python, holding the GIL, so use processes
+            pool = Pool(processes=min(jobs, len(dest_sheets)))
+            pending = pool.starmap_async(read_destination_sheet,
+                                         [(input_path, sheet_name) for _, sheet_name in dest_sheets])
+
         # Read main sheet (excluding SCP and MCP groups)
-        df_main = pd.read_excel(input_path, sheet_name='IOSUB中断源')
-        interrupts = parse_main_sheet(df_main)
+        with PROFILER.stage('read_excel'):
+            df_main = pd.read_excel(input_path, sheet_name='IOSUB中断源')
+        with PROFILER.stage('parse_sheets'):
+            interrupts = parse_main_sheet(df_main)
 
         print(f"Parsed {len(interrupts)} interrupts from IOSUB中断源 sheet (excluding SCP/MCP)")
 
         # Read MSCP-to-IOSUB sheet for SCP and MCP interrupts
-        xl = pd.ExcelFile(input_path)
         if 'MSCP-to-IOSUB中断' in xl.sheet_names:
             print("Processing MSCP-to-IOSUB中断 sheet for SCP and MCP interrupts")
-            df_mscp = pd.read_excel(input_path, sheet_name='MSCP-to-IOSUB中断')
-            mscp_interrupts = parse_mscp_sheet(df_mscp)
+            with PROFILER.stage('read_excel'):
+                df_mscp = pd.read_excel(input_path, sheet_name='MSCP-to-IOSUB中断')
+            with PROFILER.stage('parse_sheets'):
+                mscp_interrupts = parse_mscp_sheet(df_mscp)
 
             print(f"Parsed {len(mscp_interrupts)} SCP/MCP interrupts from MSCP-to-IOSUB中断 sheet")
 
@@ -388,31 +776,44 @@ def parse_interrupt_xlsx(input_path: str, output_path: str):
         else:
             print("Warning: MSCP-to-IOSUB中断 sheet not found, SCP/MCP interrupts will be missing")
 
+        # Index the source names once for destination names without an exact match
+        resolver = NameResolver(interrupts)
+
+        dest_results = None
+        if pool:
+            with PROFILER.stage('read_dest_sheets'):
+                dest_results = pending.get()
+                pool.close()
+                pool.join()
+
         # Read destination sheets and update interrupt mappings
-        for dest_name, sheet_name in DEST_SHEET_MAP.items():
-            if sheet_name in xl.sheet_names:
-                print(f"Processing destination sheet: {sheet_name}")
-                df_dest = pd.read_excel(input_path, sheet_name=sheet_name)
-                dest_indices = parse_destination_sheet(df_dest, sheet_name)
-
-                print(f"Found {len(dest_indices)} interrupt mappings in {sheet_name}")
-
-                # Update interrupt destinations
-                for interrupt_name, dest_index in dest_indices.items():
-                    if interrupt_name in interrupts:
-                        if dest_name in interrupts[interrupt_name].destinations:
-                            # Update with actual destination index
-                            signal_path = f"// {sheet_name}[{dest_index}]"
-                            interrupts[interrupt_name].destinations[dest_name] = (dest_index, signal_path)
+        for i, (dest_name, sheet_name) in enumerate(dest_sheets):
+            print(f"Processing destination sheet: {sheet_name}")
+            if dest_results is None:
+                with PROFILER.stage('read_excel'):
+                    df_dest = pd.read_excel(input_path, sheet_name=sheet_name)
+            with PROFILER.stage('destination_mapping'):
+                if dest_results is None:
+                    dest_indices = parse_destination_sheet(df_dest, sheet_name)
+                else:
+                    dest_indices, rows = dest_results[i]
+                    PROFILER.count('rows_scanned', rows)
+
+                apply_destination_sheet(interrupts, resolver, dest_name, sheet_name, dest_indices, strict_names)
 
         # Generate SystemVerilog file
-        generate_sv_file(interrupts, output_path, input_path)
+        with PROFILER.stage('render'):
+            render_outputs(interrupts, output_path, input_path, mask_tables_path, route_bitmaps_path,
+                           pair_ids_path, coverage_bins_path)
 
     except Exception as e:
         print(f"Error processing Excel file: {e}")
         raise
+    finally:
+        if pool:
+            pool.terminate()
 
-def generate_sv_file(interrupts: Dict[str, InterruptInfo], output_path: str, input_path: str = "int_vector.xlsx"):
+def generate_sv_file(interrupts: Mapping, output_path: str, input_path: str = "int_vector.xlsx"):
     """Generate SystemVerilog include file with build function content only."""
     sv_lines = [
         "// Auto-generated interrupt map entries from Excel file",
@@ -464,10 +865,61 @@ if __name__ == "__main__":
         default="seq/int_map_entries.svh",
         help="Path for the output SystemVerilog include file.\n(default: 'seq/int_map_entries.svh')"
     )
+    parser.add_argument(
+        "-m", "--mask-tables",
+        default="seq/int_mask_tables.svh",
+        help="Path for the mask bit position tables include file.\n(default: 'seq/int_mask_tables.svh')"
+    )
+    parser.add_argument(
+        "-r", "--route-bitmaps",
+        default="seq/int_route_bitmaps.svh",
+        help="Path for the per-destination routing bitmaps include file.\n(default: 'seq/int_route_bitmaps.svh')"
+    )
+    parser.add_argument(
+        "-p", "--pair-ids",
+        default="seq/int_pair_ids.svh",
+        help="Path for the interrupt/destination pair ID table include file.\n(default: 'seq/int_pair_ids.svh')"
+    )
+    parser.add_argument(
+        "-c", "--coverage-bins",
+        default="seq/int_pair_coverage.svh",
+        help="Path for the per-pair routing coverage bins include file.\n(default: 'seq/int_pair_coverage.svh')"
+    )
+    parser.add_argument(
+        "--strict-names", action="store_true",
+        help="Only report destination sheet names without an exact source match,\ndo not apply confident fuzzy matches"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for reading the destination sheets\n(default: all cores, 1: serial)"
+    )
+    parser.add_argument(
+        "--profile",
+        help="Write a stage timing/counter report to this path"
+    )
+    parser.add_argument(
+        "--profile-format", choices=["json", "prometheus"], default="json",
+        help="Format of the --profile report (default: json)"
+    )
+    parser.add_argument(
+        "--cprofile-dir",
+        help="With --profile, also dump cProfile stats per stage into this directory"
+    )
     args = parser.parse_args()
+
+    if args.profile:
+        PROFILER.enable(args.cprofile_dir)
     
     # Ensure output directory exists
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    Path(args.mask_tables).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.route_bitmaps).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.pair_ids).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.coverage_bins).parent.mkdir(parents=True, exist_ok=True)
     
-    parse_interrupt_xlsx(args.xlsx_file, output_path)
+    parse_interrupt_xlsx(args.xlsx_file, output_path, args.mask_tables, args.route_bitmaps, args.pair_ids,
+                         args.strict_names, args.jobs, args.coverage_bins)
+
+    if args.profile:
+        PROFILER.write_report(args.profile, args.profile_format)
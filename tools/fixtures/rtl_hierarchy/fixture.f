@@ -0,0 +1,7 @@
+// RTL hierarchy fixture for scan_rtl_hierarchy.py, checked with:
+//   python3 tools/scan_rtl_hierarchy.py tools/fixtures/rtl_hierarchy/fixture.f --top fixture_tb -n --no-cache \
+//     --expect iosub_top=fixture_tb.multidie_top.DUT[0].u_str_top.u_iosub_top_wrap[0] \
+//     --expect iosub_int_sub=fixture_tb.multidie_top.DUT[0].u_str_top.u_iosub_top_wrap[0].u_iosub_int_sub \
+//     --expect scp_top=fixture_tb.multidie_top.DUT[0].u_str_top.g_scp[1].u_scp_top_wrapper \
+//     --expect mcp_top=fixture_tb.multidie_top.DUT[0].u_str_top.u_mcp_top[3]
+fixture_top.sv
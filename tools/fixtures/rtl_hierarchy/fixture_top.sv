@@ -0,0 +1,45 @@
+// RTL hierarchy fixture for scan_rtl_hierarchy.py (see fixture.f)
+// Instance arrays and for-generate blocks are addressed through their first element:
+// - for (d = 0; ...) begin : DUT        -> DUT[0]
+// - iosub_top_wrap u_iosub_top_wrap [2] -> u_iosub_top_wrap[0]
+// - for (i = SCP_BASE; ...) begin : g_scp with SCP_BASE = 1 -> g_scp[1]
+// - mcp_top u_mcp_top [3:1]             -> u_mcp_top[3]
+
+module fixture_tb;
+    multidie_top multidie_top ();
+endmodule
+
+module multidie_top #(parameter NUM_DIE = 2);
+    for (genvar d = 0; d < NUM_DIE; d++) begin : DUT
+        str_top u_str_top ();
+    end
+endmodule
+
+module str_top #(parameter SCP_BASE = 1);
+    iosub_top_wrap u_iosub_top_wrap [2] ();
+
+    for (genvar i = SCP_BASE; i < (SCP_BASE + 2); i++) begin : g_scp
+        scp_top_wrapper u_scp_top_wrapper ();
+    end
+
+    mcp_top u_mcp_top [3:1] ();
+endmodule
+
+module iosub_top_wrap;
+    iosub_int_sub #(.NUM_INTR(64)) u_iosub_int_sub (.iosub_to_ap_intr());
+endmodule
+
+module iosub_int_sub #(parameter NUM_INTR = 32) (
+    output logic [NUM_INTR-1:0] iosub_to_ap_intr
+);
+endmodule
+
+module scp_top_wrapper (
+    input logic [255:0] scp_irq
+);
+endmodule
+
+module mcp_top (
+    input logic [127:0] mcp_irq
+);
+endmodule
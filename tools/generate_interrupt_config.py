@@ -6,21 +6,58 @@
 1. 检查Excel命名一致性
 2. 从Excel生成SystemVerilog配置文件
 3. 更新RTL路径
-4. 验证生成结果
+4. 规划批量激励波次
+5. 规划回归分片
+6. 规划定向掩码配置
+7. 生成源总线映像表
+8. 验证生成结果
+
+使用 --batch MANIFEST 时按清单批量生成多个芯片变体（见 tools/batch_generate.py）：
+内容相同的表格在整个批次中只解析一次，各变体在工作进程中并行生成到各自的输出目录，
+最后汇总各变体与第一个变体的差异。
+
+使用 --profile 时记录每个步骤及子工具内部阶段的墙钟时间、CPU时间、峰值RSS
+和热点计数器（扫描行数、正则求值、目标表查找命中/未命中、路径规则回退），
+输出JSON或Prometheus textfile报告。
 """
 
 import subprocess
 import sys
 import os
 import re
+import tempfile
 from pathlib import Path
 
+from pipeline_profiler import PROFILER
+from generation_history import GenerationHistory
+
 class InterruptConfigGenerator:
-    def __init__(self, excel_file="int_vector.xlsx", output_file="seq/int_map_entries.svh"):
+    def __init__(self, excel_file="int_vector.xlsx", output_file="seq/int_map_entries.svh",
+                 profile=None, profile_format="json", cprofile_dir=None):
         self.excel_file = excel_file
         self.output_file = output_file
-        self.backup_file = f"{output_file}.backup_generation"
-        
+        self.history = GenerationHistory.for_file(output_file)
+        self.generation_id = None
+        self.profile = profile
+        self.profile_format = profile_format
+        self.cprofile_dir = cprofile_dir
+        self.child_reports = {}  # 步骤名 -> 子工具JSON报告路径
+        self.report_dir = None
+        if profile:
+            PROFILER.enable(cprofile_dir)
+            self.report_dir = tempfile.mkdtemp(prefix="int_profile_")
+
+    def profile_args(self, stage):
+        """为支持--profile的子工具生成命令行参数，并登记其报告路径"""
+        if not self.profile:
+            return ""
+        report = os.path.join(self.report_dir, f"{stage}.json")
+        self.child_reports[stage] = report
+        args = f" --profile {report}"
+        if self.cprofile_dir and stage != "validate_signal_paths":
+            args += f" --cprofile-dir {os.path.join(self.cprofile_dir, stage)}"
+        return args
+
     def run_command(self, cmd, description):
         """运行命令并处理结果"""
         print(f"🔄 {description}...")
@@ -46,7 +83,7 @@ class InterruptConfigGenerator:
         print("="*60)
         
         success, output = self.run_command(
-            "python3 tools/check_excel_naming_issues.py",
+            f"python3 tools/check_excel_naming_issues.py {self.excel_file}",
             "检查Excel命名一致性"
         )
         
@@ -62,19 +99,23 @@ class InterruptConfigGenerator:
         print("步骤2: 从Excel生成SystemVerilog配置文件")
         print("="*60)
         
-        # 创建备份
+        # 记录当前文件到生成历史（内容未变时不产生新记录）
         if Path(self.output_file).exists():
-            subprocess.run(f"cp {self.output_file} {self.backup_file}", shell=True)
-            print(f"✅ 创建备份: {self.backup_file}")
+            gen_id = self.history.record(self.output_file, "pre_generation")
+            if gen_id:
+                print(f"✅ 当前文件已记录到生成历史: {gen_id}")
         
         success, output = self.run_command(
-            f"python3 tools/convert_xlsx_to_sv.py {self.excel_file} -o {self.output_file}",
+            f"python3 tools/convert_xlsx_to_sv.py {self.excel_file} -o {self.output_file}"
+            f"{self.profile_args('convert')}",
             "生成SystemVerilog配置文件"
         )
         
         if not success:
             print(f"❌ 配置文件生成失败")
             return False
+
+        self.generation_id = self.history.record(self.output_file, "convert", self.excel_file)
         
         # 解析生成统计
         lines = output.split('\n')
@@ -91,7 +132,7 @@ class InterruptConfigGenerator:
         print("="*60)
         
         success, output = self.run_command(
-            "python3 tools/update_rtl_paths.py",
+            f"python3 tools/update_rtl_paths.py{self.profile_args('update_rtl_paths')}",
             "更新RTL路径"
         )
         
@@ -114,7 +155,7 @@ class InterruptConfigGenerator:
         print("="*60)
 
         success, output = self.run_command(
-            "python3 tools/generate_signal_paths.py --validate",
+            f"python3 tools/generate_signal_paths.py --validate{self.profile_args('validate_signal_paths')}",
             "验证信号路径生成器配置"
         )
 
@@ -124,10 +165,74 @@ class InterruptConfigGenerator:
 
         return True  # 即使验证失败也继续执行
 
+    def plan_stimulus_waves(self):
+        """规划批量激励波次"""
+        print("\n" + "="*60)
+        print("步骤5: 规划批量激励波次")
+        print("="*60)
+
+        success, output = self.run_command(
+            f"python3 tools/plan_stimulus_waves.py -e {self.output_file} -o seq/int_wave_schedule.svh",
+            "规划批量激励波次"
+        )
+
+        if not success:
+            print("⚠️  激励波次规划失败，请手动运行 tools/plan_stimulus_waves.py 更新波次表")
+
+        return True  # 波次规划失败不影响中断配置
+
+    def plan_regression_shards(self):
+        """规划回归分片"""
+        print("\n" + "="*60)
+        print("步骤6: 规划回归分片")
+        print("="*60)
+
+        success, output = self.run_command(
+            f"python3 tools/plan_regression_shards.py plan -e {self.output_file} -o seq/int_shard_schedule.svh",
+            "规划回归分片"
+        )
+
+        if not success:
+            print("⚠️  回归分片规划失败，请手动运行 tools/plan_regression_shards.py plan 更新分片表")
+
+        return True  # 分片规划失败不影响中断配置
+
+    def plan_mask_configs(self):
+        """规划定向掩码配置"""
+        print("\n" + "="*60)
+        print("步骤7: 规划定向掩码配置")
+        print("="*60)
+
+        success, output = self.run_command(
+            f"python3 tools/plan_mask_configs.py -e {self.output_file} -o seq/int_mask_configs.svh",
+            "规划定向掩码配置"
+        )
+
+        if not success:
+            print("⚠️  掩码配置规划失败，请手动运行 tools/plan_mask_configs.py 更新掩码配置表")
+
+        return True  # 掩码配置规划失败不影响中断配置
+
+    def generate_source_buses(self):
+        """生成源总线映像表"""
+        print("\n" + "="*60)
+        print("步骤8: 生成源总线映像表")
+        print("="*60)
+
+        success, output = self.run_command(
+            f"python3 tools/source_buses.py -e {self.output_file} -o seq/int_source_buses.svh",
+            "生成源总线映像表"
+        )
+
+        if not success:
+            print("⚠️  源总线映像表生成失败，请手动运行 tools/source_buses.py 更新映像表")
+
+        return True  # 映像表生成失败不影响中断配置
+
     def validate_results(self):
         """验证生成结果"""
         print("\n" + "="*60)
-        print("步骤5: 验证生成结果")
+        print("步骤9: 验证生成结果")
         print("="*60)
         
         try:
@@ -137,6 +242,8 @@ class InterruptConfigGenerator:
             pattern = r'entry = \'{name:"([^"]+)".*?to_ap:(\d+).*?rtl_path_ap:"([^"]*)".*?to_scp:(\d+).*?rtl_path_scp:"([^"]*)".*?to_mcp:(\d+).*?rtl_path_mcp:"([^"]*)".*?to_accel:(\d+).*?rtl_path_accel:"([^"]*)".*?\};'
             
             matches = re.findall(pattern, content, re.DOTALL)
+            PROFILER.count('rows_scanned', len(matches))
+            PROFILER.count('regex_evaluations', len(matches) + 1)
             
             print(f"📊 总共找到 {len(matches)} 个中断条目")
             
@@ -185,6 +292,18 @@ class InterruptConfigGenerator:
             print(f"❌ 验证过程中出错: {e}")
             return False
     
+    def write_profile(self):
+        """写出性能剖析报告"""
+        if not self.profile:
+            return
+        PROFILER.write_report(self.profile, self.profile_format)
+        print(f"📈 性能剖析报告: {self.profile}")
+        for stage, record in PROFILER.stages.items():
+            print(f"   {stage:<40} {record['wall_seconds']:8.3f}s  "
+                  f"CPU {record['cpu_seconds']:8.3f}s  RSS {record['peak_rss_mb']:7.1f}MB")
+        if PROFILER.counters:
+            print("   计数器: " + ", ".join(f"{k}={v}" for k, v in sorted(PROFILER.counters.items())))
+
     def generate(self):
         """执行完整的生成流程"""
         print("🚀 中断配置生成器")
@@ -200,24 +319,37 @@ class InterruptConfigGenerator:
         
         # 执行各个步骤
         steps = [
-            ("检查Excel命名一致性", self.check_excel_naming),
-            ("生成SystemVerilog配置", self.generate_sv_config),
-            ("更新RTL路径", self.update_rtl_paths),
-            ("验证信号路径生成器", self.validate_signal_paths),
-            ("验证生成结果", self.validate_results)
+            ("检查Excel命名一致性", "naming_check", self.check_excel_naming),
+            ("生成SystemVerilog配置", "convert", self.generate_sv_config),
+            ("更新RTL路径", "update_rtl_paths", self.update_rtl_paths),
+            ("验证信号路径生成器", "validate_signal_paths", self.validate_signal_paths),
+            ("规划批量激励波次", "plan_stimulus_waves", self.plan_stimulus_waves),
+            ("规划回归分片", "plan_regression_shards", self.plan_regression_shards),
+            ("规划定向掩码配置", "plan_mask_configs", self.plan_mask_configs),
+            ("生成源总线映像表", "source_buses", self.generate_source_buses),
+            ("验证生成结果", "validate_results", self.validate_results)
         ]
         
-        for step_name, step_func in steps:
-            if not step_func():
+        for step_name, stage, step_func in steps:
+            with PROFILER.stage(stage):
+                success = step_func()
+                if stage in self.child_reports:
+                    PROFILER.merge(self.child_reports[stage], stage)
+            if not success:
                 print(f"\n❌ 流程在'{step_name}'步骤失败")
+                self.write_profile()
                 return False
+
+        self.write_profile()
         
         print("\n" + "="*60)
         print("🎉 中断配置生成完成!")
         print("="*60)
         print(f"✅ 输出文件: {self.output_file}")
-        if Path(self.backup_file).exists():
-            print(f"📁 备份文件: {self.backup_file}")
+        latest = self.history.generations(self.output_file)
+        if latest:
+            print(f"📁 生成历史: {latest[-1]['id']} (共{len(latest)}代, {self.history.root})")
+            print(f"   回滚: python3 tools/generation_history.py -e {self.output_file} rollback <id>")
         print("\n💡 后续建议:")
         print("   1. 检查验证结果中的任何问题")
         print("   2. 如有命名问题，修正Excel文件后重新生成")
@@ -234,10 +366,29 @@ def main():
                        help="Excel输入文件 (默认: int_vector.xlsx)")
     parser.add_argument("-o", "--output", default="seq/int_map_entries.svh",
                        help="SystemVerilog输出文件 (默认: seq/int_map_entries.svh)")
+    parser.add_argument("--profile", metavar="REPORT",
+                       help="记录各阶段时间/CPU/峰值RSS和计数器，写入该报告文件")
+    parser.add_argument("--profile-format", choices=["json", "prometheus"], default="json",
+                       help="性能剖析报告格式 (默认: json)")
+    parser.add_argument("--cprofile-dir",
+                       help="配合--profile，按阶段输出cProfile统计到该目录")
+    parser.add_argument("--batch", metavar="MANIFEST",
+                       help="批量生成清单中的所有芯片变体 (见 tools/batch_generate.py)，忽略excel_file和-o")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                       help="配合--batch，解析表格和生成变体的工作进程数 (默认: 全部核心)")
     
     args = parser.parse_args()
+
+    if args.batch:
+        # 各变体共享相同内容表格的解析结果，并行生成到各自的输出目录
+        from batch_generate import run_batch
+        if not Path(args.batch).exists():
+            print(f"❌ 批量清单不存在: {args.batch}")
+            return 1
+        return 0 if run_batch(args.batch, args.jobs) else 1
     
-    generator = InterruptConfigGenerator(args.excel_file, args.output)
+    generator = InterruptConfigGenerator(args.excel_file, args.output,
+                                         args.profile, args.profile_format, args.cprofile_dir)
     success = generator.generate()
     
     return 0 if success else 1
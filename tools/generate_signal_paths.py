@@ -12,6 +12,8 @@ import json
 import os
 from typing import Dict, List, Tuple, Optional
 
+from pipeline_profiler import PROFILER
+
 class SignalPathGenerator:
     def __init__(self, config_file: str = None):
         """
@@ -46,7 +48,7 @@ class SignalPathGenerator:
 
         except FileNotFoundError:
             print(f"Warning: Config file not found: {self.config_file}")
-            print("Using fallback default configuration...")
+            print("Using fallback default configuration (run tools/scan_rtl_hierarchy.py to derive it from the RTL)...")
             self._load_default_config()
         except json.JSONDecodeError as e:
             print(f"Error parsing config file: {e}")
@@ -56,6 +58,9 @@ class SignalPathGenerator:
     def _load_default_config(self):
         """Load default configuration as fallback."""
         # Fallback to hardcoded configuration
+        self.interrupt_groups = {}
+        self.destination_mappings = {}
+        self.hierarchy_rules = {}
         self.base_hierarchy = {
             'iosub_top': 'top_tb.multidie_top.DUT[0].u_str_top.u_iosub_top_wrap',
             'mcp_top': 'top_tb.multidie_top.DUT[0].u_str_top.u_iosub_top_wrap.u0_iosub_top_wrap_hd.u0_iosub_top_wrap_raw.u_mcp_top',
@@ -175,6 +180,7 @@ class SignalPathGenerator:
 
     def _fallback_hierarchy_selection(self, group: str) -> str:
         """Fallback hierarchy selection for backward compatibility."""
+        PROFILER.count('path_rule_fallbacks')
         if group == "SCP":
             return "scp_top"
         elif group == "MCP":
@@ -287,6 +293,7 @@ class SignalPathGenerator:
             if bit_index < 0:
                 # This shouldn't happen for properly configured interrupts
                 print(f"Warning: ACCEL interrupt {interrupt_name} has index {index} < 5, using index 0")
+                PROFILER.count('path_rule_fallbacks')
                 bit_index = 0
             return f"{base_path}.accel_to_iosub_intr[{bit_index}]"
 
@@ -381,6 +388,8 @@ class SignalPathGenerator:
         # Fallback for unknown groups - try to infer from group name
         else:
             print(f"Warning: Unknown interrupt group '{group}', using fallback logic")
+            PROFILER.count('path_rule_fallbacks')
+            PROFILER.count('unknown_group_fallbacks')
 
             # Try common patterns
             if group.upper() in ['USB', 'SMMU', 'IODAP', 'IO_DIE']:
@@ -448,6 +457,7 @@ class SignalPathGenerator:
         # Fallback for unknown destinations
         else:
             print(f"Warning: Unknown destination '{destination}', using fallback logic")
+            PROFILER.count('path_rule_fallbacks')
             iosub_base = self.base_hierarchy.get('iosub_top', '')
             return f"{iosub_base}.iosub_to_{destination}_intr[{index}]"
 
@@ -522,15 +532,23 @@ def main():
     parser.add_argument('-c', '--config', help='Path to hierarchy configuration file')
     parser.add_argument('-t', '--test', action='store_true', help='Run test cases')
     parser.add_argument('-v', '--validate', action='store_true', help='Validate configuration')
+    parser.add_argument('--profile', help='Write a stage timing/counter report to this path')
+    parser.add_argument('--profile-format', choices=['json', 'prometheus'], default='json',
+                        help='Format of the --profile report (default: json)')
 
     args = parser.parse_args()
 
+    if args.profile:
+        PROFILER.enable()
+
     # Initialize generator
-    generator = SignalPathGenerator(args.config)
+    with PROFILER.stage('load_config'):
+        generator = SignalPathGenerator(args.config)
 
     # Validate configuration if requested
     if args.validate:
-        generator.validate_configuration()
+        with PROFILER.stage('validate_configuration'):
+            generator.validate_configuration()
 
     # Run test cases if requested
     if args.test:
@@ -558,5 +576,8 @@ def main():
         print("Use --test to run test cases or --validate to check configuration")
         print("Use --help for more options")
 
+    if args.profile:
+        PROFILER.write_report(args.profile, args.profile_format)
+
 if __name__ == "__main__":
     main()
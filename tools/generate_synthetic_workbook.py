@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Synthetic Interrupt Workbook Generator
+
+Writes a workbook with the same sheet and column layout as int_vector.xlsx,
+scaled to an arbitrary number of interrupts, so that convert_xlsx_to_sv.py and
+the RTL path tools can be exercised at sizes the real chip does not have yet.
+
+Interrupts are replicated round-robin from a template interrupt map (the
+generated int_map_entries.svh by default), which keeps the real group mix,
+trigger/polarity mix and routing density.  Copies get a "_s<n>" name suffix
+and continue the sub index of their group; destination indices are assigned
+sequentially per destination sheet.
+
+Sheets written (cell positions match the real workbook):
+- IOSUB中断源: all groups, SCP/MCP rows included but ignored by the converter
+- MSCP-to-IOSUB中断: SCP and MCP groups
+- SCP M7中断列表 / MCP M7中断列表 (with the NMI row), iosub-to-AP中断列表,
+  iosub-to-IMU中断列表, iosub-to-IO, 跨die中断列表
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from interrupt_map import load_interrupt_map
+from convert_xlsx_to_sv import GROUP_MAP, TRIGGER_MAP, POLARITY_MAP, DEST_SHEET_MAP
+
+MAIN_SHEET = 'IOSUB中断源'
+MSCP_SHEET = 'MSCP-to-IOSUB中断'
+
+MAIN_HEADER = ['interrupt Source', 'sub index', 'Interrupt Name', 'Description', 'security',
+               'Trigger', ' Polarity', 'to AP?', 'to SCP?', 'to MCP?', 'to IMU?', 'to IO?',
+               'to other DIE?', 'comment']
+MSCP_HEADER = MAIN_HEADER[:12] + ['comment']
+DEST_HEADER = ['index', 'Interrupt Name', 'Description', 'security', 'Trigger', ' Polarity', 'Comment']
+AP_HEADER = ['interrupt Type', 'interrupt ID', 'index', 'Interrupt Name', 'Description',
+             'security', 'Trigger', ' Polarity', 'Comment']
+
+# Title cell of each destination sheet (column B, column A for the AP sheet)
+DEST_SHEET_TITLES = {
+    'AP': 'IOSUB SPI-C中断列表',
+    'SCP': 'SCP M7中断列表',
+    'MCP': 'MCP M7中断列表',
+    'ACCEL': 'IOSUB TO IMU中断列表',
+    'IO': 'IOSUB TO IO中断列表',
+    'OTHER_DIE': '跨die中断列表',
+}
+
+# First interrupt ID of the AP SPI range (spi_base=256 + 32)
+AP_SPI_BASE = 288
+
+MAIN_DESTINATIONS = ['AP', 'SCP', 'MCP', 'ACCEL', 'IO', 'OTHER_DIE']
+MSCP_DESTINATIONS = ['AP', 'SCP', 'MCP', 'ACCEL', 'IO']
+
+# Reverse mappings back to the workbook spelling
+GROUP_HEADERS = {group: header for header, group in GROUP_MAP.items()}
+TRIGGER_NAMES = {trigger: name for name, trigger in TRIGGER_MAP.items()}
+POLARITY_NAMES = {polarity: name for name, polarity in POLARITY_MAP.items()}
+
+
+class SyntheticWorkbookGenerator:
+    def __init__(self, template_entries: List[dict]):
+        """
+        Initialize the synthetic workbook generator.
+
+        Args:
+            template_entries: Interrupt map entries to replicate (see interrupt_map.load_interrupt_map).
+                              Groups that do not come from the workbook (e.g. PMERGE) are ignored.
+        """
+        self.template = [e for e in template_entries if e['group'] in GROUP_HEADERS]
+        if not self.template:
+            raise ValueError("Template contains no workbook interrupt groups")
+
+    def build_interrupts(self, count: int) -> Dict[str, List[dict]]:
+        """
+        Replicate the template up to count interrupts.
+
+        Returns:
+            Dictionary of group -> list of interrupt rows, groups in template order
+        """
+        groups: Dict[str, List[dict]] = {}
+        for i in range(count):
+            copy, pos = divmod(i, len(self.template))
+            entry = self.template[pos]
+            rows = groups.setdefault(entry['group'], [])
+            rows.append({
+                'name': entry['name'] if copy == 0 else f"{entry['name']}_s{copy}",
+                'index': len(rows),
+                'trigger': TRIGGER_NAMES.get(entry['trigger'], ''),
+                'polarity': POLARITY_NAMES.get(entry['polarity'], ''),
+                'destinations': [d for d in MAIN_DESTINATIONS if entry.get(f"to_{d.lower()}", 0)],
+            })
+        return groups
+
+    def assign_dest_indices(self, groups: Dict[str, List[dict]]) -> Dict[str, List[str]]:
+        """Get the interrupt names of each destination sheet, in destination index order."""
+        dest_lists: Dict[str, List[str]] = {d: [] for d in MAIN_DESTINATIONS}
+        for rows in groups.values():
+            for row in rows:
+                for dest in row['destinations']:
+                    dest_lists[dest].append(row['name'])
+        return dest_lists
+
+    @staticmethod
+    def _source_rows(groups: Dict[str, List[dict]], destinations: List[str]) -> List[list]:
+        rows = []
+        for group, interrupts in groups.items():
+            rows.append([GROUP_HEADERS[group]])
+            for intr in interrupts:
+                security = 'secure' if group in ('SCP', 'MCP') else 'non-secure'
+                rows.append([None, intr['index'], intr['name'], f"synthetic {group} interrupt",
+                             security, intr['trigger'], intr['polarity']] +
+                            ['YES' if d in intr['destinations'] else 'NO' for d in destinations])
+        return rows
+
+    def build_sheets(self, count: int) -> Tuple[Dict[str, List[list]], Dict[str, int]]:
+        """
+        Build the rows of every sheet for count interrupts.
+
+        Returns:
+            (sheet name -> rows including title and header rows, in workbook order,
+             sheet name -> number of data rows)
+        """
+        groups = self.build_interrupts(count)
+        dest_lists = self.assign_dest_indices(groups)
+        sheets: Dict[str, List[list]] = {}
+        summary = {}
+
+        rows = self._source_rows(groups, MAIN_DESTINATIONS)
+        sheets[MAIN_SHEET] = [MAIN_HEADER] + rows
+        summary[MAIN_SHEET] = len(rows)
+
+        mscp_groups = {g: r for g, r in groups.items() if g in ('SCP', 'MCP')}
+        rows = self._source_rows(mscp_groups, MSCP_DESTINATIONS)
+        sheets[MSCP_SHEET] = [MSCP_HEADER] + rows
+        summary[MSCP_SHEET] = len(rows)
+
+        for dest, sheet_name in DEST_SHEET_MAP.items():
+            names = dest_lists[dest]
+            if dest == 'AP':
+                rows = [[DEST_SHEET_TITLES[dest]], AP_HEADER, ['SPI(IOSUB subsys)', '不用填']]
+                rows += [[None, AP_SPI_BASE + index, index, name, None, 'non-secure', 'Level', 'Active high']
+                         for index, name in enumerate(names)]
+            else:
+                rows = [[None, DEST_SHEET_TITLES[dest]], [None] + DEST_HEADER]
+                if dest in ('SCP', 'MCP'):
+                    rows.append([None, 'NMI', f"{dest.lower()}_wdt0_ws0", None, 'secure', 'Level', 'Active high'])
+                rows += [[None, index, name, None, 'secure', 'Level', 'Active high']
+                         for index, name in enumerate(names)]
+            sheets[sheet_name] = rows
+            summary[sheet_name] = len(names)
+
+        return sheets, summary
+
+    def write(self, output_path: str, count: int) -> Dict[str, int]:
+        """
+        Write a synthetic workbook with count interrupts.
+
+        Returns:
+            Dictionary of sheet name -> number of data rows written
+        """
+        sheets, summary = self.build_sheets(count)
+        write_sheets(output_path, sheets)
+        return summary
+
+
+def write_sheets(output_path: str, sheets: Dict[str, List[list]]):
+    """Write sheet rows (see SyntheticWorkbookGenerator.build_sheets) as a workbook."""
+    from openpyxl import Workbook
+
+    # Write-only mode streams rows to disk, which keeps 100k-row workbooks cheap
+    wb = Workbook(write_only=True)
+    for sheet_name, rows in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        for row in rows:
+            ws.append(row)
+    wb.save(output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Synthetic Interrupt Workbook Generator')
+    parser.add_argument('-n', '--count', type=int, default=1000,
+                        help='Number of interrupts to generate (default: 1000)')
+    parser.add_argument('-t', '--template', default='seq/int_map_entries.svh',
+                        help='Interrupt map entries file to replicate')
+    parser.add_argument('-o', '--output', help='Output workbook (default: synthetic_int_vector_<count>.xlsx)')
+
+    args = parser.parse_args()
+
+    if not Path(args.template).exists():
+        print(f"Error: {args.template} not found!")
+        return 1
+
+    output = args.output or f"synthetic_int_vector_{args.count}.xlsx"
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+
+    generator = SyntheticWorkbookGenerator(load_interrupt_map(args.template))
+    summary = generator.write(output, args.count)
+
+    print(f"Replicated {len(generator.template)} template interrupts from {args.template}")
+    for sheet_name, rows in summary.items():
+        print(f"  {sheet_name}: {rows} rows")
+    print(f"Successfully generated '{output}' with {args.count} interrupts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Interrupt Map Generation History
+
+Keeps every generated interrupt map (int_map_entries.svh) in a content-addressed
+store next to it (<dir>/.int_map_history), instead of a single overwritten
+backup copy per stage.
+
+- Files are split into chunks: each entry line is one chunk, each run of other
+  lines (header, group comments) another.  Chunks are stored once under their
+  SHA-256, zlib-compressed, so a generation only adds the entries it changed.
+- A generation is a manifest (chunk list, stage, workbook path and revision,
+  timestamp, parent) under generations/<id>.json.  Recording content identical
+  to the latest generation of the file records nothing.
+- index.jsonl lists all generations in recording order, so the history can be
+  listed and filtered by workbook revision (SHA-256 of the workbook) and time
+  without opening the manifests.
+- Objects and manifests are written to a temporary file and renamed, and index
+  lines are appended with a single write, so an interrupted run never leaves a
+  partial object behind.  Recording errors only print a warning: the history
+  never fails the generation flow.
+
+Generations are referenced by ID (or a unique prefix), 'latest' or 'latest~N'.
+
+Usage:
+    generation_history.py log [--workbook int_vector.xlsx]
+    generation_history.py diff latest~1 [latest]
+    generation_history.py show <id> [-o file]
+    generation_history.py rollback <id>
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import zlib
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from interrupt_map import ENTRY_MARKER, parse_entry_fields
+
+HISTORY_DIR = '.int_map_history'
+
+_NAME_PATTERN = re.compile(r'\bname:"([^"]*)"')
+_RELATIVE_PATTERN = re.compile(r'^latest(?:~(\d+))?$')
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write a file through a temporary file in the same directory and a rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def workbook_revision(workbook: Optional[str]) -> Optional[str]:
+    """Content hash of a workbook (first 12 hex digits), None if it does not exist."""
+    if not workbook or not os.path.exists(workbook):
+        return None
+    with open(workbook, 'rb') as f:
+        return _sha256(f.read())[:12]
+
+
+def split_chunks(lines: List[str]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split a map file into chunks.
+
+    Returns:
+        List of (chunk text, entry name or None for a run of non-entry lines)
+    """
+    chunks = []
+    run: List[str] = []
+    for line in lines:
+        if ENTRY_MARKER in line and not line.lstrip().startswith('//'):
+            if run:
+                chunks.append((''.join(run), None))
+                run = []
+            m = _NAME_PATTERN.search(line)
+            chunks.append((line, m.group(1) if m else ''))
+        else:
+            run.append(line)
+    if run:
+        chunks.append((''.join(run), None))
+    return chunks
+
+
+class GenerationHistory:
+    def __init__(self, root: str):
+        """
+        Open (or create on first record) a history store.
+
+        Args:
+            root: Store directory
+        """
+        self.root = Path(root)
+        self.index_file = self.root / 'index.jsonl'
+
+    @classmethod
+    def for_file(cls, path: str) -> 'GenerationHistory':
+        """The store next to a generated map file."""
+        return cls(str(Path(path).resolve().parent / HISTORY_DIR))
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / 'objects' / digest[:2] / digest[2:]
+
+    def _manifest_path(self, gen_id: str) -> Path:
+        return self.root / 'generations' / f"{gen_id}.json"
+
+    def file_key(self, path: str) -> str:
+        """Name of a map file in the store, relative to the directory holding the store."""
+        return os.path.relpath(Path(path).resolve(), self.root.resolve().parent)
+
+    def generations(self, path: Optional[str] = None, revision: Optional[str] = None) -> List[dict]:
+        """Index records in recording order, optionally of one file and/or workbook revision."""
+        if not self.index_file.exists():
+            return []
+        key = self.file_key(path) if path else None
+        records = []
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn line of a run that was killed while appending
+                if (key is None or record['file'] == key) and (revision is None or record['workbook_revision'] == revision):
+                    records.append(record)
+        return records
+
+    def load_manifest(self, gen_id: str) -> dict:
+        with open(self._manifest_path(gen_id), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def record(self, path: str, stage: str, workbook: Optional[str] = None) -> Optional[str]:
+        """
+        Record the current content of a map file as a generation.
+
+        Args:
+            path: Map file
+            stage: Pipeline stage that produced the content (e.g. 'convert')
+            workbook: Source workbook; inherited from the previous generation if None
+
+        Returns:
+            ID of the generation holding the content (an existing one if the
+            content did not change), or None if it could not be recorded
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            chunks = split_chunks(lines)
+            digests = [_sha256(text.encode('utf-8')) for text, _ in chunks]
+
+            history = self.generations(path)
+            parent = self.load_manifest(history[-1]['id']) if history else None
+            if parent and parent['chunks'] == digests:
+                return parent['id']
+
+            written = 0
+            for (text, _), digest in zip(chunks, digests):
+                obj = self._object_path(digest)
+                if not obj.exists():
+                    _write_atomic(obj, zlib.compress(text.encode('utf-8')))
+                    written += 1
+
+            now = time.time()
+            if workbook is None and parent:
+                workbook, revision = parent['workbook'], parent['workbook_revision']
+            else:
+                revision = workbook_revision(workbook)
+            # The parent is hashed in, so a rollback to earlier content gets an ID of its own
+            digest = _sha256(''.join([parent['id'] if parent else ''] + digests).encode())
+            gen_id = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{digest[:8]}"
+            names = [name for _, name in chunks]
+            manifest = {
+                'id': gen_id, 'file': self.file_key(path), 'stage': stage, 'timestamp': now,
+                'workbook': workbook, 'workbook_revision': revision,
+                'parent': parent['id'] if parent else None,
+                'entries': sum(1 for name in names if name is not None),
+                'changed_chunks': written, 'chunks': digests, 'names': names,
+            }
+            _write_atomic(self._manifest_path(gen_id), json.dumps(manifest).encode('utf-8'))
+
+            record = {k: v for k, v in manifest.items() if k not in ('chunks', 'names')}
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+            return gen_id
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not record {path} in {self.root}: {e}")
+            return None
+
+    def resolve(self, ref: str, path: Optional[str] = None) -> dict:
+        """
+        Find a generation by ID, unique ID prefix, 'latest' or 'latest~N'.
+
+        Raises:
+            KeyError: if no (or more than one) generation matches
+        """
+        history = self.generations(path)
+        m = _RELATIVE_PATTERN.match(ref)
+        if m:
+            back = int(m.group(1) or 0)
+            if back >= len(history):
+                raise KeyError(f"only {len(history)} generations recorded")
+            return self.load_manifest(history[-1 - back]['id'])
+        matches = [r['id'] for r in history if r['id'].startswith(ref)]
+        if len(matches) != 1:
+            raise KeyError(f"{'ambiguous' if matches else 'unknown'} generation '{ref}'")
+        return self.load_manifest(matches[0])
+
+    def read_chunks(self, manifest: dict) -> List[str]:
+        chunks = []
+        for digest in manifest['chunks']:
+            with open(self._object_path(digest), 'rb') as f:
+                chunks.append(zlib.decompress(f.read()).decode('utf-8'))
+        return chunks
+
+    def rollback(self, ref: str, path: str) -> str:
+        """
+        Restore a map file to an earlier generation.
+
+        The current content is recorded first, so a rollback can be undone.
+
+        Returns:
+            ID of the restored generation
+        """
+        manifest = self.resolve(ref, path)
+        content = ''.join(self.read_chunks(manifest)).encode('utf-8')
+        if os.path.exists(path):
+            self.record(path, 'pre_rollback')
+        _write_atomic(Path(path), content)
+        self.record(path, f"rollback:{manifest['id']}", manifest['workbook'])
+        return manifest['id']
+
+    def diff(self, old: dict, new: dict) -> Tuple[List[str], List[str], List[Tuple[str, Dict[str, tuple]]]]:
+        """
+        Per-entry difference between two generations.
+
+        Only the chunks that differ are read.  Repeated names are numbered name#2, ...
+
+        Returns:
+            (added names, removed names, [(name, {field: (old, new)})] of changed entries)
+        """
+        def by_name(manifest):
+            entries, seen = {}, {}
+            for digest, name in zip(manifest['chunks'], manifest['names']):
+                if name is None:
+                    continue
+                seen[name] = seen.get(name, 0) + 1
+                entries[name if seen[name] == 1 else f"{name}#{seen[name]}"] = digest
+            return entries
+
+        def fields(digest):
+            with open(self._object_path(digest), 'rb') as f:
+                return parse_entry_fields(zlib.decompress(f.read()).decode('utf-8')) or {}
+
+        old_entries, new_entries = by_name(old), by_name(new)
+        added = [name for name in new_entries if name not in old_entries]
+        removed = [name for name in old_entries if name not in new_entries]
+        changed = []
+        for name, digest in new_entries.items():
+            if name in old_entries and old_entries[name] != digest:
+                old_fields, new_fields = fields(old_entries[name]), fields(digest)
+                delta = {key: (old_fields.get(key), new_fields.get(key))
+                         for key in list(old_fields) + [k for k in new_fields if k not in old_fields]
+                         if old_fields.get(key) != new_fields.get(key)}
+                changed.append((name, delta))
+        return added, removed, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Interrupt Map Generation History')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Generated map file (default: seq/int_map_entries.svh)')
+    parser.add_argument('-d', '--history-dir', help=f"History store (default: {HISTORY_DIR} next to the map file)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p = subparsers.add_parser('log', help='List recorded generations')
+    p.add_argument('-w', '--workbook', help='Only generations from this workbook (its current content)')
+    p.add_argument('-r', '--revision', help='Only generations from this workbook revision')
+    p = subparsers.add_parser('record', help='Record the current map file')
+    p.add_argument('-s', '--stage', default='manual', help='Stage label (default: manual)')
+    p.add_argument('-w', '--workbook', help='Source workbook')
+    p = subparsers.add_parser('diff', help='Per-entry differences between two generations')
+    p.add_argument('old')
+    p.add_argument('new', nargs='?', default='latest')
+    p = subparsers.add_parser('show', help='Print a generation')
+    p.add_argument('generation')
+    p.add_argument('-o', '--output', help='Write to this file instead of stdout')
+    p = subparsers.add_parser('rollback', help='Restore the map file to a generation')
+    p.add_argument('generation')
+
+    args = parser.parse_args()
+
+    history = GenerationHistory(args.history_dir) if args.history_dir else GenerationHistory.for_file(args.entries)
+
+    if args.command == 'record':
+        if not Path(args.entries).exists():
+            print(f"Error: {args.entries} not found!")
+            return 1
+        gen_id = history.record(args.entries, args.stage, args.workbook)
+        if gen_id:
+            print(f"Recorded generation {gen_id}")
+        return 0 if gen_id else 1
+
+    if args.command == 'log':
+        revision = args.revision
+        if args.workbook:
+            revision = workbook_revision(args.workbook)
+            if revision is None:
+                print(f"Error: {args.workbook} not found!")
+                return 1
+        records = history.generations(args.entries, revision)
+        for record in records:
+            when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record['timestamp']))
+            print(f"{record['id']}  {when}  {record['stage']:<24} workbook {record['workbook_revision'] or '-':<12} "
+                  f"{record['entries']:>5} entries, {record['changed_chunks']:>4} new chunks")
+        print(f"({len(records)} generations of {history.file_key(args.entries)} in {history.root})")
+        return 0
+
+    try:
+        if args.command == 'diff':
+            old, new = history.resolve(args.old, args.entries), history.resolve(args.new, args.entries)
+            added, removed, changed = history.diff(old, new)
+            print(f"{old['id']} -> {new['id']}: {len(added)} added, {len(removed)} removed, {len(changed)} changed")
+            for name in added:
+                print(f"  + {name}")
+            for name in removed:
+                print(f"  - {name}")
+            for name, delta in changed:
+                print(f"  ~ {name}")
+                for key, (before, after) in delta.items():
+                    print(f"      {key}: {before!r} -> {after!r}")
+            return 0
+
+        if args.command == 'show':
+            content = ''.join(history.read_chunks(history.resolve(args.generation, args.entries)))
+            if args.output:
+                _write_atomic(Path(args.output), content.encode('utf-8'))
+                print(f"Successfully generated '{args.output}'")
+            else:
+                sys.stdout.write(content)
+            return 0
+
+        gen_id = history.rollback(args.generation, args.entries)
+        print(f"Restored {args.entries} to generation {gen_id}")
+        return 0
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
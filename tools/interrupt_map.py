@@ -0,0 +1,250 @@
+"""
+Interrupt Map Loader
+
+Reads the generated int_map_entries.svh back into Python so that offline tools
+can work on exactly the same interrupt map the testbench builds.  Entries are
+returned in file order, which is also the index order of
+int_routing_model.interrupt_map in simulation.
+
+The merge relationships mirror int_routing_model.get_merge_sources().
+
+Ranged vector entries (width > 1, e.g. csub_pll_intr_lock[16:0]) are returned
+as one entry, as in the SV map.  Tools that work per bit (mask layout, VCD
+replay, log analysis) use expand_vector_entries(), which mirrors
+get_vector_bit() in int_def.sv.
+"""
+
+import re
+import fnmatch
+from typing import Dict, List, Optional
+
+DESTINATIONS = ['ap', 'scp', 'mcp', 'accel', 'io', 'other_die']
+
+ENTRY_MARKER = 'interrupt_map.push_back(entry);'
+
+_FIELD_PATTERN = re.compile(r'(\w+):("[^"]*"|-?\w+)')
+
+_PART_SELECT_PATTERN = re.compile(r'^(.*)\[(\d+):(\d+)\]$')
+
+_TIMING_PARAM_PATTERN = re.compile(r'^\s*int\s+(\w+_ns)\s*=\s*(\d+)\s*;', re.MULTILINE)
+
+# Merge interrupts that are not covered by the pmerge_* naming pattern
+MERGE_INTERRUPTS = [
+    "merge_pll_intr_lock",
+    "merge_pll_intr_unlock",
+    "merge_pll_intr_frechangedone",
+    "merge_pll_intr_frechange_tot_done",
+    "merge_pll_intr_intdocfrac_err",
+    "iosub_normal_intr",
+    "iosub_slv_err_intr",
+    "iosub_ras_cri_intr",
+    "iosub_ras_eri_intr",
+    "iosub_ras_fhi_intr",
+    "iosub_abnormal_0_intr",
+    "iosub_abnormal_1_intr",
+]
+
+# Merge name -> (source patterns, exact source names)
+_PLL_MERGE_SOURCES = {
+    "merge_pll_intr_lock": ("csub_pll_intr_lock_*", [
+        "iosub_pll_lock_intr", "accel_pll_lock_intr", "psub_pll_lock_intr",
+        "pcie1_pll_lock_intr", "d2d_pll_lock_intr", "ddr0_pll_lock_intr",
+        "ddr1_pll_lock_intr", "ddr2_pll_lock_intr"]),
+    "merge_pll_intr_unlock": ("csub_pll_intr_unlock_*", [
+        "iosub_pll_unlock_intr", "accel_pll_unlock_intr", "psub_pll_unlock_intr",
+        "pcie1_pll_unlock_intr", "d2d_pll_unlock_intr", "ddr0_pll_unlock_intr",
+        "ddr1_pll_unlock_intr", "ddr2_pll_unlock_intr"]),
+    "merge_pll_intr_frechangedone": ("csub_pll_intr_frechangedone_*", [
+        "ddr0_pll_frechangedone_intr", "ddr1_pll_frechangedone_intr",
+        "ddr2_pll_frechangedone_intr"]),
+    "merge_pll_intr_frechange_tot_done": ("csub_pll_intr_frechange_tot_done_*", [
+        "ddr0_pll_frechange_tot_done_intr", "ddr1_pll_frechange_tot_done_intr",
+        "ddr2_pll_frechange_tot_done_intr"]),
+    "merge_pll_intr_intdocfrac_err": ("csub_pll_intr_intdocfrac_err_*", [
+        "ddr0_pll_intdocfrac_err_intr", "ddr1_pll_intdocfrac_err_intr",
+        "ddr2_pll_intdocfrac_err_intr"]),
+}
+
+_FIXED_MERGE_SOURCES = {
+    "iosub_slv_err_intr": [
+        "iosub_nic400_in_slverr_wr_intr", "iosub_nic400_in_slverr_rd_intr",
+        "iosub_nic400_out_slverr_wr_intr", "iosub_nic400_out_slverr_rd_intr",
+        "iosub_apb1ton_pslverr_intr", "usb0_apb1ton_intr", "usb1_apb1ton_intr",
+        "usb_top_apb1ton_intr"],
+    "iosub_ras_cri_intr": ["smmu_cri_intr"],
+    "iosub_ras_eri_intr": ["smmu_eri_intr"],
+    "iosub_ras_fhi_intr": ["smmu_fhi_intr"],
+    "iosub_abnormal_0_intr": ["iodap_etr_buf_intr", "iodap_catu_addrerr_intr"],
+    "iosub_abnormal_1_intr": [],
+}
+
+
+def parse_entry_fields(line: str) -> Optional[dict]:
+    """
+    Parse one `entry = '{...}; interrupt_map.push_back(entry);` line.
+
+    Returns:
+        Dictionary of field name -> value (strings unquoted, integers converted),
+        or None if the line is not an active entry line.
+    """
+    stripped = line.strip()
+    if ENTRY_MARKER not in stripped or stripped.startswith('//'):
+        return None
+
+    body = stripped[stripped.find("'{") + 2:stripped.rfind('}')]
+    fields = {}
+    for key, raw in _FIELD_PATTERN.findall(body):
+        if raw.startswith('"'):
+            fields[key] = raw[1:-1]
+        elif re.fullmatch(r'-?\d+', raw):
+            fields[key] = int(raw)
+        else:
+            fields[key] = raw
+
+    if 'name' not in fields:
+        return None
+    return fields
+
+
+def load_interrupt_map(entries_file: str = "seq/int_map_entries.svh") -> List[dict]:
+    """
+    Load all active interrupt entries from the generated include file.
+
+    Args:
+        entries_file: Path to int_map_entries.svh
+
+    Returns:
+        List of entry dictionaries in interrupt_map order
+    """
+    entries = []
+    with open(entries_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = parse_entry_fields(line)
+            if fields is not None:
+                entries.append(fields)
+    return entries
+
+
+def get_vector_bit_path(path: str, bit: int) -> str:
+    """Path of one bit of a part-select path: ('a.sig[16:0]', 3) -> 'a.sig[3]'."""
+    m = _PART_SELECT_PATTERN.match(path)
+    if not m:
+        return path
+    msb, lsb = int(m.group(2)), int(m.group(3))
+    return f"{m.group(1)}[{lsb + bit if msb >= lsb else lsb - bit}]"
+
+
+def get_vector_bit(entry: dict, bit: int) -> dict:
+    """Single-bit view '<name>_<bit>' of a ranged vector entry (see get_vector_bit() in int_def.sv)."""
+    bit_entry = dict(entry, name=f"{entry['name']}_{bit}", width=1,
+                     rtl_path_src=get_vector_bit_path(entry.get('rtl_path_src', ''), bit))
+    for dest in DESTINATIONS:
+        bit_entry[f'rtl_path_{dest}'] = get_vector_bit_path(entry.get(f'rtl_path_{dest}', ''), bit)
+        if entry.get(f'dest_index_{dest}', -1) >= 0:
+            bit_entry[f'dest_index_{dest}'] = entry[f'dest_index_{dest}'] + bit
+    return bit_entry
+
+
+def expand_vector_entries(entries: List[dict]) -> List[dict]:
+    """Replace every ranged vector entry by its single-bit views, in place of the entry."""
+    expanded = []
+    for entry in entries:
+        width = entry.get('width', 1)
+        if width > 1:
+            expanded.extend(get_vector_bit(entry, bit) for bit in range(width))
+        else:
+            expanded.append(entry)
+    return expanded
+
+
+def load_timing_config(config_file: str = "config/timing_config.sv") -> Dict[str, int]:
+    """
+    Load the default timing parameters declared in the timing_config class.
+
+    Returns:
+        Dictionary of parameter name (e.g. 'level_hold_time_ns') -> value in ns
+    """
+    with open(config_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return {name: int(value) for name, value in _TIMING_PARAM_PATTERN.findall(content)}
+
+
+def get_destinations(entry: dict) -> List[str]:
+    """Return the destinations an entry is routed to (to_<dest>=1)."""
+    return [dest for dest in DESTINATIONS if entry.get(f'to_{dest}', 0) == 1]
+
+
+def should_skip_interrupt_check(entry: dict) -> bool:
+    """Python equivalent of int_lightweight_sequence.should_skip_interrupt_check()."""
+    dests = set(get_destinations(entry))
+    if not dests:
+        return True
+    if not dests & {'ap', 'scp', 'mcp', 'accel'}:
+        return True
+    if entry.get('group') == 'SCP' and dests == {'scp'}:
+        return True
+    if entry.get('group') == 'MCP' and dests == {'mcp'}:
+        return True
+    return False
+
+
+def is_merge_interrupt(interrupt_name: str) -> bool:
+    """Check if an interrupt is a merge interrupt (see int_routing_model.is_merge_interrupt)."""
+    return interrupt_name in MERGE_INTERRUPTS or interrupt_name.startswith("pmerge_")
+
+
+def get_merge_sources(merge_name: str, entries: List[dict]) -> List[dict]:
+    """
+    Get all source entries that are merged into a merge interrupt.
+
+    Mirrors int_routing_model.get_merge_sources().
+    """
+    m = re.fullmatch(r'pmerge_(normal|abnormal)(\d+)_intr', merge_name)
+    if m:
+        kind, n = m.group(1), m.group(2)
+        wanted = {f"psub_{kind}{n}_intr", f"pcie1_{kind}{n}_intr"}
+        return [e for e in entries if e['name'] in wanted]
+
+    m = re.fullmatch(r'pmerge_ras_(cri|eri|fhi)_intr', merge_name)
+    if m:
+        wanted = {f"psub_ras_{m.group(1)}_intr", f"pcie1_ras_{m.group(1)}_intr"}
+        return [e for e in entries if e['name'] in wanted]
+
+    if merge_name in _PLL_MERGE_SOURCES:
+        pattern, names = _PLL_MERGE_SOURCES[merge_name]
+        # A ranged csub_pll_intr_* entry matches through its bit names
+        return [e for e in entries
+                if fnmatch.fnmatchcase(e['name'], pattern) or e['name'] in names or
+                (e.get('width', 1) > 1 and fnmatch.fnmatchcase(f"{e['name']}_0", pattern))]
+
+    if merge_name == "iosub_normal_intr":
+        return [e for e in entries
+                if e.get('group') == 'IOSUB' and
+                (0 <= e.get('index', -1) <= 9 or 15 <= e.get('index', -1) <= 50)]
+
+    if merge_name in _FIXED_MERGE_SOURCES:
+        names = _FIXED_MERGE_SOURCES[merge_name]
+        return [e for e in entries if e['name'] in names]
+
+    return []
+
+
+def build_merge_relations(entries: List[dict]) -> Dict[str, List[str]]:
+    """
+    Build the source -> merge interrupts relation for every merge entry in the map.
+
+    Returns:
+        Dictionary mapping a source interrupt name to the names of the merge
+        interrupts it contributes to, in interrupt_map order.
+    """
+    merges_for_source: Dict[str, List[str]] = {}
+    for entry in entries:
+        if not is_merge_interrupt(entry['name']):
+            continue
+        for source in get_merge_sources(entry['name'], entries):
+            if source['name'] == entry['name']:
+                continue
+            merges = merges_for_source.setdefault(source['name'], [])
+            if entry['name'] not in merges:
+                merges.append(entry['name'])
+    return merges_for_source
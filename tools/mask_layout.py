@@ -0,0 +1,441 @@
+"""
+Interrupt Mask Register Layout
+
+Describes the mask registers of int_register_model and resolves, for every
+(interrupt, destination) pair, the mask register bits that must all be set for
+the interrupt to be routed.  The resolution mirrors
+int_register_model.is_interrupt_masked() layer by layer:
+
+1. PSUB/PCIE1 source domain mask (check_source_domain_mask)
+2. Level/pulse enable (check_level_pulse_mask_layer)
+3. PLL source mask (check_pll_mask_layer)
+4. PLL sources inherit the mask of their merge_pll_intr_* target
+5. iosub_normal_intr sources inherit the SCP/MCP mask of iosub_normal_intr
+6. General IOSUB-to-SCP/MCP/ACCEL mask (check_general_mask_layer)
+
+A mask bit of 0 masks the interrupt; registers that were never written read
+as all ones (enabled).
+
+The per-layer positions are also emitted as int_mask_tables.svh, which
+int_register_model uses for its mask checks instead of parsing names.
+
+For bulk expectation checks, int_route_bitmaps.svh packs the same information
+per destination over interrupt_map indices: a routing bitmap of the to_*
+flags, an always-masked bitmap, and for every mask register bit the bitmap of
+interrupts it gates.  int_routing_model combines them with a few bitwise
+operations per destination.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from interrupt_map import DESTINATIONS, build_merge_relations, expand_vector_entries
+
+# (register name, address, bits written by randomize_mask_registers)
+MASK_REGISTERS = [
+    ("MASK_PLL_INTR_0", 0x0001_C000, 0x01FF_FFFF),
+    ("MASK_PLL_INTR_1", 0x0001_C004, 0x01FF_FFFF),
+    ("MASK_PLL_INTR_2", 0x0001_C008, 0x01FF_FFFF),
+    ("MASK_PLL_INTR_3", 0x0001_C00C, 0x01FF_FFFF),
+    ("MASK_PLL_INTR_4", 0x0001_C010, 0x01FF_FFFF),
+    ("MASK_IOSUB_TO_SCP_NORMAL_INTR_0", 0x0001_C050, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_SCP_NORMAL_INTR_1", 0x0001_C054, 0x0000_3FFF),
+    ("MASK_IOSUB_TO_MCP_NORMAL_INTR_0", 0x0001_C058, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_MCP_NORMAL_INTR_1", 0x0001_C05C, 0x0000_3FFF),
+    ("MASK_IOSUB_TO_SCP_INTR_0", 0x0001_C060, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_SCP_INTR_1", 0x0001_C064, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_SCP_INTR_2", 0x0001_C068, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_SCP_INTR_3", 0x0001_C06C, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_SCP_INTR_4", 0x0001_C070, 0x0000_0007),
+    ("MASK_IOSUB_TO_MCP_INTR_0", 0x0001_C080, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_MCP_INTR_1", 0x0001_C084, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_MCP_INTR_2", 0x0001_C088, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_MCP_INTR_3", 0x0001_C08C, 0xFFFF_FFFF),
+    ("MASK_IOSUB_TO_MCP_INTR_4", 0x0001_C090, 0x0001_FFFF),
+    ("MASK_IOSUB_TO_ACCEL_INTR_0", 0x0001_C0A0, 0xFFFF_FFFF),
+    ("MASK_PSUB_TO_IOSUB_INTR", 0x0001_C0B8, 0x000F_FFFF),
+    ("MASK_PCIE1_TO_IOSUB_INTR", 0x0001_C0BC, 0x000F_FFFF),
+    ("LEVEL_INTR_ENABLE", 0x0001_0608, 0x001F_FFFF),
+    ("PULSE_INTR_ENABLE", 0x0001_0408, 0x0003_FFFF),
+]
+
+REGISTER_ADDRESSES = {name: addr for name, addr, _ in MASK_REGISTERS}
+
+# Value of a mask register that has not been written (all enabled)
+MASK_RESET_VALUE = 0xFFFF_FFFF
+
+PSUB_MASK_WIDTH = 20
+PCIE1_MASK_WIDTH = 20
+PLL_MASK_WIDTH = 25
+
+PLL_MERGE_INTERRUPTS = [
+    "merge_pll_intr_lock",
+    "merge_pll_intr_unlock",
+    "merge_pll_intr_frechangedone",
+    "merge_pll_intr_frechange_tot_done",
+    "merge_pll_intr_intdocfrac_err",
+]
+
+# Event type pattern -> PLL mask register, checked in order (longer names first)
+_PLL_TYPE_REGISTERS = [
+    ("intdocfrac_err", 0x0001_C010),
+    ("frechange_tot", 0x0001_C00C),
+    ("frechangedone", 0x0001_C008),
+    ("_unlock", 0x0001_C004),
+    ("_lock", 0x0001_C000),
+]
+
+# Name prefix -> bit in the 25-bit PLL mask registers
+_PLL_PREFIX_BITS = [
+    ("accel_pll_", 24),
+    ("psub_pll_", 23),
+    ("pcie1_pll_", 22),
+    ("iosub_pll_", 21),
+    ("d2d_pll_", 20),
+    ("ddr2_pll_", 19),
+    ("ddr1_pll_", 18),
+    ("ddr0_pll_", 17),
+]
+
+_CSUB_PLL_PATTERN = re.compile(
+    r'csub_pll_intr_(?:lock|unlock|frechangedone|frechange_tot_done|intdocfrac_err)_(\d+)')
+
+_LEVEL_PAD_PATTERN = re.compile(r'iosub_pad_in_(\d+)_intr_level')
+_PULSE_PAD_PATTERN = re.compile(r'iosub_pad_in_(\d+)_intr_pulse')
+
+_LEVEL_FIXED_BITS = {
+    "iosub_nic400_in_slverr_wr_intr": 16,
+    "iosub_nic400_in_slverr_rd_intr": 17,
+    "iosub_nic400_out_slverr_wr_intr": 18,
+    "iosub_nic400_out_slverr_rd_intr": 19,
+    "iosub_apb1ton_pslverr_intr": 20,
+}
+
+_PULSE_FIXED_BITS = {
+    "iosub_mem_ist_intr": 16,
+    "iosub_dw_axi_dlock_intr": 17,
+}
+
+# Destination -> (first cpu_irq index, last cpu_irq index, first mask register address)
+_GENERAL_MASK_RANGES = {
+    'scp': (109, 239, 0x0001_C060),
+    'mcp': (64, 209, 0x0001_C080),
+    'accel': (0, 31, 0x0001_C0A0),
+}
+
+_IOSUB_NORMAL_MASK_REGISTERS = {
+    'scp': 0x0001_C050,
+    'mcp': 0x0001_C058,
+}
+
+# A register bit that must be set for an interrupt to be routed
+MaskBit = Tuple[int, int]
+
+
+def format_sv_hex(value: int) -> str:
+    """Format a 32-bit value as an SV literal, e.g. 32'h0001_C000."""
+    return f"32'h{value >> 16:04X}_{value & 0xFFFF:04X}"
+
+
+def get_source_domain_bit(entry: dict) -> Optional[MaskBit]:
+    """PSUB/PCIE1 source domain mask position (check_source_domain_mask)."""
+    index = entry.get('index', -1)
+    if entry.get('group') == 'PSUB' and 0 <= index < PSUB_MASK_WIDTH:
+        return (0x0001_C0B8, index)
+    if entry.get('group') == 'PCIE1' and 0 <= index < PCIE1_MASK_WIDTH:
+        return (0x0001_C0BC, index)
+    return None
+
+
+def get_level_pulse_bit(name: str) -> Optional[MaskBit]:
+    """Level/pulse enable position (check_level_pulse_mask_layer)."""
+    m = _LEVEL_PAD_PATTERN.match(name)
+    if m and int(m.group(1)) <= 15:
+        return (0x0001_0608, int(m.group(1)))
+    if name in _LEVEL_FIXED_BITS:
+        return (0x0001_0608, _LEVEL_FIXED_BITS[name])
+    m = _PULSE_PAD_PATTERN.match(name)
+    if m and int(m.group(1)) <= 15:
+        return (0x0001_0408, int(m.group(1)))
+    if name in _PULSE_FIXED_BITS:
+        return (0x0001_0408, _PULSE_FIXED_BITS[name])
+    return None
+
+
+def get_pll_bit(name: str) -> Optional[MaskBit]:
+    """PLL source mask position (check_pll_mask_layer): event type selects the register, PLL the bit."""
+    for pattern, addr in _PLL_TYPE_REGISTERS:
+        if pattern in name:
+            break
+    else:
+        return None
+
+    for prefix, bit in _PLL_PREFIX_BITS:
+        if name.startswith(prefix):
+            return (addr, bit)
+
+    m = _CSUB_PLL_PATTERN.match(name)
+    if m and int(m.group(1)) <= 16:
+        return (addr, int(m.group(1)))
+    return None
+
+
+def get_dest_index(entry: dict, dest: str) -> int:
+    """Destination index used by the general mask layer, -1 if not routed there."""
+    if dest == 'other_die' or entry.get(f'to_{dest}', 0) != 1:
+        return -1
+    return entry.get(f'dest_index_{dest}', -1)
+
+
+def get_general_mask_bit(entry: dict, dest: str) -> Tuple[bool, Optional[MaskBit]]:
+    """
+    General IOSUB-to-SCP/MCP/ACCEL mask position (check_general_mask_layer).
+
+    Returns:
+        (always_masked, mask bit or None if the layer does not apply)
+    """
+    dest_index = get_dest_index(entry, dest)
+    if dest_index < 0 or dest not in _GENERAL_MASK_RANGES:
+        return False, None
+    first, last, base_addr = _GENERAL_MASK_RANGES[dest]
+    if dest_index < first or dest_index > last:
+        return True, None
+    mask_bit = dest_index - first
+    return False, (base_addr + 4 * (mask_bit // 32), mask_bit % 32)
+
+
+def get_iosub_normal_reg_bit(index: int) -> int:
+    """Map an iosub_normal_intr source index to its bit in the 46-bit normal mask, -1 if none."""
+    if 0 <= index <= 9:
+        return index
+    if 15 <= index <= 50:
+        return index - 5
+    return -1
+
+
+def get_iosub_normal_mask_bit(entry: dict, dest: str) -> Tuple[bool, Optional[MaskBit]]:
+    """
+    IOSUB normal mask position of an iosub_normal_intr source (check_iosub_normal_mask_layer).
+
+    Returns:
+        (always_masked, mask bit or None if the layer does not apply)
+    """
+    index = entry.get('index', -1)
+    if index < 0 or dest not in _IOSUB_NORMAL_MASK_REGISTERS:
+        return False, None
+    reg_bit = get_iosub_normal_reg_bit(index)
+    if reg_bit < 0:
+        return True, None
+    return False, (_IOSUB_NORMAL_MASK_REGISTERS[dest] + 4 * (reg_bit // 32), reg_bit % 32)
+
+
+def is_iosub_normal_intr_source(entry: dict) -> bool:
+    """Mirror of int_routing_model.is_iosub_normal_intr_source()."""
+    return entry.get('group') == 'IOSUB' and get_iosub_normal_reg_bit(entry.get('index', -1)) >= 0
+
+
+class MaskLayout:
+    def __init__(self, entries: List[dict]):
+        """
+        Initialize the mask layout for an interrupt map.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+        """
+        # Mask bits are per bit, so ranged vector entries are looked up by bit name
+        self.entries = expand_vector_entries(entries)
+        self.entry_by_name: Dict[str, dict] = {}
+        for entry in self.entries:
+            # Lookups in the SV model return the first matching entry
+            self.entry_by_name.setdefault(entry['name'], entry)
+
+        self.pll_merge_for_source: Dict[str, str] = {}
+        for source, merges in build_merge_relations(self.entries).items():
+            pll_merges = [m for m in merges if m in PLL_MERGE_INTERRUPTS]
+            if pll_merges:
+                self.pll_merge_for_source[source] = pll_merges[0]
+
+    def get_mask_bits(self, name: str, dest: str, visited: Optional[set] = None) -> Optional[List[MaskBit]]:
+        """
+        Resolve the mask register bits that gate an interrupt at a destination.
+
+        Returns:
+            List of (register address, bit) that must all be 1 for the
+            interrupt not to be masked, or None if it is always masked
+        """
+        if visited is None:
+            visited = set()
+        if name in visited:
+            return []
+        visited.add(name)
+
+        entry = self.entry_by_name.get(name, {})
+        bits: List[MaskBit] = []
+        for bit in (get_source_domain_bit(entry) if entry else None,
+                    get_level_pulse_bit(name),
+                    get_pll_bit(name)):
+            if bit is not None:
+                bits.append(bit)
+
+        if name in self.pll_merge_for_source:
+            inherited = self.get_mask_bits(self.pll_merge_for_source[name], dest, visited)
+        elif dest in ('scp', 'mcp') and entry and is_iosub_normal_intr_source(entry):
+            inherited = self.get_mask_bits("iosub_normal_intr", dest, visited)
+        else:
+            always_masked, bit = get_general_mask_bit(entry, dest) if entry else (False, None)
+            if always_masked:
+                return None
+            inherited = [bit] if bit is not None else []
+
+        if inherited is None:
+            return None
+        return bits + [b for b in inherited if b not in bits]
+
+
+# (SV table name, section title) in include file order
+_SV_MASK_TABLES = [
+    ("source_domain_mask_pos", "Source domain masks (PSUB/PCIE1)"),
+    ("level_pulse_mask_pos", "Level/pulse interrupt enables"),
+    ("pll_mask_pos", "PLL source masks"),
+    ("iosub_normal_mask_pos", "IOSUB normal masks (iosub_normal_intr sources)"),
+    ("general_mask_pos", "General IOSUB-to-SCP/MCP/ACCEL masks"),
+]
+
+
+def _format_mask_pos(table: str, index: str, always_masked: bool, bit: Optional[MaskBit]) -> str:
+    addr, bit_idx = bit if bit is not None else (0, -1)
+    return (f"        mask_pos = '{{always_masked:{int(always_masked)}, addr:{format_sv_hex(addr)}, "
+            f"bit_idx:{bit_idx}}}; {table}[{index}] = mask_pos;")
+
+
+def generate_mask_tables_file(entries: List[dict], output_path: str, source: str):
+    """
+    Generate the SystemVerilog include file holding the per-layer mask positions.
+
+    Keys are interrupt names, or int_pair_table pair IDs for the
+    destination-dependent iosub_normal and general layers.  The IDs are
+    resolved once when the tables are built, so that pairs outside the
+    generated pair table (iosub_normal_intr sources are only routed through
+    the merge) get one too.  Interrupts a layer does not apply to are left out
+    of its table.
+    """
+    layout = MaskLayout(entries)
+    rows: Dict[str, List[str]] = {table: [] for table, _ in _SV_MASK_TABLES}
+
+    for name, entry in layout.entry_by_name.items():
+        for table, bit in (("source_domain_mask_pos", get_source_domain_bit(entry)),
+                           ("level_pulse_mask_pos", get_level_pulse_bit(name)),
+                           ("pll_mask_pos", get_pll_bit(name))):
+            if bit is not None:
+                rows[table].append(_format_mask_pos(table, f'"{name}"', False, bit))
+
+        for table, resolve, dests in (("iosub_normal_mask_pos", get_iosub_normal_mask_bit, _IOSUB_NORMAL_MASK_REGISTERS),
+                                      ("general_mask_pos", get_general_mask_bit, _GENERAL_MASK_RANGES)):
+            for dest in dests:
+                always_masked, bit = resolve(entry, dest)
+                if always_masked or bit is not None:
+                    pair_id = f'int_pair_table::get_or_add_pair_id("{name}", "{dest.upper()}")'
+                    rows[table].append(_format_mask_pos(table, pair_id, always_masked, bit))
+
+    sv_lines = [
+        "// Auto-generated interrupt mask bit positions",
+        f"// Source: {source}",
+        "// Generated by: mask_layout.py",
+        "// NOTE: This file is included in int_register_model.sv",
+        ""
+    ]
+    for table, title in _SV_MASK_TABLES:
+        sv_lines.append(f"        // --- {title}: {len(rows[table])} entries ---")
+        sv_lines.extend(rows[table])
+        sv_lines.append("")
+
+    with open(output_path, 'w', encoding='utf-8') as svfile:
+        svfile.write("\n".join(sv_lines))
+
+
+# Capacity of the SV bitmaps (INT_MAP_MAX_ENTRIES in int_def.sv)
+ROUTE_BITMAP_CAPACITY = 1024
+
+
+def _format_bitmap_words(target: str, bitmap: int) -> List[str]:
+    """Assignments of the non-zero 32-bit words of a bitmap, e.g. x[32 +: 32] = 32'h0000_0004;"""
+    words = []
+    offset = 0
+    while bitmap >> offset:
+        word = (bitmap >> offset) & 0xFFFF_FFFF
+        if word:
+            words.append(f"{target}[{offset} +: 32] = {format_sv_hex(word)};")
+        offset += 32
+    return words
+
+
+def generate_route_bitmaps_file(entries: List[dict], output_path: str, source: str):
+    """
+    Generate the SystemVerilog include file holding the per-destination routing bitmaps.
+
+    Bit i of every bitmap stands for entries[i], which must be the interrupt_map
+    order (see interrupt_map.load_interrupt_map).  Only routed pairs appear in
+    the always-masked and gate bitmaps.  A ranged vector entry is gated by the
+    mask bits of all of its bits.
+    """
+    if len(entries) > ROUTE_BITMAP_CAPACITY:
+        raise ValueError(f"{len(entries)} interrupts exceed the route bitmap capacity of {ROUTE_BITMAP_CAPACITY}")
+
+    layout = MaskLayout(entries)
+    routed = {dest: 0 for dest in DESTINATIONS}
+    always_masked = {dest: 0 for dest in DESTINATIONS}
+    gates: Dict[Tuple[int, int, str], int] = {}
+    first_index: Dict[str, int] = {}
+
+    for i, entry in enumerate(entries):
+        # Name lookups in the SV model resolve to the first entry of that name
+        if first_index.setdefault(entry['name'], i) != i:
+            continue
+        width = entry.get('width', 1)
+        names = [f"{entry['name']}_{bit}" for bit in range(width)] if width > 1 else [entry['name']]
+        for dest in DESTINATIONS:
+            if entry.get(f'to_{dest}', 0) != 1:
+                continue
+            routed[dest] |= 1 << i
+            required: List[MaskBit] = []
+            for name in names:
+                bits = layout.get_mask_bits(name, dest)
+                if bits is None:
+                    always_masked[dest] |= 1 << i
+                    break
+                required += [b for b in bits if b not in required]
+            else:
+                for addr, bit in required:
+                    gates[(addr, bit, dest)] = gates.get((addr, bit, dest), 0) | (1 << i)
+
+    dest_labels = {dest: f"DEST_{dest.upper()}" for dest in DESTINATIONS}
+    sv_lines = [
+        "// Auto-generated per-destination routing bitmaps",
+        f"// Source: {source}",
+        "// Generated by: mask_layout.py",
+        "// NOTE: This file is included in int_routing_model.sv",
+        "// Bit i of every bitmap stands for interrupt_map[i]",
+        "",
+        f"        route_bitmap_size = {len(entries)};",
+        "",
+        f"        // --- Routed destinations (to_* flags): {sum(bin(b).count('1') for b in routed.values())} pairs ---",
+    ]
+    for dest in DESTINATIONS:
+        sv_lines.extend(f"        {line}" for line in _format_bitmap_words(f"route_bitmap[{dest_labels[dest]}]", routed[dest]))
+    sv_lines.append("")
+
+    sv_lines.append(f"        // --- Always masked: {sum(bin(b).count('1') for b in always_masked.values())} pairs ---")
+    for dest in DESTINATIONS:
+        sv_lines.extend(f"        {line}" for line in
+                        _format_bitmap_words(f"always_masked_bitmap[{dest_labels[dest]}]", always_masked[dest]))
+    sv_lines.append("")
+
+    sv_lines.append(f"        // --- Mask bit gates (interrupt masked while the bit is 0): {len(gates)} entries ---")
+    for (addr, bit, dest), bitmap in sorted(gates.items(), key=lambda kv: (DESTINATIONS.index(kv[0][2]), kv[0][0], kv[0][1])):
+        words = " ".join(_format_bitmap_words("mask_gate.gated", bitmap))
+        sv_lines.append(f"        mask_gate = '{{addr:{format_sv_hex(addr)}, bit_idx:{bit}, dest:{dest_labels[dest]}, gated:'0}}; "
+                        f"{words} mask_gates.push_back(mask_gate);")
+    sv_lines.append("")
+
+    with open(output_path, 'w', encoding='utf-8') as svfile:
+        svfile.write("\n".join(sv_lines))
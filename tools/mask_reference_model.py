@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Vectorized Mask-Aware Routing Reference Model
+
+NumPy model of int_routing_model.get_expected_destinations_with_mask().  The
+routing map and the mask-bit layout (see mask_layout.py) are compiled once into
+index arrays; expected destinations for any number of mask configurations are
+then computed with array gathers and bit tests instead of per-call string
+matching.
+
+A mask configuration is one row of 32-bit register values in MASK_REGISTERS
+order.  For every (configuration, interrupt, destination) the model predicts:
+
+    expected = to_<dest> & all(required mask bits are 1)
+
+which is exactly what the SV model predicts.  Note that
+int_register_model.update_accel_uart_dma_routing() never matches an interrupt
+name in the current SV code, so UART/DMA ACCEL routing is taken from the map
+as generated.
+
+Commands:
+- predict:    build expectation tables for random or given configurations
+- crosscheck: compare the "Final expected destinations" lines of simulation
+              logs against the model, using the mask writes from the same log
+"""
+
+import re
+import sys
+import csv
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from interrupt_map import load_interrupt_map, DESTINATIONS
+from mask_layout import MASK_REGISTERS, MASK_RESET_VALUE, MaskLayout
+
+DEST_LABELS = [dest.upper() for dest in DESTINATIONS]
+
+_WRITE_PATTERN = re.compile(r"Writing hardware register: addr=0x([0-9a-fA-F]+),.*data=0x([0-9a-fA-F]+)")
+_PREDICTION_PATTERN = re.compile(r"Final expected destinations for '([^']+)': '\{([^}]*)\}")
+
+
+class MaskReferenceModel:
+    def __init__(self, entries: List[dict]):
+        """
+        Compile the interrupt map and mask layout into index arrays.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+        """
+        layout = MaskLayout(entries)
+        self.names = list(layout.entry_by_name)
+        self.name_index = {name: i for i, name in enumerate(self.names)}
+        # Ranged vector entry name -> indices of its bit views
+        self.range_index = {e['name']: [self.name_index[f"{e['name']}_{bit}"] for bit in range(e['width'])]
+                            for e in entries if e.get('width', 1) > 1}
+        self.register_index = {addr: i for i, (_, addr, _) in enumerate(MASK_REGISTERS)}
+
+        n_regs = len(MASK_REGISTERS)
+        # Two constant columns are appended to every configuration
+        ones_col, zeros_col = n_regs, n_regs + 1
+
+        # Term 0 is always enabled, term 1 is always masked
+        terms: Dict[Tuple[int, int], int] = {(ones_col, 0): 0, (zeros_col, 0): 1}
+        pair_terms: List[List[List[int]]] = []
+        self.routed = np.zeros((len(self.names), len(DESTINATIONS)), dtype=bool)
+
+        for i, name in enumerate(self.names):
+            entry = layout.entry_by_name[name]
+            row = []
+            for d, dest in enumerate(DESTINATIONS):
+                self.routed[i, d] = entry.get(f'to_{dest}', 0) == 1
+                bits = layout.get_mask_bits(name, dest)
+                if bits is None:
+                    row.append([1])
+                    continue
+                ids = []
+                for addr, bit in bits:
+                    key = (self.register_index[addr], bit)
+                    ids.append(terms.setdefault(key, len(terms)))
+                row.append(ids or [0])
+            pair_terms.append(row)
+
+        depth = max(len(ids) for row in pair_terms for ids in row)
+        self.pair_terms = np.zeros((len(self.names), len(DESTINATIONS), depth), dtype=np.intp)
+        for i, row in enumerate(pair_terms):
+            for d, ids in enumerate(row):
+                self.pair_terms[i, d, :len(ids)] = ids
+
+        ordered = sorted(terms.items(), key=lambda kv: kv[1])
+        self.term_reg = np.array([reg for (reg, _), _ in ordered], dtype=np.intp)
+        self.term_bit = np.array([bit for (_, bit), _ in ordered], dtype=np.uint32)
+
+    @property
+    def n_terms(self) -> int:
+        return len(self.term_reg)
+
+    def reset_config(self) -> np.ndarray:
+        """Register values before any mask write (int_register_model cache empty)."""
+        return np.full(len(MASK_REGISTERS), MASK_RESET_VALUE, dtype=np.uint32)
+
+    def random_configs(self, count: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw configurations the way int_register_model.randomize_mask_registers() does."""
+        valid = np.array([mask for _, _, mask in MASK_REGISTERS], dtype=np.uint32)
+        values = rng.integers(0, 1 << 32, size=(count, len(MASK_REGISTERS)), dtype=np.uint64)
+        return values.astype(np.uint32) & valid
+
+    def evaluate(self, configs: np.ndarray) -> np.ndarray:
+        """
+        Predict expected destinations for a batch of mask configurations.
+
+        Args:
+            configs: uint32 array of shape (N, len(MASK_REGISTERS))
+
+        Returns:
+            Boolean array of shape (N, interrupts, destinations)
+        """
+        configs = np.atleast_2d(configs).astype(np.uint32, copy=False)
+        constants = np.tile(np.array([MASK_RESET_VALUE, 0], dtype=np.uint32), (len(configs), 1))
+        values = np.concatenate([configs, constants], axis=1)
+
+        term_enabled = ((values[:, self.term_reg] >> self.term_bit) & 1).astype(bool)
+        enabled = term_enabled[:, self.pair_terms].all(axis=-1)
+        return enabled & self.routed
+
+    def evaluate_chunked(self, configs: np.ndarray, chunk_size: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """Evaluate configurations in chunks to bound memory; yields (offset, expected)."""
+        for start in range(0, len(configs), chunk_size):
+            yield start, self.evaluate(configs[start:start + chunk_size])
+
+
+def load_configs(config_file: str) -> np.ndarray:
+    """
+    Load mask configurations from a CSV file with one column per register name.
+    Values may be decimal or 0x-prefixed hex; missing columns keep the reset value.
+    """
+    index = {name: i for i, (name, _, _) in enumerate(MASK_REGISTERS)}
+    rows = []
+    with open(config_file, 'r', encoding='utf-8', newline='') as f:
+        for record in csv.DictReader(f):
+            row = [MASK_RESET_VALUE] * len(MASK_REGISTERS)
+            for name, value in record.items():
+                if name in index and value not in (None, ''):
+                    row[index[name]] = int(value, 0)
+            rows.append(row)
+    return np.array(rows, dtype=np.uint32).reshape(-1, len(MASK_REGISTERS))
+
+
+def write_rate_table(path: str, model: MaskReferenceModel, enabled_counts: np.ndarray, total: int):
+    """Write the fraction of configurations in which each routed pair is expected."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['interrupt'] + DEST_LABELS)
+        for i, name in enumerate(model.names):
+            writer.writerow([name] + [f"{enabled_counts[i, d] / total:.4f}" if model.routed[i, d] else '-'
+                                      for d in range(len(DESTINATIONS))])
+
+
+def cmd_predict(args) -> int:
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+
+    model = MaskReferenceModel(load_interrupt_map(args.entries))
+    if args.configs:
+        if not Path(args.configs).exists():
+            print(f"Error: {args.configs} not found!")
+            return 1
+        configs = load_configs(args.configs)
+    else:
+        configs = model.random_configs(args.random, np.random.default_rng(args.seed))
+
+    print(f"Compiled {len(model.names)} interrupts x {len(DESTINATIONS)} destinations "
+          f"into {model.n_terms} mask terms (max {model.pair_terms.shape[2]} per pair)")
+
+    enabled_counts = np.zeros(model.routed.shape, dtype=np.int64)
+    packed = []
+    for _, expected in model.evaluate_chunked(configs, args.chunk_size):
+        enabled_counts += expected.sum(axis=0)
+        if args.output:
+            packed.append(np.packbits(expected.reshape(len(expected), -1), axis=1))
+
+    if args.output:
+        np.savez_compressed(args.output,
+                            names=np.array(model.names),
+                            destinations=np.array(DEST_LABELS),
+                            registers=np.array([name for name, _, _ in MASK_REGISTERS]),
+                            configs=configs,
+                            expected=np.concatenate(packed) if packed else np.zeros((0, 0), dtype=np.uint8))
+        print(f"Successfully generated '{args.output}' (expected bits packed per configuration, "
+              f"interrupt-major then destination)")
+
+    if args.rates and len(configs):
+        write_rate_table(args.rates, model, enabled_counts, len(configs))
+        print(f"Successfully generated '{args.rates}'")
+
+    routed_pairs = int(model.routed.sum())
+    never = int((model.routed & (enabled_counts == 0)).sum())
+    always = int((model.routed & (enabled_counts == len(configs))).sum())
+    print(f"Evaluated {len(configs)} mask configurations over {routed_pairs} routed pairs")
+    print(f"  Pairs never expected:  {never}")
+    print(f"  Pairs always expected: {always}")
+    return 0
+
+
+def parse_log_predictions(log_path: str) -> Iterator[Tuple[Tuple[int, ...], str, List[str]]]:
+    """
+    Replay mask register writes in a simulation log and yield
+    (register values, interrupt name, SV expected destinations) per prediction.
+    """
+    register_index = {addr: i for i, (_, addr, _) in enumerate(MASK_REGISTERS)}
+    values = [MASK_RESET_VALUE] * len(MASK_REGISTERS)
+    with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if "Writing hardware register" in line:
+                m = _WRITE_PATTERN.search(line)
+                if m and int(m.group(1), 16) in register_index:
+                    values[register_index[int(m.group(1), 16)]] = int(m.group(2), 16) & 0xFFFF_FFFF
+            elif "Final expected destinations" in line:
+                m = _PREDICTION_PATTERN.search(line)
+                if m:
+                    yield tuple(values), m.group(1), re.findall(r'"([^"]*)"', m.group(2))
+
+
+def cmd_crosscheck(args) -> int:
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+    for log_path in args.logs:
+        if not Path(log_path).exists():
+            print(f"Error: {log_path} not found!")
+            return 1
+
+    model = MaskReferenceModel(load_interrupt_map(args.entries))
+    cache: Dict[Tuple[int, ...], np.ndarray] = {}
+    mismatches = []
+    skipped: Dict[str, int] = {}
+    checked = 0
+
+    for log_path in args.logs:
+        for values, name, sv_dests in parse_log_predictions(log_path):
+            # A ranged vector entry is expected at a destination when any of its bits is
+            if name in model.name_index:
+                rows = [model.name_index[name]]
+            elif name in model.range_index:
+                rows = model.range_index[name]
+            else:
+                skipped[name] = skipped.get(name, 0) + 1
+                continue
+            if values not in cache:
+                cache[values] = model.evaluate(np.array(values, dtype=np.uint32))[0]
+            expected = cache[values][rows].any(axis=0)
+            model_dests = [DEST_LABELS[d] for d in range(len(DESTINATIONS)) if expected[d]]
+            checked += 1
+            if sorted(model_dests) != sorted(sv_dests):
+                mismatches.append([log_path, name, ' '.join(sv_dests), ' '.join(model_dests)])
+
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['log', 'interrupt', 'sv_expected', 'model_expected'])
+            writer.writerows(mismatches)
+        print(f"Successfully generated '{args.output}'")
+
+    print(f"Cross-checked {checked} SV predictions from {len(args.logs)} logs "
+          f"({len(cache)} distinct mask configurations)")
+    print(f"  Mismatches: {len(mismatches)}")
+    if skipped:
+        print(f"  Skipped {sum(skipped.values())} predictions for {len(skipped)} names not in the interrupt map: "
+              f"{', '.join(sorted(skipped)[:10])}")
+    for log_path, name, sv_dests, model_dests in mismatches[:20]:
+        print(f"  - {name}: SV [{sv_dests}] vs model [{model_dests}] ({log_path})")
+    if checked == 0:
+        print("Warning: no predictions found; register writes and predictions need UVM_VERBOSITY=UVM_HIGH")
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized Mask-Aware Routing Reference Model')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    predict = subparsers.add_parser('predict', help='Compute expected destinations for many mask configurations')
+    predict.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                         help='Path to interrupt map entries file')
+    predict.add_argument('-c', '--configs', help='CSV of mask configurations (one column per register)')
+    predict.add_argument('-n', '--random', type=int, default=100000,
+                         help='Number of random configurations if --configs is not given (default: 100000)')
+    predict.add_argument('-s', '--seed', type=int, default=1, help='Random seed (default: 1)')
+    predict.add_argument('-o', '--output', help='Write configurations and packed expectation tables as .npz')
+    predict.add_argument('-r', '--rates', help='Write per-pair expectation rates as CSV')
+    predict.add_argument('--chunk-size', type=int, default=4096,
+                         help='Configurations evaluated per batch (default: 4096)')
+    predict.set_defaults(func=cmd_predict)
+
+    crosscheck = subparsers.add_parser('crosscheck', help='Compare SV predictions in simulation logs with the model')
+    crosscheck.add_argument('logs', nargs='+', help='Simulation logs')
+    crosscheck.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                            help='Path to interrupt map entries file')
+    crosscheck.add_argument('-o', '--output', help='Write mismatches as CSV')
+    crosscheck.set_defaults(func=cmd_crosscheck)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
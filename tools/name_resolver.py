@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Interrupt Name Resolver
+
+Matches interrupt names of the destination sheets that have no exact match in
+the source sheets (e.g. 'iosub_normal_int' for 'iosub_normal_intr') to their
+most similar source names.
+
+The source names are indexed once by character trigrams (of the lower-cased
+name padded with '^' and '$', so that prefixes and suffixes count).  A lookup
+only walks the postings of the query's selective trigrams; trigrams shared by
+a large part of the map ('int', 'ntr', ...) are left out of candidate
+generation, so its cost depends on the length of the name, not on the size of
+the map.  Candidates are ranked by the Dice coefficient of their trigram sets.
+
+A match is a confident auto-fix when it scores at least AUTO_FIX_SCORE, leads
+the runner-up by AUTO_FIX_MARGIN and has the same numbers as the query (a
+missing 'uart3_intr' must not silently become 'uart2_intr').  Other matches
+above CANDIDATE_SCORE are reported as ambiguous.
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+NGRAM = 3
+AUTO_FIX_SCORE = 0.8
+AUTO_FIX_MARGIN = 0.1
+CANDIDATE_SCORE = 0.5
+# Trigrams in more than this share of the names do not generate candidates
+STOP_GRAM_SHARE = 0.05
+MAX_CANDIDATES = 32
+
+_NUMBER_PATTERN = re.compile(r'\d+')
+
+AUTO_FIX = 'auto_fix'
+AMBIGUOUS = 'ambiguous'
+UNMATCHED = 'unmatched'
+
+
+def name_grams(name: str, n: int = NGRAM) -> Set[str]:
+    """Character n-grams of a name, lower-cased and padded with '^'/'$'."""
+    padded = f"^{name.strip().lower()}$"
+    return {padded[i:i + n] for i in range(max(1, len(padded) - n + 1))}
+
+
+class NameResolver:
+    def __init__(self, names: Iterable[str]):
+        """
+        Build the trigram index.
+
+        Args:
+            names: Source sheet interrupt names
+        """
+        self.names: List[str] = list(dict.fromkeys(names))
+        self.grams: List[Set[str]] = [name_grams(name) for name in self.names]
+        self.postings: Dict[str, List[int]] = {}
+        for nid, grams in enumerate(self.grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(nid)
+        self.stop_postings = max(8, int(len(self.names) * STOP_GRAM_SHARE))
+
+    def candidates(self, name: str, count: int = 3) -> List[Tuple[str, float]]:
+        """
+        Most similar source names.
+
+        Returns:
+            Up to count (name, Dice score) pairs, best first
+        """
+        grams = name_grams(name)
+        postings = [self.postings[g] for g in grams if g in self.postings]
+        selective = [p for p in postings if len(p) <= self.stop_postings]
+        if not selective:
+            # Only common trigrams: fall back to the rarest ones
+            selective = sorted(postings, key=len)[:2]
+
+        shared: Dict[int, int] = {}
+        for posting in selective:
+            for nid in posting:
+                shared[nid] = shared.get(nid, 0) + 1
+        shortlist = sorted(shared, key=shared.get, reverse=True)[:MAX_CANDIDATES]
+
+        scored = []
+        for nid in shortlist:
+            common = len(grams & self.grams[nid])
+            scored.append((self.names[nid], 2.0 * common / (len(grams) + len(self.grams[nid]))))
+        scored.sort(key=lambda c: (-c[1], c[0]))
+        return scored[:count]
+
+    def resolve(self, name: str) -> Tuple[str, List[Tuple[str, float]]]:
+        """
+        Classify an unmatched name.
+
+        Returns:
+            (AUTO_FIX, AMBIGUOUS or UNMATCHED, candidates above CANDIDATE_SCORE);
+            for AUTO_FIX the first candidate is the fix
+        """
+        found = [c for c in self.candidates(name) if c[1] >= CANDIDATE_SCORE]
+        if not found:
+            return UNMATCHED, []
+        best, score = found[0]
+        runner_up = found[1][1] if len(found) > 1 else 0.0
+        if (score >= AUTO_FIX_SCORE and score - runner_up >= AUTO_FIX_MARGIN
+                and _NUMBER_PATTERN.findall(best) == _NUMBER_PATTERN.findall(name)):
+            return AUTO_FIX, found
+        return AMBIGUOUS, found
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Interrupt/Destination Pair IDs
+
+Assigns every routed (interrupt, destination) pair of the interrupt map a
+dense integer ID and emits the table as int_pair_ids.svh, which int_pair_table
+loads so that the scoreboard, event manager and coverage can key their
+per-pair state by integer instead of formatting "name@DEST" strings.
+
+- Ranged vector entries are numbered bit by bit (<name>_<n>), as the monitor
+  reports them.
+- A name resolves to the first entry of that name, as in the SV lookups.
+- IDs follow map order, then destination order (AP, SCP, MCP, ACCEL, IO,
+  OTHER_DIE), so they only change when the map does.
+
+Merge paths (a stimulable source, through a merge interrupt, to a destination
+the merge is routed to) are numbered the same way and emitted with the pair
+IDs.  Sources of nested merges (e.g. iosub_slv_err_intr sources behind
+iosub_normal_intr) count as sources of the outer merge.
+
+The per-pair routing coverage bins of int_coverage are generated from the
+same numbering as int_pair_coverage.svh: one bin per pair ID and one per merge
+path ID, so the coverage is sampled by integer.  Pairs that can never be hit
+(IO destinations, which are not monitored, and interrupts the sequences skip,
+see should_skip_interrupt_check) are emitted as ignore_bins.
+"""
+
+import re
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from interrupt_map import (DESTINATIONS, load_interrupt_map, expand_vector_entries, get_merge_sources,
+                           is_merge_interrupt, should_skip_interrupt_check)
+
+
+def assign_pair_ids(entries: List[dict]) -> Dict[str, List[int]]:
+    """
+    Number the routed (interrupt, destination) pairs.
+
+    Args:
+        entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+
+    Returns:
+        Dictionary of interrupt name -> pair ID per destination (DESTINATIONS
+        order, -1 where not routed), for interrupts with at least one route
+    """
+    pair_ids: Dict[str, List[int]] = {}
+    seen = set()
+    next_id = 0
+    for entry in expand_vector_entries(entries):
+        if entry['name'] in seen:
+            continue
+        seen.add(entry['name'])
+        ids = []
+        for dest in DESTINATIONS:
+            if entry.get(f'to_{dest}', 0) == 1:
+                ids.append(next_id)
+                next_id += 1
+            else:
+                ids.append(-1)
+        if max(ids) >= 0:
+            pair_ids[entry['name']] = ids
+    return pair_ids
+
+
+def count_pairs(pair_ids: Dict[str, List[int]]) -> int:
+    return sum(1 for ids in pair_ids.values() for pair_id in ids if pair_id >= 0)
+
+
+def get_leaf_sources(merge_name: str, entries: List[dict], visited: Set[str] = None) -> List[str]:
+    """Stimulable sources of a merge interrupt, following nested merges, in map order."""
+    if visited is None:
+        visited = set()
+    visited.add(merge_name)
+    leaves = []
+    for entry in get_merge_sources(merge_name, entries):
+        name = entry['name']
+        if name in visited:
+            continue
+        if is_merge_interrupt(name):
+            leaves += [n for n in get_leaf_sources(name, entries, visited) if n not in leaves]
+        elif entry.get('rtl_path_src', '') and name not in leaves:
+            leaves.append(name)
+    return leaves
+
+
+def assign_merge_paths(entries: List[dict], pair_ids: Dict[str, List[int]]) -> List[Tuple[int, str, str, str]]:
+    """
+    Number the merge paths.
+
+    Returns:
+        (merge pair ID, source name, merge name, destination) per merge path;
+        the list index is the merge path ID
+    """
+    paths = []
+    seen = set()
+    for entry in entries:
+        name = entry['name']
+        # A name resolves to the first entry of that name
+        if name in seen or not is_merge_interrupt(name) or name not in pair_ids:
+            continue
+        seen.add(name)
+        sources = get_leaf_sources(name, entries)
+        for dest, pair_id in zip(DESTINATIONS, pair_ids[name]):
+            if pair_id >= 0:
+                paths.extend((pair_id, source, name, dest.upper()) for source in sources)
+    return paths
+
+
+def generate_pair_ids_file(entries: List[dict], output_path: str, source: str):
+    """Generate the SystemVerilog include file holding the pair ID and merge path tables."""
+    pair_ids = assign_pair_ids(entries)
+    merge_paths = assign_merge_paths(entries, pair_ids)
+
+    sv_lines = [
+        "// Auto-generated interrupt/destination pair IDs",
+        f"// Source: {source}",
+        "// Generated by: pair_ids.py",
+        "// NOTE: This file is included in int_pair_table.sv",
+        f"// IDs per interrupt in destination order: {', '.join(d.upper() for d in DESTINATIONS)} (-1: not routed)",
+        "",
+        f"        generated_pairs = {count_pairs(pair_ids)};",
+        "",
+    ]
+    for name, ids in pair_ids.items():
+        sv_lines.append(f"        pair_ids[\"{name}\"] = '{{{', '.join(str(i) for i in ids)}}};")
+    sv_lines.append("")
+
+    sv_lines.append(f"        // --- Merge paths (source -> merge -> destination): {len(merge_paths)} ---")
+    for pair_id, source_name, merge_name, dest in merge_paths:
+        sv_lines.append(f"        merge_path = '{{pair_id:{pair_id}, source:\"{source_name}\"}}; "
+                        f"merge_paths.push_back(merge_path); // {merge_name}@{dest}")
+    sv_lines.append("")
+
+    with open(output_path, 'w', encoding='utf-8') as svfile:
+        svfile.write("\n".join(sv_lines))
+
+
+def _bin_names(labels: List[str]) -> List[str]:
+    """Coverage bin identifiers of labels, made unique by their position where they collide."""
+    names = [re.sub(r'\W', '_', label) for label in labels]
+    counts: Dict[str, int] = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+    return [f"{name}_{i}" if counts[name] > 1 else name for i, name in enumerate(names)]
+
+
+def get_unreachable_pairs(entries: List[dict], pair_ids: Dict[str, List[int]]) -> Set[int]:
+    """
+    Pair IDs that no check can hit: IO destinations (the monitor does not
+    watch them) and every pair of an interrupt the sequences skip.
+    """
+    unreachable = set()
+    seen = set()
+    for entry in expand_vector_entries(entries):
+        name = entry['name']
+        if name in seen or name not in pair_ids:
+            continue
+        seen.add(name)
+        skipped = should_skip_interrupt_check(entry)
+        for dest, pair_id in zip(DESTINATIONS, pair_ids[name]):
+            if pair_id >= 0 and (skipped or dest == 'io'):
+                unreachable.add(pair_id)
+    return unreachable
+
+
+def _bins_line(bin_name: str, value: int, unreachable: bool) -> str:
+    return f"            {'ignore_bins' if unreachable else 'bins'} {bin_name} = {{{value}}};"
+
+
+def generate_coverage_bins_file(entries: List[dict], output_path: str, source: str):
+    """Generate the SystemVerilog include file holding the per-pair coverage bins."""
+    pair_ids = assign_pair_ids(entries)
+    merge_paths = assign_merge_paths(entries, pair_ids)
+    unreachable = get_unreachable_pairs(entries, pair_ids)
+    pairs = sorted((pair_id, f"{name}__{dest.upper()}")
+                   for name, ids in pair_ids.items() for dest, pair_id in zip(DESTINATIONS, ids) if pair_id >= 0)
+
+    sv_lines = [
+        "// Auto-generated per-pair routing coverage bins",
+        f"// Source: {source}",
+        "// Generated by: pair_ids.py",
+        "// NOTE: This file is included in int_coverage.sv",
+        "// Bin values are the pair IDs and merge path IDs of int_pair_ids.svh",
+        "// ignore_bins: pairs no check can hit (IO destinations, interrupts the sequences skip)",
+        "",
+        "        routed_pair: coverpoint pair_id iff (pair_id >= 0) {",
+    ]
+    for (pair_id, _), bin_name in zip(pairs, _bin_names([label for _, label in pairs])):
+        sv_lines.append(_bins_line(bin_name, pair_id, pair_id in unreachable))
+    sv_lines.append("        }")
+
+    labels = [f"{source_name}__{merge_name}__{dest}" for _, source_name, merge_name, dest in merge_paths]
+    sv_lines.append("")
+    sv_lines.append("        merge_path: coverpoint merge_path_id iff (merge_path_id >= 0) {")
+    for path_id, bin_name in enumerate(_bin_names(labels)):
+        sv_lines.append(_bins_line(bin_name, path_id, merge_paths[path_id][0] in unreachable))
+    if not merge_paths:
+        # Keep the coverpoint for int_coverage's report, but out of the group coverage
+        sv_lines.append("            option.weight = 0;")
+        sv_lines.append("            bins no_merge_paths = {-1};")
+    sv_lines.append("        }")
+    sv_lines.append("")
+
+    with open(output_path, 'w', encoding='utf-8') as svfile:
+        svfile.write("\n".join(sv_lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Interrupt/Destination Pair ID Generator')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('-o', '--output', default='seq/int_pair_ids.svh',
+                        help='Output SystemVerilog include file')
+    parser.add_argument('-c', '--coverage-bins', default='seq/int_pair_coverage.svh',
+                        help='Output SystemVerilog include file for the per-pair coverage bins')
+
+    args = parser.parse_args()
+
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+
+    entries = load_interrupt_map(args.entries)
+    generate_pair_ids_file(entries, args.output, args.entries)
+    generate_coverage_bins_file(entries, args.coverage_bins, args.entries)
+    pair_ids = assign_pair_ids(entries)
+    print(f"Assigned {count_pairs(pair_ids)} pair IDs to the routes of {len(entries)} interrupts")
+    print(f"Assigned {len(assign_merge_paths(entries, pair_ids))} merge path IDs")
+    print(f"Successfully generated '{args.output}'")
+    print(f"Successfully generated '{args.coverage_bins}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
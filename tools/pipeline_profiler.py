@@ -0,0 +1,158 @@
+"""
+Pipeline Stage Profiler
+
+Shared instrumentation for the Excel-to-SV generation flow.  Tools wrap their
+stages in PROFILER.stage(...) and bump hot-path counters with
+PROFILER.count(...); both are no-ops until the profiler is enabled, which the
+tools do for --profile.
+
+Per stage the profiler records:
+- wall_seconds / cpu_seconds: CPU time includes waited-for child processes,
+  so stages that shell out to another tool are accounted for
+- peak_rss_mb: peak RSS of this process (or of its largest child) at the end
+  of the stage; ru_maxrss never decreases, so it is a high-water mark
+- counters: rows_scanned, regex_evaluations, dest_lookup_hits/misses,
+  path_rule_fallbacks, ... bumped while the stage was active
+
+Reports are JSON (also used to pass a child tool's report back to the
+generator, see merge()) or Prometheus textfile format.  With a cProfile
+directory, each stage is additionally dumped to <dir>/<stage>.prof.
+"""
+
+import sys
+import json
+import time
+import cProfile
+import resource
+import contextlib
+from pathlib import Path
+from typing import Dict, Optional
+
+METRIC_PREFIX = 'int_pipeline'
+
+
+def _rss_mb(who: int) -> float:
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _children_cpu() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class PipelineProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.cprofile_dir: Optional[Path] = None
+        self.stages: Dict[str, dict] = {}
+        self.counters: Dict[str, int] = {}
+        self._current: Optional[dict] = None
+
+    def enable(self, cprofile_dir: Optional[str] = None):
+        """
+        Start recording stages and counters.
+
+        Args:
+            cprofile_dir: Optional directory for per-stage cProfile dumps
+        """
+        self.enabled = True
+        if cprofile_dir:
+            self.cprofile_dir = Path(cprofile_dir)
+            self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+
+    def count(self, name: str, n: int = 1):
+        """Add n to a hot-path counter (total and current stage)."""
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + n
+        if self._current is not None:
+            stage_counters = self._current['counters']
+            stage_counters[name] = stage_counters.get(name, 0) + n
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Record wall time, CPU time, peak RSS and counters of the enclosed block."""
+        if not self.enabled:
+            yield
+            return
+
+        record = self.stages.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0,
+                                               'peak_rss_mb': 0.0, 'calls': 0, 'counters': {}})
+        outer, self._current = self._current, record
+        profile = cProfile.Profile() if self.cprofile_dir and outer is None else None
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time() + _children_cpu()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+                profile.dump_stats(str(self.cprofile_dir / f"{name}.prof"))
+            record['wall_seconds'] += time.perf_counter() - wall_start
+            record['cpu_seconds'] += time.process_time() + _children_cpu() - cpu_start
+            record['peak_rss_mb'] = max(record['peak_rss_mb'], _rss_mb(resource.RUSAGE_SELF),
+                                        _rss_mb(resource.RUSAGE_CHILDREN))
+            record['calls'] += 1
+            self._current = outer
+
+    def merge(self, report_path: str, prefix: str):
+        """
+        Merge the JSON report of a child tool, naming its stages '<prefix>.<stage>'.
+
+        Child counters are added to the totals and to the enclosing stage.
+        """
+        if not self.enabled or not Path(report_path).exists():
+            return
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        for name, record in report.get('stages', {}).items():
+            self.stages[f"{prefix}.{name}"] = record
+        for name, value in report.get('counters', {}).items():
+            self.count(name, value)
+
+    def report(self) -> dict:
+        return {'stages': self.stages, 'counters': self.counters}
+
+    def write_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+
+    def write_prometheus(self, path: str):
+        """Write the report in Prometheus textfile collector format."""
+        lines = []
+        gauges = [
+            ('stage_wall_seconds', 'wall_seconds', 'Wall time per pipeline stage'),
+            ('stage_cpu_seconds', 'cpu_seconds', 'CPU time per pipeline stage, including child processes'),
+            ('stage_peak_rss_megabytes', 'peak_rss_mb', 'Peak RSS at the end of each pipeline stage'),
+        ]
+        for metric, key, help_text in gauges:
+            lines.append(f"# HELP {METRIC_PREFIX}_{metric} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{metric} gauge")
+            for name, record in self.stages.items():
+                lines.append(f'{METRIC_PREFIX}_{metric}{{stage="{name}"}} {record[key]:.6f}')
+
+        lines.append(f"# HELP {METRIC_PREFIX}_events_total Hot-path counters per pipeline stage")
+        lines.append(f"# TYPE {METRIC_PREFIX}_events_total counter")
+        for name, record in self.stages.items():
+            for counter, value in sorted(record['counters'].items()):
+                lines.append(f'{METRIC_PREFIX}_events_total{{stage="{name}",counter="{counter}"}} {value}')
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def write_report(self, path: str, fmt: str = 'json'):
+        """Write the report as 'json' or 'prometheus'."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        if fmt == 'prometheus':
+            self.write_prometheus(path)
+        else:
+            self.write_json(path)
+
+
+# Process-wide profiler shared by all tools
+PROFILER = PipelineProfiler()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Coverage-Maximizing Mask Configuration Planner
+
+Computes a small set of directed mask register configurations that together
+cover the masked/unmasked routing cross of every routed (interrupt,
+destination) pair, replacing many randomize_mask_registers() seeds.
+
+A pair is gated by one or more mask bits (see mask_layout.py), one per mask
+layer it passes through.  The coverage targets of a pair are:
+- unmasked: every gating bit is 1
+- masked by bit b: b is 0 and every other gating bit is 1, so that each
+  layer is seen masking the pair on its own
+
+Configurations are chosen with greedy set cover: each round builds several
+candidate configurations by greedily packing compatible uncovered targets, and
+keeps the candidate that covers the most of them.  Bits outside the widths
+written by randomize_mask_registers() are kept at 0.
+
+Outputs an SV include consumed by int_register_model.apply_mask_config() and,
+with -p, a run list of +INT_MASK_CONFIG=<n> plusargs, one line per directed run.
+"""
+
+import sys
+import csv
+import random
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from interrupt_map import load_interrupt_map, get_destinations
+from mask_layout import MASK_REGISTERS, MaskLayout, MaskBit, format_sv_hex
+
+# Coverage target: ((interrupt, destination), masking bit or None for unmasked)
+Target = Tuple[Tuple[str, str], Optional[MaskBit]]
+
+
+class MaskConfigPlanner:
+    def __init__(self, entries: List[dict], candidates: int = 8, seed: int = 1):
+        """
+        Initialize the mask configuration planner.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+            candidates: Candidate configurations built per greedy round
+            seed: Seed for the candidate target orderings
+        """
+        self.layout = MaskLayout(entries)
+        self.candidates = max(1, candidates)
+        self.rng = random.Random(seed)
+        self.valid_masks = {addr: mask for _, addr, mask in MASK_REGISTERS}
+
+        # Routed pair -> gating mask bits (None if always masked)
+        self.pair_bits: Dict[Tuple[str, str], Optional[List[MaskBit]]] = {}
+        for name, entry in self.layout.entry_by_name.items():
+            for dest in get_destinations(entry):
+                self.pair_bits[(name, dest)] = self.layout.get_mask_bits(name, dest)
+
+    def is_writable(self, bit: MaskBit) -> bool:
+        addr, index = bit
+        return bool((self.valid_masks[addr] >> index) & 1)
+
+    def get_targets(self) -> Tuple[List[Target], List[Target]]:
+        """
+        Enumerate the coverage targets of every routed pair.
+
+        Returns:
+            (coverable targets, targets no configuration can reach)
+        """
+        coverable, unreachable = [], []
+        for pair, bits in self.pair_bits.items():
+            if bits is None:
+                # Always masked by the SV model: nothing to cover
+                unreachable.append((pair, None))
+                continue
+            for masking_bit in [None] + bits:
+                others = [b for b in bits if b != masking_bit]
+                target = (pair, masking_bit)
+                if all(self.is_writable(b) for b in others):
+                    coverable.append(target)
+                else:
+                    unreachable.append(target)
+        return coverable, unreachable
+
+    def _requirements(self, target: Target) -> Dict[MaskBit, int]:
+        pair, masking_bit = target
+        return {b: (0 if b == masking_bit else 1) for b in self.pair_bits[pair]}
+
+    def build_candidate(self, ordered_targets: List[Target]) -> Dict[MaskBit, int]:
+        """Greedily assign mask bits so that as many targets as possible are satisfied."""
+        assignment: Dict[MaskBit, int] = {}
+        for target in ordered_targets:
+            required = self._requirements(target)
+            if all(assignment.get(b, value) == value for b, value in required.items()):
+                assignment.update(required)
+        return assignment
+
+    def to_register_values(self, assignment: Dict[MaskBit, int]) -> Dict[int, int]:
+        """Turn a bit assignment into register values; unassigned writable bits are enabled."""
+        values = dict(self.valid_masks)
+        for (addr, index), value in assignment.items():
+            if value == 0:
+                values[addr] &= ~(1 << index) & 0xFFFF_FFFF
+        return values
+
+    def covered_targets(self, values: Dict[int, int]) -> Set[Target]:
+        """Get the targets a set of register values covers."""
+        covered = set()
+        for pair, bits in self.pair_bits.items():
+            if bits is None:
+                continue
+            cleared = [b for b in bits if not (values[b[0]] >> b[1]) & 1]
+            if not cleared:
+                covered.add((pair, None))
+            elif len(cleared) == 1:
+                covered.add((pair, cleared[0]))
+        return covered
+
+    def plan(self, max_configs: int = 0) -> Tuple[List[Dict[int, int]], Set[Target]]:
+        """
+        Select mask configurations with greedy set cover.
+
+        Returns:
+            (list of register address -> value per configuration, targets left uncovered)
+        """
+        targets, _ = self.get_targets()
+        # Harder targets (more gating bits) first in the deterministic candidate
+        base_order = sorted(targets, key=lambda t: (-len(self.pair_bits[t[0]]), t[1] is None))
+        uncovered = set(targets)
+        configs: List[Dict[int, int]] = []
+
+        while uncovered and (not max_configs or len(configs) < max_configs):
+            pending = [t for t in base_order if t in uncovered]
+            best_values, best_gain = None, set()
+            for attempt in range(self.candidates):
+                order = pending if attempt == 0 else self.rng.sample(pending, len(pending))
+                values = self.to_register_values(self.build_candidate(order))
+                gain = self.covered_targets(values) & uncovered
+                if len(gain) > len(best_gain):
+                    best_values, best_gain = values, gain
+            if not best_gain:
+                break
+            configs.append(best_values)
+            uncovered -= best_gain
+
+        return configs, uncovered
+
+    def generate_sv_file(self, configs: List[Dict[int, int]], output_path: str, entries_file: str):
+        """Generate the SystemVerilog include file holding the mask configuration table."""
+        sv_lines = [
+            "// Auto-generated directed mask configurations",
+            f"// Source: {entries_file}",
+            "// Generated by: plan_mask_configs.py",
+            "// NOTE: This file is included in int_register_model.sv",
+            ""
+        ]
+
+        for config_id, values in enumerate(configs):
+            sv_lines.append(f"        // --- Mask configuration {config_id} ---")
+            for name, addr, _ in MASK_REGISTERS:
+                sv_lines.append(
+                    f"        mask_cfg_entry = '{{config_id:{config_id}, addr:{format_sv_hex(addr)}, "
+                    f"value:{format_sv_hex(values[addr])}}}; "
+                    f"mask_config_table.push_back(mask_cfg_entry); // {name}"
+                )
+            sv_lines.append("")
+
+        with open(output_path, 'w', encoding='utf-8') as svfile:
+            svfile.write("\n".join(sv_lines))
+
+
+def write_plusargs(path: str, configs: List[Dict[int, int]]):
+    """Write one +INT_MASK_CONFIG plusarg line per directed run."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for config_id in range(len(configs)):
+            f.write(f"+INT_MASK_CONFIG={config_id}\n")
+
+
+def write_config_csv(path: str, configs: List[Dict[int, int]]):
+    """Write the configurations in the CSV format read by mask_reference_model.py."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, _, _ in MASK_REGISTERS])
+        for values in configs:
+            writer.writerow([f"0x{values[addr]:08X}" for _, addr, _ in MASK_REGISTERS])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Coverage-Maximizing Mask Configuration Planner')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('-o', '--output', default='seq/int_mask_configs.svh',
+                        help='Path for the generated mask configuration include file')
+    parser.add_argument('-p', '--plusargs',
+                        help='Also write the run list of +INT_MASK_CONFIG plusargs to this path')
+    parser.add_argument('--csv', help='Also write the configurations as CSV (mask_reference_model.py format)')
+    parser.add_argument('--max-configs', type=int, default=0,
+                        help='Stop after this many configurations (default: until covered)')
+    parser.add_argument('--candidates', type=int, default=8,
+                        help='Candidate configurations per greedy round (default: 8)')
+    parser.add_argument('-s', '--seed', type=int, default=1, help='Random seed for candidate orderings (default: 1)')
+
+    args = parser.parse_args()
+
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+
+    entries = load_interrupt_map(args.entries)
+    planner = MaskConfigPlanner(entries, args.candidates, args.seed)
+    targets, unreachable = planner.get_targets()
+    configs, uncovered = planner.plan(args.max_configs)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    planner.generate_sv_file(configs, args.output, args.entries)
+    if args.plusargs:
+        write_plusargs(args.plusargs, configs)
+    if args.csv:
+        write_config_csv(args.csv, configs)
+
+    print(f"Loaded {len(entries)} interrupt entries from {args.entries}")
+    print(f"Routed pairs: {len(planner.pair_bits)}, coverage targets: {len(targets)}")
+    print(f"Selected {len(configs)} mask configurations covering {len(targets) - len(uncovered)} targets")
+    if uncovered:
+        print(f"Warning: {len(uncovered)} targets left uncovered (--max-configs reached)")
+    if unreachable:
+        print(f"Note: {len(unreachable)} targets cannot be reached by any configuration:")
+        for (name, dest), bit in sorted(unreachable, key=lambda t: (t[0], t[1] or (0, -1)))[:20]:
+            state = "unmasked" if bit is None else f"masked by 0x{bit[0]:05X}[{bit[1]}]"
+            print(f"  - {name}@{dest.upper()} {state}")
+    print(f"Successfully generated '{args.output}'")
+    if args.plusargs:
+        print(f"Successfully generated '{args.plusargs}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Regression Shard Planner for tc_int_routing
+
+Splits the interrupt map into K shards balanced by estimated simulation cost so
+that tc_int_routing can be distributed over K farm slots.  Each shard is run with
++INT_SHARD_ID=<k>; int_lightweight_sequence then only checks the interrupts
+assigned to that shard in seq/int_shard_schedule.svh.
+
+The unit of work is an interrupt_map entry, except for merge interrupts: each
+source test of a merge ('<merge>/<source>') and its multi-source test
+('<merge>') are separate units, so a merge with many sources such as
+iosub_normal_intr is spread over the shards instead of bounding the longest one.
+
+Cost model (per interrupt_map entry, in ns-equivalent units):
+- stimulus time from config/timing_config.sv for the trigger type
+  (assert, propagation, clear) for every source that is stimulated
+- a per-destination cost for every expected destination, including the
+  destinations of every merge the source feeds (merge chains followed)
+- a merge source test pays for the source; the multi-source test of a merge
+  pays for all its sources together
+- historical runtimes, when available, replace the model estimate; the model
+  is calibrated against them so that both can be mixed in one plan
+
+Usage:
+    python3 tools/plan_regression_shards.py plan -k 8
+    python3 tools/plan_regression_shards.py merge shard_0.log shard_1.log ... --update-history
+"""
+
+import re
+import sys
+import json
+import heapq
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from interrupt_map import (load_interrupt_map, load_timing_config, build_merge_relations,
+                           get_destinations, get_merge_sources, is_merge_interrupt,
+                           should_skip_interrupt_check)
+
+# Fixed delays in int_lightweight_sequence around every stimulus (#10ns after
+# assert, #10ns after clear)
+SEQUENCE_DELAY_NS = 20
+
+# Shards of the schedule regenerated with the interrupt map (generate_interrupt_config.py)
+DEFAULT_SHARD_COUNT = 4
+
+
+class ShardCostModel:
+    def __init__(self, entries: List[dict], timing: Dict[str, int], dest_cost: float = 20.0,
+                 check_overhead: float = 5.0, history: Optional[Dict[str, float]] = None):
+        """
+        Initialize the cost model.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+            timing: Default timing parameters (see interrupt_map.load_timing_config)
+            dest_cost: Cost of waiting for and checking one expected destination
+            check_overhead: Fixed cost of visiting an interrupt_map entry
+            history: Historical runtime in seconds per unit of work (see unit_key)
+        """
+        self.entries = entries
+        self.timing = timing
+        self.dest_cost = dest_cost
+        self.check_overhead = check_overhead
+        self.history = history or {}
+        self.entry_by_name = {e['name']: e for e in entries}
+        self.merges_for_source = build_merge_relations(entries)
+
+    def stimulus_cost(self, entry: dict) -> float:
+        """Simulated time of one assert/clear cycle driven by int_driver."""
+        t = self.timing
+        trigger = entry.get('trigger', 'LEVEL')
+        if trigger == 'PULSE':
+            width = entry.get('pulse_width_ns', 0) or t.get('pulse_width_ns', 1)
+            assert_ns = t.get('pulse_setup_time_ns', 0) + width + t.get('pulse_hold_time_ns', 0)
+        elif trigger == 'EDGE':
+            assert_ns = t.get('edge_setup_time_ns', 0) + t.get('edge_hold_time_ns', 0)
+        else:
+            assert_ns = t.get('level_setup_time_ns', 0) + t.get('propagation_delay_ns', 0)
+        clear_ns = t.get('clear_setup_time_ns', 0) + t.get('clear_propagation_delay_ns', 0)
+        return assert_ns + clear_ns + SEQUENCE_DELAY_NS
+
+    def expected_destination_count(self, name: str, visited: Optional[set] = None) -> int:
+        """Count destinations checked when a source fires, following merge chains."""
+        if visited is None:
+            visited = set()
+        if name in visited or name not in self.entry_by_name:
+            return 0
+        visited.add(name)
+        count = len(get_destinations(self.entry_by_name[name]))
+        for merge_name in self.merges_for_source.get(name, []):
+            count += self.expected_destination_count(merge_name, visited)
+        return count
+
+    def source_test_cost(self, entry: dict) -> float:
+        """Cost of stimulating one source and checking everything it reaches (for every bit of a vector)."""
+        return (self.stimulus_cost(entry) +
+                self.dest_cost * self.expected_destination_count(entry['name']) * entry.get('width', 1))
+
+    def merge_source_cost(self, source: dict) -> float:
+        """Cost of one merge source test (the SV model tests every bit of a ranged vector source separately)."""
+        return self.source_test_cost(source) + (source.get('width', 1) - 1) * self.stimulus_cost(source)
+
+    def unit_costs(self) -> Dict[str, float]:
+        """
+        Estimate the cost of every unit of work of int_lightweight_sequence, in
+        interrupt_map order (see unit_key).
+
+        An interrupt_map entry is one unit (check_interrupt_routing()); a merge
+        interrupt is split into its source tests (test_merge_source()), then its
+        multi-source test (test_multiple_merge_sources()).
+        """
+        costs = {}
+        for entry in self.entries:
+            cost = self.check_overhead
+            if not is_merge_interrupt(entry['name']):
+                if entry.get('rtl_path_src', '') and not should_skip_interrupt_check(entry):
+                    cost += self.source_test_cost(entry)
+                costs[entry['name']] = cost
+                continue
+
+            sources = []
+            if not should_skip_interrupt_check(entry):
+                sources = [s for s in get_merge_sources(entry['name'], self.entries)
+                           if s.get('rtl_path_src', '') and not is_merge_interrupt(s['name'])]
+            for source in sources:
+                costs[unit_key(entry['name'], source['name'])] = self.merge_source_cost(source)
+            if len(sources) > 1:
+                cost += sum(self.merge_source_cost(source) for source in sources)
+            costs[entry['name']] = cost
+        return costs
+
+    def estimate(self) -> Dict[str, float]:
+        """
+        Estimate the cost of every unit of work.
+
+        When historical runtimes exist, the model is scaled so that its total over
+        the units with history equals their measured total, and measured values
+        are used directly where available.
+        """
+        model = self.unit_costs()
+
+        known = [name for name in model if name in self.history]
+        model_total = sum(model[name] for name in known)
+        history_total = sum(self.history[name] for name in known)
+        if not known or model_total <= 0 or history_total <= 0:
+            return model
+
+        scale = history_total / model_total
+        return {name: self.history[name] if name in self.history else cost * scale
+                for name, cost in model.items()}
+
+
+def unit_key(name: str, source: str = '') -> str:
+    """Unit of work of a merge source test ('<merge>/<source>'), or of an entry / multi-source test ('<name>')."""
+    return f"{name}/{source}" if source else name
+
+
+def plan_shards(costs: Dict[str, float], order: List[str], shard_count: int) -> List[List[str]]:
+    """
+    Assign units of work to shards with longest-processing-time-first scheduling:
+    the most expensive unit goes to the currently least loaded shard.
+
+    Returns:
+        List of shards, each a list of unit keys in interrupt_map order
+    """
+    position = {name: i for i, name in enumerate(order)}
+    heap = [(0.0, shard) for shard in range(shard_count)]
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+
+    for name in sorted(order, key=lambda n: (-costs[n], position[n])):
+        load, shard = heapq.heappop(heap)
+        shards[shard].append(name)
+        heapq.heappush(heap, (load + costs[name], shard))
+
+    return [sorted(shard, key=lambda n: position[n]) for shard in shards]
+
+
+def generate_sv_file(shards: List[List[str]], output_path: str, entries_file: str):
+    """Generate the SystemVerilog include file holding the shard assignment."""
+    sv_lines = [
+        "// Auto-generated regression shard schedule",
+        f"// Source: {entries_file}",
+        "// Generated by: plan_regression_shards.py",
+        "// NOTE: This file is included in int_lightweight_sequence.sv",
+        ""
+    ]
+
+    for shard_id, units in enumerate(shards):
+        sv_lines.append(f"            // --- Shard {shard_id} ({len(units)} units) ---")
+        for unit in units:
+            name, _, source = unit.partition('/')
+            sv_lines.append(
+                f"            shard_entry = '{{shard:{shard_id}, name:\"{name}\", source:\"{source}\"}}; "
+                "shard_schedule.push_back(shard_entry);"
+            )
+        sv_lines.append("")
+
+    with open(output_path, 'w', encoding='utf-8') as svfile:
+        svfile.write("\n".join(sv_lines))
+
+
+def load_history(history_file: Optional[str]) -> Dict[str, float]:
+    """Load historical per-interrupt runtimes (seconds) written by the merge command."""
+    if not history_file or not Path(history_file).exists():
+        return {}
+    with open(history_file, 'r', encoding='utf-8') as f:
+        return json.load(f).get('interrupts', {})
+
+
+def cmd_plan(args) -> int:
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+    if args.shards < 1:
+        print("Error: shard count must be at least 1")
+        return 1
+
+    entries = load_interrupt_map(args.entries)
+    timing = load_timing_config(args.timing_config)
+    history = load_history(args.history)
+
+    model = ShardCostModel(entries, timing, args.dest_cost, args.check_overhead, history)
+    costs = model.estimate()
+    order = list(costs)
+    shards = plan_shards(costs, order, args.shards)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    generate_sv_file(shards, args.output, args.entries)
+
+    manifest = {
+        'entries_file': args.entries,
+        'shard_count': args.shards,
+        'shards': [
+            {
+                'id': shard_id,
+                'plusargs': f"+INT_SHARD_ID={shard_id}",
+                'estimated_cost': sum(costs[n] for n in names),
+                'interrupts': {n: costs[n] for n in names},
+            }
+            for shard_id, names in enumerate(shards)
+        ],
+    }
+    with open(args.manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    total = sum(costs.values())
+    ideal = total / args.shards
+    print(f"Loaded {len(entries)} interrupt entries from {args.entries}")
+    if history:
+        print(f"Using historical runtimes for {len([n for n in order if n in history])} units")
+    for shard in manifest['shards']:
+        share = shard['estimated_cost'] / total * 100 if total else 0
+        print(f"  Shard {shard['id']:2d}: {len(shard['interrupts']):4d} units, "
+              f"cost {shard['estimated_cost']:10.1f} ({share:5.1f}%)  {shard['plusargs']}")
+    if ideal:
+        worst = max(s['estimated_cost'] for s in manifest['shards'])
+        print(f"Longest shard is {worst / ideal:.3f}x the ideal total/{args.shards}")
+        heaviest = max(order, key=lambda n: costs[n])
+        if costs[heaviest] > ideal:
+            print(f"Warning: '{heaviest}' alone costs {costs[heaviest] / ideal:.2f}x the ideal shard "
+                  f"and bounds the regression wall-clock time")
+    print(f"Successfully generated '{args.output}' and '{args.manifest}'")
+    return 0
+
+
+# Log patterns produced by int_monitor / int_scoreboard and the UVM report server
+_SUMMARY_PATTERN = re.compile(r'^UVM_(ERROR|FATAL|WARNING)\s*:\s*(\d+)\s*$', re.MULTILINE)
+_DETECTED_PATTERN = re.compile(r"INTERRUPT DETECTED \[\d+\]: '([^']+)' -> '([^']+)'")
+_MISSING_PATTERN = re.compile(r'Missing interrupt: (\S+)')
+_UNEXPECTED_PATTERN = re.compile(r"UNEXPECTED interrupt: '([^']+)' was routed to '([^']+)'")
+_CPU_TIME_PATTERN = re.compile(r'CPU Time:\s+([\d.]+) seconds')
+
+
+def parse_shard_log(log_path: str) -> dict:
+    """Extract pass/fail counters from one shard's simulation log."""
+    with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+
+    summary = {severity: int(count) for severity, count in _SUMMARY_PATTERN.findall(content)}
+    cpu_time = _CPU_TIME_PATTERN.findall(content)
+    return {
+        'log': log_path,
+        'completed': bool(summary),
+        'errors': summary.get('ERROR', 0),
+        'fatals': summary.get('FATAL', 0),
+        'warnings': summary.get('WARNING', 0),
+        'detected': len(_DETECTED_PATTERN.findall(content)),
+        'missing': _MISSING_PATTERN.findall(content),
+        'unexpected': [f"{name}@{dest}" for name, dest in _UNEXPECTED_PATTERN.findall(content)],
+        'cpu_time': float(cpu_time[-1]) if cpu_time else None,
+    }
+
+
+def cmd_merge(args) -> int:
+    with open(args.manifest, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if len(args.logs) != manifest['shard_count']:
+        print(f"Error: expected {manifest['shard_count']} shard logs (in shard order), got {len(args.logs)}")
+        return 1
+
+    results = []
+    for shard, log_path in zip(manifest['shards'], args.logs):
+        if not Path(log_path).exists():
+            print(f"Error: {log_path} not found!")
+            return 1
+        result = parse_shard_log(log_path)
+        result['id'] = shard['id']
+        results.append(result)
+
+    passed = True
+    print("Regression shard results:")
+    for r in results:
+        ok = r['completed'] and r['errors'] == 0 and r['fatals'] == 0
+        passed &= ok
+        cpu = f"{r['cpu_time']:.1f}s" if r['cpu_time'] is not None else "n/a"
+        status = "PASS" if ok else ("INCOMPLETE" if not r['completed'] else "FAIL")
+        print(f"  Shard {r['id']:2d}: {status:10s} errors={r['errors']} fatals={r['fatals']} "
+              f"detected={r['detected']} cpu={cpu}  ({r['log']})")
+
+    missing = sorted({m for r in results for m in r['missing']})
+    unexpected = sorted({u for r in results for u in r['unexpected']})
+    if missing:
+        print(f"Missing interrupts ({len(missing)}):")
+        for name in missing:
+            print(f"  - {name}")
+    if unexpected:
+        print(f"Unexpected interrupts ({len(unexpected)}):")
+        for name in unexpected:
+            print(f"  - {name}")
+
+    times = [r['cpu_time'] for r in results if r['cpu_time'] is not None]
+    if times:
+        print(f"Total CPU time: {sum(times):.1f}s, longest shard: {max(times):.1f}s "
+              f"(ideal {sum(times) / len(times):.1f}s)")
+
+    if args.output:
+        merged = {
+            'passed': passed,
+            'shards': results,
+            'missing': missing,
+            'unexpected': unexpected,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=2)
+        print(f"Merged results written to '{args.output}'")
+
+    if args.update_history:
+        update_history(args.history, manifest, results)
+
+    print("OVERALL: PASS" if passed else "OVERALL: FAIL")
+    return 0 if passed else 1
+
+
+def update_history(history_file: str, manifest: dict, results: List[dict]):
+    """
+    Record per-unit runtimes by spreading each shard's measured CPU time over
+    its units of work in proportion to their estimated cost.
+    """
+    history = load_history(history_file)
+    updated = 0
+    for shard, result in zip(manifest['shards'], results):
+        if result['cpu_time'] is None or not result['completed'] or shard['estimated_cost'] <= 0:
+            continue
+        for name, cost in shard['interrupts'].items():
+            history[name] = result['cpu_time'] * cost / shard['estimated_cost']
+            updated += 1
+
+    with open(history_file, 'w', encoding='utf-8') as f:
+        json.dump({'interrupts': history}, f, indent=2, sort_keys=True)
+    print(f"Updated historical runtimes for {updated} units in '{history_file}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regression Shard Planner for tc_int_routing')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    plan = subparsers.add_parser('plan', help='Split the interrupt map into K cost-balanced shards')
+    plan.add_argument('-k', '--shards', type=int, default=DEFAULT_SHARD_COUNT,
+                      help=f'Number of shards (default: {DEFAULT_SHARD_COUNT})')
+    plan.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                      help='Path to interrupt map entries file')
+    plan.add_argument('-t', '--timing-config', default='config/timing_config.sv',
+                      help='Path to timing configuration class')
+    plan.add_argument('-o', '--output', default='seq/int_shard_schedule.svh',
+                      help='Path for the generated shard schedule include file')
+    plan.add_argument('-m', '--manifest', default='int_shards.json',
+                      help='Path for the shard manifest used by the merge command')
+    plan.add_argument('--history', default='int_shard_history.json',
+                      help='Historical per-interrupt runtimes (used if present)')
+    plan.add_argument('--dest-cost', type=float, default=20.0,
+                      help='Cost per expected destination check (default: 20)')
+    plan.add_argument('--check-overhead', type=float, default=5.0,
+                      help='Fixed cost per interrupt_map entry (default: 5)')
+    plan.set_defaults(func=cmd_plan)
+
+    merge = subparsers.add_parser('merge', help='Merge per-shard simulation results')
+    merge.add_argument('logs', nargs='+', help='Shard simulation logs in shard order')
+    merge.add_argument('-m', '--manifest', default='int_shards.json', help='Shard manifest from the plan command')
+    merge.add_argument('-o', '--output', help='Write merged results as JSON')
+    merge.add_argument('--history', default='int_shard_history.json', help='Historical runtime file')
+    merge.add_argument('--update-history', action='store_true',
+                       help='Record measured shard runtimes for the next plan')
+    merge.set_defaults(func=cmd_merge)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
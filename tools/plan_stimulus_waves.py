@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Stimulus Wave Planner for Batched Interrupt Routing Checks
+
+Partitions the interrupt map into waves of interrupts that can be stimulated
+and checked in parallel.  Two interrupts conflict (and are never placed in the
+same wave) when they share:
+- a source signal bit (rtl_path_src)
+- a destination bit (destination + dest_index)
+- a merge output, directly or through a chain of merges
+
+Ranged vector entries (width > 1) occupy every bit of their source
+part-select and their destination index range, so they conflict with
+single-bit entries on the same bus bits.
+
+The schedule is emitted as an SV include consumed by int_batched_sequence.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from typing import List, Set, Tuple
+
+from interrupt_map import (load_interrupt_map, build_merge_relations, get_destinations,
+                           is_merge_interrupt, should_skip_interrupt_check, get_vector_bit_path)
+
+
+class StimulusWavePlanner:
+    def __init__(self, entries: List[dict], max_wave_size: int = 0):
+        """
+        Initialize the wave planner.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+            max_wave_size: Maximum number of interrupts per wave, 0 for unlimited
+        """
+        self.entries = entries
+        self.max_wave_size = max_wave_size
+        self.entry_by_name = {e['name']: e for e in entries}
+        self.merges_for_source = build_merge_relations(entries)
+
+    def _destination_bits(self, entry: dict) -> Set[Tuple]:
+        """Get the destination bits an entry drives directly (every bit of a ranged entry)."""
+        bits = set()
+        width = entry.get('width', 1)
+        for dest in get_destinations(entry):
+            dest_index = entry.get(f'dest_index_{dest}', -1)
+            if dest_index >= 0:
+                bits.update(('dest', dest, dest_index + b) for b in range(width))
+            elif entry.get(f'rtl_path_{dest}', ''):
+                bits.update(('path', get_vector_bit_path(entry[f'rtl_path_{dest}'], b)) for b in range(width))
+        return bits
+
+    def get_resources(self, name: str, visited: Set[str] = None) -> Set[Tuple]:
+        """
+        Get every resource (source signal, destination bit, merge output) that
+        stimulating an interrupt touches, following merge chains recursively.
+        """
+        if visited is None:
+            visited = set()
+        if name in visited or name not in self.entry_by_name:
+            return set()
+        visited.add(name)
+
+        entry = self.entry_by_name[name]
+        resources = self._destination_bits(entry)
+        if entry.get('rtl_path_src', ''):
+            resources.update(('src', get_vector_bit_path(entry['rtl_path_src'], b))
+                             for b in range(entry.get('width', 1)))
+
+        for merge_name in self.merges_for_source.get(name, []):
+            resources.add(('merge', merge_name))
+            resources |= self.get_resources(merge_name, visited)
+        return resources
+
+    def has_checkable_routing(self, entry: dict) -> bool:
+        """
+        Check whether an interrupt produces an observable routing check, either
+        directly or through a merge it contributes to.  Mirrors the filters in
+        int_lightweight_sequence.should_skip_interrupt_check().
+        """
+        if not should_skip_interrupt_check(entry):
+            return True
+        for merge_name in self.merges_for_source.get(entry['name'], []):
+            merge_entry = self.entry_by_name.get(merge_name)
+            if merge_entry and not should_skip_interrupt_check(merge_entry):
+                return True
+        return False
+
+    def get_schedulable_entries(self) -> List[dict]:
+        """Get all interrupts that can be stimulated directly by the driver."""
+        return [e for e in self.entries
+                if e.get('rtl_path_src', '') and not is_merge_interrupt(e['name'])
+                and self.has_checkable_routing(e)]
+
+    def plan(self) -> List[List[str]]:
+        """
+        Partition the schedulable interrupts into conflict-free waves.
+
+        Uses first-fit on interrupts sorted by decreasing resource count, so that
+        the heavily shared merge sources are spread out first.
+
+        Returns:
+            List of waves, each a list of interrupt names in interrupt_map order
+        """
+        candidates = self.get_schedulable_entries()
+        order = {e['name']: i for i, e in enumerate(self.entries)}
+        resources = {e['name']: self.get_resources(e['name']) for e in candidates}
+
+        ranked = sorted(candidates, key=lambda e: (-len(resources[e['name']]), order[e['name']]))
+
+        waves: List[List[str]] = []
+        wave_resources: List[Set[Tuple]] = []
+        for entry in ranked:
+            name = entry['name']
+            for i, used in enumerate(wave_resources):
+                if self.max_wave_size and len(waves[i]) >= self.max_wave_size:
+                    continue
+                if used.isdisjoint(resources[name]):
+                    waves[i].append(name)
+                    used |= resources[name]
+                    break
+            else:
+                waves.append([name])
+                wave_resources.append(set(resources[name]))
+
+        return [sorted(wave, key=lambda n: order[n]) for wave in waves]
+
+    def get_unscheduled_names(self) -> List[str]:
+        """Get the interrupts the batched sequence does not stimulate, in interrupt_map order."""
+        schedulable = {e['name'] for e in self.get_schedulable_entries()}
+        return [e['name'] for e in self.entries if e['name'] not in schedulable]
+
+    def generate_sv_file(self, waves: List[List[str]], output_path: str, entries_file: str,
+                         unscheduled: List[str] = ()):
+        """
+        Generate the SystemVerilog include file holding the wave schedule.
+
+        The unscheduled interrupts are listed with wave -1, so that the sequence
+        can tell them from map entries the schedule does not know (stale schedule).
+        """
+        sv_lines = [
+            "// Auto-generated stimulus wave schedule",
+            f"// Source: {entries_file}",
+            "// Generated by: plan_stimulus_waves.py",
+            "// NOTE: This file is included in int_batched_sequence.sv",
+            ""
+        ]
+
+        for wave_idx, wave in enumerate(waves):
+            sv_lines.append(f"        // --- Wave {wave_idx} ({len(wave)} interrupts) ---")
+            for name in wave:
+                sv_lines.append(
+                    f"        wave_entry = '{{wave:{wave_idx}, name:\"{name}\"}}; wave_schedule.push_back(wave_entry);"
+                )
+            sv_lines.append("")
+
+        if unscheduled:
+            sv_lines.append(f"        // --- Not stimulated ({len(unscheduled)} interrupts: merge outputs, "
+                            "no source path or no checkable routing) ---")
+            for name in unscheduled:
+                sv_lines.append(
+                    f"        wave_entry = '{{wave:-1, name:\"{name}\"}}; wave_schedule.push_back(wave_entry);"
+                )
+            sv_lines.append("")
+
+        with open(output_path, 'w', encoding='utf-8') as svfile:
+            svfile.write("\n".join(sv_lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stimulus Wave Planner for Batched Interrupt Routing Checks')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('-o', '--output', default='seq/int_wave_schedule.svh',
+                        help='Path for the generated wave schedule include file')
+    parser.add_argument('--max-wave-size', type=int, default=0,
+                        help='Maximum number of interrupts per wave (default: unlimited)')
+
+    args = parser.parse_args()
+
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+
+    entries = load_interrupt_map(args.entries)
+    planner = StimulusWavePlanner(entries, args.max_wave_size)
+    waves = planner.plan()
+    unscheduled = planner.get_unscheduled_names()
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    planner.generate_sv_file(waves, args.output, args.entries, unscheduled)
+
+    scheduled = sum(len(wave) for wave in waves)
+    print(f"Loaded {len(entries)} interrupt entries from {args.entries}")
+    print(f"Scheduled {scheduled} interrupts into {len(waves)} waves ({len(unscheduled)} not stimulated)")
+    if waves:
+        print(f"Largest wave: {max(len(wave) for wave in waves)} interrupts")
+    print(f"Successfully generated '{args.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Interrupt Map Query Tool
+
+Answers routing debug questions without grepping int_map_entries.svh:
+- what sits at a destination index          dest scp 62 / path cpu_irq[62]
+- which interrupts feed a merge interrupt   feeds pmerge_normal3_intr
+- which merges an interrupt feeds           merges psub_normal3_intr
+- which entries use a signal                path 'iosub_peri_intr[*]'
+- entries by name pattern, group, source index or RTL path prefix
+
+The map is parsed once into forward and reverse indexes (name, group, source
+index, dest index per destination, RTL signal and sorted RTL paths for prefix
+search, merge relations) which are pickled next to the entries file.  The
+cache is reused while the entries file keeps its size and modification time.
+
+Ranged vector entries (width > 1) are also indexed per bit: the bit view
+names '<name>_<n>' used in the monitor and scoreboard logs, the bit paths
+('...pll_lock_intr[3]') and the destination index of every bit resolve to
+the vector entry, in the name queries as well as in 'feeds' and 'merges'.
+
+Use the 'interactive' command to run repeated queries against one loaded map.
+"""
+
+import os
+import sys
+import time
+import shlex
+import bisect
+import pickle
+import fnmatch
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from interrupt_map import (DESTINATIONS, load_interrupt_map, get_destinations, build_merge_relations,
+                           expand_vector_entries)
+
+CACHE_VERSION = 2
+
+# Query hit: (entry id, role 'src' or destination, RTL path)
+Hit = Tuple[int, str, str]
+
+
+def split_signal(path: str) -> Tuple[str, str]:
+    """Split an RTL path into (leaf signal with bit select, leaf signal name)."""
+    leaf = path.rsplit('.', 1)[-1]
+    return leaf, leaf.split('[', 1)[0]
+
+
+class InterruptMapIndex:
+    def __init__(self, entries: List[dict]):
+        """
+        Build all query indexes for an interrupt map.
+
+        Args:
+            entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+        """
+        self.entries = entries
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_group: Dict[str, List[int]] = {}
+        self.by_src_index: Dict[int, List[int]] = {}
+        self.by_dest_index: Dict[str, Dict[int, List[int]]] = {d: {} for d in DESTINATIONS}
+        self.by_leaf: Dict[str, List[Hit]] = {}     # 'cpu_irq[62]' -> hits
+        self.by_signal: Dict[str, List[Hit]] = {}   # 'cpu_irq' -> hits
+        self.paths: List[Tuple[str, int, str]] = []  # sorted (path, entry id, role)
+        self.by_bit_path: Dict[str, List[Hit]] = {}  # bit path of a ranged entry -> hits
+
+        for eid, entry in enumerate(entries):
+            self.by_group.setdefault(entry.get('group', ''), []).append(eid)
+            self.by_src_index.setdefault(entry.get('index', -1), []).append(eid)
+
+            # A ranged entry is indexed as itself and as its single-bit views
+            bit_views = expand_vector_entries([entry]) if entry.get('width', 1) > 1 else []
+            for view in [entry] + bit_views:
+                self.by_name.setdefault(view['name'], []).append(eid)
+                routes = [('src', view.get('rtl_path_src', ''))]
+                for dest in get_destinations(view):
+                    dest_index = view.get(f'dest_index_{dest}', -1)
+                    if dest_index >= 0 and eid not in self.by_dest_index[dest].get(dest_index, []):
+                        self.by_dest_index[dest].setdefault(dest_index, []).append(eid)
+                    routes.append((dest, view.get(f'rtl_path_{dest}', '')))
+
+                for role, path in routes:
+                    if not path:
+                        continue
+                    leaf, signal = split_signal(path)
+                    self.by_leaf.setdefault(leaf, []).append((eid, role, path))
+                    if view is entry:
+                        self.by_signal.setdefault(signal, []).append((eid, role, path))
+                        self.paths.append((path, eid, role))
+                    else:
+                        self.by_bit_path.setdefault(path, []).append((eid, role, path))
+
+        self.paths.sort()
+        self.path_keys = [path for path, _, _ in self.paths]
+
+        # source -> merges it feeds, and the reverse merge -> sources
+        self.merges_for_source = build_merge_relations(entries)
+        self.sources_for_merge: Dict[str, List[str]] = {}
+        for source, merges in self.merges_for_source.items():
+            for merge in merges:
+                self.sources_for_merge.setdefault(merge, []).append(source)
+
+    def find_names(self, pattern: str) -> List[int]:
+        if not any(c in pattern for c in '*?['):
+            return list(self.by_name.get(pattern, []))
+        return [eid for name, ids in self.by_name.items() if fnmatch.fnmatchcase(name, pattern) for eid in ids]
+
+    def resolve_names(self, pattern: str) -> List[str]:
+        """Names of the entries matched by a name, bit view name or glob pattern, in map order."""
+        return [self.entries[eid]['name'] for eid in sorted(set(self.find_names(pattern)))]
+
+    def find_group(self, group: str) -> List[int]:
+        return list(self.by_group.get(group.upper(), []))
+
+    def find_src_index(self, index: int, group: Optional[str] = None) -> List[int]:
+        ids = self.by_src_index.get(index, [])
+        if group:
+            ids = [eid for eid in ids if self.entries[eid].get('group') == group.upper()]
+        return list(ids)
+
+    def find_dest_index(self, dest: str, index: int) -> List[int]:
+        return list(self.by_dest_index.get(dest.lower(), {}).get(index, []))
+
+    def find_path(self, pattern: str) -> List[Hit]:
+        """
+        Find RTL path uses.
+
+        'sig[*]' or 'sig' matches every bit of a signal, 'sig[3]' one bit,
+        'a.b.c' is a path prefix, and other wildcards are matched against full paths.
+        """
+        if pattern.endswith('[*]') and not any(c in pattern[:-3] for c in '*?['):
+            return list(self.by_signal.get(pattern[:-3].rsplit('.', 1)[-1], []))
+        if any(c in pattern for c in '*?'):
+            return [(eid, role, path) for path, eid, role in self.paths if fnmatch.fnmatchcase(path, pattern)]
+        if '.' in pattern:
+            start = bisect.bisect_left(self.path_keys, pattern)
+            hits = []
+            for path, eid, role in self.paths[start:]:
+                if not path.startswith(pattern):
+                    break
+                hits.append((eid, role, path))
+            return hits or list(self.by_bit_path.get(pattern, []))
+        if '[' in pattern:
+            return list(self.by_leaf.get(pattern, []))
+        return list(self.by_signal.get(pattern, []))
+
+    def get_state(self) -> dict:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'InterruptMapIndex':
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
+
+
+def load_index(entries_file: str, cache_file: Optional[str]) -> Tuple[InterruptMapIndex, bool]:
+    """
+    Load the query index, from the cache if it matches the entries file.
+
+    Returns:
+        (index, True if it came from the cache)
+    """
+    stat = os.stat(entries_file)
+    key = {'version': CACHE_VERSION, 'source': os.path.abspath(entries_file),
+           'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') == key:
+                return InterruptMapIndex.from_state(cached['state']), True
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError):
+            pass  # Stale or unreadable cache: rebuild below
+
+    index = InterruptMapIndex(load_interrupt_map(entries_file))
+    if cache_file:
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump({'key': key, 'state': index.get_state()}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Warning: could not write cache {cache_file}: {e}")
+    return index, False
+
+
+def format_entry(entry: dict, verbose: bool) -> str:
+    routes = []
+    for dest in get_destinations(entry):
+        dest_index = entry.get(f'dest_index_{dest}', -1)
+        routes.append(f"{dest.upper()}[{dest_index}]" if dest_index >= 0 else dest.upper())
+    line = f"{entry['name']:<45} {entry.get('group', '')}[{entry.get('index', -1)}]  -> {' '.join(routes) or '(none)'}"
+    if verbose:
+        line += f"\n    src: {entry.get('rtl_path_src', '')}"
+        for dest in get_destinations(entry):
+            line += f"\n    {dest}: {entry.get(f'rtl_path_{dest}', '')}"
+    return line
+
+
+def run_query(index: InterruptMapIndex, args) -> int:
+    """Run one query command and print its answer."""
+    start = time.perf_counter()
+    entries = index.entries
+
+    if args.command in ('feeds', 'merges'):
+        table = index.sources_for_merge if args.command == 'feeds' else index.merges_for_source
+        names = []
+        for resolved in index.resolve_names(args.name):
+            names += [name for name in table.get(resolved, []) if name not in names]
+        for name in names:
+            for eid in index.by_name.get(name, []):
+                print(format_entry(entries[eid], args.verbose))
+        count = len(names)
+    elif args.command == 'path':
+        hits = index.find_path(args.pattern)
+        for eid, role, path in hits:
+            print(f"{entries[eid]['name']:<45} {role:<10} {path}")
+        count = len(hits)
+    else:
+        if args.command == 'name':
+            ids = index.find_names(args.pattern)
+        elif args.command == 'group':
+            ids = index.find_group(args.group)
+        elif args.command == 'src':
+            ids = index.find_src_index(args.index, args.group)
+        else:
+            ids = index.find_dest_index(args.dest, args.index)
+        for eid in ids:
+            print(format_entry(entries[eid], args.verbose))
+        count = len(ids)
+
+    print(f"({count} matches, {(time.perf_counter() - start) * 1000:.2f} ms)")
+    return 0 if count else 1
+
+
+def interactive(index: InterruptMapIndex, parser: argparse.ArgumentParser) -> int:
+    """Read queries from stdin until EOF or 'quit'."""
+    print(f"Loaded {len(index.entries)} entries. Type a query (e.g. 'dest scp 62'), 'help' or 'quit'.")
+    while True:
+        try:
+            line = input("int_map> ").strip()
+        except EOFError:
+            print()
+            return 0
+        if not line:
+            continue
+        if line in ('quit', 'exit'):
+            return 0
+        if line == 'help':
+            parser.print_help()
+            continue
+        try:
+            args = parser.parse_args(shlex.split(line))
+        except SystemExit:
+            continue  # argparse already printed the error
+        if args.command == 'interactive':
+            continue
+        run_query(index, args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Interrupt Map Query Tool')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('--cache', help='Index cache file (default: <entries>.qcache)')
+    parser.add_argument('--no-cache', action='store_true', help='Always rebuild the index')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Print RTL paths of matched entries')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p = subparsers.add_parser('name', help='Entries by name or glob pattern')
+    p.add_argument('pattern')
+    p = subparsers.add_parser('group', help='Entries of an interrupt group')
+    p.add_argument('group')
+    p = subparsers.add_parser('src', help='Entries at a source sub index')
+    p.add_argument('index', type=int)
+    p.add_argument('-g', '--group', help='Restrict to one group')
+    p = subparsers.add_parser('dest', help='Entries at a destination index (e.g. dest scp 62)')
+    p.add_argument('dest', choices=DESTINATIONS + [d.upper() for d in DESTINATIONS])
+    p.add_argument('index', type=int)
+    p = subparsers.add_parser('path', help="Entries using an RTL signal, bit or path prefix (e.g. 'iosub_peri_intr[*]')")
+    p.add_argument('pattern')
+    p = subparsers.add_parser('feeds', help='Interrupts merged into a merge interrupt (name, bit view or glob)')
+    p.add_argument('name')
+    p = subparsers.add_parser('merges', help='Merge interrupts an interrupt feeds (name, bit view or glob)')
+    p.add_argument('name')
+    subparsers.add_parser('interactive', help='Run repeated queries against the loaded map')
+    return parser
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+
+    cache_file = None if args.no_cache else (args.cache or f"{args.entries}.qcache")
+    start = time.perf_counter()
+    index, cached = load_index(args.entries, cache_file)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    if args.command == 'interactive':
+        print(f"Index {'loaded from cache' if cached else 'built'} in {load_ms:.1f} ms")
+        return interactive(index, parser)
+    return run_query(index, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
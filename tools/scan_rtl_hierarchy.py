@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+RTL Hierarchy Scanner
+
+Derives config/hierarchy_config.json from the RTL instead of the hard-coded
+fallback in SignalPathGenerator._load_default_config().
+
+Flow:
+1. Expand the file lists (int_subenv.f, tb/top_tb.f by default), following
+   nested -f/-F lists and $VAR / ${VAR} references
+2. Parse every referenced source file for module parameters, port
+   declarations (ANSI and non-ANSI) and instantiations with their #(...)
+   parameter overrides
+3. Walk the instance tree from the top module to find the base hierarchies
+   (u_iosub_top_wrap, u_iosub_int_sub, u_scp_top_wrapper, u_mcp_top),
+   resolving the parameters of every instance from the overrides along its
+   path (named .W(4) or positional) and the module defaults
+4. Evaluate the widths of the interrupt ports (names containing 'intr' or
+   'irq') of the instances found with their resolved parameters, and write
+   them with the hierarchy into the config
+
+Parse results are cached per file in a JSON cache.  A file is only re-read
+when its size or mtime changed, and only re-parsed when its SHA-256 changed,
+so rescanning a large RTL tree is incremental.
+
+An existing config is updated in place (base_hierarchy and signal_widths);
+other sections such as interrupt_groups are kept.  A new config is seeded
+from the fallback configuration.
+
+tools/fixtures/rtl_hierarchy holds a small RTL tree with instance arrays and
+for-generate blocks; its file list names the --expect paths the scanner must
+find (run it with -n --no-cache).
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CACHE_VERSION = 3
+
+SOURCE_SUFFIXES = ('.sv', '.v', '.svh', '.vh')
+
+# base_hierarchy key -> instance name searched for in the instance tree
+DEFAULT_TARGETS = {
+    'iosub_top': 'u_iosub_top_wrap',
+    'iosub_int_sub': 'u_iosub_int_sub',
+    'scp_top': 'u_scp_top_wrapper',
+    'mcp_top': 'u_mcp_top',
+}
+
+# Ports whose widths are recorded in signal_widths
+INTERRUPT_PORT_PATTERN = re.compile(r'intr|irq')
+
+_COMMENT_PATTERN = re.compile(r'//[^\n]*|/\*.*?\*/', re.DOTALL)
+_MODULE_PATTERN = re.compile(r'\bmodule\s+(\w+)(.*?)\bendmodule\b', re.DOTALL)
+_PARAM_PATTERN = re.compile(r'\b(parameter|localparam)\b(?:\s+(?:int|integer|logic|bit)\b)?'
+                            r'(?:\s+unsigned|\s+signed)?\s*(?:\[[^\]]*\]\s*)?(\w+)\s*=\s*([^,;)]+)')
+_PORT_PATTERN = re.compile(r'\b(input|output|inout)\b\s*(?:wire|logic|reg|bit|var)?\s*(?:signed|unsigned)?\s*'
+                           r'(\[[^\]]+\])?\s*([\w\s,]+?)(?=[;)]|\b(?:input|output|inout)\b)')
+_BLOCK_PATTERN = re.compile(r'(?:\bfor\s*\(\s*(?:genvar\s+)?\w+\s*=\s*([^;]+);(?:[^()]|\([^()]*\))*\)\s*)?'
+                            r'\bbegin\b(?:\s*:\s*(\w+))?|\bend\b')
+_INSTANCE_PATTERN = re.compile(r'(?:^|;|\bbegin\b(?:\s*:\s*\w+)?|\bend\b|\bgenerate\b|\belse\b|\))\s*(?:\w+\s*:\s*)?'
+                               r'(\w+)\s*(?:#\s*\(((?:[^()]|\((?:[^()]|\([^()]*\))*\))*)\)\s*)?'
+                               r'(\w+)\s*(\[[^\]]*\])?\s*\(')
+_VAR_PATTERN = re.compile(r'\$\{(\w+)\}|\$(\w+)')
+
+_KEYWORDS = {
+    'module', 'if', 'for', 'foreach', 'case', 'casez', 'casex', 'while', 'assign', 'always',
+    'always_ff', 'always_comb', 'always_latch', 'initial', 'final', 'function', 'task',
+    'wire', 'logic', 'reg', 'bit', 'int', 'integer', 'input', 'output', 'inout', 'return',
+    'begin', 'end', 'else', 'generate', 'genvar', 'parameter', 'localparam', 'assert', 'property',
+}
+
+
+def expand_vars(text: str, defines: Dict[str, str]) -> str:
+    """Expand $VAR and ${VAR} from the defines, then the environment; unknown variables are kept."""
+    def repl(match):
+        name = match.group(1) or match.group(2)
+        return defines.get(name, os.environ.get(name, match.group(0)))
+    return _VAR_PATTERN.sub(repl, text)
+
+
+def expand_filelist(filelist: str, defines: Dict[str, str], seen: Optional[set] = None,
+                    missing: Optional[List[str]] = None) -> List[str]:
+    """
+    Expand a simulator file list into source files, following nested -f/-F lists.
+
+    Relative paths are resolved against the directory of the list that names them.
+
+    Returns:
+        Source file paths in file-list order (missing files are appended to missing)
+    """
+    seen = set() if seen is None else seen
+    missing = [] if missing is None else missing
+    sources: List[str] = []
+    list_path = os.path.abspath(filelist)
+    if list_path in seen:
+        return sources
+    seen.add(list_path)
+
+    if not os.path.exists(list_path):
+        missing.append(filelist)
+        return sources
+
+    base_dir = os.path.dirname(list_path)
+    with open(list_path, 'r', encoding='utf-8', errors='replace') as f:
+        tokens = _COMMENT_PATTERN.sub('', f.read()).split()
+
+    i = 0
+    while i < len(tokens):
+        token = expand_vars(tokens[i], defines)
+        i += 1
+        if token in ('-f', '-F') and i < len(tokens):
+            nested = expand_vars(tokens[i], defines)
+            i += 1
+            sources.extend(expand_filelist(os.path.join(base_dir, nested), defines, seen, missing))
+        elif token in ('-v', '-y') and i < len(tokens):
+            i += 1  # Library files/directories are not scanned
+        elif token.startswith('+') or token.startswith('-'):
+            continue  # +incdir+, +define+, simulator options
+        elif token.endswith(SOURCE_SUFFIXES):
+            path = os.path.normpath(os.path.join(base_dir, token))
+            if os.path.exists(path):
+                sources.append(path)
+            else:
+                missing.append(token)
+    return sources
+
+
+def eval_width(range_text: Optional[str], params: Dict[str, str]) -> Optional[int]:
+    """Evaluate a packed range such as '[N-1:0]' to a width; None if it cannot be resolved."""
+    if not range_text:
+        return 1
+    m = re.fullmatch(r'\[\s*(.+?)\s*:\s*(.+?)\s*\]', range_text.strip())
+    if not m:
+        return None
+    bounds = []
+    for expr in m.groups():
+        value = eval_expr(expr, params)
+        if value is None:
+            return None
+        bounds.append(value)
+    return abs(bounds[0] - bounds[1]) + 1
+
+
+def eval_expr(expr: str, params: Dict[str, str], depth: int = 0) -> Optional[int]:
+    """Evaluate an integer parameter expression (+ - * / % ( ) $clog2, sized literals)."""
+    if depth > 8:
+        return None
+    expr = re.sub(r"\d*'[sS]?[dD](\d+)", r'\1', expr)
+    expr = re.sub(r"\d*'[sS]?[hH]([0-9a-fA-F_]+)", lambda m: str(int(m.group(1).replace('_', ''), 16)), expr)
+    expr = re.sub(r"\d*'[sS]?[bB]([01_]+)", lambda m: str(int(m.group(1).replace('_', ''), 2)), expr)
+
+    def repl(match):
+        name = match.group(0)
+        if name not in params:
+            raise KeyError(name)
+        value = eval_expr(params[name], params, depth + 1)
+        if value is None:
+            raise KeyError(name)
+        return str(value)
+
+    try:
+        expr = re.sub(r'\$clog2', '_clog2', expr)
+        expr = re.sub(r'\b(?!_clog2\b)[A-Za-z_]\w*\b', repl, expr)
+    except KeyError:
+        return None
+    if not re.fullmatch(r'[\d\s+\-*/%()_clog]*', expr):
+        return None
+    try:
+        value = eval(expr.replace('/', '//'), {'__builtins__': {}},
+                     {'_clog2': lambda v: max(0, (int(v) - 1).bit_length())})
+    except Exception:
+        return None
+    return int(value)
+
+
+def first_index(expr: str, params: Dict[str, str]) -> int:
+    """First index of an instance array or generate loop, evaluated with the parameter defaults (0 if unknown)."""
+    value = eval_expr(expr.strip(), params)
+    return value if value is not None else 0
+
+
+def split_arguments(text: str) -> List[str]:
+    """Split a comma-separated argument list at the top parenthesis level."""
+    args, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch in '([{':
+            depth += 1
+        elif ch in ')]}':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            args.append(text[start:i].strip())
+            start = i + 1
+    if text[start:].strip():
+        args.append(text[start:].strip())
+    return args
+
+
+def parse_overrides(text: Optional[str]) -> Dict[str, str]:
+    """
+    Parse the #(...) parameter overrides of an instantiation.
+
+    Returns:
+        Dictionary of parameter name (named overrides) or '#<position>'
+        (positional overrides) -> expression in the instantiating module
+    """
+    overrides = {}
+    for position, arg in enumerate(split_arguments(text or '')):
+        named = re.fullmatch(r'\.\s*(\w+)\s*\((.*)\)', arg, re.DOTALL)
+        if named:
+            if named.group(2).strip():
+                overrides[named.group(1)] = named.group(2).strip()
+        else:
+            overrides[f"#{position}"] = arg
+    return overrides
+
+
+def parse_source(text: str) -> Dict[str, dict]:
+    """
+    Parse the modules of one source file.
+
+    Returns:
+        Dictionary of module name -> {'params': {name: default expression},
+                                      'param_order': [overridable parameters in declaration order],
+                                      'ports': {name: {'direction', 'range', 'width'}},
+                                      'instances': [[module type, instance name, overrides], ...]}
+        with port widths evaluated against the parameter defaults
+    """
+    modules = {}
+    text = _COMMENT_PATTERN.sub('', text)
+    for match in _MODULE_PATTERN.finditer(text):
+        name, body = match.group(1), match.group(2)
+        declared = _PARAM_PATTERN.findall(body)
+        params = {p: v.strip() for _, p, v in declared}
+        param_order = [p for kind, p, _ in declared if kind == 'parameter']
+
+        ports = {}
+        for direction, range_text, names in _PORT_PATTERN.findall(body):
+            width = eval_width(range_text, params)
+            for port in (n.strip() for n in names.split(',')):
+                if re.fullmatch(r'[A-Za-z_]\w*', port) and port not in _KEYWORDS:
+                    ports[port] = {'direction': direction, 'range': range_text or '', 'width': width}
+
+        # Named begin/end blocks (generate scopes) become part of the instance path;
+        # a for-generate block is addressed through its first iteration
+        blocks = []
+        for m in _BLOCK_PATTERN.finditer(body):
+            start, label = m.group(1), m.group(2)
+            if label and start is not None:
+                label = f"{label}[{first_index(start, params)}]"
+            blocks.append((m.start(), m.group(0) != 'end', label))
+
+        instances = []
+        header_end = body.find(';')
+        for inst in _INSTANCE_PATTERN.finditer(body, max(header_end, 0)):
+            module_type, overrides, inst_name, array = inst.groups()
+            if module_type in _KEYWORDS or inst_name in _KEYWORDS:
+                continue
+            if array:
+                # Instance arrays are addressed through their first element: [N] declares
+                # elements 0..N-1, [m:l] starts at m
+                bounds = array[1:-1].split(':')
+                inst_name = f"{inst_name}[{first_index(bounds[0], params) if len(bounds) == 2 else 0}]"
+            scope = []
+            for pos, is_begin, label in blocks:
+                if pos >= inst.start(1):
+                    break
+                if is_begin:
+                    scope.append(label)
+                elif scope:
+                    scope.pop()
+            instances.append([module_type, '.'.join([b for b in scope if b] + [inst_name]),
+                              parse_overrides(overrides)])
+
+        modules[name] = {'params': params, 'param_order': param_order, 'ports': ports, 'instances': instances}
+    return modules
+
+
+class RTLScanner:
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Initialize the RTL scanner.
+
+        Args:
+            cache_file: JSON cache of per-file parse results (None disables caching)
+        """
+        self.cache_file = cache_file
+        self.cache: Dict[str, dict] = {}
+        self.stats = {'files': 0, 'unchanged': 0, 'rehashed': 0, 'parsed': 0}
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self.cache = data.get('files', {})
+            except (OSError, json.JSONDecodeError):
+                self.cache = {}
+
+    def scan_file(self, path: str) -> Dict[str, dict]:
+        """Get the modules of a source file, re-parsing only if its content changed."""
+        self.stats['files'] += 1
+        stat = os.stat(path)
+        cached = self.cache.get(path)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            self.stats['unchanged'] += 1
+            return cached['modules']
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if cached and cached['sha256'] == digest:
+            self.stats['rehashed'] += 1
+            modules = cached['modules']
+        else:
+            self.stats['parsed'] += 1
+            modules = parse_source(data.decode('utf-8', errors='replace'))
+
+        self.cache[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                            'sha256': digest, 'modules': modules}
+        return modules
+
+    def scan(self, sources: List[str]) -> Dict[str, dict]:
+        """Scan all sources; later definitions of a module override earlier ones."""
+        modules = {}
+        for path in sources:
+            modules.update(self.scan_file(path))
+        return modules
+
+    def save_cache(self):
+        if not self.cache_file:
+            return
+        Path(self.cache_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': self.cache}, f)
+
+
+def resolve_params(module: dict, overrides: Dict[str, str], parent_params: Dict[str, str]) -> Dict[str, str]:
+    """
+    Effective parameters of an instance: the module defaults with the
+    instantiation overrides applied.  Overrides are evaluated in the
+    instantiating module; an expression that cannot be evaluated is kept, so
+    the widths depending on it stay unresolved instead of falling back to
+    the default.
+    """
+    params = dict(module.get('params', {}))
+    order = module.get('param_order', [])
+    for name, expr in overrides.items():
+        if name.startswith('#'):
+            position = int(name[1:])
+            if position >= len(order):
+                continue
+            name = order[position]
+        value = eval_expr(expr, parent_params)
+        params[name] = str(value) if value is not None else f"({expr})"
+    return params
+
+
+def find_instance_paths(modules: Dict[str, dict], top: str,
+                        targets: Dict[str, str]) -> Dict[str, Tuple[str, str, Dict[str, str]]]:
+    """
+    Breadth-first search of the instance tree for the target instance names.
+
+    Returns:
+        Dictionary of base_hierarchy key -> (hierarchical path, module name,
+        effective parameters) of the shallowest match
+    """
+    found: Dict[str, Tuple[str, str, Dict[str, str]]] = {}
+    wanted = {inst: key for key, inst in targets.items()}
+    queue = [(top, top, dict(modules.get(top, {}).get('params', {})))]
+    visited = set()
+    while queue and len(found) < len(targets):
+        path, module, params = queue.pop(0)
+        if module in visited:
+            continue  # Only the first (shallowest) instance of a module is expanded
+        visited.add(module)
+        for module_type, inst_name, overrides in modules.get(module, {}).get('instances', []):
+            if module_type not in modules:
+                continue
+            child = f"{path}.{inst_name}"
+            child_params = resolve_params(modules[module_type], overrides, params)
+            key = wanted.get(inst_name.rsplit('.', 1)[-1].split('[')[0])
+            if key and key not in found:
+                found[key] = (child, module_type, child_params)
+            queue.append((child, module_type, child_params))
+    return found
+
+
+def collect_signal_widths(modules: Dict[str, dict],
+                          hierarchy: Dict[str, Tuple[str, str, Dict[str, str]]]) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Get the widths of the interrupt ports of the instances found in the
+    hierarchy, evaluated with the effective parameters of each instance.
+
+    Returns:
+        (signal name -> width, ports whose width could not be resolved)
+    """
+    widths, unresolved = {}, []
+    for key, (_, module, params) in hierarchy.items():
+        for port, info in modules[module]['ports'].items():
+            if not INTERRUPT_PORT_PATTERN.search(port):
+                continue
+            width = eval_width(info['range'], params)
+            if width is None:
+                unresolved.append(f"{module}.{port}{info['range']}")
+            else:
+                widths[port] = width
+    return widths, unresolved
+
+
+def build_config(config_file: str, hierarchy: Dict[str, Tuple[str, str, Dict[str, str]]],
+                 widths: Dict[str, int]) -> dict:
+    """Update the existing config, or seed a new one from the fallback configuration."""
+    if os.path.exists(config_file):
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    else:
+        from generate_signal_paths import SignalPathGenerator
+        generator = SignalPathGenerator.__new__(SignalPathGenerator)
+        generator._load_default_config()
+        config = {'base_hierarchy': generator.base_hierarchy,
+                  'signal_mappings': generator.signal_mappings,
+                  'signal_widths': generator.signal_widths,
+                  'interrupt_groups': {},
+                  'destination_mappings': {},
+                  'hierarchy_selection_rules': {}}
+
+    config.setdefault('base_hierarchy', {}).update({key: path for key, (path, _, _) in hierarchy.items()})
+    config.setdefault('signal_widths', {}).update(widths)
+    config['derived_from_rtl'] = {key: module for key, (_, module, _) in hierarchy.items()}
+    return config
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RTL Hierarchy Scanner')
+    parser.add_argument('filelists', nargs='*', default=['int_subenv.f', 'tb/top_tb.f'],
+                        help='Simulator file lists to scan (default: int_subenv.f tb/top_tb.f)')
+    parser.add_argument('-o', '--output', default='config/hierarchy_config.json',
+                        help='Hierarchy configuration to write (updated if it exists)')
+    parser.add_argument('--top', default='top_tb', help='Top module of the instance tree (default: top_tb)')
+    parser.add_argument('-D', '--define', action='append', default=[], metavar='VAR=VALUE',
+                        help='Value for a $VAR used in the file lists (default: environment)')
+    parser.add_argument('--target', action='append', default=[], metavar='KEY=INSTANCE',
+                        help='Override a base_hierarchy target instance (e.g. scp_top=u_scp_top_wrapper)')
+    parser.add_argument('--cache', default='config/.rtl_scan_cache.json', help='Per-file parse cache')
+    parser.add_argument('--no-cache', action='store_true', help='Parse every file again')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='Report only, do not write the config')
+    parser.add_argument('--expect', action='append', default=[], metavar='KEY=PATH',
+                        help='Fail unless base_hierarchy KEY is found at PATH (see tools/fixtures/rtl_hierarchy)')
+
+    args = parser.parse_args()
+
+    defines = dict(d.split('=', 1) for d in args.define if '=' in d)
+    targets = dict(DEFAULT_TARGETS)
+    targets.update(dict(t.split('=', 1) for t in args.target if '=' in t))
+
+    missing: List[str] = []
+    seen: set = set()
+    sources: List[str] = []
+    for filelist in args.filelists:
+        for path in expand_filelist(filelist, defines, seen, missing):
+            if path not in sources:
+                sources.append(path)
+
+    print(f"Expanded {len(args.filelists)} file lists into {len(sources)} source files")
+    if missing:
+        print(f"Warning: {len(missing)} referenced files not found (set $VARs with -D):")
+        for path in missing[:10]:
+            print(f"  - {path}")
+
+    scanner = RTLScanner(None if args.no_cache else args.cache)
+    modules = scanner.scan(sources)
+    scanner.save_cache()
+    stats = scanner.stats
+    print(f"Scanned {stats['files']} files: {stats['parsed']} parsed, "
+          f"{stats['unchanged']} unchanged, {stats['rehashed']} rehashed; {len(modules)} modules")
+
+    if args.top not in modules:
+        print(f"Error: top module '{args.top}' not found in the scanned sources!")
+        return 1
+
+    hierarchy = find_instance_paths(modules, args.top, targets)
+    for key, inst in targets.items():
+        if key in hierarchy:
+            path, module, params = hierarchy[key]
+            overridden = {p: v for p, v in params.items() if v != modules[module]['params'].get(p)}
+            print(f"  {key:<14} {path} ({module})"
+                  + (f" with {', '.join(f'{p}={v}' for p, v in overridden.items())}" if overridden else ""))
+        else:
+            print(f"  {key:<14} Warning: instance '{inst}' not found, keeping configured path")
+
+    widths, unresolved = collect_signal_widths(modules, hierarchy)
+    print(f"Derived {len(widths)} interrupt port widths")
+    for port in unresolved:
+        print(f"  Warning: could not evaluate width of {port}")
+
+    mismatched = [(key, path) for key, path in (e.split('=', 1) for e in args.expect if '=' in e)
+                  if hierarchy.get(key, ('',))[0] != path]
+    for key, path in mismatched:
+        print(f"Error: expected {key} at {path}, found {hierarchy.get(key, ('(none)',))[0]}")
+    if mismatched:
+        return 1
+
+    if args.dry_run:
+        for name, width in sorted(widths.items()):
+            print(f"  {name}: {width}")
+        return 0
+
+    config = build_config(args.output, hierarchy, widths)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+    print(f"Successfully wrote '{args.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Interrupt Source Bus Images
+
+Groups the interrupt sources that are bits or slices of one multi-bit source
+bus (iosub_peri_intr, scp_to_iosub_intr, csub_to_iosub_intr, ...) and emits
+the bit position of every entry as int_source_buses.svh, which
+int_source_bus_table loads for the burst mode of int_driver: a whole set of
+interrupts on a bus is asserted with one force per bus segment instead of one
+force (and one set of setup/hold delays) per interrupt.
+
+- A segment is a maximal run of contiguous bus bits owned by drivable entries.
+  Bits of merge outputs (e.g. iosub_peri_intr[0], driven by iosub_slv_err_intr)
+  and bits not in the map are never part of a segment, so a burst never
+  overrides logic it does not stimulate.
+- Every segment carries its idle image (ACTIVE_LOW bits idle at 1).
+- Every entry carries its interrupt_map index, so the expected destinations of
+  a burst come from the routing bitmaps (int_route_bitmaps.svh) directly.
+
+Sources without a bit or part-select, and entries sharing a source bit with
+another entry, are left out and driven one by one.
+"""
+
+import re
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from interrupt_map import load_interrupt_map, is_merge_interrupt
+from mask_layout import format_sv_hex
+
+_SOURCE_SELECT_PATTERN = re.compile(r'^(.*)\[(\d+)(?::(\d+))?\]$')
+
+
+def parse_source_select(path: str):
+    """
+    Split a source path into bus and bit range.
+
+    Returns:
+        (bus path, lsb, width), or None for paths without an ascending-order
+        bit or part-select (e.g. 'a.sig', 'a.sig[0:3]')
+    """
+    m = _SOURCE_SELECT_PATTERN.match(path)
+    if not m:
+        return None
+    msb = int(m.group(2))
+    lsb = int(m.group(3)) if m.group(3) is not None else msb
+    if msb < lsb:
+        return None
+    return m.group(1), lsb, msb - lsb + 1
+
+
+def build_source_buses(entries: List[dict]) -> Dict[str, List[Tuple[int, int, int, dict]]]:
+    """
+    Collect the drivable entries of every source bus.
+
+    Args:
+        entries: Interrupt map entries (see interrupt_map.load_interrupt_map)
+
+    Returns:
+        Dictionary of bus path -> (lsb, width, map index, entry) sorted by lsb,
+        for buses with at least two drivable bits
+    """
+    slots: Dict[str, List[Tuple[int, int, int, dict]]] = {}
+    owners: Dict[Tuple[str, int], int] = {}
+    seen = set()
+    for i, entry in enumerate(entries):
+        select = parse_source_select(entry.get('rtl_path_src', ''))
+        if select is None:
+            continue
+        bus, lsb, width = select
+        for bit in range(lsb, lsb + width):
+            owners[(bus, bit)] = owners.get((bus, bit), 0) + 1
+        # Name lookups in the SV model resolve to the first entry of that name
+        if entry['name'] in seen or is_merge_interrupt(entry['name']):
+            continue
+        seen.add(entry['name'])
+        slots.setdefault(bus, []).append((lsb, width, i, entry))
+
+    buses = {}
+    for bus, bus_slots in slots.items():
+        # A bit shared with another entry or a merge output cannot be imaged for one entry alone
+        drivable = sorted((s for s in bus_slots
+                           if all(owners[(bus, b)] == 1 for b in range(s[0], s[0] + s[1]))), key=lambda s: s[0])
+        if sum(s[1] for s in drivable) > 1:
+            buses[bus] = drivable
+    return buses
+
+
+def build_segments(slots: List[Tuple[int, int, int, dict]]) -> List[Tuple[int, int]]:
+    """Maximal runs (lsb, msb) of contiguous bits of the slots."""
+    segments: List[Tuple[int, int]] = []
+    for lsb, width, _, _ in slots:
+        if segments and segments[-1][1] + 1 == lsb:
+            segments[-1] = (segments[-1][0], lsb + width - 1)
+        else:
+            segments.append((lsb, lsb + width - 1))
+    return segments
+
+
+def _format_value_words(target: str, value: int) -> List[str]:
+    words = []
+    offset = 0
+    while value >> offset:
+        word = (value >> offset) & 0xFFFF_FFFF
+        if word:
+            words.append(f"{target}[{offset} +: 32] = {format_sv_hex(word)};")
+        offset += 32
+    return words
+
+
+def generate_source_buses_file(entries: List[dict], output_path: str, source: str):
+    """Generate the SystemVerilog include file holding the source bus images."""
+    buses = build_source_buses(entries)
+
+    sv_lines = [
+        "// Auto-generated interrupt source bus images",
+        f"// Source: {source}",
+        "// Generated by: source_buses.py",
+        "// NOTE: This file is included in int_source_bus_table.sv",
+        "// Bit positions are relative to the segment lsb; map_index is the interrupt_map index",
+        "",
+    ]
+    segment_id = 0
+    for bus_id, (bus, slots) in enumerate(buses.items()):
+        segments = build_segments(slots)
+        sv_lines.append(f"        // --- {bus.split('.')[-1]}: {len(slots)} interrupts, {len(segments)} segments ---")
+        sv_lines.append(f"        bus_paths.push_back(\"{bus}\");")
+        for lsb, msb in segments:
+            idle = 0
+            for s_lsb, s_width, _, entry in slots:
+                if lsb <= s_lsb <= msb and entry.get('polarity') == 'ACTIVE_LOW':
+                    idle |= ((1 << s_width) - 1) << (s_lsb - lsb)
+            words = " ".join(_format_value_words("segment.idle", idle))
+            sv_lines.append(f"        segment = '{{bus:{bus_id}, lsb:{lsb}, msb:{msb}, idle:'0}}; "
+                            f"{words + ' ' if words else ''}segments.push_back(segment);")
+            for s_lsb, s_width, map_index, entry in slots:
+                if lsb <= s_lsb <= msb:
+                    sv_lines.append(f"        slot = '{{segment:{segment_id}, offset:{s_lsb - lsb}, width:{s_width}, "
+                                    f"map_index:{map_index}}}; slots[\"{entry['name']}\"] = slot;")
+            segment_id += 1
+        sv_lines.append("")
+
+    with open(output_path, 'w', encoding='utf-8') as svfile:
+        svfile.write("\n".join(sv_lines))
+    return buses
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Interrupt Source Bus Image Generator')
+    parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
+                        help='Path to interrupt map entries file')
+    parser.add_argument('-o', '--output', default='seq/int_source_buses.svh',
+                        help='Output SystemVerilog include file')
+
+    args = parser.parse_args()
+
+    if not Path(args.entries).exists():
+        print(f"Error: {args.entries} not found!")
+        return 1
+
+    entries = load_interrupt_map(args.entries)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    buses = generate_source_buses_file(entries, args.output, args.entries)
+
+    print(f"Loaded {len(entries)} interrupt entries from {args.entries}")
+    print(f"Mapped {sum(len(slots) for slots in buses.values())} interrupts onto {len(buses)} source buses "
+          f"({sum(len(build_segments(slots)) for slots in buses.values())} segments)")
+    print(f"Successfully generated '{args.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,8 @@ import re
 import sys
 import os
 from generate_signal_paths import SignalPathGenerator
+from pipeline_profiler import PROFILER
+from generation_history import GenerationHistory
 
 class RTLPathUpdater:
     def __init__(self, config_file: str = None):
@@ -28,11 +30,15 @@ class RTLPathUpdater:
         """
         # Extract interrupt name
         name_match = re.search(r'name:"([^"]+)"', line)
+        PROFILER.count('regex_evaluations')
         if not name_match:
             return None
             
         name = name_match.group(1)
         
+        # group, index, width and 6 destination index/flag searches
+        PROFILER.count('regex_evaluations', 15)
+
         # Extract group
         group_match = re.search(r'group:(\w+)', line)
         group = group_match.group(1) if group_match else "UNKNOWN"
@@ -40,6 +46,10 @@ class RTLPathUpdater:
         # Extract index
         index_match = re.search(r'index:(\d+)', line)
         index = int(index_match.group(1)) if index_match else 0
+
+        # Extract vector width (ranged entries such as csub_pll_intr_lock[16:0])
+        width_match = re.search(r'width:(\d+)', line)
+        width = int(width_match.group(1)) if width_match else 1
         
         # Extract destination indices
         dest_indices = {}
@@ -61,6 +71,7 @@ class RTLPathUpdater:
             'name': name,
             'group': group,
             'index': index,
+            'width': width,
             'dest_indices': dest_indices,
             'to_flags': to_flags,
             'original_line': line
@@ -99,8 +110,15 @@ class RTLPathUpdater:
             else:
                 dest_paths[dest] = ""
         
+        # Ranged entries drive and monitor the whole part-select starting at the generated bit
+        width = entry_info.get('width', 1)
+        if width > 1:
+            src_path = self.to_part_select(src_path, width)
+            dest_paths = {dest: self.to_part_select(path, width) for dest, path in dest_paths.items()}
+
         # Build the updated line
         line = entry_info['original_line']
+        PROFILER.count('regex_evaluations', 7)
         
         # Update rtl_path_src
         line = re.sub(r'rtl_path_src:"[^"]*"', f'rtl_path_src:"{src_path}"', line)
@@ -113,6 +131,15 @@ class RTLPathUpdater:
         
         return line
     
+    @staticmethod
+    def to_part_select(path: str, width: int) -> str:
+        """Turn a single-bit path sig[n] (or a whole signal sig) into sig[n+width-1:n]."""
+        if not path:
+            return path
+        m = re.match(r'^(.*)\[(\d+)\]$', path)
+        base, lsb = (m.group(1), int(m.group(2))) if m else (path, 0)
+        return f"{base}[{lsb + width - 1}:{lsb}]"
+
     def update_entries_file(self):
         """
         Update the int_map_entries.svh file with correct RTL paths.
@@ -122,40 +149,45 @@ class RTLPathUpdater:
             return False
         
         # Read the original file
-        with open(self.entries_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        with PROFILER.stage('read_entries'):
+            with open(self.entries_file, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
         
         # Process each line
         updated_lines = []
         updated_count = 0
         
-        for line in lines:
-            if 'interrupt_map.push_back(entry);' in line:
-                # This is an entry line, parse and update it
-                entry_info = self.parse_entry_line(line)
-                if entry_info:
-                    updated_line = self.generate_updated_line(entry_info)
-                    updated_lines.append(updated_line)
-                    updated_count += 1
-                    
-                    # Print progress for some entries
-                    if updated_count <= 5 or updated_count % 50 == 0:
-                        print(f"Updated entry {updated_count}: {entry_info['name']}")
+        with PROFILER.stage('path_generation'):
+            PROFILER.count('rows_scanned', len(lines))
+            for line in lines:
+                if 'interrupt_map.push_back(entry);' in line:
+                    # This is an entry line, parse and update it
+                    entry_info = self.parse_entry_line(line)
+                    if entry_info:
+                        updated_line = self.generate_updated_line(entry_info)
+                        updated_lines.append(updated_line)
+                        updated_count += 1
+                        
+                        # Print progress for some entries
+                        if updated_count <= 5 or updated_count % 50 == 0:
+                            print(f"Updated entry {updated_count}: {entry_info['name']}")
+                    else:
+                        updated_lines.append(line)
                 else:
+                    # Keep non-entry lines as-is
                     updated_lines.append(line)
-            else:
-                # Keep non-entry lines as-is
-                updated_lines.append(line)
-        
-        # Create backup of original file
-        backup_file = f"{self.entries_file}.backup"
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-        print(f"Created backup: {backup_file}")
         
-        # Write updated file
-        with open(self.entries_file, 'w', encoding='utf-8') as f:
-            f.writelines(updated_lines)
+        with PROFILER.stage('write_entries'):
+            # Keep the original in the generation history (a no-op if it is already the latest generation)
+            history = GenerationHistory.for_file(self.entries_file)
+            history.record(self.entries_file, 'pre_update_rtl_paths')
+
+            # Write updated file
+            with open(self.entries_file, 'w', encoding='utf-8') as f:
+                f.writelines(updated_lines)
+            gen_id = history.record(self.entries_file, 'update_rtl_paths')
+            if gen_id:
+                print(f"Recorded generation {gen_id} in {history.root}")
         
         print(f"Updated {updated_count} interrupt entries in {self.entries_file}")
         return True
@@ -193,9 +225,16 @@ def main():
     parser.add_argument('-c', '--config', help='Path to hierarchy configuration file')
     parser.add_argument('-e', '--entries', default='seq/int_map_entries.svh',
                        help='Path to interrupt map entries file')
+    parser.add_argument('--profile', help='Write a stage timing/counter report to this path')
+    parser.add_argument('--profile-format', choices=['json', 'prometheus'], default='json',
+                       help='Format of the --profile report (default: json)')
+    parser.add_argument('--cprofile-dir', help='With --profile, also dump cProfile stats per stage')
 
     args = parser.parse_args()
 
+    if args.profile:
+        PROFILER.enable(args.cprofile_dir)
+
     updater = RTLPathUpdater(args.config)
 
     # Override entries file if specified
@@ -210,12 +249,16 @@ def main():
     # Update the entries file
     if updater.update_entries_file():
         # Validate the results
-        updater.validate_paths()
+        with PROFILER.stage('validate_paths'):
+            updater.validate_paths()
         print("\nRTL path update completed successfully!")
     else:
         print("RTL path update failed!")
         return 1
 
+    if args.profile:
+        PROFILER.write_report(args.profile, args.profile_format)
+
     return 0
 
 if __name__ == "__main__":